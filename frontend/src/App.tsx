@@ -14,7 +14,7 @@ import WeatherDetailPanel from './components/WeatherDetailPanel';
 import type { RandomPoi } from './components/Beaty/BeatyBubble';
 import { queryBeatyStream } from './services/beatyApi';
 import type { BeatyResponse, SSEDataEvent } from './services/beatyApi';
-import { oauthLogin, saveSession, getSessionToken, getCurrentUser, clearSession, logout as logoutApi, getActiveTripSession, getTripContext, getCategories, getQueryHistory } from './services/authApi';
+import { oauthLogin, saveSession, getSessionToken, getCurrentUser, clearSession, logout as logoutApi, getActiveTripSession, getTripContext, getCategories, getQueryHistory, getQueryHistoryEntry } from './services/authApi';
 import type { TripContext, QueryHistory } from './services/authApi';
 import './App.css';
 
@@ -157,7 +157,7 @@ function App() {
   const [googlePlaceDetail, setGooglePlaceDetail] = useState<SelectedPlace | null>(null);
   const [googlePanelHeight, setGooglePanelHeight] = useState<'half' | 'full'>('half');
   const [isChatHistoryExpanded, setIsChatHistoryExpanded] = useState(false);
-  const [chatHistoryPage, setChatHistoryPage] = useState(1);
+  const [historyCursor, setHistoryCursor] = useState<string | null>(null);
   const [weather, setWeather] = useState<{emoji: string, temperature: number} | null>(null);
   const [showWeatherDetail, setShowWeatherDetail] = useState(false);
   const [isLoadingMoreHistory, setIsLoadingMoreHistory] = useState(false);
@@ -184,6 +184,8 @@ function App() {
           const historyResponse = await getQueryHistory(sessionToken, 20);
           if (historyResponse.success && historyResponse.queries) {
             setChatHistory(historyResponse.queries);
+            setHistoryCursor(historyResponse.next_cursor);
+            setHasMoreHistory(historyResponse.has_more);
           }
         } catch (error) {
           console.error('[CHAT_HISTORY] 초기 로드 실패:', error);
@@ -1204,6 +1206,8 @@ function App() {
               const historyResponse = await getQueryHistory(sessionToken, 20);
               if (historyResponse.success && historyResponse.queries) {
                 setChatHistory(historyResponse.queries);
+                setHistoryCursor(historyResponse.next_cursor);
+                setHasMoreHistory(historyResponse.has_more);
               }
             } catch (error) {
               console.error('[CHAT_HISTORY] 검색 후 재로드 실패:', error);
@@ -1243,8 +1247,6 @@ function App() {
   // 대화기록 닫기
   const handleChatHistoryClose = () => {
     setIsChatHistoryExpanded(false);
-    setChatHistoryPage(1);
-    setHasMoreHistory(true);
   };
 
   // 최근 본 장소 더보기 클릭
@@ -1257,26 +1259,32 @@ function App() {
     setIsRecentPlacesExpanded(false);
   };
 
+  // 대화기록 상세 결과 조회 (목록에는 final_result가 없어 기록을 열 때 단건 조회)
+  const fetchHistoryResult = async (history: QueryHistory) => {
+    const sessionToken = getSessionToken();
+    if (!sessionToken || !user?.id) {
+      throw new Error('로그인 정보가 없습니다');
+    }
+    const entry = await getQueryHistoryEntry(sessionToken, history.id, user.id);
+    return entry.final_result;
+  };
+
   // 추가 대화기록 로드 (Pull-to-refresh)
   const loadMoreChatHistory = async () => {
-    if (isLoadingMoreHistory || !hasMoreHistory) return;
+    if (isLoadingMoreHistory || !hasMoreHistory || !historyCursor) return;
 
     const sessionToken = getSessionToken();
     if (!sessionToken) return;
 
     setIsLoadingMoreHistory(true);
     try {
-      const nextPage = chatHistoryPage + 1;
-      const historyResponse = await getQueryHistory(sessionToken, 20, (nextPage - 1) * 20);
+      const historyResponse = await getQueryHistory(sessionToken, 20, historyCursor);
 
       if (historyResponse.success && historyResponse.queries) {
-        if (historyResponse.queries.length === 0) {
-          setHasMoreHistory(false);
-        } else {
-          // 기존 기록 앞에 추가 (과거 데이터)
-          setChatHistory(prev => [...historyResponse.queries, ...prev]);
-          setChatHistoryPage(nextPage);
-        }
+        // 기존 기록 앞에 추가 (과거 데이터)
+        setChatHistory(prev => [...historyResponse.queries, ...prev]);
+        setHistoryCursor(historyResponse.next_cursor);
+        setHasMoreHistory(historyResponse.has_more);
       } else {
         setHasMoreHistory(false);
       }
@@ -2144,7 +2152,13 @@ function App() {
                             onClick={async () => {
                               // 대화 클릭 시 검색 결과 복원
                               // final_result가 JSON 문자열이면 파싱
-                              let parsedResult = history.final_result;
+                              let parsedResult;
+                              try {
+                                parsedResult = await fetchHistoryResult(history);
+                              } catch (e) {
+                                console.error('[CHAT_HISTORY] 상세 조회 실패:', e);
+                                return;
+                              }
                               if (typeof parsedResult === 'string') {
                                 try {
                                   parsedResult = JSON.parse(parsedResult);
@@ -2731,7 +2745,13 @@ function App() {
                             onClick={async () => {
                               // 더보기 안에서 클릭한 것과 동일한 액션 실행
                               // final_result가 JSON 문자열이면 파싱
-                              let parsedResult = history.final_result;
+                              let parsedResult;
+                              try {
+                                parsedResult = await fetchHistoryResult(history);
+                              } catch (e) {
+                                console.error('[CHAT_HISTORY] 상세 조회 실패:', e);
+                                return;
+                              }
                               if (typeof parsedResult === 'string') {
                                 try {
                                   parsedResult = JSON.parse(parsedResult);
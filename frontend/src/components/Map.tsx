@@ -43,8 +43,8 @@ const Map: React.FC<MapProps> = ({ onMapLoad, onLocationUpdate, onKTOPOIClick, s
   const poiMarkers = useRef<mapboxgl.Marker[]>([]);
   const [isLoaded, setIsLoaded] = useState(false);
 
-  // POI 데이터 로드
-  const { allPOIs, currentZoom } = useMapPOIs(map.current, 14);
+  // 화면 안의 POI 클러스터 + 개별 POI 로드
+  const { visiblePOIs, clusters } = useMapPOIs(map.current, 14);
 
   useEffect(() => {
     if (!mapContainer.current || map.current) return;
@@ -189,14 +189,14 @@ const Map: React.FC<MapProps> = ({ onMapLoad, onLocationUpdate, onKTOPOIClick, s
 
   // POI 데이터를 GeoJSON으로 변환하여 Source 업데이트
   useEffect(() => {
-    if (!map.current || !isLoaded || allPOIs.length === 0) return;
+    if (!map.current || !isLoaded) return;
 
     const mapInstance = map.current;
 
     // GeoJSON FeatureCollection 생성
     const geojson: GeoJSON.FeatureCollection = {
       type: 'FeatureCollection',
-      features: allPOIs.map(poi => ({
+      features: visiblePOIs.map(poi => ({
         type: 'Feature',
         id: poi.content_id,
         geometry: {
@@ -355,7 +355,82 @@ const Map: React.FC<MapProps> = ({ onMapLoad, onLocationUpdate, onKTOPOIClick, s
     } else {
       (mapInstance.getSource('pois') as mapboxgl.GeoJSONSource).setData(geojson);
     }
-  }, [allPOIs, isLoaded, selectedKTOContentId]);
+  }, [visiblePOIs, isLoaded, selectedKTOContentId]);
+
+  // POI 클러스터 (원 + 개수), 클릭 시 클러스터가 펼쳐지는 줌으로 이동
+  useEffect(() => {
+    if (!map.current || !isLoaded) return;
+
+    const mapInstance = map.current;
+
+    const geojson: GeoJSON.FeatureCollection = {
+      type: 'FeatureCollection',
+      features: clusters.map(cluster => ({
+        type: 'Feature',
+        id: cluster.id,
+        geometry: {
+          type: 'Point',
+          coordinates: [cluster.lng, cluster.lat]
+        },
+        properties: {
+          count: cluster.count,
+          expansion_zoom: cluster.expansion_zoom,
+          content_type_id: cluster.content_type_id
+        }
+      }))
+    };
+
+    if (!mapInstance.getSource('poi-clusters')) {
+      mapInstance.addSource('poi-clusters', {
+        type: 'geojson',
+        data: geojson
+      });
+
+      mapInstance.addLayer({
+        id: 'poi-clusters',
+        type: 'circle',
+        source: 'poi-clusters',
+        paint: {
+          'circle-color': '#ffffff',
+          'circle-stroke-color': '#00A86B',
+          'circle-stroke-width': 2,
+          'circle-radius': ['step', ['get', 'count'], 14, 10, 18, 50, 24]
+        }
+      });
+
+      mapInstance.addLayer({
+        id: 'poi-cluster-count',
+        type: 'symbol',
+        source: 'poi-clusters',
+        layout: {
+          'text-field': ['to-string', ['get', 'count']],
+          'text-size': 12,
+          'text-font': ['Open Sans Bold', 'Arial Unicode MS Bold']
+        },
+        paint: {
+          'text-color': '#00A86B'
+        }
+      });
+
+      mapInstance.on('click', 'poi-clusters', (e) => {
+        const feature = e.features?.[0];
+        if (!feature || feature.geometry.type !== 'Point') return;
+        mapInstance.easeTo({
+          center: feature.geometry.coordinates as [number, number],
+          zoom: feature.properties?.expansion_zoom
+        });
+      });
+
+      mapInstance.on('mouseenter', 'poi-clusters', () => {
+        mapInstance.getCanvas().style.cursor = 'pointer';
+      });
+      mapInstance.on('mouseleave', 'poi-clusters', () => {
+        mapInstance.getCanvas().style.cursor = '';
+      });
+    } else {
+      (mapInstance.getSource('poi-clusters') as mapboxgl.GeoJSONSource).setData(geojson);
+    }
+  }, [clusters, isLoaded]);
 
   return (
     <>
@@ -1,97 +1,97 @@
 /**
- * POI T�pt0 \�  D0� Hook
+ * POI 화면(viewport) 로딩 Hook
+ * 지도 이동/줌이 끝날 때마다 화면 안의 클러스터 + 개별 POI만 서버에서 조회
  */
 
-import { useState, useEffect, useMemo } from 'react';
-import { fetchAllPOIsMetadata } from '../services/beatmapApi';
-import type { POIMetadata } from '../services/beatmapApi';
-import type { Map, LngLatBounds } from 'mapbox-gl';
+import { useState, useEffect } from 'react';
+import { fetchViewportPOIs } from '../services/beatmapApi';
+import type { POIMetadata, POICluster } from '../services/beatmapApi';
+import type { Map } from 'mapbox-gl';
+
+// 줌 레벨별 표시할 카테고리 (content_type_id)
+const categoriesForZoom = (zoom: number): string[] => {
+  if (zoom >= 16) {
+    // 줌 16+: 모든 카테고리
+    return ['12', '14', '15', '25', '28', '32', '38', '39'];
+  }
+  if (zoom >= 15) {
+    // 줌 15: 음식점, 쇼핑 제외
+    return ['12', '14', '15', '25', '28', '32'];
+  }
+  if (zoom >= 14) {
+    // 줌 14: 여행코스만
+    return ['25'];
+  }
+  return [];
+};
 
 export const useMapPOIs = (
   map: Map | null,
   minZoom: number = 14
 ) => {
-  const [allPOIs, setAllPOIs] = useState<POIMetadata[]>([]);
+  const [visiblePOIs, setVisiblePOIs] = useState<POIMetadata[]>([]);
+  const [clusters, setClusters] = useState<POICluster[]>([]);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<Error | null>(null);
   const [currentZoom, setCurrentZoom] = useState(12);
-  const [bounds, setBounds] = useState<LngLatBounds | null>(null);
 
-  // 1. q ܑ� � POI T�pt0 \� (1�)
   useEffect(() => {
-    const loadPOIs = async () => {
+    if (!map) return;
+
+    let controller: AbortController | null = null;
+
+    const handleMove = async () => {
+      const zoom = map.getZoom();
+      setCurrentZoom(zoom);
+
+      // 이전 요청 취소 (빠르게 이동할 때 늦게 온 응답이 덮어쓰지 않도록)
+      controller?.abort();
+
+      const categories = categoriesForZoom(zoom);
+      if (zoom < minZoom || categories.length === 0) {
+        setVisiblePOIs([]);
+        setClusters([]);
+        return;
+      }
+
+      const bounds = map.getBounds();
+      if (!bounds) return;
+
+      controller = new AbortController();
       setIsLoading(true);
       try {
-        const pois = await fetchAllPOIsMetadata();
-        setAllPOIs(pois);
+        const result = await fetchViewportPOIs(
+          [bounds.getWest(), bounds.getSouth(), bounds.getEast(), bounds.getNorth()],
+          zoom,
+          categories,
+          controller.signal
+        );
+        setVisiblePOIs(result.points);
+        setClusters(result.clusters);
+        setError(null);
       } catch (err) {
+        if ((err as Error).name === 'CanceledError') return;
         setError(err as Error);
-        console.error('[useMapPOIs] POI \� �(:', err);
+        console.error('[useMapPOIs] POI 로드 실패:', err);
       } finally {
         setIsLoading(false);
       }
     };
 
-    loadPOIs();
-  }, []);
-
-  // 2. �� Zoom/Bounds �� �
-  useEffect(() => {
-    if (!map) return;
-
-    const handleMove = () => {
-      setCurrentZoom(map.getZoom());
-      setBounds(map.getBounds());
-    };
-
-    map.on('zoomend', handleMove);
     map.on('moveend', handleMove);
 
-    // 0 $
+    // 초기 화면
     handleMove();
 
     return () => {
-      map.off('zoomend', handleMove);
+      controller?.abort();
       map.off('moveend', handleMove);
     };
-  }, [map]);
-
-  // 3. 표시할 POI 필터링 (Zoom + BBOX + Category)
-  const visiblePOIs = useMemo(() => {
-    // 줌이 minZoom 미만이면 POI 숨김
-    if (currentZoom < minZoom) {
-      return [];
-    }
-
-    if (!bounds) {
-      return [];
-    }
-
-    // 줌 레벨별 표시할 카테고리 정의
-    let allowedCategories: string[] = [];
-
-    if (currentZoom >= 16) {
-      // 줌 16+: 모든 카테고리
-      allowedCategories = ['12', '14', '15', '25', '28', '32', '38', '39'];
-    } else if (currentZoom >= 15) {
-      // 줌 15: 음식점, 쇼핑 제외
-      allowedCategories = ['12', '14', '15', '25', '28', '32'];
-    } else if (currentZoom >= 14) {
-      // 줌 14: 여행코스만
-      allowedCategories = ['25'];
-    }
-
-    // BBOX 및 카테고리 필터링
-    return allPOIs.filter((poi) => {
-      const inBounds = bounds.contains([poi.lng, poi.lat]);
-      const categoryAllowed = allowedCategories.includes(poi.content_type_id || '');
-      return inBounds && categoryAllowed;
-    });
-  }, [allPOIs, currentZoom, bounds, minZoom]);
+  }, [map, minZoom]);
 
   return {
-    allPOIs,
     visiblePOIs,
+    clusters,
     isLoading,
     error,
     currentZoom,
@@ -309,21 +309,34 @@ export interface QueryHistory {
   result_count: number;
   beaty_response_text: string;
   beaty_response_type: string;
-  final_result: any;
+  final_result?: any;  // 단건 조회(getQueryHistoryEntry)에서만 포함
   created_at: string;
 }
 
 export interface QueryHistoryResponse {
   success: boolean;
   queries: QueryHistory[];
+  next_cursor: string | null;
+  has_more: boolean;
+}
+
+export interface QueryHistoryEntryResponse {
+  success: boolean;
+  query: QueryHistory;
 }
 
 /**
- * 대화기록 조회 (query_logs 테이블에서)
+ * 대화기록 목록 조회 (query_logs 테이블에서, 최신순 cursor 페이지네이션)
  * Note: beaty-service에서 query_logs를 관리하므로 beaty-service로 요청
+ * 목록에는 final_result가 없음 - 기록을 열 때 getQueryHistoryEntry로 조회
  */
-export async function getQueryHistory(sessionToken: string, limit: number = 20, offset: number = 0): Promise<QueryHistoryResponse> {
-  const response = await fetch(`${BEATY_SERVICE_URL}/api/history/queries?limit=${limit}&offset=${offset}`, {
+export async function getQueryHistory(sessionToken: string, limit: number = 20, cursor: string | null = null): Promise<QueryHistoryResponse> {
+  const params = new URLSearchParams({ limit: String(limit) });
+  if (cursor) {
+    params.set('cursor', cursor);
+  }
+
+  const response = await fetch(`${BEATY_SERVICE_URL}/api/history/queries?${params.toString()}`, {
     method: 'GET',
     headers: {
       'Authorization': `Bearer ${sessionToken}`,
@@ -336,3 +349,22 @@ export async function getQueryHistory(sessionToken: string, limit: number = 20,
 
   return await response.json();
 }
+
+/**
+ * 대화기록 단건 조회 (final_result 포함, POI 정보 복원됨)
+ */
+export async function getQueryHistoryEntry(sessionToken: string, queryId: number, userId: number): Promise<QueryHistory> {
+  const response = await fetch(`${BEATY_SERVICE_URL}/api/history/queries/${queryId}?user_id=${userId}`, {
+    method: 'GET',
+    headers: {
+      'Authorization': `Bearer ${sessionToken}`,
+    },
+  });
+
+  if (!response.ok) {
+    throw new Error(`Get query history entry failed: ${response.statusText}`);
+  }
+
+  const data: QueryHistoryEntryResponse = await response.json();
+  return data.query;
+}
@@ -20,6 +20,22 @@ export interface POIMetadata {
   first_image?: string | null;
 }
 
+export interface POICluster {
+  id: number;
+  lat: number;
+  lng: number;
+  count: number;
+  content_type_id: string;
+  expansion_zoom: number;
+}
+
+export interface ViewportPOIs {
+  version: number;
+  zoom: number;
+  clusters: POICluster[];
+  points: POIMetadata[];
+}
+
 export interface POIDetail extends POIMetadata {
   overview?: string;
 }
@@ -38,6 +54,27 @@ export const fetchAllPOIsMetadata = async (): Promise<POIMetadata[]> => {
   }
 };
 
+/**
+ * 화면(bbox) 안의 POI 클러스터 + 개별 POI 조회
+ * 지도 이동/줌 종료 시 호출 (응답 크기가 화면 크기에 비례)
+ */
+export const fetchViewportPOIs = async (
+  bounds: [number, number, number, number],
+  zoom: number,
+  categories: string[],
+  signal?: AbortSignal
+): Promise<ViewportPOIs> => {
+  const response = await axios.get<ViewportPOIs>(`${POI_API_URL}/api/kto/viewport`, {
+    params: {
+      bbox: bounds.map((value) => value.toFixed(6)).join(','),
+      zoom: zoom.toFixed(2),
+      categories: categories.join(','),
+    },
+    signal,
+  });
+  return response.data;
+};
+
 /**
  * 개별 POI 상세 정보 조회
  * 필요할 때만 호출
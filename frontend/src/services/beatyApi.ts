@@ -46,7 +46,14 @@ export interface SSEErrorEvent {
   message: string;
 }
 
-export type SSEEvent = SSEDataEvent | SSEChunkEvent | SSEDoneEvent | SSEErrorEvent;
+// 서버 혼잡 (대기열 시간 초과) - retry_after초 후 재시도 권장
+export interface SSEBusyEvent {
+  type: 'busy';
+  message: string;
+  retry_after: number;
+}
+
+export type SSEEvent = SSEDataEvent | SSEChunkEvent | SSEDoneEvent | SSEErrorEvent | SSEBusyEvent;
 
 // SSE 콜백 인터페이스
 export interface BeatyStreamCallbacks {
@@ -88,7 +95,12 @@ export const queryBeatyStream = async (
         method: 'POST',
         headers,
         body
-      }).then(response => {
+      }).then(async response => {
+        if (response.status === 503) {
+          // 서버 혼잡 (부하 차단) - 안내 문구 전달
+          const busy = await response.json().catch(() => null);
+          throw new Error(busy?.detail || `HTTP error! status: ${response.status}`);
+        }
         if (!response.ok) {
           throw new Error(`HTTP error! status: ${response.status}`);
         }
@@ -141,6 +153,11 @@ export const queryBeatyStream = async (
                         callbacks.onError?.(event.message);
                         reject(new Error(event.message));
                         return;
+                      case 'busy':
+                        console.log('[beatyApi] Server busy, retry after', event.retry_after);
+                        callbacks.onError?.(event.message);
+                        reject(new Error(event.message));
+                        return;
                     }
                   } catch (parseError) {
                     console.error('Failed to parse SSE event:', jsonStr, parseError);
@@ -5,21 +5,18 @@ Beaty Service - TripBee AI 캐릭터 서비스
 """
 
 import json
-import httpx
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from fastapi import FastAPI, HTTPException, Body, Header
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from openai import OpenAI
 from dotenv import load_dotenv
 import os
 import asyncio
 import uuid
 from datetime import datetime
-import asyncpg
 
 # 로깅 설정
 logging.basicConfig(
@@ -33,11 +30,33 @@ logger = logging.getLogger(__name__)
 from orchestration.intent_classifier import IntentClassifier
 from orchestration.geocoder import GoogleGeocoder
 from orchestration.session_memory import memory_manager
+from orchestration.result_state import ResultState, RESULT_ITEM_KEYS
 from orchestration.gpt_streaming import stream_gpt_response
+from orchestration.http_clients import http_clients
+from orchestration.db import create_db_pool
+from orchestration.query_history import (
+    fetch_history_page, fetch_history_entry, ensure_indexes as ensure_history_indexes, InvalidHistoryRequest
+)
+from orchestration.query_log import compact_final_response, rehydrate_final_results
+from orchestration.prompt_cache import prompt_cache
+from orchestration.components import ComponentContainer
+from orchestration.llm_scheduler import LLMScheduler
+from orchestration.loop_monitor import loop_monitor
+from orchestration.admission import admission, AdmissionRejected
+from orchestration import usage_ledger
+from orchestration.usage_ledger import start_ledger, usage_metrics
+from orchestration.answer_cache import answer_cache, replay_answer
+from orchestration.answer_policy import answer_policy
 from utils.weather_client import WeatherClient
 
 load_dotenv()
 
+# 캐릭터 프롬프트 파일이 없을 때 사용하는 기본 프롬프트
+DEFAULT_CHARACTER_PROMPT = "당신은 Beaty라는 친절한 여행 도우미입니다. 항상 존댓말을 사용하고 밝은 어조로 대화합니다."
+
+# 부하 차단 시 안내 문구 (503 응답 / SSE busy 이벤트)
+BUSY_MESSAGE = "지금 찾는 분들이 많아서 조금 바빠요! 잠시 후에 다시 물어봐주세요."
+
 # =====================================================================================
 # REQUEST/RESPONSE MODELS
 # =====================================================================================
@@ -103,17 +122,10 @@ class BeatyService:
                 "password": os.getenv("DB_PASSWORD", "UsXp4ijCnWw@$eJ")
             }
 
-        self.client = OpenAI(api_key=self.openai_api_key)
+        self.llm = LLMScheduler(self.openai_api_key)  # 모든 LLM 호출은 스케줄러 경유 (우선순위/동시성/레이트리밋)
 
-        # Load character prompt for final response generation
-        character_prompt_path = Path(__file__).parent / "orchestration" / "beaty_character_prompt.txt"
-        try:
-            with open(character_prompt_path, "r", encoding="utf-8") as f:
-                self.character_prompt = f.read()
-            logger.info(f"[BEATY_SERVICE] Character prompt loaded from {character_prompt_path}")
-        except Exception as e:
-            logger.warning(f"[BEATY_SERVICE] Warning: Could not load character prompt: {e}")
-            self.character_prompt = "당신은 Beaty라는 친절한 여행 도우미입니다. 항상 존댓말을 사용하고 밝은 어조로 대화합니다."
+        # Character prompt for final response generation (prompt_cache로 파일 수정 시 자동 반영)
+        self.character_prompt_path = Path(__file__).parent / "orchestration" / "beaty_character_prompt.txt"
 
         # Store config for pipelines
         self.config = {
@@ -123,9 +135,17 @@ class BeatyService:
         }
 
         # Initialize internal modules
-        self.intent_classifier = IntentClassifier(self.openai_api_key, self.db_config)
+        self.intent_classifier = IntentClassifier(self.openai_api_key, self.db_config, llm=self.llm)
         self.google_geocoder = GoogleGeocoder(self.google_api_key)  # ROUTE용 Google Geocoding API
         self.weather_client = WeatherClient(self.weather_api_key)  # 기상청 날씨 API
+        self.http_clients = http_clients  # 서비스 간/외부 API 공유 HTTP 클라이언트
+        self.db_pool = None  # startup에서 생성 (asyncpg 커넥션 풀)
+        self.components = None  # startup에서 생성 (공유 컴포넌트 + 파이프라인 레지스트리)
+
+    @property
+    def character_prompt(self) -> str:
+        """Beaty 캐릭터 프롬프트"""
+        return prompt_cache.get(self.character_prompt_path, DEFAULT_CHARACTER_PROMPT)
 
 
 
@@ -152,9 +172,26 @@ def create_app() -> FastAPI:
     async def startup_event():
         """서비스 시작 시 비동기 초기화"""
         logger.info("[BEATY_SERVICE] 초기화 시작...")
+        service.db_pool = await create_db_pool(service.db_config)
         await service.intent_classifier.initialize()
+        service.components = ComponentContainer(service)
+        await service.google_geocoder.initialize(service.db_pool)
+        await ensure_history_indexes(service.db_pool)
+        await usage_ledger.ensure_usage_column(service.db_pool)
+        service.weather_client.start_refresher()
+        loop_monitor.start()
         logger.info("[BEATY_SERVICE] 초기화 완료!")
 
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """서비스 종료 시 백그라운드 작업, 공유 HTTP/LLM 클라이언트, DB 풀 정리"""
+        await service.weather_client.stop_refresher()
+        await loop_monitor.stop()
+        await service.http_clients.aclose()
+        await service.llm.aclose()
+        if service.db_pool:
+            await service.db_pool.close()
+
     @app.get("/", response_class=HTMLResponse)
     async def root():
         """테스트 UI 페이지 제공"""
@@ -182,6 +219,9 @@ def create_app() -> FastAPI:
     ):
         """SSE 이벤트 생성기"""
         try:
+            # 요청별 LLM 사용량 장부 (스케줄러가 이 컨텍스트에서 호출될 때마다 기록)
+            ledger = start_ledger()
+
             if not query:
                 error_event = {"type": "error", "message": "query is required"}
                 yield f"data: {json.dumps(error_event, ensure_ascii=False)}\n\n"
@@ -197,22 +237,23 @@ def create_app() -> FastAPI:
                 logger.info(f"[API/QUERY] Session token: {session_token[:20]}...")
                 try:
                     # privacy-service에 session_token으로 user 정보 조회
-                    async with httpx.AsyncClient() as client:
-                        response = await client.get(
-                            "http://localhost:8100/api/auth/me",
-                            headers={"Authorization": f"Bearer {session_token}"}
-                        )
-                        logger.info(f"[API/QUERY] Privacy service 응답 코드: {response.status_code}")
-                        if response.status_code == 200:
-                            response_data = response.json()
-                            logger.info(f"[API/QUERY] Privacy service 응답 데이터: {response_data}")
-                            user_data = response_data.get("user", {})
-                            user_id = user_data.get("id")
-                            session_id_str = response_data.get("session_id")
-                            session_id = int(session_id_str) if session_id_str else None  # 문자열 → 정수 변환
-                            logger.info(f"[API/QUERY] 인증된 사용자: user_id={user_id}, session_id={session_id} (type={type(session_id)})")
-                        else:
-                            logger.warning(f"[API/QUERY] Privacy service 응답: {response.text}")
+                    privacy_url = "http://localhost:8100/api/auth/me"
+                    client = service.http_clients.get(privacy_url)
+                    response = await client.get(
+                        privacy_url,
+                        headers={"Authorization": f"Bearer {session_token}"}
+                    )
+                    logger.info(f"[API/QUERY] Privacy service 응답 코드: {response.status_code}")
+                    if response.status_code == 200:
+                        response_data = response.json()
+                        logger.info(f"[API/QUERY] Privacy service 응답 데이터: {response_data}")
+                        user_data = response_data.get("user", {})
+                        user_id = user_data.get("id")
+                        session_id_str = response_data.get("session_id")
+                        session_id = int(session_id_str) if session_id_str else None  # 문자열 → 정수 변환
+                        logger.info(f"[API/QUERY] 인증된 사용자: user_id={user_id}, session_id={session_id} (type={type(session_id)})")
+                    else:
+                        logger.warning(f"[API/QUERY] Privacy service 응답: {response.text}")
                 except Exception as e:
                     logger.warning(f"[API/QUERY] 사용자 인증 실패 (무시): {e}")
                     import traceback
@@ -233,10 +274,22 @@ def create_app() -> FastAPI:
             # 대화 맥락 가져오기 (최근 5개)
             context_messages = session_memory.get_context(last_n=5)
 
-            # Step 1: 의도분류 (대화 맥락 포함)
-            classification = service.intent_classifier.classify(query, context_messages)
+            # 직전 검색 결과 (후속 질의 REFINE 판단/처리용)
+            result_state = session_memory.result_state
+
+            # Step 1: 의도분류 (대화 맥락 + 직전 결과 요약 포함)
+            classification = await service.intent_classifier.classify(
+                query, context_messages,
+                result_hint=result_state.hint() if result_state else None
+            )
             intent = classification.get("intent", "RECOMMEND")
 
+            # 다듬을 직전 결과가 없으면 새 추천으로 처리
+            if intent == "REFINE" and result_state is None:
+                logger.info(f"[API/QUERY] REFINE 대상 결과 없음 → RECOMMEND")
+                intent = "RECOMMEND"
+                classification["intent"] = intent
+
             steps.append({
                 "step": 1,
                 "name": "의도분류",
@@ -245,37 +298,39 @@ def create_app() -> FastAPI:
             logger.info(f"[API/QUERY] Step 1 완료: intent={intent}")
 
             # Step 2~N: 의도별 파이프라인 실행
-            if intent == "ROUTE":
-                from pipelines.route.pipeline import execute
-                pipeline_result = await execute(service, query, classification, user_location_dict, steps)
-
-            elif intent == "FIND_PLACE":
-                from pipelines.google.pipeline import execute
-                pipeline_result = await execute(service, query, classification, user_location_dict, steps)
-
-            elif intent == "RECOMMEND":
-                from pipelines.recommend.pipeline import execute
-                pipeline_result = await execute(service, query, classification, user_location_dict, steps)
+            execute = service.components.get_pipeline(intent)
+            if intent == "REFINE":
+                pipeline_result = await execute(service, query, classification, user_location_dict, steps, result_state=result_state)
 
-            elif intent == "LANDMARK":
-                from pipelines.landmark.pipeline import execute
-                pipeline_result = await execute(service, query, classification, user_location_dict, steps)
-
-            elif intent == "RANDOM":
-                from pipelines.randompoi.pipeline import execute
+            elif execute:
                 pipeline_result = await execute(service, query, classification, user_location_dict, steps)
 
             else:
                 # GENERAL_CHAT 등 기타 의도 - GPT-4 mini가 직접 대화 (대화 맥락 포함, 스트리밍)
                 try:
-                    # 대화 맥락을 포함한 메시지 구성
-                    messages = [{"role": "system", "content": service.character_prompt}]
-                    messages.extend(context_messages)  # 기존 대화 추가
-                    messages.append({"role": "user", "content": query})
-
-                    # 스트리밍 응답 생성
-                    from orchestration.response_generator import create_streaming_response_with_messages
-                    answer_stream = create_streaming_response_with_messages(service, messages)
+                    # 맥락 없는 잡담은 답변 캐시 사용 (폴백 분류(confidence 0)는 제외)
+                    cache_key = None
+                    cached_answer = None
+                    if intent == "GENERAL_CHAT" and classification.get("confidence", 0) > 0:
+                        cache_key = answer_cache.make_key(query, context_messages, service.character_prompt)
+                        if cache_key:
+                            cached_answer = await answer_cache.get(cache_key, service.llm)
+
+                    if cached_answer:
+                        logger.info(f"[ANSWER_CACHE] 캐시 답변 사용: '{cache_key.text}'")
+                        answer_stream = replay_answer(cached_answer)
+                    else:
+                        # 대화 맥락을 포함한 메시지 구성 (캐시 대상 잡담은 맥락 없이 생성해야 재사용 가능)
+                        messages = [{"role": "system", "content": service.character_prompt}]
+                        if not cache_key:
+                            messages.extend(context_messages)  # 기존 대화 추가
+                        messages.append({"role": "user", "content": query})
+
+                        # 스트리밍 응답 생성
+                        from orchestration.response_generator import create_streaming_response_with_messages
+                        answer_stream = create_streaming_response_with_messages(service, messages)
+                        if cache_key:
+                            answer_stream = answer_cache.capture(cache_key, answer_stream)
 
                     pipeline_result = {
                         "intent": intent,
@@ -299,6 +354,12 @@ def create_app() -> FastAPI:
                         }
                     }
 
+            # 새 검색 결과면 세션 결과 상태 교체 (REFINE 결과는 기존 상태를 이미 갱신함, 기타 의도는 유지)
+            if "refined" not in pipeline_result["final_response"] and pipeline_result["intent"] in RESULT_ITEM_KEYS:
+                session_memory.set_result_state(ResultState.from_pipeline_result(
+                    query, classification, pipeline_result, user_location_dict
+                ))
+
             logger.info(f"[API/QUERY] 파이프라인 완료: {len(pipeline_result['steps'])}개 단계")
             logger.info(f"{'='*60}\n")
 
@@ -360,13 +421,29 @@ def create_app() -> FastAPI:
                 session_memory.add_message("assistant", answer)
                 logger.info(f"[MEMORY] 대화 저장 완료 (session: {memory_session_id})")
 
-            # Final Event: done
+            # LLM 사용량 장부 마감 (스트리밍 답변까지 포함) → steps 디버그 출력 + 의도별 누적 지표
+            usage_summary = ledger.summary()
+            usage_metrics.add_request(pipeline_result["intent"], ledger)
+            pipeline_result["steps"].append({
+                "step": "usage",
+                "name": "LLM 사용량",
+                "result": usage_summary
+            })
+            logger.info(
+                f"[USAGE] {usage_summary['totals']['calls']}회 호출, "
+                f"{usage_summary['totals']['prompt_tokens']}+{usage_summary['totals']['completion_tokens']} 토큰, "
+                f"${usage_summary['totals']['cost_usd']:.6f}"
+            )
+
+            # Final Event: done (테스트 모드는 사용량 포함 - data 이벤트 이후 스트리밍 답변까지 집계)
             done_event = {"type": "done"}
+            if mode == "test":
+                done_event["usage"] = usage_summary
             yield f"data: {json.dumps(done_event, ensure_ascii=False)}\n\n"
             logger.info(f"[SSE] done 이벤트 전송 완료")
 
             # 백그라운드 로그 저장 (answer_stream 제외)
-            response_time_ms = len(pipeline_result['steps']) * 100
+            response_time_ms = int(usage_summary["totals"]["request_ms"])
 
             # answer_stream을 제외한 final_response 복사
             final_response_for_log = {k: v for k, v in final_response.items() if k != 'answer_stream'}
@@ -379,9 +456,10 @@ def create_app() -> FastAPI:
                     pipeline_steps=pipeline_result["steps"],
                     final_response=final_response_for_log,
                     response_time_ms=response_time_ms,
-                    db_config=service.db_config,
+                    db_pool=service.db_pool,
                     user_id=user_id,
-                    session_id=session_id
+                    session_id=session_id,
+                    llm_usage=usage_summary
                 )
             )
 
@@ -395,6 +473,22 @@ def create_app() -> FastAPI:
             }
             yield f"data: {json.dumps(error_event, ensure_ascii=False)}\n\n"
 
+    async def admitted_event_generator(
+        query: str,
+        user_location_dict: Optional[Dict],
+        mode: str,
+        authorization: Optional[str]
+    ):
+        """처리 슬롯을 받은 뒤 SSE 이벤트 생성 (대기 시간 초과 시 busy 이벤트)"""
+        try:
+            async with admission.slot():
+                async for event in query_event_generator(query, user_location_dict, mode, authorization):
+                    yield event
+        except AdmissionRejected as e:
+            logger.warning(f"[ADMISSION] 대기 시간 초과 ({e.reason}, retry_after={e.retry_after}s)")
+            busy_event = {"type": "busy", "message": BUSY_MESSAGE, "retry_after": e.retry_after}
+            yield f"data: {json.dumps(busy_event, ensure_ascii=False)}\n\n"
+
     @app.post("/api/query")
     async def process_query(request: BeatyRequest, authorization: Optional[str] = Header(None)):
         """
@@ -428,8 +522,18 @@ def create_app() -> FastAPI:
         if request.user_location:
             user_location_dict = {"lat": request.user_location.lat, "lng": request.user_location.lng}
 
+        # 부하 차단: 대기열이 가득 찼거나 예상 대기가 길면 응답 시작 전에 503
+        rejection = admission.check()
+        if rejection:
+            logger.warning(f"[ADMISSION] 거절 ({rejection.reason}, retry_after={rejection.retry_after}s)")
+            return JSONResponse(
+                status_code=503,
+                content={"detail": BUSY_MESSAGE, "reason": rejection.reason, "retry_after": rejection.retry_after},
+                headers={"Retry-After": str(rejection.retry_after)}
+            )
+
         return StreamingResponse(
-            query_event_generator(query_text, user_location_dict, request.mode, authorization),
+            admitted_event_generator(query_text, user_location_dict, request.mode, authorization),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache",
@@ -484,7 +588,7 @@ def create_app() -> FastAPI:
             if lat is not None and lng is not None:
                 user_location_dict = {"lat": lat, "lng": lng}
 
-            from pipelines.randompoi.pipeline import execute
+            execute = service.components.get_pipeline("RANDOM")
             pipeline_result = await execute(service, "랜덤 추천", classification, user_location_dict, steps, session_token)
 
             if pipeline_result["final_response"].get("poi"):
@@ -507,14 +611,23 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=500, detail=str(e))
 
     @app.get("/api/history/queries")
-    async def get_query_history(limit: int = 20, offset: int = 0, user_id: Optional[int] = None):
+    async def get_query_history(
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None,
+        user_id: Optional[int] = None,
+        offset: int = 0
+    ):
         """
-        사용자의 대화기록 조회 (query_logs 테이블에서)
+        사용자의 대화기록 조회 (query_logs 테이블에서, 최신순 키셋 페이지네이션)
 
         Query Parameters:
-            limit: 최대 개수 (기본 20개)
-            offset: 건너뛸 개수 (기본 0개) - pagination용
+            limit: 최대 개수 (기본 20개, 최대 100개)
+            cursor: 이전 응답의 next_cursor (없으면 첫 페이지)
+            fields: 반환 컬럼 (콤마 구분). 기본은 경량 컬럼만,
+                    "final_result" 등 무거운 컬럼은 명시적으로 요청해야 포함 (압축 참조 그대로, 복원은 단건 API)
             user_id: 사용자 ID (향후 JWT에서 추출)
+            offset: (deprecated) cursor를 쓰지 않는 기존 클라이언트 호환용
 
         Response:
             {
@@ -526,84 +639,89 @@ def create_app() -> FastAPI:
                         "intent": "ROUTE",
                         "result_count": 5,
                         "beaty_response_text": "...",
-                        "final_result": {...},
+                        "beaty_response_type": "route",
                         "created_at": "2025-01-15T10:30:00"
                     },
                     ...
-                ]
+                ],
+                "next_cursor": "WyIyMDI1LTAxLTE1VDEwOjMwOjAwIiwgMV0",
+                "has_more": true
             }
         """
+        if not service.db_pool:
+            raise HTTPException(status_code=503, detail="DB 연결을 사용할 수 없습니다")
+
         try:
-            logger.info(f"[BEATY/HISTORY] 대화기록 조회: user_id={user_id}, limit={limit}, offset={offset}")
-
-            # DB 연결 (SSL 필요)
-            import ssl
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-            conn = await asyncpg.connect(
-                host=service.db_config["host"],
-                port=service.db_config["port"],
-                database=service.db_config["database"],
-                user=service.db_config["user"],
-                password=service.db_config["password"],
-                ssl=ssl_context
+            logger.info(f"[BEATY/HISTORY] 대화기록 조회: user_id={user_id}, limit={limit}, cursor={cursor}, fields={fields}")
+
+            page = await fetch_history_page(
+                service.db_pool,
+                user_id=user_id,
+                limit=limit,
+                cursor=cursor,
+                fields=fields,
+                offset=offset
             )
 
-            # Query 실행
-            if user_id:
-                query_sql = """
-                    SELECT id, query_text, intent, result_count,
-                           beaty_response_text, beaty_response_type,
-                           final_result, created_at
-                    FROM query_logs
-                    WHERE user_id = $1
-                    ORDER BY created_at DESC
-                    LIMIT $2 OFFSET $3
-                """
-                rows = await conn.fetch(query_sql, user_id, limit, offset)
-            else:
-                # user_id가 없으면 전체 조회 (테스트용)
-                query_sql = """
-                    SELECT id, query_text, intent, result_count,
-                           beaty_response_text, beaty_response_type,
-                           final_result, created_at
-                    FROM query_logs
-                    ORDER BY created_at DESC
-                    LIMIT $1 OFFSET $2
-                """
-                rows = await conn.fetch(query_sql, limit, offset)
-
-            await conn.close()
-
-            # 결과 포맷팅
-            queries = []
-            for row in rows:
-                queries.append({
-                    "id": row["id"],
-                    "query_text": row["query_text"],
-                    "intent": row["intent"],
-                    "result_count": row["result_count"],
-                    "beaty_response_text": row["beaty_response_text"],
-                    "beaty_response_type": row["beaty_response_type"],
-                    "final_result": row["final_result"],
-                    "created_at": row["created_at"].isoformat() if row["created_at"] else None
-                })
-
-            logger.info(f"[BEATY/HISTORY] 완료: {len(queries)}개 조회")
+            # final_result는 압축 참조 그대로 반환 (POI 상세 복원은 기록을 열 때 단건 API에서)
+
+            logger.info(f"[BEATY/HISTORY] 완료: {len(page['queries'])}개 조회 (has_more={page['has_more']})")
 
             return {
                 "success": True,
-                "queries": queries
+                **page
             }
 
+        except InvalidHistoryRequest as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             logger.error(f"[BEATY/HISTORY] 오류: {e}")
             import traceback
             traceback.print_exc()
             raise HTTPException(status_code=500, detail=str(e))
 
+    @app.get("/api/history/queries/{query_id}")
+    async def get_query_history_entry(query_id: int, user_id: int):
+        """
+        대화기록 단건 상세 조회 (final_result 등 전체 결과 포함)
+
+        목록 API는 무거운 JSONB를 제외하므로, 기록을 열 때 이 API로 전체 결과를 가져옴
+        user_id 필수 - 해당 사용자의 기록이 아니면 404
+
+        Response:
+            {
+                "success": true,
+                "query": {
+                    "id": 1,
+                    "query_text": "...",
+                    "intent": "ROUTE",
+                    ...
+                    "final_result": {...},
+                    "intent_result": {...},
+                    "pipeline_steps": [...],
+                    "created_at": "2025-01-15T10:30:00"
+                }
+            }
+        """
+        if not service.db_pool:
+            raise HTTPException(status_code=503, detail="DB 연결을 사용할 수 없습니다")
+
+        try:
+            entry = await fetch_history_entry(service.db_pool, query_id, user_id)
+            if entry:
+                entry["final_result"] = (await rehydrate_final_results([entry["final_result"]]))[0]
+        except Exception as e:
+            logger.error(f"[BEATY/HISTORY] 상세 조회 오류: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+        if not entry:
+            raise HTTPException(status_code=404, detail=f"대화기록을 찾을 수 없습니다: {query_id}")
+
+        return {
+            "success": True,
+            "query": entry
+        }
+
     @app.get("/api/weather")
     async def get_weather():
         """
@@ -619,7 +737,7 @@ def create_app() -> FastAPI:
             }
         """
         try:
-            weather = service.weather_client.get_current_weather()
+            weather = await service.weather_client.get_current_weather()
             if weather:
                 return weather
             else:
@@ -653,7 +771,7 @@ def create_app() -> FastAPI:
             }
         """
         try:
-            weather_detail = service.weather_client.get_detailed_weather()
+            weather_detail = await service.weather_client.get_detailed_weather()
             if weather_detail:
                 return weather_detail
             else:
@@ -662,6 +780,32 @@ def create_app() -> FastAPI:
             logger.error(f"[WEATHER_DETAILED] 오류: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    @app.get("/api/llm/stats")
+    async def get_llm_stats():
+        """LLM 스케줄러 상태 (우선순위별 실행/대기 수, 재시도, 레이트리밋 잔량, 부하) + 잡담 답변 캐시 적중률 + 답변 정책 모드별 횟수"""
+        return {**service.llm.stats(), "answer_cache": answer_cache.stats(), "answer_policy": answer_policy.stats()}
+
+    @app.get("/api/metrics/llm-usage")
+    async def get_llm_usage(reset: bool = False):
+        """의도별/단계별 누적 LLM 토큰, 비용, 지연 (reset=true면 조회 후 초기화)"""
+        snapshot = usage_metrics.snapshot()
+        if reset:
+            usage_metrics.reset()
+        return snapshot
+
+    @app.get("/api/runtime/admission")
+    async def get_admission_stats():
+        """요청 처리 슬롯 상태 (처리 중/대기 수, 거절 수, 예상 대기, 성능 저하 단계)"""
+        return admission.stats()
+
+    @app.get("/api/runtime/loop-lag")
+    async def get_loop_lag(reset: bool = False):
+        """이벤트 루프 지연 백분위 (reset=true면 조회 후 샘플 초기화 - 부하 테스트 구간 측정용)"""
+        snapshot = loop_monitor.snapshot()
+        if reset:
+            loop_monitor.reset()
+        return snapshot
+
     @app.get("/health")
     async def health():
         return {"status": "healthy", "character": "Beaty"}
@@ -679,30 +823,22 @@ async def save_query_log(
     pipeline_steps: List[Dict[str, Any]],
     final_response: Dict[str, Any],
     response_time_ms: int,
-    db_config: Dict[str, str],
+    db_pool,
     user_id: Optional[int] = None,
-    session_id: Optional[str] = None
+    session_id: Optional[str] = None,
+    llm_usage: Optional[Dict[str, Any]] = None
 ):
     """
     Query 로그를 DB에 비동기로 저장
     - 백그라운드에서 실행되어 응답 속도에 영향 없음
     - 실패해도 메인 파이프라인에 영향 없음
+    - final_result는 엔티티 참조만 남긴 압축 형식으로 저장 (조회 시 query_log.rehydrate_final_results로 복원)
+    - llm_usage는 query_logs.llm_usage 컬럼이 준비된 경우에만 저장 (usage_ledger.ensure_usage_column)
     """
     try:
-        # DB 연결 (SSL 필요)
-        import ssl
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
-        conn = await asyncpg.connect(
-            host=db_config["host"],
-            port=db_config["port"],
-            database=db_config["database"],
-            user=db_config["user"],
-            password=db_config["password"],
-            ssl=ssl_context
-        )
+        if not db_pool:
+            logger.warning("[QUERY_LOG] DB 풀 없음 - 저장 생략")
+            return
 
         # 파이프라인 이름 추출
         pipeline_name = intent.lower()  # "FIND_PLACE" -> "findplace"
@@ -749,43 +885,55 @@ async def save_query_log(
                     step_meta["place_ids"] = [poi.get("content_id") for poi in result["pois"] if poi.get("content_id")]
                 elif "places" in result:
                     step_meta["place_ids"] = [p.get("place_id") for p in result["places"] if p.get("place_id")]
+                elif step.get("step") == "usage":
+                    step_meta["usage"] = result["totals"]  # 호출별 상세는 llm_usage 컬럼
 
             pipeline_metadata.append(step_meta)
 
+        # llm_usage 컬럼이 있으면 함께 저장
+        usage_column = ""
+        usage_param = ""
+        usage_values = []
+        if llm_usage is not None and usage_ledger.usage_column_ready:
+            usage_column = ", llm_usage"
+            usage_param = ", $16"
+            usage_values = [json.dumps(llm_usage)]
+
         # INSERT
-        await conn.execute("""
-            INSERT INTO query_logs (
-                user_id, session_id, query_text,
-                intent, location_keyword, category_text, emotion_keywords,
-                pipeline, result_count, response_time_ms,
-                beaty_response_text, beaty_response_type,
-                intent_result, pipeline_steps, final_result
-            ) VALUES (
-                $1, $2, $3,
-                $4, $5, $6, $7,
-                $8, $9, $10,
-                $11, $12,
-                $13, $14, $15
+        async with db_pool.acquire() as conn:
+            await conn.execute(f"""
+                INSERT INTO query_logs (
+                    user_id, session_id, query_text,
+                    intent, location_keyword, category_text, emotion_keywords,
+                    pipeline, result_count, response_time_ms,
+                    beaty_response_text, beaty_response_type,
+                    intent_result, pipeline_steps, final_result{usage_column}
+                ) VALUES (
+                    $1, $2, $3,
+                    $4, $5, $6, $7,
+                    $8, $9, $10,
+                    $11, $12,
+                    $13, $14, $15{usage_param}
+                )
+            """,
+                user_id,
+                session_id,  # user_sessions.id (integer)
+                query_text,
+                intent,
+                location_keyword,
+                category_text,
+                emotion_keywords,
+                pipeline_name,
+                result_count,
+                response_time_ms,
+                beaty_response_text,
+                beaty_response_type,
+                json.dumps(intent_result),  # JSONB
+                json.dumps(pipeline_metadata),  # JSONB
+                json.dumps(compact_final_response(final_response, intent_result)),  # JSONB (압축)
+                *usage_values  # JSONB (llm_usage)
             )
-        """,
-            user_id,
-            session_id,  # user_sessions.id (integer)
-            query_text,
-            intent,
-            location_keyword,
-            category_text,
-            emotion_keywords,
-            pipeline_name,
-            result_count,
-            response_time_ms,
-            beaty_response_text,
-            beaty_response_type,
-            json.dumps(intent_result),  # JSONB
-            json.dumps(pipeline_metadata),  # JSONB
-            json.dumps(final_response)  # JSONB
-        )
 
-        await conn.close()
         logger.info(f"[QUERY_LOG] 저장 완료: query='{query_text[:30]}...', intent={intent}, result_count={result_count}")
 
     except Exception as e:
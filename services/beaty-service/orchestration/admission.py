@@ -0,0 +1,206 @@
+"""
+Admission Control - /api/query 동시 처리 제한 + 부하 차단
+- 동시 처리 상한 + 제한된 대기열 (FIFO)
+- 예상 대기 시간이 길거나 대기열이 가득 차면 즉시 거절 (503 + Retry-After)
+- 대기열에서 오래 기다리면 거절 (SSE busy 이벤트)
+- 대기열이 길어질수록 단계적 성능 저하: POI 설명 생략 → Vector 대안 검색 생략 → 템플릿 답변
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejected(Exception):
+    """처리 거절 (reason: queue_full / estimated_wait / queue_timeout)"""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"admission rejected: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class Degradation:
+    """현재 성능 저하 단계 (0: 정상)"""
+    level: int
+
+    @property
+    def skip_descriptions(self) -> bool:
+        """RECOMMEND POI별 LLM 설명 생략 (기본 문구 사용)"""
+        return self.level >= 1
+
+    @property
+    def skip_vector_fallback(self) -> bool:
+        """RECOMMEND 키워드 매칭 실패 시 Vector 유사도 대안 검색 생략 (카테고리 결과 사용)"""
+        return self.level >= 2
+
+    @property
+    def template_answers(self) -> bool:
+        """최종 답변 템플릿만 사용 (LLM 호출 없음)"""
+        return self.level >= 3
+
+
+def parse_thresholds(value: str) -> Tuple[float, ...]:
+    """'0.8,1.0,1.25' → (0.8, 1.0, 1.25)"""
+    return tuple(sorted(float(part) for part in value.split(",") if part.strip()))
+
+
+class AdmissionController:
+    """요청 처리 슬롯 관리"""
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        max_queue: int = 64,
+        max_queue_wait: float = 5.0,
+        degrade_thresholds: Tuple[float, ...] = (0.8, 1.0, 1.25)
+    ):
+        """
+        Args:
+            max_concurrency: 동시에 처리할 요청 수
+            max_queue: 대기열 최대 길이
+            max_queue_wait: 대기열 최대 대기 시간(초) - 예상 대기가 이보다 길면 즉시 거절
+            degrade_thresholds: 성능 저하 1/2/3단계 기준 ((처리 중 + 대기) / 동시 처리 상한)
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_queue_wait = max_queue_wait
+        self.degrade_thresholds = degrade_thresholds
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._service_time = 2.0  # 요청당 처리 시간 EWMA(초), 첫 관측 전 기본값
+        self._stats = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected_queue_full": 0,
+            "rejected_estimated_wait": 0,
+            "rejected_queue_timeout": 0,
+            "queue_wait_total_ms": 0.0,
+        }
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for future in self._waiters if not future.done())
+
+    def load(self) -> float:
+        """(처리 중 + 대기) / 동시 처리 상한"""
+        return (self.in_flight + self.queued) / self.max_concurrency
+
+    def degradation(self) -> Degradation:
+        load = self.load()
+        return Degradation(sum(1 for threshold in self.degrade_thresholds if load >= threshold))
+
+    def estimated_wait(self) -> float:
+        """지금 대기열에 들어가면 슬롯을 받기까지 예상 시간(초)"""
+        if self.in_flight < self.max_concurrency and not self.queued:
+            return 0.0
+        # 앞선 대기 요청 + 나를 처리하려면 (대기 수 + 1) / 동시 처리 상한 만큼의 처리 주기가 필요
+        return (self.queued + 1) / self.max_concurrency * self._service_time
+
+    def _retry_after(self) -> int:
+        return max(1, math.ceil(self.estimated_wait()))
+
+    def check(self) -> Optional[AdmissionRejected]:
+        """응답 시작 전 빠른 거절 판단 (대기열 가득 / 예상 대기 초과)"""
+        if self.queued >= self.max_queue:
+            self._stats["rejected_queue_full"] += 1
+            return AdmissionRejected("queue_full", self._retry_after())
+        if self.estimated_wait() > self.max_queue_wait:
+            self._stats["rejected_estimated_wait"] += 1
+            return AdmissionRejected("estimated_wait", self._retry_after())
+        return None
+
+    async def acquire(self):
+        """슬롯 획득 (대기열에서 max_queue_wait 초과 시 AdmissionRejected)"""
+        if self.in_flight < self.max_concurrency and not self.queued:
+            self.in_flight += 1
+            self._stats["admitted"] += 1
+            return
+
+        if self.queued >= self.max_queue:
+            self._stats["rejected_queue_full"] += 1
+            raise AdmissionRejected("queue_full", self._retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._stats["queued"] += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.max_queue_wait)
+        except asyncio.TimeoutError:
+            if future.done():
+                # 시간 초과와 동시에 슬롯을 받음 → 그대로 진행
+                pass
+            else:
+                future.cancel()
+                self._stats["rejected_queue_timeout"] += 1
+                raise AdmissionRejected("queue_timeout", self._retry_after())
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 클라이언트 연결 종료 → 반납
+                self.release(0.0)
+            else:
+                future.cancel()
+            raise
+        finally:
+            self._stats["queue_wait_total_ms"] += (time.perf_counter() - started) * 1000
+
+        self._stats["admitted"] += 1
+
+    def release(self, service_time: float):
+        """슬롯 반납 + 처리 시간 반영 + 다음 대기 요청에 슬롯 전달"""
+        self.in_flight -= 1
+        if service_time > 0:
+            self._service_time = 0.8 * self._service_time + 0.2 * service_time
+
+        while self._waiters and self.in_flight < self.max_concurrency:
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self):
+        """async with admission.slot(): ... (처리 시간은 슬롯 보유 시간)"""
+        await self.acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(time.perf_counter() - started)
+
+    def stats(self) -> Dict:
+        queued = self._stats["queued"]
+        return {
+            **self._stats,
+            "queue_wait_total_ms": round(self._stats["queue_wait_total_ms"], 1),
+            "avg_queue_wait_ms": round(self._stats["queue_wait_total_ms"] / queued, 1) if queued else 0.0,
+            "in_flight": self.in_flight,
+            "waiting": self.queued,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "max_queue_wait": self.max_queue_wait,
+            "service_time_ms": round(self._service_time * 1000, 1),
+            "estimated_wait_ms": round(self.estimated_wait() * 1000, 1),
+            "load": round(self.load(), 3),
+            "degradation_level": self.degradation().level,
+        }
+
+
+# 전역 요청 처리 슬롯 인스턴스
+admission = AdmissionController(
+    max_concurrency=int(os.getenv("ADMISSION_MAX_CONCURRENCY", 32)),
+    max_queue=int(os.getenv("ADMISSION_MAX_QUEUE", 64)),
+    max_queue_wait=float(os.getenv("ADMISSION_MAX_QUEUE_WAIT", 5.0)),
+    degrade_thresholds=parse_thresholds(os.getenv("ADMISSION_DEGRADE_AT", "0.8,1.0,1.25"))
+)
@@ -0,0 +1,200 @@
+"""
+Answer Cache - GENERAL_CHAT 잡담 응답 캐시
+"안녕", "고마워", "넌 누구야"처럼 맥락과 무관한 짧은 대화는 캐릭터 프롬프트가 같으면 답도 같은 종류
+→ 정규화한 질의(+ 선택적 임베딩 유사도)를 키로 여러 개의 답변 변형을 저장하고 돌려가며 재생
+"""
+
+import hashlib
+import logging
+import operator
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, List, Optional
+
+from .llm_scheduler import LLMScheduler, Priority
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# 맥락이 있어도 맥락 없이 답해도 되는 고정 문구 (정규화된 형태) - 캐시에 저장하는 유일한 대상
+# "응", "네", "좋아"처럼 직전 대화에 대한 대답일 수 있는 문구는 넣지 않음
+SMALL_TALK_PHRASES = {
+    "안녕", "안녕하세요", "안뇽", "하이", "ㅎㅇ", "hi", "hello", "반가워", "반가워요", "반갑습니다",
+    "고마워", "고마워요", "고맙습니다", "감사합니다", "감사해요", "땡큐", "thanks", "thankyou", "ㄱㅅ",
+    "넌누구야", "너는누구야", "누구야", "누구세요", "너누구야", "이름이뭐야", "너이름이뭐야", "비티", "비티야",
+    "잘가", "잘가요", "바이", "bye", "잘자", "잘자요", "좋은하루", "수고했어", "수고하셨습니다",
+}
+
+# 고정 문구가 아닌 경우: 대화 맥락이 없고 이 길이 이하면 임베딩 유사도로 고정 문구 답변 조회만 (저장 안 함)
+MAX_SEMANTIC_LOOKUP_CHARS = 12
+
+# 스트림 오류 시 gpt_streaming이 내보내는 문구 (캐시 금지)
+_ERROR_PREFIX = "[오류 발생"
+
+_STRIP_PATTERN = re.compile(r"[^\w가-힣ㄱ-ㅎㅏ-ㅣ]+")
+_REPEAT_PATTERN = re.compile(r"(.)\1{2,}")
+
+
+def normalize_query(text: str) -> str:
+    """캐시 키용 정규화 (NFC, 소문자, 공백/문장부호/이모지 제거, 3회 이상 반복 문자 축약)"""
+    normalized = unicodedata.normalize("NFC", text).lower()
+    normalized = _STRIP_PATTERN.sub("", normalized).replace("_", "")
+    return _REPEAT_PATTERN.sub(r"\1\1", normalized)
+
+
+@dataclass
+class AnswerCacheKey:
+    prompt_hash: str
+    text: str
+    fixed_phrase: bool  # False면 유사도 조회 전용 키 (저장 안 함)
+    embedding: Optional[List[float]] = None
+
+    @property
+    def cache_key(self):
+        return (self.prompt_hash, self.text)
+
+
+class AnswerCache:
+    """잡담 답변 변형 캐시"""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl_seconds: float = 24 * 3600.0,
+        variants: int = 3,
+        use_embeddings: bool = False,
+        similarity_threshold: float = 0.93,
+        max_semantic_entries: int = 256
+    ):
+        """
+        Args:
+            max_entries: 최대 키 수
+            ttl_seconds: 키 만료 시간
+            variants: 키당 모을 답변 수 (다 모이기 전까지는 LLM 호출 후 변형 추가)
+            use_embeddings: 정규화 키가 없을 때 임베딩 유사도로 가장 가까운 키 사용
+            similarity_threshold: 임베딩 코사인 유사도 기준
+            max_semantic_entries: 유사도 비교 대상 최대 키 수 (비교는 이벤트 루프에서 수행)
+        """
+        self.entries = TTLCache(max_size=max_entries, ttl_seconds=ttl_seconds)
+        self.variants = variants
+        self.use_embeddings = use_embeddings
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        self._vectors: Dict[tuple, List[float]] = {}
+        self._stats = {"hits": 0, "semantic_hits": 0, "misses": 0, "stored": 0}
+
+    def make_key(self, query: str, context_messages: List[Dict], character_prompt: str) -> Optional[AnswerCacheKey]:
+        """
+        캐시 대상이면 키 반환 (아니면 None)
+        - 고정 문구: 대화 맥락과 무관하게 대상 (답변도 맥락 없이 생성, 저장)
+        - 그 외: 임베딩 사용 시 대화 맥락이 없는 짧은 질의만 고정 문구 답변을 유사도로 조회 (저장 안 함)
+        """
+        text = normalize_query(query)
+        if not text:
+            return None
+
+        fixed_phrase = text in SMALL_TALK_PHRASES
+        if not fixed_phrase and (
+            not self.use_embeddings or context_messages or len(text) > MAX_SEMANTIC_LOOKUP_CHARS
+        ):
+            return None
+
+        # 캐릭터 프롬프트가 바뀌면 (핫 리로드) 이전 답변은 자동으로 쓰이지 않음
+        prompt_hash = hashlib.sha1(character_prompt.encode("utf-8")).hexdigest()[:12]
+        return AnswerCacheKey(prompt_hash, text, fixed_phrase)
+
+    async def get(self, key: AnswerCacheKey, llm: Optional[LLMScheduler] = None) -> Optional[str]:
+        """변형이 다 모인 키면 다음 순번 답변 반환"""
+        entry = self.entries.get(key.cache_key)
+
+        if entry is None and self.use_embeddings and llm is not None:
+            entry = await self._semantic_lookup(key, llm)
+            if entry is not None:
+                self._stats["semantic_hits"] += 1
+
+        if entry is None or len(entry["variants"]) < self.variants:
+            self._stats["misses"] += 1
+            return None
+
+        answer = entry["variants"][entry["next"] % len(entry["variants"])]
+        entry["next"] += 1
+        self._stats["hits"] += 1
+        return answer
+
+    async def _semantic_lookup(self, key: AnswerCacheKey, llm: LLMScheduler) -> Optional[Dict]:
+        try:
+            response = await llm.embed(Priority.CLASSIFY, stage="answer_cache_embedding", model="text-embedding-3-small", input=key.text)
+            key.embedding = response.data[0].embedding
+        except Exception as e:
+            logger.warning(f"[ANSWER_CACHE] 임베딩 실패 (정규화 키만 사용): {e}")
+            return None
+
+        best_key, best_score = None, self.similarity_threshold
+        for cache_key, vector in self._vectors.items():
+            if cache_key[0] != key.prompt_hash:
+                continue
+            # OpenAI 임베딩은 단위 벡터 → 내적 = 코사인 유사도
+            score = sum(map(operator.mul, key.embedding, vector))
+            if score >= best_score:
+                best_key, best_score = cache_key, score
+
+        if best_key is None:
+            return None
+        entry = self.entries.get(best_key)
+        if entry is None:
+            self._vectors.pop(best_key, None)
+            return None
+        logger.info(f"[ANSWER_CACHE] 유사 키 적중: '{key.text}' → '{best_key[1]}' ({best_score:.3f})")
+        return entry
+
+    def store(self, key: AnswerCacheKey, answer: str):
+        """생성된 답변을 변형으로 추가 (고정 문구만, 같은 답변은 중복 저장하지 않음)"""
+        answer = answer.strip()
+        if not key.fixed_phrase or not answer or answer.startswith(_ERROR_PREFIX):
+            return
+
+        entry = self.entries.get(key.cache_key)
+        if entry is None:
+            entry = {"variants": [], "next": 0}
+            self.entries.set(key.cache_key, entry)
+        if answer in entry["variants"] or len(entry["variants"]) >= self.variants:
+            return
+
+        entry["variants"].append(answer)
+        self._stats["stored"] += 1
+
+        if key.embedding is not None and len(self._vectors) < self.max_semantic_entries:
+            self._vectors[key.cache_key] = key.embedding
+
+    async def capture(self, key: AnswerCacheKey, stream: AsyncGenerator[str, None]) -> AsyncGenerator[str, None]:
+        """스트림을 그대로 전달하면서 끝까지 받은 답변만 저장 (중간에 끊기면 저장 안 함)"""
+        chunks = []
+        async for chunk in stream:
+            chunks.append(chunk)
+            yield chunk
+        self.store(key, "".join(chunks))
+
+    def stats(self) -> Dict:
+        total = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / total, 3) if total else 0.0,
+            "keys": len(self.entries),
+            "semantic_keys": len(self._vectors),
+        }
+
+
+async def replay_answer(answer: str, chunk_chars: int = 4) -> AsyncGenerator[str, None]:
+    """캐시된 답변을 GPT 스트림과 같은 chunk 경로로 전송"""
+    for start in range(0, len(answer), chunk_chars):
+        yield answer[start:start + chunk_chars]
+
+
+# 전역 답변 캐시 인스턴스
+answer_cache = AnswerCache(
+    variants=int(os.getenv("ANSWER_CACHE_VARIANTS", 3)),
+    use_embeddings=os.getenv("ANSWER_CACHE_EMBEDDINGS", "false").lower() == "true",
+    similarity_threshold=float(os.getenv("ANSWER_CACHE_SIMILARITY", 0.93))
+)
@@ -0,0 +1,110 @@
+"""
+Answer Policy - 최종 답변 생성 방식 선택 (부하 기반 단계적 성능 저하)
+- LLM: 템플릿 없이 LLM 스트리밍 답변 (평상시)
+- FLOURISH: 템플릿을 바로 보내고 LLM 한 문장을 이어서 스트리밍 (부하 증가 시)
+- TEMPLATE: 템플릿만 (LLM 호출 없음, 트래픽 급증/레이트리밋 근접 시)
+"""
+
+import logging
+import os
+from enum import Enum
+from typing import Dict, Optional
+
+from .admission import admission
+from .llm_scheduler import LLMScheduler
+from .loop_monitor import loop_monitor
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerMode(str, Enum):
+    LLM = "llm"
+    FLOURISH = "flourish"
+    TEMPLATE = "template"
+
+
+def parse_overrides(value: str) -> Dict[str, AnswerMode]:
+    """'ROUTE=template,RECOMMEND=flourish' → {의도: 모드}"""
+    overrides = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        intent, _, mode = item.partition("=")
+        try:
+            overrides[intent.strip().upper()] = AnswerMode(mode.strip().lower())
+        except ValueError:
+            logger.warning(f"[ANSWER_POLICY] 잘못된 의도별 설정 무시: '{item}'")
+    return overrides
+
+
+class AnswerPolicy:
+    """부하/배포 설정에 따른 답변 모드 선택"""
+
+    def __init__(
+        self,
+        mode: str = "auto",
+        flourish_load: float = 0.5,
+        template_load: float = 0.85,
+        template_lag_ms: float = 250.0,
+        overrides: Optional[Dict[str, AnswerMode]] = None
+    ):
+        """
+        Args:
+            mode: "auto" (부하 기반) 또는 고정 모드 (llm / flourish / template)
+            flourish_load: LLM 스케줄러 부하가 이 이상이면 FLOURISH
+            template_load: LLM 스케줄러 부하가 이 이상이면 TEMPLATE
+            template_lag_ms: 최근 이벤트 루프 지연이 이 이상이면 TEMPLATE
+            overrides: 의도별 고정 모드 (auto보다 우선, 단 TEMPLATE 강등은 항상 적용)
+        """
+        if mode != "auto" and mode not in {answer_mode.value for answer_mode in AnswerMode}:
+            logger.warning(f"[ANSWER_POLICY] 알 수 없는 모드 '{mode}' → auto")
+            mode = "auto"
+        self.mode = mode
+        self.flourish_load = flourish_load
+        self.template_load = template_load
+        self.template_lag_ms = template_lag_ms
+        self.overrides = overrides or {}
+        self._counts = {answer_mode.value: 0 for answer_mode in AnswerMode}
+
+    def choose(self, llm: LLMScheduler, intent: str, outcome: str) -> AnswerMode:
+        """이번 답변의 생성 방식"""
+        answer_mode = self._choose(llm, intent, outcome)
+        self._counts[answer_mode.value] += 1
+        return answer_mode
+
+    def _choose(self, llm: LLMScheduler, intent: str, outcome: str) -> AnswerMode:
+        # 요청 대기열이 길면 배포 설정과 무관하게 템플릿 (부하 차단 3단계)
+        if admission.degradation().template_answers:
+            return AnswerMode.TEMPLATE
+        if self.mode != "auto":
+            return AnswerMode(self.mode)
+
+        load = llm.load()
+        lag_ms = loop_monitor.recent_max() * 1000
+        if load >= self.template_load or lag_ms >= self.template_lag_ms:
+            logger.info(f"[ANSWER_POLICY] 템플릿 답변 (load={load:.2f}, lag={lag_ms:.0f}ms)")
+            return AnswerMode.TEMPLATE
+
+        if intent in self.overrides:
+            return self.overrides[intent]
+        if load >= self.flourish_load:
+            return AnswerMode.FLOURISH
+        return AnswerMode.LLM
+
+    def stats(self) -> Dict:
+        return {
+            "mode": self.mode,
+            "flourish_load": self.flourish_load,
+            "template_load": self.template_load,
+            "template_lag_ms": self.template_lag_ms,
+            "overrides": {intent: answer_mode.value for intent, answer_mode in self.overrides.items()},
+            "counts": dict(self._counts),
+        }
+
+
+# 전역 답변 정책 인스턴스 (ANSWER_POLICY_MODE: auto | llm | flourish | template)
+answer_policy = AnswerPolicy(
+    mode=os.getenv("ANSWER_POLICY_MODE", "auto").lower(),
+    flourish_load=float(os.getenv("ANSWER_POLICY_FLOURISH_LOAD", 0.5)),
+    template_load=float(os.getenv("ANSWER_POLICY_TEMPLATE_LOAD", 0.85)),
+    template_lag_ms=float(os.getenv("ANSWER_POLICY_TEMPLATE_LAG_MS", 250)),
+    overrides=parse_overrides(os.getenv("ANSWER_POLICY_INTENTS", ""))
+)
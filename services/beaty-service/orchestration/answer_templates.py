@@ -0,0 +1,81 @@
+"""
+Answer Templates - 의도/결과별 템플릿 답변
+대부분의 최종 답변은 "N개 장소를 찾았어요" 수준 (프롬프트가 장소 이름 나열을 금지)
+→ LLM 없이 바로 보낼 수 있는 답변 문구를 변형 여러 개로 보관하고 돌려가며 사용
+"""
+
+import itertools
+from typing import Dict, Iterator, List, Tuple
+
+# 결과 종류
+FOUND = "found"                        # 결과 있음
+NONE = "none"                          # 결과 없음
+ALTERNATIVE = "alternative"            # 정확한 결과 없음, 비슷한 곳 대안 추천
+FALLBACK = "fallback"                  # 자체 데이터 없음, 구글 검색 결과로 대체
+GEOCODING_FAILED = "geocoding_failed"  # 위치 특정 실패 (경로 → 장소검색 전환)
+
+# (의도, 결과) → 변형 목록 (str.format 치환: count, query, search_keyword, location, category, origin, destination)
+TEMPLATES: Dict[Tuple[str, str], List[str]] = {
+    ("FIND_PLACE", FOUND): [
+        "'{search_keyword}' 찾아봤어요! {count}곳이 있네요. 지도에서 확인해보세요~",
+        "주인님, '{search_keyword}'로 {count}곳을 찾았어요! 마음에 드는 곳이 있으면 좋겠어요 😊",
+        "짜잔! '{search_keyword}' 검색 결과 {count}곳을 가져왔어요.",
+    ],
+    ("FIND_PLACE", NONE): [
+        "앗, '{search_keyword}'에 대한 검색 결과를 찾을 수 없었어요. 다른 이름으로 찾아볼까요?",
+        "음... '{search_keyword}'는 찾지 못했어요 ㅠㅠ 조금 다르게 말씀해주시면 다시 찾아볼게요!",
+    ],
+    ("FIND_PLACE", GEOCODING_FAILED): [
+        "앗! '{location}'까지 가는 경로를 찾으려 했는데, 정확한 위치를 특정하기 어려워요. 😅\n\n"
+        "'{location}'가 조금 애매한 것 같아요. 지도에서 정확한 출발지나 도착지를 클릭해서 선택해주시면, "
+        "더 정확한 경로를 안내해드릴 수 있어요!",
+    ],
+    ("FIND_PLACE", "geocoding_failed_places"): [
+        "\n\n대신 '{search_keyword}'에 대한 장소 {count}개를 찾아봤어요. 혹시 이 중에 원하시는 곳이 있을까요?",
+    ],
+    ("RECOMMEND", FOUND): [
+        "비티만의 추천이에요! 주인님께 딱 맞을 것 같은 {count}곳을 골라봤어요 😊",
+        "비티만의 추천이에요! {count}곳을 찾았어요. 지도에서 하나씩 구경해보세요~",
+        "비티만의 추천이에요! 가볼 만한 곳 {count}곳을 모아봤어요!",
+    ],
+    ("RECOMMEND", NONE): [
+        "앗, '{query}'에 대한 추천 결과를 찾을 수 없었어요. 조건을 조금 바꿔서 다시 물어봐주실래요?",
+        "음... 추천드릴 만한 곳을 찾지 못했어요 ㅠㅠ 다른 지역이나 종류로 찾아볼까요?",
+    ],
+    ("RECOMMEND", ALTERNATIVE): [
+        "제가 알고 있는 {location}{category}는 없네요 ㅠㅠ 대신 비슷한 곳 {count}곳을 추천해드릴게요! 아니면 구글에서 검색해드릴까요?",
+        "앗, {location}{category}는 비트맵에 없어요 ㅠㅠ 그래도 비슷한 곳 {count}곳을 찾았어요! 구글에서도 찾아볼까요?",
+    ],
+    ("RECOMMEND", FALLBACK): [
+        "제가 가진 정보에는 추천드릴 곳이 없어요. 대신 구글에서 검색해서 {count}개 장소를 찾았어요!",
+        "비트맵에는 없었지만, 구글에서 {count}곳을 찾아왔어요!",
+    ],
+    ("RECOMMEND", "fallback_none"): [
+        "앗, '{query}'에 대한 결과를 찾을 수 없었어요. 다르게 말씀해주시면 다시 찾아볼게요!",
+    ],
+    ("ROUTE", FOUND): [
+        "{destination}까지 가는 경로 {count}개를 찾았어요! 지도에서 비교해보세요~",
+        "주인님, {origin}에서 {destination}까지 {count}개 경로가 있어요. 편한 길로 골라보세요!",
+        "{destination} 가는 길 찾았어요! 경로 {count}개를 준비했어요 😊",
+    ],
+    ("ROUTE", NONE): [
+        "앗, {destination}까지 가는 경로를 찾을 수 없었어요. 출발지나 도착지를 지도에서 다시 골라주실래요?",
+        "음... {destination} 가는 대중교통 경로가 없네요 ㅠㅠ 위치를 조금 바꿔서 다시 찾아볼까요?",
+    ],
+}
+
+_rotations: Dict[Tuple[str, str], Iterator[int]] = {}
+
+
+class _BlankMissing(dict):
+    """치환 값이 없는 자리는 빈 문자열로"""
+
+    def __missing__(self, key):
+        return ""
+
+
+def render_template(intent: str, outcome: str, **params) -> str:
+    """템플릿 답변 (같은 키는 변형을 돌려가며 사용)"""
+    variants = TEMPLATES[(intent, outcome)]
+    rotation = _rotations.setdefault((intent, outcome), itertools.cycle(range(len(variants))))
+    return variants[next(rotation)].format_map(_BlankMissing(params))
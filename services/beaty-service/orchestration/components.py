@@ -0,0 +1,46 @@
+"""
+Component Container - 요청 간 공유하는 컴포넌트 모음
+위치 해결기 / 쿼리 리라이터 / LLM 클라이언트 / 파이프라인 레지스트리를 startup에서 1회 생성
+"""
+
+import logging
+from typing import Dict, Optional
+
+from pipelines import PIPELINES, PipelineExecute
+from pipelines.recommend.position_resolver import PositionResolver
+from pipelines.recommend.query_rewriter import QueryRewriter
+from pipelines.google.query_rewriter import GoogleQueryRewriter
+
+logger = logging.getLogger(__name__)
+
+
+class ComponentContainer:
+    """파이프라인 공유 컴포넌트 (싱글톤)"""
+
+    def __init__(self, service):
+        """
+        Args:
+            service: BeatyService (config, llm, db_pool, intent_classifier 사용)
+                     intent_classifier.initialize() 이후에 생성해야 카테고리 목록이 전달됨
+        """
+        openai_api_key = service.config["openai_api_key"]
+
+        self.position_resolver = PositionResolver(
+            openai_api_key,
+            service.config["db_config"],
+            llm=service.llm,
+            db_pool=service.db_pool
+        )
+        self.query_rewriter = QueryRewriter(
+            openai_api_key,
+            service.intent_classifier.categories or "",
+            llm=service.llm
+        )
+        self.google_query_rewriter = GoogleQueryRewriter(openai_api_key, llm=service.llm)
+        self.pipelines: Dict[str, PipelineExecute] = dict(PIPELINES)
+
+        logger.info(f"[COMPONENTS] 컴포넌트 준비 완료 (파이프라인: {', '.join(self.pipelines)})")
+
+    def get_pipeline(self, intent: str) -> Optional[PipelineExecute]:
+        """의도에 해당하는 파이프라인 (없으면 None → 일반 대화)"""
+        return self.pipelines.get(intent)
@@ -0,0 +1,56 @@
+"""
+Database Pool - 앱 수명 동안 유지되는 asyncpg 커넥션 풀
+요청마다 SSL 연결을 새로 맺지 않도록 공유
+"""
+
+import os
+import ssl
+import logging
+from typing import Dict, Any, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+
+def _ssl_context() -> ssl.SSLContext:
+    """Supabase 연결용 SSL 설정 (인증서 검증 생략 - 기존 연결 방식과 동일)"""
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+async def create_db_pool(
+    db_config: Dict[str, Any],
+    min_size: Optional[int] = None,
+    max_size: Optional[int] = None
+) -> Optional[asyncpg.Pool]:
+    """
+    asyncpg 커넥션 풀 생성
+
+    Args:
+        db_config: {"host", "port", "database", "user", "password"}
+        min_size: 최소 연결 수 (기본: DB_POOL_MIN_SIZE 또는 1)
+        max_size: 최대 연결 수 (기본: DB_POOL_MAX_SIZE 또는 10)
+
+    Returns:
+        asyncpg.Pool 또는 None (연결 실패 시)
+    """
+    try:
+        pool = await asyncpg.create_pool(
+            host=db_config["host"],
+            port=db_config["port"],
+            database=db_config["database"],
+            user=db_config["user"],
+            password=db_config["password"],
+            ssl=_ssl_context(),
+            min_size=min_size or int(os.getenv("DB_POOL_MIN_SIZE", 1)),
+            max_size=max_size or int(os.getenv("DB_POOL_MAX_SIZE", 10)),
+            command_timeout=60
+        )
+        logger.info(f"[DB_POOL] 커넥션 풀 생성 완료 (max_size={pool.get_max_size()})")
+        return pool
+    except Exception as e:
+        logger.error(f"[DB_POOL] 커넥션 풀 생성 실패: {e}")
+        return None
@@ -0,0 +1,64 @@
+"""
+Geo Utils - 거리 계산 및 geohash 셀 인코딩
+"""
+
+import math
+
+EARTH_RADIUS_KM = 6371.0088
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이의 대원 거리 (km)"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = math.radians(lat2 - lat1)
+    d_lambda = math.radians(lng2 - lng1)
+
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def geohash_encode(lat: float, lng: float, precision: int = 7) -> str:
+    """
+    좌표를 geohash 문자열로 인코딩
+
+    precision별 셀 크기 (서울 위도 기준 대략):
+        5: 4.9km x 4.9km
+        6: 1.2km x 0.6km
+        7: 153m x 153m
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bit = 0
+    ch = 0
+    even = True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if lng >= mid:
+                ch = (ch << 1) | 1
+                lng_range[0] = mid
+            else:
+                ch = ch << 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if lat >= mid:
+                ch = (ch << 1) | 1
+                lat_range[0] = mid
+            else:
+                ch = ch << 1
+                lat_range[1] = mid
+
+        even = not even
+        bit += 1
+        if bit == 5:
+            chars.append(_GEOHASH_BASE32[ch])
+            bit = 0
+            ch = 0
+
+    return "".join(chars)
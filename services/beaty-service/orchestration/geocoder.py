@@ -1,9 +1,24 @@
 """
 Google Geocoding API - 주소/장소명을 위경도로 변환
+메모리(L1) + DB(L2) 지오코딩 캐시 사용, 결과 없음도 캐시 (negative caching)
 """
 
-import httpx
+import os
+import re
+import unicodedata
 from typing import Optional, Dict, Any
+from .http_clients import http_clients
+from .ttl_cache import TTLCache
+
+# Geocoding API 주소 (부하 테스트 시 mock-service로 교체)
+GEOCODE_URL = os.getenv("GOOGLE_GEOCODE_URL", "https://maps.googleapis.com/maps/api/geocode/json")
+
+# 캐시 유효 기간
+POSITIVE_TTL_DAYS = 30
+NEGATIVE_TTL_DAYS = 1
+
+# 결과 없음 표시 (메모리 캐시용)
+_NOT_FOUND = {"found": False}
 
 
 class GoogleGeocoder:
@@ -11,7 +26,43 @@ class GoogleGeocoder:
 
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.base_url = "https://maps.googleapis.com/maps/api/geocode/json"
+        self.base_url = GEOCODE_URL
+        self.db_pool = None  # initialize()에서 설정
+        self.memory_cache = TTLCache(max_size=2048, ttl_seconds=3600.0)
+
+    async def initialize(self, db_pool):
+        """비동기 초기화 - DB 캐시 테이블 준비"""
+        self.db_pool = db_pool
+        if not self.db_pool:
+            print("[GEOCODER] DB 풀 없음 - 메모리 캐시만 사용")
+            return
+
+        try:
+            async with self.db_pool.acquire() as conn:
+                await conn.execute("""
+                    CREATE TABLE IF NOT EXISTS geocode_cache (
+                        address_key TEXT NOT NULL,
+                        language TEXT NOT NULL,
+                        found BOOLEAN NOT NULL,
+                        lat DOUBLE PRECISION,
+                        lng DOUBLE PRECISION,
+                        formatted_address TEXT,
+                        place_id TEXT,
+                        created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                        expires_at TIMESTAMPTZ NOT NULL,
+                        PRIMARY KEY (address_key, language)
+                    )
+                """)
+            print("[GEOCODER] DB 캐시 테이블 준비 완료")
+        except Exception as e:
+            print(f"[GEOCODER] DB 캐시 테이블 준비 실패 (메모리 캐시만 사용): {e}")
+            self.db_pool = None
+
+    @staticmethod
+    def normalize_address(address: str) -> str:
+        """캐시 키용 주소 정규화 (유니코드 NFC, 공백 정리, 소문자)"""
+        normalized = unicodedata.normalize("NFC", address).strip().lower()
+        return re.sub(r"\s+", " ", normalized)
 
     async def geocode(self, address: str, language: str = "ko") -> Optional[Dict[str, Any]]:
         """
@@ -31,28 +82,50 @@ class GoogleGeocoder:
             또는 None (실패 시)
         """
         try:
-            print(f"[GEOCODER] Geocoding: '{address}'")
+            address_key = self.normalize_address(address)
+            cache_key = (address_key, language)
 
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.base_url,
-                    params={
-                        "address": address,
-                        "language": language,
-                        "key": self.api_key
-                    },
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                data = response.json()
+            # 1. 메모리 캐시
+            cached = self.memory_cache.get(cache_key)
+            if cached is not None:
+                print(f"[GEOCODER] 메모리 캐시 적중: '{address}'")
+                return None if cached is _NOT_FOUND else dict(cached)
 
-            if data.get("status") != "OK":
-                print(f"[GEOCODER] Error: {data.get('status')} - {data.get('error_message', 'N/A')}")
-                return None
+            # 2. DB 캐시
+            cached = await self._load_from_db(address_key, language)
+            if cached is not None:
+                print(f"[GEOCODER] DB 캐시 적중: '{address}'")
+                self.memory_cache.set(cache_key, cached)
+                return None if cached is _NOT_FOUND else dict(cached)
+
+            # 3. Google Geocoding API
+            print(f"[GEOCODER] Geocoding: '{address}'")
 
+            client = http_clients.get(self.base_url)
+            response = await client.get(
+                self.base_url,
+                params={
+                    "address": address,
+                    "language": language,
+                    "key": self.api_key
+                },
+                timeout=10.0
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            status = data.get("status")
             results = data.get("results", [])
-            if not results:
+
+            if status == "ZERO_RESULTS" or (status == "OK" and not results):
+                # 확정적인 결과 없음만 캐시 (일시적 오류는 캐시하지 않음)
                 print(f"[GEOCODER] No results found for: '{address}'")
+                self.memory_cache.set(cache_key, _NOT_FOUND)
+                await self._save_to_db(address_key, language, None)
+                return None
+
+            if status != "OK":
+                print(f"[GEOCODER] Error: {status} - {data.get('error_message', 'N/A')}")
                 return None
 
             # 첫 번째 결과 사용
@@ -66,11 +139,83 @@ class GoogleGeocoder:
                 "place_id": result.get("place_id", "")
             }
 
+            self.memory_cache.set(cache_key, geocoded)
+            await self._save_to_db(address_key, language, geocoded)
+
             print(f"[GEOCODER] Success: {geocoded['formatted_address']} ({geocoded['lat']:.4f}, {geocoded['lng']:.4f})")
-            return geocoded
+            return dict(geocoded)
 
         except Exception as e:
             print(f"[GEOCODER] Exception: {e}")
             import traceback
             traceback.print_exc()
             return None
+
+    async def _load_from_db(self, address_key: str, language: str) -> Optional[Dict[str, Any]]:
+        """DB 캐시 조회 (만료되지 않은 항목만), 결과 없음 캐시는 _NOT_FOUND 반환"""
+        if not self.db_pool:
+            return None
+
+        try:
+            async with self.db_pool.acquire() as conn:
+                row = await conn.fetchrow("""
+                    SELECT found, lat, lng, formatted_address, place_id
+                    FROM geocode_cache
+                    WHERE address_key = $1 AND language = $2 AND expires_at > now()
+                """, address_key, language)
+        except Exception as e:
+            print(f"[GEOCODER] DB 캐시 조회 실패: {e}")
+            return None
+
+        if not row:
+            return None
+        if not row["found"]:
+            return _NOT_FOUND
+
+        return {
+            "lat": row["lat"],
+            "lng": row["lng"],
+            "formatted_address": row["formatted_address"] or "",
+            "place_id": row["place_id"] or ""
+        }
+
+    async def _save_to_db(self, address_key: str, language: str, geocoded: Optional[Dict[str, Any]]):
+        """DB 캐시 저장 (geocoded=None이면 결과 없음으로 저장)"""
+        if not self.db_pool:
+            return
+
+        found = geocoded is not None
+        ttl_days = POSITIVE_TTL_DAYS if found else NEGATIVE_TTL_DAYS
+
+        try:
+            async with self.db_pool.acquire() as conn:
+                await conn.execute("""
+                    INSERT INTO geocode_cache (
+                        address_key, language, found,
+                        lat, lng, formatted_address, place_id,
+                        created_at, expires_at
+                    ) VALUES (
+                        $1, $2, $3,
+                        $4, $5, $6, $7,
+                        now(), now() + make_interval(days => $8)
+                    )
+                    ON CONFLICT (address_key, language) DO UPDATE SET
+                        found = EXCLUDED.found,
+                        lat = EXCLUDED.lat,
+                        lng = EXCLUDED.lng,
+                        formatted_address = EXCLUDED.formatted_address,
+                        place_id = EXCLUDED.place_id,
+                        created_at = EXCLUDED.created_at,
+                        expires_at = EXCLUDED.expires_at
+                """,
+                    address_key,
+                    language,
+                    found,
+                    geocoded["lat"] if found else None,
+                    geocoded["lng"] if found else None,
+                    geocoded["formatted_address"] if found else None,
+                    geocoded["place_id"] if found else None,
+                    ttl_days
+                )
+        except Exception as e:
+            print(f"[GEOCODER] DB 캐시 저장 실패 (무시): {e}")
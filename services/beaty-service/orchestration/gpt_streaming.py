@@ -5,45 +5,49 @@ OpenAI GPT 응답을 스트리밍으로 처리하는 공통 유틸리티
 
 import logging
 from typing import AsyncGenerator
-from openai import OpenAI
+
+from .llm_scheduler import LLMScheduler, Priority
 
 logger = logging.getLogger(__name__)
 
 
 async def stream_gpt_response(
-    client: OpenAI,
+    llm: LLMScheduler,
     messages: list,
     model: str = "gpt-4o-mini",
     temperature: float = 0.7,
-    max_tokens: int = None
+    max_tokens: int = None,
+    stage: str = "answer"
 ) -> AsyncGenerator[str, None]:
     """
     OpenAI GPT 응답을 스트리밍으로 생성
 
     Args:
-        client: OpenAI client instance
+        llm: LLM 스케줄러 (service.llm)
         messages: 메시지 배열 [{"role": "system", "content": "..."}, ...]
         model: 사용할 모델
         temperature: 온도 설정
         max_tokens: 최대 토큰 수
+        stage: 사용량 장부 단계 이름
 
     Yields:
         str: GPT 응답 chunk
     """
     try:
         logger.info(f"[GPT_STREAMING] 모델: {model}, temperature: {temperature}")
-        # OpenAI 스트리밍 요청
-        stream = client.chat.completions.create(
+        # OpenAI 스트리밍 요청 (최우선 클래스)
+        stream = llm.stream_chat(
+            Priority.ANSWER,
+            stage=stage,
             model=model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens,
-            stream=True  # 스트리밍 활성화
+            max_tokens=max_tokens
         )
 
         # 각 chunk를 yield
-        for chunk in stream:
-            if chunk.choices[0].delta.content is not None:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content is not None:
                 content = chunk.choices[0].delta.content
                 yield content
 
@@ -52,40 +56,43 @@ async def stream_gpt_response(
         yield f"[오류 발생: {str(e)}]"
 
 
-def get_full_response_from_stream(
-    client: OpenAI,
+async def get_full_response_from_stream(
+    llm: LLMScheduler,
     messages: list,
     model: str = "gpt-4o-mini",
     temperature: float = 0.7,
-    max_tokens: int = None
+    max_tokens: int = None,
+    stage: str = "answer"
 ) -> str:
     """
     스트리밍을 사용하되 전체 응답을 문자열로 반환 (non-streaming 대체용)
     기존 코드 호환성을 위한 함수
 
     Args:
-        client: OpenAI client instance
+        llm: LLM 스케줄러 (service.llm)
         messages: 메시지 배열
         model: 사용할 모델
         temperature: 온도 설정
         max_tokens: 최대 토큰 수
+        stage: 사용량 장부 단계 이름
 
     Returns:
         str: 전체 GPT 응답
     """
     try:
         logger.info(f"[GPT_STREAMING] 모델: {model}, temperature: {temperature} (non-streaming)")
-        stream = client.chat.completions.create(
+        stream = llm.stream_chat(
+            Priority.ANSWER,
+            stage=stage,
             model=model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens,
-            stream=True
+            max_tokens=max_tokens
         )
 
         full_response = ""
-        for chunk in stream:
-            if chunk.choices[0].delta.content is not None:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content is not None:
                 full_response += chunk.choices[0].delta.content
 
         return full_response
@@ -0,0 +1,99 @@
+"""
+HTTP Client Registry - 공유 outbound HTTP 클라이언트
+호스트별 커넥션 풀을 앱 수명 동안 유지하여 요청마다 TCP/TLS 연결을 새로 맺지 않도록 함
+"""
+
+import os
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2는 h2 패키지가 설치된 경우에만 사용
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# HTTP/2를 사용할 외부 호스트 (Google API는 HTTP/2 멀티플렉싱 지원)
+DEFAULT_HTTP2_HOSTS = (
+    "maps.googleapis.com",
+    "places.googleapis.com",
+)
+
+
+class HttpClientRegistry:
+    """호스트(origin)별 공유 httpx.AsyncClient 레지스트리"""
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2_hosts: Optional[tuple] = None
+    ):
+        """
+        Args:
+            max_connections: 호스트별 최대 동시 연결 수 (기본: HTTP_MAX_CONNECTIONS 또는 100)
+            max_keepalive_connections: 호스트별 keep-alive 유지 연결 수 (기본: HTTP_MAX_KEEPALIVE 또는 20)
+            keepalive_expiry: keep-alive 연결 유지 시간(초) (기본: HTTP_KEEPALIVE_EXPIRY 또는 30)
+            http2_hosts: HTTP/2를 사용할 호스트 목록 (h2 미설치 시 무시)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections or int(os.getenv("HTTP_MAX_CONNECTIONS", 100)),
+            max_keepalive_connections=max_keepalive_connections or int(os.getenv("HTTP_MAX_KEEPALIVE", 20)),
+            keepalive_expiry=keepalive_expiry or float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30.0))
+        )
+        self.http2_hosts = set(http2_hosts if http2_hosts is not None else DEFAULT_HTTP2_HOSTS)
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+
+    @staticmethod
+    def _origin(url: str) -> str:
+        """URL에서 scheme://host:port 추출 (풀 키)"""
+        parts = urlsplit(url)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """
+        URL의 호스트에 해당하는 공유 클라이언트 반환 (없으면 생성)
+
+        Args:
+            url: 요청할 전체 URL 또는 base URL ("http://localhost:8001/api/recommend")
+
+        Returns:
+            httpx.AsyncClient (호출자가 닫지 말 것)
+        """
+        origin = self._origin(url)
+        client = self.clients.get(origin)
+
+        if client is None or client.is_closed:
+            host = urlsplit(url).hostname or ""
+            use_http2 = HTTP2_AVAILABLE and host in self.http2_hosts
+
+            client = httpx.AsyncClient(
+                limits=self.limits,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                http2=use_http2
+            )
+            self.clients[origin] = client
+            logger.info(f"[HTTP_CLIENTS] 클라이언트 생성: {origin} (http2={use_http2})")
+
+        return client
+
+    async def aclose(self):
+        """모든 클라이언트 종료 (앱 shutdown 시 호출)"""
+        for origin, client in list(self.clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"[HTTP_CLIENTS] 종료 실패 ({origin}): {e}")
+        self.clients.clear()
+        logger.info("[HTTP_CLIENTS] 모든 클라이언트 종료")
+
+
+# 전역 클라이언트 레지스트리 인스턴스
+http_clients = HttpClientRegistry()
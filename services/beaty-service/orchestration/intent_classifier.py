@@ -5,23 +5,65 @@ SystemPrompt 로직을 Beaty 서비스 내부로 통합
 
 import json
 import logging
-from typing import Dict, Any
-from openai import OpenAI
+from typing import Dict, Any, Optional
 from pathlib import Path
 import asyncpg
 
+from .llm_scheduler import LLMScheduler, Priority
+from .prompt_cache import prompt_cache
+
 logger = logging.getLogger(__name__)
 
+# 프롬프트 파일이 없을 때 사용하는 기본 프롬프트
+DEFAULT_SYSTEM_PROMPT = """당신은 서울 관광 전문 의도 분류, 슬롯 추출, 쿼리 리라이트 시스템입니다.
+
+의도 분류 가이드:
+1. FIND_PLACE: 구체적인 장소를 찾거나 정보를 물을 때
+   - 키워드: "어디야", "어디", "알려줘", "위치", "찾아줘", "주소"
+   - 예시: "경복궁 어디야", "명동교자 위치", "이태원 술집 알려줘", "강남 카페 어디"
+
+2. RECOMMEND: 추천을 요청하거나 애매한 질문 (구체적 장소명 없음)
+   - 키워드: "추천", "할만한곳", "좋은곳", "괜찮은곳", "가볼만한", "유명한"
+   - 예시: "맛집 추천", "할만한곳 있어?", "근처 관광지 추천", "가볼만한 카페"
+
+3. ROUTE: 경로/길찾기 ("명동에서 경복궁 가는 길")
+4. EXPERIENCE: 체험/투어 ("한복 체험", "역사 투어")
+5. EVENT: 행사/이벤트 정보 ("이번 주 축제", "공연 정보")
+6. RANDOM: 무작위 추천 ("아무데나 가고 싶어", "심심해", "뭐 할까") - 구체적 카테고리 없이 심심함 표현
+7. GENERAL_CHAT: 일반 대화 ("안녕", "고마워")
+8. REFINE: 직전 결과 목록에 대한 후속 조건 ("그 중에 주차 되는 곳만", "더 가까운 곳은?", "다른 곳도 보여줘")
+   - 직전 결과가 있을 때만 사용, 새로운 장소/카테고리를 찾으면 RECOMMEND/FIND_PLACE
+
+중요: FIND_PLACE vs RECOMMEND 구분
+- "홍대 술집 알려줘" → FIND_PLACE (구체적 장소 + "알려줘")
+- "술집 추천해줘" → RECOMMEND (추천 키워드)
+- "강남 맛집 어디야" → FIND_PLACE (구체적 장소 + "어디야")
+- "맛집 추천" → RECOMMEND (추천 키워드)
+
+슬롯 추출 원칙:
+- location_keyword: 명시적 장소명만 추출 (홍대, 명동, 경복궁 등)
+  * "경복궁 근처" → location_keyword="경복궁" (장소명이 명시됨)
+  * "근처 관광지" → location_keyword=null (장소명 없음)
+- category_text: 카테고리 관련 자연어 반드시 추출 (맛집, 일식집, 카페, 관광지, 박물관 등)
+- emotion: 감정/분위기 표현 (힐링, 조용한, 예쁜, 유명한, 인기있는, 핫한 등)
+- hard_constraints: 절대적 조건들 (주차가능, 무료, 아이동반 등)
+
+중요: "근처 관광지 알려줘" = RECOMMEND + category_text="관광지" + location_keyword=null
+중요: "경복궁 근처 고궁" = RECOMMEND + category_text="고궁" + location_keyword="경복궁"
+
+중요: 추론하지 말고 명시적으로 언급된 것만 추출하세요.
+중요: 서울에 위치한 지역이 아닐 경우에 위치 키워드는 없음으로 답변하세요.
+"""
+
 
 class IntentClassifier:
     """의도 분류 및 슬롯 추출 시스템"""
 
-    def __init__(self, openai_api_key: str, db_config: Dict[str, Any]):
-        self.client = OpenAI(api_key=openai_api_key)
+    def __init__(self, openai_api_key: str, db_config: Dict[str, Any], llm: Optional[LLMScheduler] = None):
+        self.llm = llm or LLMScheduler(openai_api_key)
         self.db_config = db_config
         self.prompt_file = Path(__file__).parent / "intent_classify_prompt.txt"
         self.categories = None  # 초기화 시 로드
-        self.load_system_prompt()
         self.setup_function_definition()
 
     async def initialize(self):
@@ -72,64 +114,17 @@ class IntentClassifier:
             traceback.print_exc()
             return ""
 
-    def load_system_prompt(self):
-        """시스템 프롬프트 파일에서 로드"""
-        try:
-            if self.prompt_file.exists():
-                with open(self.prompt_file, "r", encoding="utf-8") as f:
-                    self.system_prompt = f.read()
-                logger.info(f"[INTENT_CLASSIFIER] System prompt loaded from {self.prompt_file}")
-            else:
-                # 기본 프롬프트
-                self.system_prompt = """당신은 서울 관광 전문 의도 분류, 슬롯 추출, 쿼리 리라이트 시스템입니다.
-
-의도 분류 가이드:
-1. FIND_PLACE: 구체적인 장소를 찾거나 정보를 물을 때
-   - 키워드: "어디야", "어디", "알려줘", "위치", "찾아줘", "주소"
-   - 예시: "경복궁 어디야", "명동교자 위치", "이태원 술집 알려줘", "강남 카페 어디"
-
-2. RECOMMEND: 추천을 요청하거나 애매한 질문 (구체적 장소명 없음)
-   - 키워드: "추천", "할만한곳", "좋은곳", "괜찮은곳", "가볼만한", "유명한"
-   - 예시: "맛집 추천", "할만한곳 있어?", "근처 관광지 추천", "가볼만한 카페"
-
-3. ROUTE: 경로/길찾기 ("명동에서 경복궁 가는 길")
-4. EXPERIENCE: 체험/투어 ("한복 체험", "역사 투어")
-5. EVENT: 행사/이벤트 정보 ("이번 주 축제", "공연 정보")
-6. RANDOM: 무작위 추천 ("아무데나 가고 싶어", "심심해", "뭐 할까") - 구체적 카테고리 없이 심심함 표현
-7. GENERAL_CHAT: 일반 대화 ("안녕", "고마워")
-
-중요: FIND_PLACE vs RECOMMEND 구분
-- "홍대 술집 알려줘" → FIND_PLACE (구체적 장소 + "알려줘")
-- "술집 추천해줘" → RECOMMEND (추천 키워드)
-- "강남 맛집 어디야" → FIND_PLACE (구체적 장소 + "어디야")
-- "맛집 추천" → RECOMMEND (추천 키워드)
-
-슬롯 추출 원칙:
-- location_keyword: 명시적 장소명만 추출 (홍대, 명동, 경복궁 등)
-  * "경복궁 근처" → location_keyword="경복궁" (장소명이 명시됨)
-  * "근처 관광지" → location_keyword=null (장소명 없음)
-- category_text: 카테고리 관련 자연어 반드시 추출 (맛집, 일식집, 카페, 관광지, 박물관 등)
-- emotion: 감정/분위기 표현 (힐링, 조용한, 예쁜, 유명한, 인기있는, 핫한 등)
-- hard_constraints: 절대적 조건들 (주차가능, 무료, 아이동반 등)
-
-중요: "근처 관광지 알려줘" = RECOMMEND + category_text="관광지" + location_keyword=null
-중요: "경복궁 근처 고궁" = RECOMMEND + category_text="고궁" + location_keyword="경복궁"
-
-중요: 추론하지 말고 명시적으로 언급된 것만 추출하세요.
-중요: 서울에 위치한 지역이 아닐 경우에 위치 키워드는 없음으로 답변하세요.
-"""
-                # 기본 프롬프트를 파일로 저장
-                self.save_system_prompt(self.system_prompt)
-        except Exception as e:
-            logger.error(f"[INTENT_CLASSIFIER] Error loading system prompt: {e}")
-            self.system_prompt = "당신은 서울 관광 전문 AI 어시스턴트입니다."
+    @property
+    def system_prompt(self) -> str:
+        """시스템 프롬프트 (파일 수정 시 자동 반영)"""
+        return prompt_cache.get(self.prompt_file, DEFAULT_SYSTEM_PROMPT)
 
     def save_system_prompt(self, new_prompt: str) -> bool:
         """시스템 프롬프트를 파일에 저장"""
         try:
             with open(self.prompt_file, "w", encoding="utf-8") as f:
                 f.write(new_prompt)
-            self.system_prompt = new_prompt
+            prompt_cache.invalidate(self.prompt_file)
             logger.info(f"[INTENT_CLASSIFIER] System prompt saved to {self.prompt_file}")
             return True
         except Exception as e:
@@ -154,7 +149,8 @@ class IntentClassifier:
                                 "EXPERIENCE",
                                 "EVENT",
                                 "RANDOM",
-                                "GENERAL_CHAT"
+                                "GENERAL_CHAT",
+                                "REFINE"
                             ],
                             "description": "사용자의 의도 분류"
                         },
@@ -189,6 +185,27 @@ class IntentClassifier:
                             "enum": ["fastest", "min_transfer", "min_walk"],
                             "description": "[ROUTE 전용] 경로 우선순위. 기본값=fastest"
                         },
+                        "refine_filters": {
+                            "type": "array",
+                            "items": {
+                                "type": "string",
+                                "enum": ["parking", "open_now", "kids", "wheelchair", "pets", "reservable", "high_rating", "has_image"]
+                            },
+                            "description": "[REFINE 전용] 직전 결과에 적용할 조건. parking=주차, open_now=영업중, kids=아이동반, wheelchair=휠체어, pets=반려동물, reservable=예약, high_rating=평점 높은, has_image=사진 있는"
+                        },
+                        "refine_sort": {
+                            "type": ["string", "null"],
+                            "enum": ["distance", "rating", "popularity", None],
+                            "description": "[REFINE 전용] 정렬 기준. distance=가까운 순, rating=평점 순, popularity=리뷰 많은 순"
+                        },
+                        "refine_more": {
+                            "type": "boolean",
+                            "description": "[REFINE 전용] 같은 조건으로 다른 곳 더 보기 (\"다른 곳은?\", \"더 보여줘\")"
+                        },
+                        "max_distance_km": {
+                            "type": "number",
+                            "description": "[REFINE 전용] 거리 제한 km (\"1km 이내\" → 1)"
+                        },
                         "confidence": {
                             "type": "number",
                             "minimum": 0,
@@ -201,13 +218,14 @@ class IntentClassifier:
             }
         ]
 
-    def classify(self, user_input: str, context_messages: list = None) -> Dict[str, Any]:
+    async def classify(self, user_input: str, context_messages: list = None, result_hint: Optional[str] = None) -> Dict[str, Any]:
         """
         의도 분류 및 슬롯 추출
 
         Args:
             user_input: 사용자 질의
             context_messages: 대화 맥락 [{"role": "user", "content": "..."}, ...]
+            result_hint: 직전 검색 결과 요약 (있을 때만 REFINE 가능)
         """
         try:
             logger.info(f"[INTENT_CLASSIFIER] Processing: {user_input}")
@@ -220,12 +238,20 @@ class IntentClassifier:
                 messages.extend(context_messages[-3:])
                 logger.info(f"[INTENT_CLASSIFIER] 대화 맥락: {len(context_messages[-3:])}개 메시지")
 
+            # 직전 결과 요약 (REFINE 판단용)
+            if result_hint:
+                messages.append({"role": "system", "content": result_hint})
+
             messages.append({"role": "user", "content": user_input})
 
             model = "gpt-4o-mini"
             logger.info(f"[INTENT_CLASSIFIER] 모델: {model}, temperature: 0.0")
 
-            response = self.client.chat.completions.create(
+            # 응답 경로 맨 앞단이므로 지연 시 헤지 요청 허용
+            response = await self.llm.chat(
+                Priority.CLASSIFY,
+                hedge=True,
+                stage="classify",
                 model=model,
                 messages=messages,
                 functions=self.functions,
@@ -249,6 +275,10 @@ class IntentClassifier:
                 logger.info(f"  Destination: {slots.get('destination_keyword', 'None')}")
                 logger.info(f"  Transport: {slots.get('transportation_mode', 'None (all)')}")
                 logger.info(f"  Preference: {slots.get('route_preference', 'fastest')}")
+            # REFINE 전용 슬롯
+            elif slots.get('intent') == 'REFINE':
+                logger.info(f"  Filters: {slots.get('refine_filters', [])}")
+                logger.info(f"  Sort: {slots.get('refine_sort')}, More: {slots.get('refine_more', False)}")
             # RECOMMEND/FIND_PLACE 전용 슬롯
             else:
                 logger.info(f"  Location: {slots.get('location_keyword', 'None')}")
@@ -276,6 +306,7 @@ class IntentClassifier:
 
 # 테스트 코드
 if __name__ == "__main__":
+    import asyncio
     import os
     from dotenv import load_dotenv
 
@@ -292,7 +323,7 @@ if __name__ == "__main__":
             config = json.loads(config_str.replace('\t', ''))
             openai_api_key = config["openai_api_key"]
 
-    classifier = IntentClassifier(openai_api_key)
+    classifier = IntentClassifier(openai_api_key, {})
 
     # 테스트
     test_queries = [
@@ -304,5 +335,5 @@ if __name__ == "__main__":
 
     for query in test_queries:
         print(f"\n{'='*60}")
-        result = classifier.classify(query)
+        result = asyncio.run(classifier.classify(query))
         print(f"Result: {json.dumps(result, ensure_ascii=False, indent=2)}")
@@ -0,0 +1,470 @@
+"""
+LLM Scheduler - 모든 OpenAI 호출이 거치는 전역 스케줄러
+우선순위 클래스별 동시 실행 제한 + x-ratelimit-* 헤더 기반 토큰 버킷 + 지터 재시도 + (선택) 헤지 요청
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import random
+import re
+import time
+from enum import IntEnum
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+
+import openai
+from openai import AsyncOpenAI
+
+from .usage_ledger import record_usage
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """LLM 호출 우선순위 (값이 작을수록 우선)"""
+    ANSWER = 0       # 사용자에게 보이는 답변 (스트리밍 포함)
+    CLASSIFY = 1     # 의도분류 / 쿼리 리라이트 / 위치 임베딩 (응답 경로 앞단)
+    DESCRIPTION = 2  # POI별 Beaty 소개 문구
+    BACKGROUND = 3   # 사용자 응답과 무관한 작업
+
+
+# 클래스별 최대 동시 실행 수
+DEFAULT_CLASS_LIMITS = {
+    Priority.ANSWER: int(os.getenv("LLM_MAX_ANSWER", 8)),
+    Priority.CLASSIFY: int(os.getenv("LLM_MAX_CLASSIFY", 8)),
+    Priority.DESCRIPTION: int(os.getenv("LLM_MAX_DESCRIPTION", 4)),
+    Priority.BACKGROUND: int(os.getenv("LLM_MAX_BACKGROUND", 2)),
+}
+
+# 재시도 대상 예외 (429 / 5xx / 연결 오류)
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    openai.APIConnectionError,
+    openai.APITimeoutError,
+)
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """x-ratelimit-reset-* 값 ("1s", "6m0s", "20ms") → 초"""
+    if not value:
+        return None
+    matches = _DURATION_PATTERN.findall(value)
+    if not matches:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in matches)
+
+
+class RateBucket:
+    """
+    토큰 버킷 - 응답 헤더(limit/remaining/reset)로 용량과 충전 속도를 갱신
+    헤더를 보기 전까지는 제한 없음
+    """
+
+    def __init__(self, name: str, reserve_ratio: float = 0.2):
+        """
+        Args:
+            name: 로그용 이름 ("requests" / "tokens")
+            reserve_ratio: 낮은 우선순위(DESCRIPTION 이하)가 건드리지 못하는 예비 용량 비율
+        """
+        self.name = name
+        self.reserve_ratio = reserve_ratio
+        self.capacity: Optional[float] = None
+        self.rate = 0.0  # 초당 충전량
+        self.tokens = 0.0
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        if self.capacity is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def observe(self, limit: Optional[str], remaining: Optional[str], reset: Optional[str]):
+        """응답 헤더 반영"""
+        try:
+            limit_value = float(limit) if limit else None
+            remaining_value = float(remaining) if remaining else None
+        except ValueError:
+            return
+        if not limit_value:
+            return
+
+        self._refill()
+        reset_seconds = parse_reset_duration(reset)
+        first = self.capacity is None
+
+        self.capacity = limit_value
+        # OpenAI 한도는 분당 기준 - reset 값이 있으면 실제 회복 속도로 보정
+        self.rate = limit_value / 60.0
+        if reset_seconds and remaining_value is not None and reset_seconds > 0:
+            self.rate = max(self.rate, (limit_value - remaining_value) / reset_seconds)
+
+        if remaining_value is not None:
+            self.tokens = remaining_value if first else min(self.tokens, remaining_value)
+
+    def pressure(self) -> float:
+        """소진 정도 0~1 (차단 중이면 1, 헤더를 보기 전이면 0)"""
+        if time.monotonic() < self._blocked_until:
+            return 1.0
+        if not self.capacity:
+            return 0.0
+        self._refill()
+        return max(0.0, 1.0 - self.tokens / self.capacity)
+
+    def block(self, seconds: float):
+        """429 수신 시 일정 시간 전체 차단"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    async def take(self, amount: float, priority: Priority):
+        """amount만큼 소비 (부족하면 충전될 때까지 대기)"""
+        while True:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+
+            if self.capacity is None:
+                return
+
+            self._refill()
+            amount = min(amount, self.capacity)
+            floor = self.capacity * self.reserve_ratio if priority >= Priority.DESCRIPTION else 0.0
+            if self.tokens - amount >= floor:
+                self.tokens -= amount
+                return
+
+            wait = (amount + floor - self.tokens) / self.rate if self.rate > 0 else 1.0
+            await asyncio.sleep(min(max(wait, 0.01), 1.0))
+
+
+class PriorityGate:
+    """
+    우선순위 동시 실행 제한
+    - 클래스별 상한 + 전체 상한
+    - 대기 중인 요청은 우선순위 순으로 슬롯 배정
+    - DESCRIPTION 이하는 interactive_reserve 만큼의 슬롯을 남겨둠 (사용자 응답 경로 보호)
+    """
+
+    def __init__(self, total: int, class_limits: Dict[Priority, int], interactive_reserve: int):
+        self.total = total
+        self.class_limits = class_limits
+        self.interactive_reserve = interactive_reserve
+        self.active: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self.active_total = 0
+        self._waiters: List[Tuple[int, int, Priority, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    def _can_run(self, priority: Priority) -> bool:
+        if self.active[priority] >= self.class_limits.get(priority, self.total):
+            return False
+        limit = self.total
+        if priority >= Priority.DESCRIPTION:
+            limit -= self.interactive_reserve
+        return self.active_total < limit
+
+    def _take(self, priority: Priority):
+        self.active[priority] += 1
+        self.active_total += 1
+
+    async def acquire(self, priority: Priority):
+        has_earlier_waiter = any(w[0] <= priority for w in self._waiters if not w[3].done())
+        if not has_earlier_waiter and self._can_run(priority):
+            self._take(priority)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), priority, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯을 받은 직후 취소됨 → 반납
+                self.release(priority)
+            raise
+
+    def release(self, priority: Priority):
+        self.active[priority] -= 1
+        self.active_total -= 1
+        self._wake()
+
+    def _wake(self):
+        remaining = []
+        while self._waiters:
+            entry = heapq.heappop(self._waiters)
+            future = entry[3]
+            if future.done():
+                continue
+            if self._can_run(entry[2]):
+                self._take(entry[2])
+                future.set_result(None)
+            else:
+                remaining.append(entry)
+        for entry in remaining:
+            heapq.heappush(self._waiters, entry)
+
+    def waiting(self) -> Dict[str, int]:
+        counts = {priority.name: 0 for priority in Priority}
+        for entry in self._waiters:
+            if not entry[3].done():
+                counts[entry[2].name] += 1
+        return counts
+
+
+class LLMScheduler:
+    """OpenAI 호출 스케줄러 (BeatyService.llm)"""
+
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = int(os.getenv("LLM_MAX_CONCURRENCY", 12)),
+        class_limits: Optional[Dict[Priority, int]] = None,
+        interactive_reserve: int = int(os.getenv("LLM_INTERACTIVE_RESERVE", 4)),
+        max_retries: int = int(os.getenv("LLM_MAX_RETRIES", 3)),
+        hedge_delay: float = float(os.getenv("LLM_HEDGE_DELAY", 1.5))
+    ):
+        """
+        Args:
+            api_key: OpenAI API 키
+            max_concurrency: 전체 동시 실행 상한
+            class_limits: 우선순위 클래스별 동시 실행 상한
+            interactive_reserve: DESCRIPTION 이하가 사용할 수 없는 예비 슬롯 수
+            max_retries: 429/5xx 재시도 횟수
+            hedge_delay: hedge=True 호출에서 두 번째 요청을 보내기까지 대기(초)
+        """
+        # 재시도는 스케줄러에서 처리 (SDK 자체 재시도 비활성화)
+        # OPENAI_BASE_URL 설정 시 mock-service 등 대체 서버 사용
+        self.client = AsyncOpenAI(api_key=api_key, base_url=os.getenv("OPENAI_BASE_URL") or None, max_retries=0)
+        self.gate = PriorityGate(max_concurrency, class_limits or DEFAULT_CLASS_LIMITS, interactive_reserve)
+        self.request_bucket = RateBucket("requests")
+        self.token_bucket = RateBucket("tokens")
+        self.max_retries = max_retries
+        self.hedge_delay = hedge_delay
+        self._stats = {
+            "calls": 0,
+            "retries": 0,
+            "rate_limited": 0,
+            "hedged": 0,
+            "hedge_wins": 0,
+            "failures": 0,
+        }
+
+    # =================================================================================
+    # PUBLIC API
+    # =================================================================================
+
+    async def chat(self, priority: Priority, hedge: bool = False, stage: Optional[str] = None, **kwargs) -> Any:
+        """
+        chat.completions.create
+
+        Args:
+            priority: 우선순위 클래스
+            hedge: True면 hedge_delay 안에 응답이 없을 때 같은 요청을 한 번 더 보내 먼저 끝난 결과 사용
+            stage: 사용량 장부에 기록할 단계 이름 (없으면 우선순위 이름)
+            **kwargs: chat.completions.create 인자
+        """
+        create = self.client.chat.completions.with_raw_response.create
+        estimate = self._estimate_tokens(kwargs)
+        stage = stage or priority.name.lower()
+        if hedge:
+            return await self._hedged(priority, create, kwargs, estimate, stage)
+        return await self._call(priority, create, kwargs, estimate, stage)
+
+    async def embed(self, priority: Priority, stage: Optional[str] = None, **kwargs) -> Any:
+        """embeddings.create"""
+        text = kwargs.get("input", "")
+        estimate = len(text if isinstance(text, str) else " ".join(text)) / 2
+        stage = stage or "embedding"
+        return await self._call(priority, self.client.embeddings.with_raw_response.create, kwargs, estimate, stage)
+
+    async def stream_chat(self, priority: Priority = Priority.ANSWER, stage: Optional[str] = None,
+                          **kwargs) -> AsyncGenerator[Any, None]:
+        """
+        스트리밍 chat.completions.create - 스트림이 끝날 때까지 슬롯 점유
+        (첫 chunk 이전 실패만 재시도, 마지막 chunk의 usage로 사용량 기록)
+        """
+        estimate = self._estimate_tokens(kwargs)
+        create = self.client.chat.completions.with_raw_response.create
+        stage = stage or priority.name.lower()
+        kwargs.setdefault("stream_options", {"include_usage": True})
+
+        requested = time.perf_counter()
+        await self.gate.acquire(priority)
+        started = None
+        usage = None
+        content_chunks = 0
+        error = None
+        try:
+            stream = None
+            for attempt in range(self.max_retries + 1):
+                try:
+                    await self._take_rate(priority, estimate)
+                    self._stats["calls"] += 1
+                    started = time.perf_counter()
+                    raw = await create(stream=True, **kwargs)
+                    self._observe(raw.headers)
+                    stream = raw.parse()
+                    break
+                except RETRYABLE_ERRORS as e:
+                    if attempt >= self.max_retries:
+                        self._stats["failures"] += 1
+                        error = type(e).__name__
+                        raise
+                    await self._backoff(e, attempt, priority)
+
+            async for chunk in stream:
+                if getattr(chunk, "usage", None) is not None:
+                    usage = chunk.usage
+                if chunk.choices:
+                    content_chunks += 1
+                yield chunk
+        except Exception as e:
+            error = error or type(e).__name__
+            raise
+        finally:
+            self.gate.release(priority)
+            if started is not None:
+                # 중간에 끊긴 스트림은 usage가 없음 → 입력 추정치 + 받은 chunk 수(≈ 토큰 수)로 기록
+                now = time.perf_counter()
+                record_usage(
+                    stage, kwargs.get("model"), priority.name, usage,
+                    latency=now - started, wait=started - requested, streamed=True,
+                    fallback_prompt_tokens=estimate - (kwargs.get("max_tokens") or 300),
+                    fallback_completion_tokens=content_chunks, error=error
+                )
+
+    async def aclose(self):
+        """서비스 종료 시 OpenAI 클라이언트 정리"""
+        await self.client.close()
+
+    def load(self) -> float:
+        """
+        현재 부하 0~1+ (답변 정책 판단용)
+        max(동시 실행 슬롯 점유율(대기 포함), 요청/토큰 레이트리밋 소진율)
+        """
+        waiting = sum(self.gate.waiting().values())
+        occupancy = (self.gate.active_total + waiting) / self.gate.total if self.gate.total else 0.0
+        return max(occupancy, self.request_bucket.pressure(), self.token_bucket.pressure())
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "active": {priority.name: count for priority, count in self.gate.active.items()},
+            "waiting": self.gate.waiting(),
+            "load": round(self.load(), 3),
+            "rate_limit": {
+                "requests_capacity": self.request_bucket.capacity,
+                "requests_available": round(self.request_bucket.tokens, 1),
+                "tokens_capacity": self.token_bucket.capacity,
+                "tokens_available": round(self.token_bucket.tokens, 1),
+            },
+        }
+
+    # =================================================================================
+    # INTERNAL
+    # =================================================================================
+
+    @staticmethod
+    def _estimate_tokens(kwargs: Dict[str, Any]) -> float:
+        """토큰 버킷 차감용 대략적 토큰 수 (한국어 기준 2자 ≈ 1토큰 + 최대 출력)"""
+        chars = sum(len(str(message.get("content") or "")) for message in kwargs.get("messages", []))
+        return chars / 2 + (kwargs.get("max_tokens") or 300)
+
+    async def _take_rate(self, priority: Priority, estimate: float):
+        await self.request_bucket.take(1, priority)
+        await self.token_bucket.take(estimate, priority)
+
+    def _observe(self, headers):
+        self.request_bucket.observe(
+            headers.get("x-ratelimit-limit-requests"),
+            headers.get("x-ratelimit-remaining-requests"),
+            headers.get("x-ratelimit-reset-requests"),
+        )
+        self.token_bucket.observe(
+            headers.get("x-ratelimit-limit-tokens"),
+            headers.get("x-ratelimit-remaining-tokens"),
+            headers.get("x-ratelimit-reset-tokens"),
+        )
+
+    async def _backoff(self, error: Exception, attempt: int, priority: Priority):
+        """지수 백오프 + full jitter (Retry-After 헤더가 있으면 우선)"""
+        self._stats["retries"] += 1
+
+        retry_after = None
+        response = getattr(error, "response", None)
+        if response is not None:
+            retry_after = parse_reset_duration(response.headers.get("retry-after"))
+
+        if isinstance(error, openai.RateLimitError):
+            self._stats["rate_limited"] += 1
+            if retry_after:
+                self.request_bucket.block(retry_after)
+
+        delay = retry_after or random.uniform(0, min(8.0, 0.5 * (2 ** attempt)))
+        logger.warning(f"[LLM_SCHEDULER] {priority.name} 재시도 {attempt + 1}/{self.max_retries} ({delay:.2f}s 후): {error}")
+        await asyncio.sleep(delay)
+
+    async def _call(self, priority: Priority, create, kwargs: Dict[str, Any], estimate: float, stage: str) -> Any:
+        """슬롯 획득 → 호출 → 헤더/사용량 반영 (재시도 대기 중에는 슬롯 반납)"""
+        requested = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            await self.gate.acquire(priority)
+            try:
+                await self._take_rate(priority, estimate)
+                self._stats["calls"] += 1
+                started = time.perf_counter()
+                raw = await create(**kwargs)
+                self._observe(raw.headers)
+                result = raw.parse()
+                record_usage(
+                    stage, kwargs.get("model"), priority.name, getattr(result, "usage", None),
+                    latency=time.perf_counter() - started, wait=started - requested
+                )
+                return result
+            except RETRYABLE_ERRORS as e:
+                if attempt >= self.max_retries:
+                    self._stats["failures"] += 1
+                    record_usage(
+                        stage, kwargs.get("model"), priority.name, None,
+                        latency=time.perf_counter() - started, wait=started - requested, error=type(e).__name__
+                    )
+                    raise
+                error = e
+            finally:
+                self.gate.release(priority)
+
+            await self._backoff(error, attempt, priority)
+
+    async def _hedged(self, priority: Priority, create, kwargs: Dict[str, Any], estimate: float, stage: str) -> Any:
+        """hedge_delay 안에 끝나지 않으면 같은 요청을 한 번 더 보내 먼저 성공한 결과 사용"""
+        primary = asyncio.ensure_future(self._call(priority, create, kwargs, estimate, stage))
+        done, _ = await asyncio.wait({primary}, timeout=self.hedge_delay)
+        if done:
+            return primary.result()
+
+        self._stats["hedged"] += 1
+        secondary = asyncio.ensure_future(self._call(priority, create, kwargs, estimate, stage))
+        pending = {primary, secondary}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is secondary:
+                            self._stats["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
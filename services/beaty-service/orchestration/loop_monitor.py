@@ -0,0 +1,90 @@
+"""
+Loop Lag Monitor - 이벤트 루프 지연 측정
+일정 간격으로 sleep 후 실제로 깨어난 시각과의 차이(= 루프를 막은 시간)를 기록
+"""
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 백분위 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 샘플러"""
+
+    def __init__(self, interval: float = 0.05, max_samples: int = 20000):
+        """
+        Args:
+            interval: 샘플링 간격(초)
+            max_samples: 보관할 최근 샘플 수
+        """
+        self.interval = interval
+        self.samples: deque = deque(maxlen=max_samples)
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"[LOOP_MONITOR] 시작 (간격 {self.interval * 1000:.0f}ms)")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - expected)
+            self.samples.append(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+    def recent_max(self, count: int = 20) -> float:
+        """최근 count개 샘플 중 최대 지연(초)"""
+        recent = list(itertools.islice(reversed(self.samples), count))
+        return max(recent) if recent else 0.0
+
+    def reset(self):
+        self.samples.clear()
+        self.max_lag = 0.0
+
+    def snapshot(self) -> Dict[str, float]:
+        """지연 백분위 (ms)"""
+        values = sorted(self.samples)
+        return {
+            "samples": len(values),
+            "interval_ms": self.interval * 1000,
+            "mean_ms": round(sum(values) / len(values) * 1000, 3) if values else 0.0,
+            "p50_ms": round(percentile(values, 50) * 1000, 3),
+            "p95_ms": round(percentile(values, 95) * 1000, 3),
+            "p99_ms": round(percentile(values, 99) * 1000, 3),
+            "max_ms": round(self.max_lag * 1000, 3),
+        }
+
+
+# 전역 루프 지연 모니터 인스턴스
+loop_monitor = LoopLagMonitor()
@@ -0,0 +1,84 @@
+"""
+Prompt Cache - 프롬프트 파일 캐시
+파일 수정 시각(mtime)이 바뀐 경우에만 다시 읽음 (서비스 재시작 없이 프롬프트 수정 반영)
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+
+
+class PromptCache:
+    """mtime 기반 핫 리로드 프롬프트 캐시"""
+
+    def __init__(self, check_interval: float = 1.0):
+        """
+        Args:
+            check_interval: mtime 확인 최소 간격(초) - 요청마다 stat 하지 않도록
+        """
+        self.check_interval = check_interval
+        self._entries: Dict[str, Tuple[Optional[int], float, str]] = {}  # path -> (mtime_ns, checked_at, text)
+        self._lock = threading.Lock()
+
+    def get(self, path: PathLike, default: str = "") -> str:
+        """
+        프롬프트 조회
+
+        Args:
+            path: 프롬프트 파일 경로
+            default: 파일이 없거나 읽기 실패 시 사용할 기본 프롬프트
+
+        Returns:
+            프롬프트 텍스트
+        """
+        key = str(path)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None and now - entry[1] < self.check_interval:
+            return entry[2]
+
+        with self._lock:
+            entry = self._entries.get(key)
+            try:
+                mtime_ns = os.stat(key).st_mtime_ns
+            except FileNotFoundError:
+                mtime_ns = None
+
+            if entry is not None and entry[0] == mtime_ns:
+                self._entries[key] = (mtime_ns, now, entry[2])
+                return entry[2]
+
+            if mtime_ns is None:
+                logger.warning(f"[PROMPT_CACHE] 파일 없음, 기본 프롬프트 사용: {key}")
+                text = default
+            else:
+                try:
+                    with open(key, "r", encoding="utf-8") as f:
+                        text = f.read()
+                    logger.info(f"[PROMPT_CACHE] 프롬프트 로드: {key}")
+                except Exception as e:
+                    logger.error(f"[PROMPT_CACHE] 프롬프트 로드 실패 ({key}): {e}")
+                    text = entry[2] if entry is not None else default
+
+            self._entries[key] = (mtime_ns, now, text)
+            return text
+
+    def invalidate(self, path: Optional[PathLike] = None):
+        """캐시 무효화 (path 미지정 시 전체)"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(path), None)
+
+
+# 전역 프롬프트 캐시 인스턴스
+prompt_cache = PromptCache(check_interval=float(os.getenv("PROMPT_CHECK_INTERVAL", 1.0)))
@@ -0,0 +1,197 @@
+"""
+Query History - query_logs 대화기록 조회
+(created_at, id) 키셋 페이지네이션 + 컬럼 프로젝션 (무거운 JSONB는 기본 제외)
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 반환 컬럼 (경량)
+DEFAULT_FIELDS = [
+    "query_text",
+    "intent",
+    "result_count",
+    "beaty_response_text",
+    "beaty_response_type",
+]
+
+# fields= 로 요청 가능한 무거운 컬럼
+HEAVY_FIELDS = [
+    "final_result",
+    "intent_result",
+    "pipeline_steps",
+]
+
+ALLOWED_FIELDS = set(DEFAULT_FIELDS) | set(HEAVY_FIELDS)
+
+
+class InvalidHistoryRequest(ValueError):
+    """잘못된 cursor / fields 파라미터"""
+
+
+async def ensure_indexes(db_pool):
+    """히스토리 조회용 인덱스 생성 (서비스 시작 시 1회)"""
+    if not db_pool:
+        return
+
+    try:
+        async with db_pool.acquire() as conn:
+            # 사용자별 최신순 조회 - 목록 컬럼을 INCLUDE 하여 index-only scan 가능
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_query_logs_user_created
+                ON query_logs (user_id, created_at DESC, id DESC)
+                INCLUDE (intent, result_count, beaty_response_type)
+            """)
+            # user_id 없는 전체 조회 (테스트용)
+            await conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_query_logs_created
+                ON query_logs (created_at DESC, id DESC)
+            """)
+        logger.info("[QUERY_HISTORY] 인덱스 준비 완료")
+    except Exception as e:
+        logger.warning(f"[QUERY_HISTORY] 인덱스 생성 실패 (무시): {e}")
+
+
+def parse_fields(fields: Optional[str]) -> List[str]:
+    """
+    fields 파라미터 파싱
+
+    Args:
+        fields: 콤마 구분 컬럼 목록 (예: "final_result" 또는 "query_text,intent,final_result")
+                None이면 기본 컬럼, 기본 컬럼 외 이름만 주면 기본 컬럼에 추가
+
+    Returns:
+        SELECT할 컬럼 목록 (id, created_at 제외)
+    """
+    if not fields:
+        return list(DEFAULT_FIELDS)
+
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in requested if f not in ALLOWED_FIELDS]
+    if unknown:
+        raise InvalidHistoryRequest(f"알 수 없는 fields: {', '.join(unknown)}")
+
+    # 무거운 컬럼만 지정하면 기본 컬럼 + 해당 컬럼
+    if all(f in HEAVY_FIELDS for f in requested):
+        requested = DEFAULT_FIELDS + requested
+
+    # 중복 제거 (순서 유지)
+    return list(dict.fromkeys(requested))
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id) → 불투명 cursor 문자열"""
+    raw = json.dumps([created_at.isoformat(), row_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """cursor 문자열 → (created_at, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_str, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at_str), int(row_id)
+    except Exception:
+        raise InvalidHistoryRequest("잘못된 cursor")
+
+
+def _format_row(row, columns: List[str]) -> Dict[str, Any]:
+    """DB row → 응답 dict"""
+    item = {"id": row["id"]}
+    for column in columns:
+        item[column] = row[column]
+    item["created_at"] = row["created_at"].isoformat() if row["created_at"] else None
+    return item
+
+
+async def fetch_history_page(
+    db_pool,
+    user_id: Optional[int],
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    offset: int = 0
+) -> Dict[str, Any]:
+    """
+    대화기록 한 페이지 조회
+
+    Args:
+        db_pool: asyncpg 풀
+        user_id: 사용자 ID (None이면 전체 - 테스트용)
+        limit: 페이지 크기 (1~100)
+        cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+        fields: 반환 컬럼 (parse_fields 참고)
+        offset: (deprecated) cursor 미사용 클라이언트 호환용
+
+    Returns:
+        {"queries": [...], "next_cursor": "..." 또는 None, "has_more": bool}
+    """
+    columns = parse_fields(fields)
+    limit = max(1, min(limit, 100))
+
+    conditions = []
+    params: List[Any] = []
+
+    if user_id:
+        params.append(user_id)
+        conditions.append(f"user_id = ${len(params)}")
+
+    if cursor:
+        cursor_created_at, cursor_id = decode_cursor(cursor)
+        params.extend([cursor_created_at, cursor_id])
+        conditions.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)})")
+
+    where_clause = ("WHERE " + " AND ".join(conditions)) if conditions else ""
+
+    # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+    params.append(limit + 1)
+    query_sql = f"""
+        SELECT id, created_at, {", ".join(columns)}
+        FROM query_logs
+        {where_clause}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ${len(params)}
+    """
+    if offset and not cursor:
+        params.append(offset)
+        query_sql += f" OFFSET ${len(params)}"
+
+    async with db_pool.acquire() as conn:
+        rows = await conn.fetch(query_sql, *params)
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(last["created_at"], last["id"])
+
+    return {
+        "queries": [_format_row(row, columns) for row in rows],
+        "next_cursor": next_cursor,
+        "has_more": has_more
+    }
+
+
+async def fetch_history_entry(db_pool, query_id: int, user_id: int) -> Optional[Dict[str, Any]]:
+    """대화기록 단건 전체 조회 (final_result 포함, user_id 소유 기록만)"""
+    columns = DEFAULT_FIELDS + HEAVY_FIELDS
+
+    query_sql = f"""
+        SELECT id, created_at, {", ".join(columns)}
+        FROM query_logs
+        WHERE id = $1 AND user_id = $2
+    """
+
+    async with db_pool.acquire() as conn:
+        row = await conn.fetchrow(query_sql, query_id, user_id)
+
+    if not row:
+        return None
+    return _format_row(row, columns)
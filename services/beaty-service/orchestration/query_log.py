@@ -0,0 +1,317 @@
+"""
+Query Log - query_logs.final_result 압축 저장 / 조회 시 복원
+POI/장소 본문 대신 엔티티 참조(KTO content_id, Google place_id, 경로 요약)만 저장하고,
+대화기록을 열 때 poi-service에서 일괄 조회하여 원래 응답 형태로 복원
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from .http_clients import http_clients
+
+logger = logging.getLogger(__name__)
+
+COMPACT_FORMAT = "compact_v1"
+
+POI_SERVICE_URL = "http://localhost:8001"
+
+# KTO POI 목록 키 (파이프라인별)
+KTO_LIST_KEYS = ("pois", "landmarks")
+
+# KTO 테이블에 없는 파이프라인 생성 필드 (POI별로 따로 보관)
+KTO_EXTRA_FIELDS = (
+    "beaty_description",
+    "distance_km",
+    "keyword_match_count",
+    "similarity",
+    "rank",
+    "description",
+)
+
+# 압축 대상 키 (나머지 키는 그대로 저장)
+COMPACTED_KEYS = set(KTO_LIST_KEYS) | {"poi", "places", "routes", "geojson"}
+
+# 좌표 소수점 자리수 (6자리 ≈ 0.1m)
+COORD_PRECISION = 6
+
+
+# =====================================================================================
+# 저장 (압축)
+# =====================================================================================
+
+def compact_final_response(final_response: Dict[str, Any], intent_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    final_response → 압축 로그 형식
+
+    Returns:
+        {
+            "format": "compact_v1",
+            "answer": "...", "count": 5, ...        # 스칼라/소형 필드는 그대로
+            "refs": {"pois": ["126508", ...], "poi": "126508", "places": ["ChIJ..."]},
+            "extras": {"pois": {"126508": {"beaty_description": "...", "distance_km": 0.4}}},
+            "route": {"origin_coords": {...}, "dest_coords": {...}, "paths": [...]}
+        }
+    """
+    intent_result = intent_result or {}
+    compact: Dict[str, Any] = {"format": COMPACT_FORMAT}
+    refs: Dict[str, Any] = {}
+    extras: Dict[str, Any] = {}
+
+    for key, value in final_response.items():
+        if key not in COMPACTED_KEYS:
+            compact[key] = value
+
+    # KTO POI 목록
+    for key in KTO_LIST_KEYS:
+        items = final_response.get(key)
+        if items is None:
+            continue
+        refs[key] = [str(item["content_id"]) for item in items if item.get("content_id")]
+        extras[key] = {
+            str(item["content_id"]): _pick(item, KTO_EXTRA_FIELDS)
+            for item in items
+            if item.get("content_id") and _pick(item, KTO_EXTRA_FIELDS)
+        }
+
+    # RANDOM 단일 POI
+    if "poi" in final_response:
+        poi = final_response["poi"]
+        refs["poi"] = str(poi["content_id"]) if poi and poi.get("content_id") else None
+        if poi:
+            extras["poi"] = _pick(poi, KTO_EXTRA_FIELDS)
+
+    # Google Places
+    if "places" in final_response:
+        refs["places"] = [place["place_id"] for place in final_response["places"] if place.get("place_id")]
+        refs["language"] = intent_result.get("language", "ko")
+
+    # 경로
+    if "routes" in final_response:
+        compact["route"] = _compact_route(final_response, intent_result)
+
+    compact["refs"] = refs
+    if any(extras.values()):
+        compact["extras"] = {k: v for k, v in extras.items() if v}
+
+    return compact
+
+
+def _pick(item: Dict[str, Any], fields) -> Dict[str, Any]:
+    return {field: item[field] for field in fields if item.get(field) is not None}
+
+
+def _round_coord(coord: List[float]) -> List[float]:
+    return [round(value, COORD_PRECISION) for value in coord]
+
+
+def _compact_route(final_response: Dict[str, Any], intent_result: Dict[str, Any]) -> Dict[str, Any]:
+    """경로 응답 요약 - subPath 트리 대신 경로별 info + 지도 표시용 좌표열만 보관"""
+    origin_coords = None
+    dest_coords = None
+    lines: Dict[int, List[List[float]]] = {}
+
+    geojson = final_response.get("geojson") or {}
+    for feature in geojson.get("features", []):
+        properties = feature.get("properties", {})
+        coordinates = feature.get("geometry", {}).get("coordinates")
+        feature_type = properties.get("type")
+        if feature_type == "origin" and coordinates:
+            origin_coords = {"lat": coordinates[1], "lng": coordinates[0]}
+        elif feature_type == "destination" and coordinates:
+            dest_coords = {"lat": coordinates[1], "lng": coordinates[0]}
+        elif feature_type == "route" and coordinates:
+            lines[properties.get("routeIndex", len(lines))] = [_round_coord(c) for c in coordinates]
+
+    paths = []
+    for index, path in enumerate(final_response.get("routes") or []):
+        paths.append({
+            "pathType": path.get("pathType"),
+            "info": path.get("info", {}),
+            "coordinates": lines.get(index, [])
+        })
+
+    return {
+        "origin_coords": origin_coords,
+        "dest_coords": dest_coords,
+        "transportation_mode": intent_result.get("transportation_mode"),
+        "route_preference": intent_result.get("route_preference", "fastest"),
+        "paths": paths
+    }
+
+
+# =====================================================================================
+# 조회 (복원)
+# =====================================================================================
+
+def _load_json(value: Any) -> Any:
+    """asyncpg는 JSONB를 문자열로 반환"""
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def is_compact(final_result: Any) -> bool:
+    return isinstance(final_result, dict) and final_result.get("format") == COMPACT_FORMAT
+
+
+async def rehydrate_final_results(final_results: List[Any]) -> List[Any]:
+    """
+    압축 로그 목록 → 원래 final_response 형태로 복원
+
+    여러 기록의 KTO/Google 참조를 모아 poi-service에 한 번씩 일괄 조회
+    (압축 이전 형식의 기록은 그대로 반환)
+
+    Args:
+        final_results: query_logs.final_result 값 목록 (JSONB 문자열 또는 dict)
+
+    Returns:
+        복원된 final_response 목록 (입력 순서 유지)
+    """
+    loaded = [_load_json(value) for value in final_results]
+    compacts = [value for value in loaded if is_compact(value)]
+    if not compacts:
+        return loaded
+
+    content_ids: List[str] = []
+    place_ids_by_language: Dict[str, List[str]] = {}
+    for compact in compacts:
+        refs = compact.get("refs", {})
+        for key in KTO_LIST_KEYS:
+            content_ids.extend(refs.get(key) or [])
+        if refs.get("poi"):
+            content_ids.append(refs["poi"])
+        if refs.get("places"):
+            place_ids_by_language.setdefault(refs.get("language", "ko"), []).extend(refs["places"])
+
+    kto_task = _fetch_kto_pois(content_ids)
+    google_tasks = [
+        _fetch_google_places(place_ids, language)
+        for language, place_ids in place_ids_by_language.items()
+    ]
+    kto_pois, *google_results = await asyncio.gather(kto_task, *google_tasks)
+
+    places_by_language = dict(zip(place_ids_by_language.keys(), google_results))
+
+    return [
+        _rehydrate(value, kto_pois, places_by_language) if is_compact(value) else value
+        for value in loaded
+    ]
+
+
+def _rehydrate(
+    compact: Dict[str, Any],
+    kto_pois: Dict[str, Dict[str, Any]],
+    places_by_language: Dict[str, Dict[str, Dict[str, Any]]]
+) -> Dict[str, Any]:
+    refs = compact.get("refs", {})
+    extras = compact.get("extras", {})
+    result = {k: v for k, v in compact.items() if k not in ("format", "refs", "extras", "route")}
+
+    for key in KTO_LIST_KEYS:
+        if key not in refs:
+            continue
+        key_extras = extras.get(key, {})
+        result[key] = [
+            {**kto_pois[content_id], **key_extras.get(content_id, {})}
+            for content_id in refs[key]
+            if content_id in kto_pois
+        ]
+
+    if "poi" in refs:
+        content_id = refs["poi"]
+        result["poi"] = {**kto_pois[content_id], **extras.get("poi", {})} if content_id in kto_pois else None
+
+    if "places" in refs:
+        places = places_by_language.get(refs.get("language", "ko"), {})
+        result["places"] = [places[place_id] for place_id in refs["places"] if place_id in places]
+
+    if "route" in compact:
+        result.update(_rehydrate_route(compact["route"]))
+
+    return result
+
+
+def _rehydrate_route(route: Dict[str, Any]) -> Dict[str, Any]:
+    """경로 요약 → routes + geojson (파이프라인과 같은 FeatureCollection 구조)"""
+    routes = []
+    features = []
+
+    origin = route.get("origin_coords")
+    destination = route.get("dest_coords")
+    if origin:
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [origin["lng"], origin["lat"]]},
+            "properties": {"type": "origin", "name": "출발지"}
+        })
+    if destination:
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [destination["lng"], destination["lat"]]},
+            "properties": {"type": "destination", "name": "도착지"}
+        })
+
+    for index, path in enumerate(route.get("paths", [])):
+        info = path.get("info", {})
+        routes.append({"pathType": path.get("pathType"), "info": info})
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "LineString", "coordinates": path.get("coordinates", [])},
+            "properties": {
+                "type": "route",
+                "routeIndex": index,
+                "totalTime": info.get("totalTime", 0),
+                "payment": info.get("payment", 0),
+                "totalDistance": info.get("totalDistance", 0)
+            }
+        })
+
+    return {
+        "routes": routes,
+        "geojson": {"type": "FeatureCollection", "features": features}
+    }
+
+
+async def _fetch_kto_pois(content_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """poi-service /api/kto/batch 일괄 조회 → {content_id: poi}"""
+    unique_ids = list(dict.fromkeys(content_ids))
+    if not unique_ids:
+        return {}
+
+    try:
+        client = http_clients.get(POI_SERVICE_URL)
+        response = await client.post(
+            f"{POI_SERVICE_URL}/api/kto/batch",
+            json={"content_ids": unique_ids},
+            timeout=10.0
+        )
+        response.raise_for_status()
+        return {poi["content_id"]: poi for poi in response.json().get("results", [])}
+    except Exception as e:
+        logger.warning(f"[QUERY_LOG] KTO POI 복원 실패: {e}")
+        return {}
+
+
+async def _fetch_google_places(place_ids: List[str], language: str) -> Dict[str, Dict[str, Any]]:
+    """poi-service /api/google/details 일괄 조회 → {place_id: place}"""
+    unique_ids = list(dict.fromkeys(place_ids))
+    if not unique_ids:
+        return {}
+
+    try:
+        client = http_clients.get(POI_SERVICE_URL)
+        response = await client.post(
+            f"{POI_SERVICE_URL}/api/google/details",
+            json={"place_ids": unique_ids, "language": language},
+            timeout=15.0
+        )
+        response.raise_for_status()
+        return {place["place_id"]: place for place in response.json().get("results", [])}
+    except Exception as e:
+        logger.warning(f"[QUERY_LOG] Google 장소 복원 실패: {e}")
+        return {}
@@ -3,9 +3,22 @@ Response Generator - GPT 응답 생성 헬퍼
 모든 파이프라인에서 사용할 수 있는 공통 응답 생성기
 """
 
-from typing import AsyncGenerator, List, Dict
+import logging
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from .answer_cache import replay_answer
+from .answer_policy import AnswerMode, answer_policy
+from .answer_templates import render_template
 from .gpt_streaming import stream_gpt_response
 
+logger = logging.getLogger(__name__)
+
+# gpt_streaming이 오류 시 내보내는 문구
+_ERROR_PREFIX = "[오류 발생"
+
+# FLOURISH 모드에서 템플릿 뒤에 붙일 LLM 문장 최대 토큰
+FLOURISH_MAX_TOKENS = 60
+
 
 async def create_streaming_response(
     service,
@@ -28,13 +41,14 @@ async def create_streaming_response(
         {"role": "user", "content": f"{context}\n\n{instruction}"}
     ]
 
-    async for chunk in stream_gpt_response(service.client, messages):
+    async for chunk in stream_gpt_response(service.llm, messages):
         yield chunk
 
 
 async def create_streaming_response_with_messages(
     service,
-    messages: List[Dict[str, str]]
+    messages: List[Dict[str, str]],
+    stage: str = "chat"
 ) -> AsyncGenerator[str, None]:
     """
     커스텀 메시지로 GPT 스트리밍 응답 생성
@@ -42,9 +56,97 @@ async def create_streaming_response_with_messages(
     Args:
         service: BeatyService 인스턴스
         messages: GPT 메시지 배열
+        stage: 사용량 장부 단계 이름
 
     Yields:
         str: GPT 응답 chunk
     """
-    async for chunk in stream_gpt_response(service.client, messages):
+    async for chunk in stream_gpt_response(service.llm, messages, stage=stage):
+        yield chunk
+
+
+async def _llm_answer_stream(
+    service,
+    context: str,
+    instruction: str,
+    fallback: str
+) -> AsyncGenerator[str, None]:
+    """LLM 스트리밍 답변 (첫 chunk부터 오류면 템플릿 답변으로 대체)"""
+    started = False
+    async for chunk in create_streaming_response(service, context, instruction):
+        if not started and chunk.startswith(_ERROR_PREFIX):
+            logger.warning(f"[RESPONSE] LLM 답변 실패 → 템플릿 사용")
+            async for replayed in replay_answer(fallback):
+                yield replayed
+            return
+        started = True
+        yield chunk
+
+
+async def _flourish_stream(
+    service,
+    template: str,
+    context: str
+) -> AsyncGenerator[str, None]:
+    """템플릿을 먼저 보내고 LLM 한 문장을 이어서 스트리밍 (LLM 오류 시 템플릿으로 종료)"""
+    async for chunk in replay_answer(template):
+        yield chunk
+
+    messages = [
+        {"role": "system", "content": service.character_prompt},
+        {"role": "user", "content": (
+            f"{context}\n\n이미 주인님께 이렇게 말씀드렸어요: \"{template}\"\n"
+            "이 말 뒤에 자연스럽게 이어질 짧은 한 문장만 덧붙여주세요. 앞의 말을 반복하거나 장소 이름을 나열하지 마세요."
+        )}
+    ]
+    first = True
+    async for chunk in stream_gpt_response(service.llm, messages, max_tokens=FLOURISH_MAX_TOKENS, stage="flourish"):
+        if first:
+            if chunk.startswith(_ERROR_PREFIX):
+                return
+            yield " "
+            first = False
         yield chunk
+
+
+def compose_answer(
+    service,
+    intent: str,
+    outcome: str,
+    context: str,
+    instruction: str = "위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요.",
+    mode: Optional[AnswerMode] = None,
+    **params
+) -> Dict[str, Any]:
+    """
+    템플릿 우선 최종 답변 (answer + answer_stream)
+    답변 정책(부하/배포 설정)에 따라 템플릿만 / 템플릿 + LLM 한 문장 / LLM 답변 중 선택
+
+    Args:
+        service: BeatyService 인스턴스
+        intent: 의도 (템플릿 키)
+        outcome: 결과 종류 (found / none / alternative / fallback / geocoding_failed)
+        context: LLM에 제공할 컨텍스트 (LLM / FLOURISH 모드)
+        instruction: LLM 모드 지시사항
+        mode: 이미 정한 답변 모드 (없으면 정책에서 선택)
+        **params: 템플릿 치환 값
+
+    Returns:
+        {"answer": 템플릿 답변, "answer_stream": 스트림, "answer_mode": 모드}
+        answer는 스트리밍 완료 후 main에서 실제 전송된 답변으로 교체됨
+    """
+    mode = mode or answer_policy.choose(service.llm, intent, outcome)
+    template = render_template(intent, outcome, **params)
+
+    if mode == AnswerMode.TEMPLATE:
+        answer_stream = replay_answer(template)
+    elif mode == AnswerMode.FLOURISH:
+        answer_stream = _flourish_stream(service, template, context)
+    else:
+        answer_stream = _llm_answer_stream(service, context, instruction, template)
+
+    return {
+        "answer": template,
+        "answer_stream": answer_stream,
+        "answer_mode": mode.value
+    }
@@ -0,0 +1,104 @@
+"""
+Result State - 세션별 직전 검색 결과 (구조화)
+"그 중에 주차 되는 곳만", "더 가까운 곳은?" 같은 후속 질의를 파이프라인 재실행 없이
+직전 후보 집합에서 필터/정렬/페이지 이동으로 처리하기 위해 보관
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# 결과 상태를 남기는 의도 → 목록 키
+RESULT_ITEM_KEYS = {
+    "RECOMMEND": "pois",
+    "FIND_PLACE": "places",
+}
+
+
+@dataclass
+class ResultState:
+    """직전 검색 결과 + 현재 보기 (필터/정렬/표시 개수)"""
+    intent: str
+    item_key: str
+    items: List[Dict[str, Any]]
+    query: str
+    classification: Dict[str, Any]
+    user_location: Optional[Dict[str, float]] = None
+    geometry: Optional[Dict[str, Any]] = None
+    category_ids: List[str] = field(default_factory=list)
+    page_size: int = 10
+
+    # 현재 보기 (후속 질의마다 갱신)
+    filters: List[str] = field(default_factory=list)
+    max_distance_km: Optional[float] = None
+    sort_by: Optional[str] = None
+    shown: int = 0
+    created_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_pipeline_result(
+        cls,
+        query: str,
+        classification: Dict[str, Any],
+        pipeline_result: Dict[str, Any],
+        user_location: Optional[Dict[str, float]] = None
+    ) -> Optional["ResultState"]:
+        """
+        파이프라인 결과에서 결과 상태 생성 (대상 의도가 아니거나 결과가 없으면 None)
+        후보 = 화면에 보여준 목록 + 검색 단계에서 받았지만 보여주지 않은 나머지
+        """
+        intent = pipeline_result.get("intent")
+        item_key = RESULT_ITEM_KEYS.get(intent)
+        if not item_key:
+            return None
+
+        final_response = pipeline_result.get("final_response", {})
+        shown_items = final_response.get(item_key) or []
+        if not shown_items:
+            return None
+
+        geometry = None
+        category_ids: List[str] = []
+        pool: List[Dict[str, Any]] = []
+        for step in pipeline_result.get("steps", []):
+            result = step.get("result")
+            if not isinstance(result, dict):
+                continue
+            resolved = result.get("resolved")
+            if isinstance(resolved, dict):
+                geometry = resolved
+            if result.get("category_ids"):
+                category_ids = result["category_ids"]
+            if isinstance(result.get(item_key), list) and result is not final_response:
+                pool = result[item_key]
+
+        items = list(shown_items)
+        seen = {item_identity(item) for item in items}
+        for item in pool:
+            identity = item_identity(item)
+            if identity not in seen:
+                seen.add(identity)
+                items.append(item)
+
+        return cls(
+            intent=intent,
+            item_key=item_key,
+            items=items,
+            query=query,
+            classification={k: v for k, v in classification.items() if k != "intent"},
+            user_location=user_location,
+            geometry=geometry,
+            category_ids=category_ids,
+            page_size=len(shown_items),
+            shown=len(shown_items),
+        )
+
+    def hint(self) -> str:
+        """의도분류에 전달할 요약 (REFINE 판단용)"""
+        kind = "추천 장소" if self.intent == "RECOMMEND" else "검색 장소"
+        return f"직전 결과: '{self.query}'에 대한 {kind} {len(self.items)}곳 ({self.shown}곳 표시 중)"
+
+
+def item_identity(item: Dict[str, Any]) -> str:
+    """중복 제거용 항목 식별자 (KTO content_id / Google place_id / 이름)"""
+    return str(item.get("content_id") or item.get("place_id") or item.get("title") or item.get("name"))
@@ -6,6 +6,8 @@ Session Memory - 대화 히스토리 관리
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
+from .result_state import ResultState
+
 
 class Message:
     """대화 메시지"""
@@ -32,6 +34,7 @@ class SessionMemory:
             max_history: 최대 저장할 메시지 수 (기본 10개)
         """
         self.messages: List[Message] = []
+        self.result_state: Optional[ResultState] = None  # 직전 검색 결과 (후속 질의용)
         self.max_history = max_history
         self.created_at = datetime.now()
         self.last_accessed = datetime.now()
@@ -58,6 +61,11 @@ class SessionMemory:
         messages = self.messages if last_n is None else self.messages[-last_n:]
         return [{"role": msg.role, "content": msg.content} for msg in messages]
 
+    def set_result_state(self, state: Optional[ResultState]):
+        """직전 검색 결과 교체"""
+        self.result_state = state
+        self.last_accessed = datetime.now()
+
     def get_context_text(self, last_n: Optional[int] = None) -> str:
         """대화 히스토리를 텍스트로 반환 (프롬프트용)"""
         messages = self.messages if last_n is None else self.messages[-last_n:]
@@ -75,6 +83,7 @@ class SessionMemory:
     def clear(self):
         """메모리 초기화"""
         self.messages = []
+        self.result_state = None
         self.last_accessed = datetime.now()
 
     def is_expired(self, ttl_minutes: int = 60) -> bool:
@@ -0,0 +1,97 @@
+"""
+SWR Cache - stale-while-revalidate 비동기 캐시
+신선한 값은 바로 반환, 오래된 값은 바로 반환하면서 백그라운드로 갱신
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class SWRCache:
+    """stale-while-revalidate 캐시 (동일 키 동시 로드는 1회로 합침)"""
+
+    def __init__(self, fresh_seconds: float = 300.0, stale_seconds: float = 3600.0):
+        """
+        Args:
+            fresh_seconds: 이 시간 이내 값은 그대로 반환
+            stale_seconds: 이 시간 이내 값은 반환하되 백그라운드 갱신 (초과 시 동기 로드)
+        """
+        self.fresh_seconds = fresh_seconds
+        self.stale_seconds = stale_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """저장된 값의 경과 시간(초), 없으면 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return time.monotonic() - entry[0]
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Loader,
+        fresh_seconds: Optional[float] = None,
+        stale_seconds: Optional[float] = None
+    ) -> Any:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+            loader: 값을 새로 가져오는 코루틴 함수 (실패 시 None 반환 또는 예외)
+            fresh_seconds / stale_seconds: 키별 TTL (미지정 시 기본값)
+
+        Returns:
+            값 (로드 실패 + 저장된 값 없으면 None)
+        """
+        fresh = self.fresh_seconds if fresh_seconds is None else fresh_seconds
+        stale = self.stale_seconds if stale_seconds is None else stale_seconds
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            if age < fresh:
+                return entry[1]
+            if age < stale:
+                # 오래된 값 즉시 반환 + 백그라운드 갱신
+                self._start_refresh(key, loader)
+                return entry[1]
+
+        value = await self._start_refresh(key, loader)
+        if value is None and entry is not None:
+            # stale-if-error: 갱신 실패 시 마지막 값이라도 반환
+            logger.warning(f"[SWR_CACHE] 갱신 실패, 만료된 값 반환: {key}")
+            return entry[1]
+        return value
+
+    async def refresh(self, key: Hashable, loader: Loader) -> Any:
+        """강제 갱신 (백그라운드 리프레셔용)"""
+        return await self._start_refresh(key, loader)
+
+    def _start_refresh(self, key: Hashable, loader: Loader) -> "asyncio.Task":
+        """키별 로드 작업 시작 (이미 진행 중이면 기존 작업 재사용)"""
+        task = self._inflight.get(key)
+        if task is None or task.done():
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+        return task
+
+    async def _load(self, key: Hashable, loader: Loader) -> Any:
+        try:
+            value = await loader()
+            if value is not None:
+                self._entries[key] = (time.monotonic(), value)
+            return value
+        except Exception as e:
+            logger.error(f"[SWR_CACHE] 로드 실패 ({key}): {e}")
+            return None
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,265 @@
+"""
+Usage Ledger - 요청별 OpenAI 사용량/비용 장부
+- LLMScheduler가 모든 chat / embedding / 스트리밍 호출의 토큰, 모델, 지연을 현재 요청 장부에 기록
+- 요청 장부는 ContextVar로 전달 (파이프라인 함수 시그니처 변경 없음, gather 하위 작업에도 전파)
+- 요청 종료 시 의도별 누적 지표에 합산 → /api/metrics/llm-usage
+"""
+
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 모델별 단가 (USD / 1M 토큰): (입력, 캐시 입력, 출력)
+MODEL_PRICES = {
+    "gpt-4o-mini": (0.15, 0.075, 0.60),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "text-embedding-3-small": (0.02, 0.02, 0.0),
+    "text-embedding-3-large": (0.13, 0.13, 0.0),
+    "text-embedding-ada-002": (0.10, 0.10, 0.0),
+}
+
+
+def model_price(model: Optional[str]):
+    """단가 조회 (날짜 붙은 스냅샷 이름은 기본 모델 단가 사용, 모르면 None)"""
+    if not model:
+        return None
+    if model in MODEL_PRICES:
+        return MODEL_PRICES[model]
+    for name in sorted(MODEL_PRICES, key=len, reverse=True):
+        if model.startswith(name):
+            return MODEL_PRICES[name]
+    return None
+
+
+def estimate_cost(model: Optional[str], prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> float:
+    price = model_price(model)
+    if price is None:
+        return 0.0
+    input_price, cached_price, output_price = price
+    uncached = max(0, prompt_tokens - cached_tokens)
+    return (uncached * input_price + cached_tokens * cached_price + completion_tokens * output_price) / 1_000_000
+
+
+class UsageLedger:
+    """요청 1건의 LLM 호출 기록"""
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self.started_at = time.perf_counter()
+
+    def record(
+        self,
+        stage: str,
+        model: Optional[str],
+        priority: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency_ms: float,
+        wait_ms: float,
+        cached_tokens: int = 0,
+        streamed: bool = False,
+        estimated: bool = False,
+        error: Optional[str] = None
+    ):
+        self.entries.append({
+            "stage": stage,
+            "model": model,
+            "priority": priority,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
+            "latency_ms": round(latency_ms, 1),
+            "wait_ms": round(wait_ms, 1),
+            "cost_usd": round(estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens), 8),
+            "streamed": streamed,
+            "estimated": estimated,
+            "error": error,
+        })
+
+    def summary(self) -> Dict[str, Any]:
+        """단계별 합계 + 전체 합계 + 호출 목록"""
+        by_stage: Dict[str, Dict[str, Any]] = {}
+        for entry in self.entries:
+            stage = by_stage.setdefault(entry["stage"], {
+                "calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0, "latency_ms": 0.0, "errors": 0,
+            })
+            stage["calls"] += 1
+            stage["prompt_tokens"] += entry["prompt_tokens"]
+            stage["completion_tokens"] += entry["completion_tokens"]
+            stage["cost_usd"] += entry["cost_usd"]
+            stage["latency_ms"] += entry["latency_ms"]
+            stage["errors"] += 1 if entry["error"] else 0
+
+        for stage in by_stage.values():
+            stage["cost_usd"] = round(stage["cost_usd"], 8)
+            stage["latency_ms"] = round(stage["latency_ms"], 1)
+
+        return {
+            "totals": {
+                "calls": len(self.entries),
+                "prompt_tokens": sum(entry["prompt_tokens"] for entry in self.entries),
+                "completion_tokens": sum(entry["completion_tokens"] for entry in self.entries),
+                "cost_usd": round(sum(entry["cost_usd"] for entry in self.entries), 8),
+                "llm_latency_ms": round(sum(entry["latency_ms"] for entry in self.entries), 1),
+                "request_ms": round((time.perf_counter() - self.started_at) * 1000, 1),
+            },
+            "by_stage": by_stage,
+            "calls": self.entries,
+        }
+
+
+# 현재 요청의 장부 (요청 밖의 호출 - 백그라운드 작업 등은 None → 누적 지표에만 "background"로 합산)
+current_ledger: ContextVar[Optional[UsageLedger]] = ContextVar("current_ledger", default=None)
+
+
+def start_ledger() -> UsageLedger:
+    """현재 요청(작업) 컨텍스트에 새 장부 설정"""
+    ledger = UsageLedger()
+    current_ledger.set(ledger)
+    return ledger
+
+
+def record_usage(
+    stage: str,
+    model: Optional[str],
+    priority: str,
+    usage: Any,
+    latency: float,
+    wait: float,
+    streamed: bool = False,
+    fallback_prompt_tokens: int = 0,
+    fallback_completion_tokens: int = 0,
+    error: Optional[str] = None
+):
+    """
+    LLMScheduler 호출 결과 기록
+    usage(OpenAI 응답 usage 객체)가 없으면 (스트림 중단, 오류) fallback 추정치로 기록
+    """
+    if usage is not None:
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = (getattr(details, "cached_tokens", 0) or 0) if details is not None else 0
+        estimated = False
+    else:
+        prompt_tokens = int(fallback_prompt_tokens)
+        completion_tokens = int(fallback_completion_tokens)
+        cached_tokens = 0
+        estimated = True
+
+    ledger = current_ledger.get()
+    if ledger is None:
+        usage_metrics.add_background(stage, model, prompt_tokens, completion_tokens, cached_tokens, latency * 1000)
+        return
+    ledger.record(
+        stage, model, priority, prompt_tokens, completion_tokens,
+        latency * 1000, wait * 1000, cached_tokens, streamed, estimated, error
+    )
+
+
+class UsageMetrics:
+    """의도별 누적 사용량 (프로세스 시작 이후)"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.intents: Dict[str, Dict[str, Any]] = {}
+
+    def _bucket(self, intent: str) -> Dict[str, Any]:
+        return self.intents.setdefault(intent, {
+            "requests": 0, "calls": 0, "prompt_tokens": 0, "completion_tokens": 0,
+            "cost_usd": 0.0, "llm_latency_ms": 0.0, "stages": {},
+        })
+
+    def _add_stage(self, bucket: Dict[str, Any], stage_name: str, calls: int, prompt_tokens: int,
+                   completion_tokens: int, cost_usd: float, latency_ms: float, errors: int = 0):
+        stage = bucket["stages"].setdefault(stage_name, {
+            "calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0,
+            "latency_ms": 0.0, "max_latency_ms": 0.0, "errors": 0,
+        })
+        stage["calls"] += calls
+        stage["prompt_tokens"] += prompt_tokens
+        stage["completion_tokens"] += completion_tokens
+        stage["cost_usd"] += cost_usd
+        stage["latency_ms"] += latency_ms
+        stage["errors"] += errors
+
+        bucket["calls"] += calls
+        bucket["prompt_tokens"] += prompt_tokens
+        bucket["completion_tokens"] += completion_tokens
+        bucket["cost_usd"] += cost_usd
+        bucket["llm_latency_ms"] += latency_ms
+
+    def add_request(self, intent: str, ledger: UsageLedger):
+        bucket = self._bucket(intent)
+        bucket["requests"] += 1
+        for entry in ledger.entries:
+            self._add_stage(
+                bucket, entry["stage"], 1, entry["prompt_tokens"], entry["completion_tokens"],
+                entry["cost_usd"], entry["latency_ms"], 1 if entry["error"] else 0
+            )
+            stage = bucket["stages"][entry["stage"]]
+            stage["max_latency_ms"] = max(stage["max_latency_ms"], entry["latency_ms"])
+
+    def add_background(self, stage: str, model: Optional[str], prompt_tokens: int, completion_tokens: int,
+                       cached_tokens: int, latency_ms: float):
+        bucket = self._bucket("background")
+        cost = estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens)
+        self._add_stage(bucket, stage, 1, prompt_tokens, completion_tokens, cost, latency_ms)
+        bucket["stages"][stage]["max_latency_ms"] = max(bucket["stages"][stage]["max_latency_ms"], latency_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        intents = {}
+        for intent, bucket in self.intents.items():
+            requests = bucket["requests"]
+            stages = {}
+            for name, stage in sorted(bucket["stages"].items(), key=lambda item: -item[1]["cost_usd"]):
+                stages[name] = {
+                    **stage,
+                    "cost_usd": round(stage["cost_usd"], 6),
+                    "latency_ms": round(stage["latency_ms"], 1),
+                    "avg_latency_ms": round(stage["latency_ms"] / stage["calls"], 1) if stage["calls"] else 0.0,
+                    "max_latency_ms": round(stage["max_latency_ms"], 1),
+                }
+            intents[intent] = {
+                **bucket,
+                "cost_usd": round(bucket["cost_usd"], 6),
+                "llm_latency_ms": round(bucket["llm_latency_ms"], 1),
+                "avg_cost_usd": round(bucket["cost_usd"] / requests, 8) if requests else None,
+                "avg_tokens": round((bucket["prompt_tokens"] + bucket["completion_tokens"]) / requests, 1) if requests else None,
+                "stages": stages,
+            }
+        return {
+            "since": self.started_at,
+            "total_cost_usd": round(sum(bucket["cost_usd"] for bucket in self.intents.values()), 6),
+            "intents": intents,
+        }
+
+    def reset(self):
+        self.started_at = time.time()
+        self.intents.clear()
+
+
+# 전역 의도별 누적 사용량 인스턴스
+usage_metrics = UsageMetrics()
+
+# query_logs.llm_usage 컬럼 준비 여부 (ensure_usage_column 성공 시 True)
+usage_column_ready = False
+
+
+async def ensure_usage_column(db_pool):
+    """query_logs에 llm_usage JSONB 컬럼 추가 (서비스 시작 시 1회, 실패 시 컬럼 없이 저장)"""
+    global usage_column_ready
+    if not db_pool or os.getenv("QUERY_LOG_USAGE", "true").lower() != "true":
+        return
+
+    try:
+        async with db_pool.acquire() as conn:
+            await conn.execute("ALTER TABLE query_logs ADD COLUMN IF NOT EXISTS llm_usage JSONB")
+        usage_column_ready = True
+        logger.info("[USAGE_LEDGER] query_logs.llm_usage 컬럼 준비 완료")
+    except Exception as e:
+        logger.warning(f"[USAGE_LEDGER] llm_usage 컬럼 준비 실패 (사용량 저장 생략): {e}")
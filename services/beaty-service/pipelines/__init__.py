@@ -1,3 +1,29 @@
 """
 Beaty Pipelines - 의도별 파이프라인 오케스트레이션
 """
+
+from typing import Awaitable, Callable, Dict, Optional
+
+from .route.pipeline import execute as execute_route
+from .google.pipeline import execute as execute_findplace
+from .recommend.pipeline import execute as execute_recommend
+from .landmark.pipeline import execute as execute_landmark
+from .randompoi.pipeline import execute as execute_random
+from .refine.pipeline import execute as execute_refine
+
+PipelineExecute = Callable[..., Awaitable[Dict]]
+
+# 의도 → 파이프라인 (GENERAL_CHAT 등 미등록 의도는 main에서 직접 대화 처리)
+PIPELINES: Dict[str, PipelineExecute] = {
+    "ROUTE": execute_route,
+    "FIND_PLACE": execute_findplace,
+    "RECOMMEND": execute_recommend,
+    "LANDMARK": execute_landmark,
+    "RANDOM": execute_random,
+    "REFINE": execute_refine,
+}
+
+
+def get_pipeline(intent: str) -> Optional[PipelineExecute]:
+    """의도에 해당하는 파이프라인 execute 함수 (없으면 None)"""
+    return PIPELINES.get(intent)
@@ -1,15 +1,15 @@
 """
 FIND_PLACE 파이프라인 - 장소 검색 의도 처리
 """
-import httpx
 from typing import Dict, Any, Optional, List
-from openai import OpenAI
 import sys
 from pathlib import Path
 
 # 상위 디렉토리의 orchestration 모듈 import
 sys.path.append(str(Path(__file__).parent.parent.parent))
-from orchestration.response_generator import create_streaming_response
+from orchestration.answer_cache import replay_answer
+from orchestration.answer_templates import FOUND, NONE, GEOCODING_FAILED, render_template
+from orchestration.response_generator import compose_answer
 
 
 async def execute(
@@ -57,16 +57,14 @@ async def execute(
         )
 
         # Step 2: 쿼리 리라이트 (FIND_PLACE용)
-        from .query_rewriter import GoogleQueryRewriter
-
-        rewriter = GoogleQueryRewriter(service.config["openai_api_key"])
+        rewriter = service.components.google_query_rewriter
 
         category_text = classification.get("category_text")
         location_keyword = classification.get("location_keyword") or classification.get("destination_keyword")
         hard_constraints = classification.get("hard_constraints", [])
         emotion = classification.get("emotion")
 
-        rewrite_result = rewriter.rewrite(
+        rewrite_result = await rewriter.rewrite(
             original_query=query,
             category_text=category_text,
             location_keyword=location_keyword,
@@ -90,21 +88,21 @@ async def execute(
         user_lat = user_location["lat"] if user_location else 37.5665
         user_lng = user_location["lng"] if user_location else 126.9780
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:8001/api/google/search",
-                json={
-                    "keyword": search_keyword,
-                    "user_lat": user_lat,
-                    "user_lng": user_lng,
-                    "limit": limit,
-                    "language": "ko",
-                    "filters": filters
-                },
-                timeout=10.0
-            )
-            response.raise_for_status()
-            places_data = response.json()
+        client = service.http_clients.get("http://localhost:8001")
+        response = await client.post(
+            "http://localhost:8001/api/google/search",
+            json={
+                "keyword": search_keyword,
+                "user_lat": user_lat,
+                "user_lng": user_lng,
+                "limit": limit,
+                "language": "ko",
+                "filters": filters
+            },
+            timeout=10.0
+        )
+        response.raise_for_status()
+        places_data = response.json()
 
         places = places_data.get("results", [])
 
@@ -121,7 +119,7 @@ async def execute(
         print(f"[GOOGLE_PIPELINE] Step 3 완료: {len(places)}개 장소")
 
         # Step 4: 최종 응답 생성
-        final_response = _generate_final_response(
+        final_response = await _generate_final_response(
             service,
             query,
             search_keyword,
@@ -130,24 +128,6 @@ async def execute(
             location_keyword=location_keyword
         )
 
-        # 스트리밍 응답 추가
-        if "answer" in final_response and final_response["answer"]:
-            context = f"""
-사용자 질문: {query}
-검색 키워드: {search_keyword}
-Google Places 검색 결과: {len(places)}개 장소
-
-** 응답 가이드:
-1. 검색 결과를 친근하게 소개
-2. 장소 이름은 나열하지 않기
-3. 짧고 자연스럽게 답변하기
-"""
-            final_response["answer_stream"] = create_streaming_response(
-                service,
-                context,
-                "위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 장소 이름은 절대 나열하지 마세요."
-            )
-
         steps.append({
             "step": 4,
             "name": "최종응답",
@@ -182,7 +162,7 @@ Google Places 검색 결과: {len(places)}개 장소
         }
 
 
-def _generate_final_response(
+async def _generate_final_response(
     service,
     original_query: str,
     search_keyword: str,
@@ -190,19 +170,18 @@ def _generate_final_response(
     is_geocoding_failed: bool = False,
     location_keyword: str = None
 ) -> Dict:
-    """최종 응답 생성 - Beaty 캐릭터로 응답"""
+    """최종 응답 생성 - 템플릿 우선 (답변 정책에 따라 LLM 스트리밍)"""
 
-    # Geocoding 실패로 전환된 경우 특별 처리
+    # Geocoding 실패로 전환된 경우 특별 처리 (고정 안내 문구)
     if is_geocoding_failed:
-        answer = f"앗! '{location_keyword}'까지 가는 경로를 찾으려 했는데, 정확한 위치를 특정하기 어려워요. 😅\n\n"
-        answer += f"'{location_keyword}'가 조금 애매한 것 같아요. 지도에서 정확한 출발지나 도착지를 클릭해서 선택해주시면, "
-        answer += f"더 정확한 경로를 안내해드릴 수 있어요!\n\n"
-
+        answer = render_template("FIND_PLACE", GEOCODING_FAILED, location=location_keyword)
         if places:
-            answer += f"대신 '{search_keyword}'에 대한 장소 {len(places)}개를 찾아봤어요. 혹시 이 중에 원하시는 곳이 있을까요?"
+            answer += render_template("FIND_PLACE", "geocoding_failed_places", search_keyword=search_keyword, count=len(places))
 
         return {
             "answer": answer,
+            "answer_stream": replay_answer(answer),
+            "answer_mode": "template",
             "places": places,
             "count": len(places),
             "geocoding_failed": True,
@@ -215,54 +194,34 @@ def _generate_final_response(
 검색 키워드: {search_keyword}
 결과: 장소를 찾을 수 없음
 """
-        try:
-            client = OpenAI(api_key=service.config["openai_api_key"])
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": service.character_prompt},
-                    {"role": "user", "content": f"{context}\n\n위 정보를 바탕으로 주인님께 친절하게 답변해주세요."}
-                ],
-                temperature=0.7
-            )
-            answer = response.choices[0].message.content
-        except Exception as e:
-            print(f"[GOOGLE_PIPELINE] OpenAI 호출 실패: {e}")
-            answer = f"앗, '{search_keyword}'에 대한 검색 결과를 찾을 수 없었어요."
-
         return {
-            "answer": answer,
+            **compose_answer(
+                service, "FIND_PLACE", NONE, context,
+                "위 정보를 바탕으로 주인님께 친절하게 답변해주세요.",
+                search_keyword=search_keyword
+            ),
             "places": [],
             "count": 0
         }
 
-    # GPT로 자연스러운 응답 생성 (장소 리스트 제외)
+    # 장소 리스트 제외, 개수만 전달
     context = f"""
 사용자 질문: {original_query}
 검색 키워드: {search_keyword}
-총 검색 결과: {len(places)}개
+Google Places 검색 결과: {len(places)}개 장소
 
-** 장소 이름을 나열하지 말고, "{len(places)}개 장소를 찾았다"는 내용으로 자연스럽게 응답해주세요.
-** 사용자의 질문 의도에 맞춰 공감하며 짧게 답변해주세요.
+** 응답 가이드:
+1. 검색 결과를 친근하게 소개
+2. 장소 이름은 나열하지 않기
+3. 짧고 자연스럽게 답변하기
 """
 
-    try:
-        client = OpenAI(api_key=service.config["openai_api_key"])
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": service.character_prompt},
-                {"role": "user", "content": f"{context}\n\n위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 장소 이름은 절대 나열하지 마세요."}
-            ],
-            temperature=0.7
-        )
-        answer = response.choices[0].message.content
-    except Exception as e:
-        print(f"[FINDPLACE_PIPELINE] OpenAI 호출 실패: {e}")
-        answer = f"{len(places)}개 장소를 찾았어요!"
-
     return {
-        "answer": answer,
+        **compose_answer(
+            service, "FIND_PLACE", FOUND, context,
+            "위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 장소 이름은 절대 나열하지 마세요.",
+            search_keyword=search_keyword, count=len(places)
+        ),
         "places": places,
         "count": len(places),
         "search_keyword": search_keyword
@@ -6,38 +6,30 @@ Google Query Rewriter - FIND_PLACE 의도 전용 쿼리 리라이트
 import json
 import os
 from typing import Dict, Any, Optional, List
-from openai import OpenAI
+
+from orchestration.llm_scheduler import LLMScheduler, Priority
+from orchestration.prompt_cache import prompt_cache
+
+# 프롬프트 파일을 읽지 못했을 때의 기본 프롬프트
+DEFAULT_SYSTEM_PROMPT = "당신은 Google Places API 검색 쿼리 최적화 전문가입니다."
 
 
 class GoogleQueryRewriter:
     """FIND_PLACE 의도 전용 쿼리 리라이터 (Google Places API)"""
 
-    def __init__(self, openai_api_key: str, prompt_file: str = "query_rewrite_prompt.txt"):
-        self.client = OpenAI(api_key=openai_api_key)
-        self.prompt_file = prompt_file
-        self.load_system_prompt()
+    def __init__(self, openai_api_key: str, prompt_file: str = "query_rewrite_prompt.txt", llm: Optional[LLMScheduler] = None):
+        self.llm = llm or LLMScheduler(openai_api_key)
+        # 현재 파일의 디렉토리 경로 기준
+        self.prompt_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), prompt_file)
         self.setup_function_definition()
 
-    def load_system_prompt(self):
-        """외부 파일에서 system prompt 로드"""
-        try:
-            # 현재 파일의 디렉토리 경로 기준
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            prompt_path = os.path.join(current_dir, self.prompt_file)
-
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                self.system_prompt = f.read()
-
-            print(f"[GOOGLE_REWRITER] System prompt loaded from {prompt_path}")
-        except Exception as e:
-            print(f"[GOOGLE_REWRITER] Failed to load prompt file: {e}")
-            # Fallback to default prompt
-            self.system_prompt = "당신은 Google Places API 검색 쿼리 최적화 전문가입니다."
+    @property
+    def system_prompt(self) -> str:
+        """외부 파일의 system prompt (파일 수정 시 자동 반영)"""
+        return prompt_cache.get(self.prompt_file, DEFAULT_SYSTEM_PROMPT)
 
     def setup_function_definition(self):
         """GPT Function Calling 정의"""
-        # system_prompt는 load_system_prompt()에서 이미 로드됨
-
         self.functions = [
             {
                 "name": "rewrite_findplace_query",
@@ -109,7 +101,7 @@ class GoogleQueryRewriter:
             }
         ]
 
-    def rewrite(
+    async def rewrite(
         self,
         original_query: str,
         category_text: Optional[str] = None,
@@ -162,7 +154,9 @@ class GoogleQueryRewriter:
 브랜드명이 없을 때만 위치+카테고리 조합으로 만드세요."""
 
             # GPT-4o-mini Function Calling
-            response = self.client.chat.completions.create(
+            response = await self.llm.chat(
+                Priority.CLASSIFY,
+                stage="google_rewrite",
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": self.system_prompt},
@@ -3,7 +3,6 @@ LANDMARK 파이프라인
 의도: "서울에서 꼭 가봐야 할 곳"
 """
 
-import httpx
 from openai import OpenAI
 
 LANDMARK_SERVICE_URL = "http://localhost:8001"
@@ -45,32 +44,32 @@ async def execute(service, query, classification, user_location, steps):
 
     # Step 3: landmark-service 호출
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{LANDMARK_SERVICE_URL}/api/landmark",
-                json={
-                    "location_keyword": location_keyword,
-                    "limit": 10
-                },
-                timeout=30.0
-            )
-
-            if response.status_code != 200:
-                raise Exception(f"landmark-service 오류: {response.status_code}")
-
-            landmark_data = response.json()
-            landmarks = landmark_data.get("landmarks", [])
-
-            steps.append({
-                "step": len(steps) + 1,
-                "name": "랜드마크 조회",
-                "result": {
-                    "count": len(landmarks),
-                    "landmarks": landmarks[:3]  # 처음 3개만 steps에 포함
-                }
-            })
-
-            print(f"[LANDMARK] 조회 완료: {len(landmarks)}개")
+        client = service.http_clients.get(LANDMARK_SERVICE_URL)
+        response = await client.post(
+            f"{LANDMARK_SERVICE_URL}/api/landmark",
+            json={
+                "location_keyword": location_keyword,
+                "limit": 10
+            },
+            timeout=30.0
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"landmark-service 오류: {response.status_code}")
+
+        landmark_data = response.json()
+        landmarks = landmark_data.get("landmarks", [])
+
+        steps.append({
+            "step": len(steps) + 1,
+            "name": "랜드마크 조회",
+            "result": {
+                "count": len(landmarks),
+                "landmarks": landmarks[:3]  # 처음 3개만 steps에 포함
+            }
+        })
+
+        print(f"[LANDMARK] 조회 완료: {len(landmarks)}개")
 
     except Exception as e:
         print(f"[LANDMARK] 오류: {e}")
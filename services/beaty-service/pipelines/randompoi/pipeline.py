@@ -3,8 +3,8 @@ RANDOM 파이프라인
 의도: "아무데나 가고 싶어", "심심해", "뭐 할까" 등 무작위 추천
 """
 
-import httpx
 from typing import Optional
+import hashlib
 import sys
 from pathlib import Path
 
@@ -45,15 +45,18 @@ async def execute(service, query, classification, user_location, steps, session_
             params["lat"] = user_location["lat"]
             params["lng"] = user_location["lng"]
             print(f"[RANDOM_PIPELINE] 사용자 위치 포함: {params}")
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "http://localhost:8001/api/random",
-                params=params,
-                timeout=30.0
-            )
-            response.raise_for_status()
-            random_data = response.json()
+        if session_token:
+            # 세션별 중복 추천 방지 덱 키 (토큰 원문은 전달하지 않음)
+            params["session"] = hashlib.sha256(session_token.encode("utf-8")).hexdigest()[:16]
+
+        client = service.http_clients.get("http://localhost:8001")
+        response = await client.get(
+            "http://localhost:8001/api/random",
+            params=params,
+            timeout=30.0
+        )
+        response.raise_for_status()
+        random_data = response.json()
 
         if not random_data.get("success") or not random_data.get("poi"):
             steps.append({
@@ -1,10 +1,8 @@
 """
 RECOMMEND 파이프라인 - POI 추천 의도 처리
 """
-import httpx
+import asyncio
 from typing import Dict, Any, Optional, List, AsyncGenerator
-from openai import OpenAI
-from .position_resolver import PositionResolver
 import asyncpg
 import sys
 from pathlib import Path
@@ -12,6 +10,12 @@ from pathlib import Path
 # 상위 디렉토리의 orchestration 모듈 import
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from orchestration.gpt_streaming import stream_gpt_response
+from orchestration.llm_scheduler import Priority
+from orchestration.admission import admission
+from orchestration.answer_policy import AnswerMode, answer_policy
+from orchestration.answer_templates import FOUND, NONE, ALTERNATIVE, FALLBACK
+from orchestration.response_generator import compose_answer
+from .result_cache import recommend_result_cache
 
 
 async def execute(
@@ -36,8 +40,12 @@ async def execute(
 
     print(f"[RECOMMEND_PIPELINE] 시작: '{query}'")
 
-    # Resolver 초기화 (이 파이프라인에서만 사용)
-    position_resolver = PositionResolver(service.config["openai_api_key"], service.config["db_config"])
+    # 공유 컴포넌트 (startup에서 1회 생성)
+    position_resolver = service.components.position_resolver
+
+    # 하이브리드 랭킹용 쿼리 임베딩 (LLM 스케줄러 경유 → 사용량 기록)
+    # 원본 질의로 위치 해결/쿼리 리라이트와 동시에 생성 → 추천 검색 요청 전에 따로 기다리지 않음
+    ranking_embedding_task = asyncio.create_task(_embed_query(service, query, "recommend_query_embedding"))
 
     try:
         # Step 2: 위치 해결 (PositionResolver 사용)
@@ -66,14 +74,10 @@ async def execute(
             "result": step2_result
         })
 
-        # Step 3: 쿼리 리라이트 (QueryRewriter 사용)
-        from .query_rewriter import QueryRewriter
-
-        # IntentClassifier에서 로드한 카테고리 목록 전달
-        categories = service.intent_classifier.categories if hasattr(service.intent_classifier, 'categories') else ""
-        rewriter = QueryRewriter(service.config["openai_api_key"], categories)
+        # Step 3: 쿼리 리라이트 (QueryRewriter 사용 - IntentClassifier 카테고리 목록은 생성 시 전달됨)
+        rewriter = service.components.query_rewriter
 
-        rewrite_result = rewriter.rewrite(
+        rewrite_result = await rewriter.rewrite(
             original_query=query,
             intent="RECOMMEND",
             category=None,
@@ -134,18 +138,36 @@ async def execute(
 
         pois = []
         keyword_matched_pois = []
+        cache_hit = False
 
         try:
-            async with httpx.AsyncClient() as client:
+            # 결과 캐시 조회 (같은 리라이트 결과 + 같은 랭킹 질의 + 같은 위치 셀)
+            cache_key = recommend_result_cache.make_key(request_data, ranking_text=query)
+            cached_pois = recommend_result_cache.get(cache_key, user_location)
+
+            if cached_pois is not None:
+                pois = cached_pois
+                cache_hit = True
+                ranking_embedding_task.cancel()
+                print(f"[RECOMMEND_PIPELINE] 결과 캐시 적중: {len(pois)}개")
+            else:
+                # 실패 시 None → 벡터 신호 없이 랭킹
+                ranking_embedding = await ranking_embedding_task
+                client = service.http_clients.get("http://localhost:8001")
                 response = await client.post(
                     "http://localhost:8001/api/recommend",
-                    json=request_data,
+                    json={**request_data, "embedding": ranking_embedding},
                     timeout=30.0
                 )
                 response.raise_for_status()
                 recommend_data = response.json()
 
-            pois = recommend_data.get("results", [])
+                pois = recommend_data.get("results", [])
+                # 임베딩 실패(일시적 OpenAI 오류)로 벡터 신호 없이 랭킹된 결과는 캐시하지 않음 (다음 요청에서 다시 랭킹)
+                if ranking_embedding is not None:
+                    recommend_result_cache.set(cache_key, pois)
+                else:
+                    print(f"[RECOMMEND_PIPELINE] 랭킹 임베딩 없음 → 결과 캐시 저장 생략")
 
             # keyword_match_count > 0인 POI만 필터링
             keyword_matched_pois = [poi for poi in pois if poi.get('keyword_match_count', 0) > 0]
@@ -155,8 +177,13 @@ async def execute(
         except Exception as e:
             print(f"[RECOMMEND_PIPELINE] KTO 검색 실패: {e}")
 
+        # 부하 차단 2단계: Vector 대안 검색(DB 연결 + 임베딩 + POI 설명) 생략, 카테고리 결과로 응답
+        skip_vector = len(keyword_matched_pois) == 0 and admission.degradation().skip_vector_fallback
+        if skip_vector:
+            print(f"[RECOMMEND_PIPELINE] 부하 차단: Vector 대안 검색 생략 (카테고리 결과 {len(pois)}개 사용)")
+
         # Step 4-1: Vector 유사도 검색으로 대안 추천
-        if len(keyword_matched_pois) == 0:
+        if len(keyword_matched_pois) == 0 and not skip_vector:
             print(f"[RECOMMEND_PIPELINE] 키워드 매칭 결과 없음 → Vector 유사도로 대안 검색")
 
             # category_text 생성 (Vector 검색용)
@@ -171,121 +198,35 @@ async def execute(
             try:
                 print(f"[RECOMMEND_PIPELINE] Vector 검색 시작...")
                 if category_text:
-                    # 카테고리 Vector 검색 (유사한 카테고리 POI)
-                    import asyncpg
-                    import ssl
-                    ssl_context = ssl.create_default_context()
-                    ssl_context.check_hostname = False
-                    ssl_context.verify_mode = ssl.CERT_NONE
-
-                    conn = await asyncpg.connect(
-                        host=service.db_config["host"],
-                        port=service.db_config["port"],
-                        database=service.db_config["database"],
-                        user=service.db_config["user"],
-                        password=service.db_config["password"],
-                        ssl=ssl_context
+                    # 쿼리 임베딩 (POI 임베딩과 같은 모델, 랭킹용으로 같은 문장을 임베딩했으면 재사용)
+                    query_embedding = None
+                    if category_text == query and ranking_embedding_task.done() and not ranking_embedding_task.cancelled():
+                        query_embedding = ranking_embedding_task.result()
+                    if query_embedding is None:
+                        print(f"[RECOMMEND_PIPELINE] OpenAI 임베딩 생성 중...")
+                        embedding_response = await service.llm.embed(
+                            Priority.CLASSIFY,
+                            stage="vector_fallback_embedding",
+                            model="text-embedding-3-small",
+                            input=category_text
+                        )
+                        query_embedding = embedding_response.data[0].embedding
+                        print(f"[RECOMMEND_PIPELINE] 임베딩 생성 완료: {len(query_embedding)}차원")
+
+                    # POI 임베딩 ANN 검색 (geometry 필터는 poi-service에서)
+                    client = service.http_clients.get("http://localhost:8001")
+                    response = await client.post(
+                        "http://localhost:8001/api/recommend/vector",
+                        json={
+                            "embedding": query_embedding,
+                            "geometry_id": geometry_id,
+                            "limit": 10
+                        },
+                        timeout=30.0
                     )
+                    response.raise_for_status()
+                    similar_pois = response.json().get("results", [])
 
-                    # 카테고리 임베딩 가져오기
-                    print(f"[RECOMMEND_PIPELINE] OpenAI 임베딩 생성 중...")
-                    from openai import OpenAI
-                    openai_client = OpenAI(api_key=service.config["openai_api_key"])
-                    embedding_response = openai_client.embeddings.create(
-                        model="text-embedding-3-small",
-                        input=category_text
-                    )
-                    query_embedding = embedding_response.data[0].embedding
-                    print(f"[RECOMMEND_PIPELINE] 임베딩 생성 완료: {len(query_embedding)}차원")
-
-                    # vector를 PostgreSQL 문자열 형식으로 변환: "[0.1, 0.2, ...]"
-                    embedding_str = str(query_embedding)
-
-                    # geometry 정보 조회 (위치 필터링용)
-                    geometry_info = None
-                    if geometry_id:
-                        geom_query = """
-                            SELECT geometry_id, geom_type, ST_AsGeoJSON(geom) as geojson
-                            FROM mkb_master_position_geometry
-                            WHERE geometry_id = $1
-                        """
-                        geom_row = await conn.fetchrow(geom_query, geometry_id)
-                        if geom_row:
-                            import json
-                            geometry_info = {
-                                "geometry_id": geom_row["geometry_id"],
-                                "geom_type": geom_row["geom_type"],
-                                "geojson": json.loads(geom_row["geojson"])
-                            }
-                            print(f"[RECOMMEND_PIPELINE] Geometry 정보 로드: type={geometry_info['geom_type']}")
-
-                    # 유사한 카테고리의 POI 검색
-                    vector_query = """
-                        SELECT DISTINCT
-                            t.content_id,
-                            t.title,
-                            t.mapx,
-                            t.mapy,
-                            t.addr1,
-                            t.cat1,
-                            t.cat2,
-                            t.cat3,
-                            t.content_type_id,
-                            t.first_image,
-                            t.overview,
-                            1 - (c.embedding <=> $1::vector) AS similarity
-                        FROM kto_tour_base_list t
-                        JOIN kto_tour_category c ON (
-                            t.cat1 = c.cat_code OR
-                            t.cat2 = c.cat_code OR
-                            t.cat3 = c.cat_code
-                        )
-                        WHERE c.lang = 'ko'
-                          AND t.language = 'Kor'
-                          AND t.mapx IS NOT NULL
-                          AND t.mapy IS NOT NULL
-                    """
-
-                    # Geometry 필터 추가
-                    params = [embedding_str]  # 문자열로 변환된 임베딩 사용
-                    param_idx = 2
-
-                    if geometry_info:
-                        geom_type = geometry_info["geom_type"].upper()
-                        geojson_str = json.dumps(geometry_info["geojson"])
-
-                        if geom_type in ['POLYGON', 'MULTIPOLYGON']:
-                            # POLYGON: Intersects
-                            vector_query += f" AND ST_Intersects(t.location, ST_GeomFromGeoJSON(${param_idx}))"
-                            params.append(geojson_str)
-                        else:
-                            # POINT: 1500m 반경
-                            vector_query += f" AND ST_DWithin(t.location::geography, ST_GeomFromGeoJSON(${param_idx})::geography, 1500)"
-                            params.append(geojson_str)
-                        print(f"[RECOMMEND_PIPELINE] Geometry 필터 적용: {geom_type}")
-
-                    print(f"[RECOMMEND_PIPELINE] Vector SQL 실행 중...")
-                    rows = await conn.fetch(vector_query + " ORDER BY similarity DESC LIMIT 10", *params)
-
-                    print(f"[RECOMMEND_PIPELINE] SQL 실행 완료: {len(rows)}개 row")
-
-                    for row in rows:
-                        similar_pois.append({
-                            "content_id": str(row["content_id"]),
-                            "title": row["title"],
-                            "mapx": float(row["mapx"]) if row["mapx"] else 0,
-                            "mapy": float(row["mapy"]) if row["mapy"] else 0,
-                            "addr1": row["addr1"],
-                            "cat1": row["cat1"],
-                            "cat2": row["cat2"],
-                            "cat3": row["cat3"],
-                            "content_type_id": str(row["content_type_id"]),
-                            "first_image": row["first_image"],
-                            "overview": row["overview"],
-                            "similarity": float(row["similarity"])
-                        })
-
-                    await conn.close()
                     print(f"[RECOMMEND_PIPELINE] Vector 유사도 검색 결과: {len(similar_pois)}개")
 
             except Exception as e:
@@ -298,7 +239,7 @@ async def execute(
             })
 
             # 대안 POI로 최종 응답 생성 (구글 검색 제안 포함)
-            final_response = _generate_alternative_response(service, query, category_text, similar_pois, location_keyword)
+            final_response = await _generate_alternative_response(service, query, category_text, similar_pois, location_keyword)
 
             steps.append({
                 "step": 5,
@@ -312,11 +253,13 @@ async def execute(
                 "final_response": final_response
             }
 
-        # KTO 키워드 매칭 결과가 있으면 그대로 진행
-        pois = keyword_matched_pois
+        # KTO 키워드 매칭 결과가 있으면 그대로 진행 (Vector 대안 생략 시 카테고리 결과)
+        if not skip_vector:
+            pois = keyword_matched_pois
         step4_result = {
             "count": len(pois),
-            "pois": pois
+            "pois": pois,
+            "cache_hit": cache_hit
         }
         steps.append({
             "step": 4,
@@ -326,28 +269,7 @@ async def execute(
         print(f"[RECOMMEND_PIPELINE] Step 4 완료: {len(pois)}개 POI")
 
         # Step 5: 최종 응답 생성
-        final_response = _generate_final_response(service, query, pois)
-
-        # 스트리밍 응답 추가
-        if "answer" in final_response and final_response["answer"]:
-            # answer를 재생성하기 위한 컨텍스트 구성
-            from orchestration.response_generator import create_streaming_response
-
-            context = f"""
-사용자 질문: {query}
-추천 결과: {len(pois)}개의 장소
-
-** 응답 가이드:
-1. "비티만의 추천이에요!" 문구를 포함해서 답변 시작
-2. 검색 결과를 친근하게 소개
-3. 장소 이름은 나열하지 않기
-4. 짧고 자연스럽게 답변하기
-"""
-            final_response["answer_stream"] = create_streaming_response(
-                service,
-                context,
-                "위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 장소 이름은 절대 나열하지 마세요."
-            )
+        final_response = await _generate_final_response(service, query, pois)
 
         steps.append({
             "step": 5,
@@ -381,32 +303,42 @@ async def execute(
             }
         }
 
+    finally:
+        # 추천 검색 전에 끝난 경우(오류, 캐시 적중) 임베딩 작업 정리
+        ranking_embedding_task.cancel()
+
 
-def _generate_google_fallback_response(service, query: str, places: List[Dict]) -> Dict:
-    """Google Places 폴백 최종 응답 생성 - Beaty 캐릭터로 응답"""
+async def _embed_query(service, text: str, stage: str) -> Optional[List[float]]:
+    """쿼리 임베딩 (POI 임베딩과 같은 모델, 실패 시 None)"""
+    if not text:
+        return None
+    try:
+        response = await service.llm.embed(
+            Priority.CLASSIFY,
+            stage=stage,
+            model="text-embedding-3-small",
+            input=text
+        )
+        return response.data[0].embedding
+    except Exception as e:
+        print(f"[RECOMMEND_PIPELINE] 쿼리 임베딩 실패 (벡터 신호 없이 검색): {e}")
+        return None
+
+
+async def _generate_google_fallback_response(service, query: str, places: List[Dict]) -> Dict:
+    """Google Places 폴백 최종 응답 생성 - 템플릿 우선 (답변 정책에 따라 LLM 스트리밍)"""
 
     if not places:
         context = f"""
 사용자 질문: {query}
 결과: Google Places에서도 장소를 찾을 수 없음
 """
-        try:
-            client = OpenAI(api_key=service.config["openai_api_key"])
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": service.character_prompt},
-                    {"role": "user", "content": f"{context}\n\n위 정보를 바탕으로 주인님께 친절하게 답변해주세요."}
-                ],
-                temperature=0.7
-            )
-            answer = response.choices[0].message.content
-        except Exception as e:
-            print(f"[RECOMMEND_PIPELINE] OpenAI 호출 실패: {e}")
-            answer = f"앗, '{query}'에 대한 결과를 찾을 수 없었어요."
-
         return {
-            "answer": answer,
+            **compose_answer(
+                service, "RECOMMEND", "fallback_none", context,
+                "위 정보를 바탕으로 주인님께 친절하게 답변해주세요.",
+                query=query
+            ),
             "places": [],
             "count": 0
         }
@@ -424,53 +356,31 @@ Google Places 검색 결과: {len(places)}개
 4. 친근하고 자연스럽게 답변하기
 """
 
-    try:
-        client = OpenAI(api_key=service.config["openai_api_key"])
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": service.character_prompt},
-                {"role": "user", "content": f"{context}\n\n위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 장소 이름은 절대 나열하지 마세요."}
-            ],
-            temperature=0.7
-        )
-        answer = response.choices[0].message.content
-    except Exception as e:
-        print(f"[RECOMMEND_PIPELINE] OpenAI 호출 실패: {e}")
-        answer = f"{len(places)}개 장소를 찾았어요!"
-
     return {
-        "answer": answer,
+        **compose_answer(
+            service, "RECOMMEND", FALLBACK, context,
+            "위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 장소 이름은 절대 나열하지 마세요.",
+            count=len(places)
+        ),
         "places": places,
         "count": len(places)
     }
 
 
-def _generate_final_response(service, query: str, pois: List[Dict]) -> Dict:
-    """최종 응답 생성 - Beaty 캐릭터로 응답"""
+async def _generate_final_response(service, query: str, pois: List[Dict]) -> Dict:
+    """최종 응답 생성 - 템플릿 우선 (답변 정책에 따라 LLM 스트리밍)"""
 
     if not pois:
         context = f"""
 사용자 질문: {query}
 결과: 추천할 장소를 찾을 수 없음
 """
-        try:
-            client = OpenAI(api_key=service.config["openai_api_key"])
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": service.character_prompt},
-                    {"role": "user", "content": f"{context}\n\n위 정보를 바탕으로 주인님께 친절하게 답변해주세요."}
-                ],
-                temperature=0.7
-            )
-            answer = response.choices[0].message.content
-        except Exception as e:
-            print(f"[RECOMMEND_PIPELINE] OpenAI 호출 실패: {e}")
-            answer = f"앗, '{query}'에 대한 추천 결과를 찾을 수 없었어요."
-
         return {
-            "answer": answer,
+            **compose_answer(
+                service, "RECOMMEND", NONE, context,
+                "위 정보를 바탕으로 주인님께 친절하게 답변해주세요.",
+                query=query
+            ),
             "pois": [],
             "count": 0
         }
@@ -486,49 +396,33 @@ def _generate_final_response(service, query: str, pois: List[Dict]) -> Dict:
         selected_pois = pois
         match_type = "category"
 
-    # Beaty 설명 추가
-    for poi in selected_pois:
-        if 'beaty_description' not in poi:
-            poi["beaty_description"] = _generate_beaty_description(service, poi)
+    # 답변 모드 먼저 결정 (TEMPLATE이면 POI 설명도 LLM 없이)
+    mode = answer_policy.choose(service.llm, "RECOMMEND", FOUND)
+    await _add_beaty_descriptions(service, selected_pois, mode)
 
     # 컨텍스트 구성 (장소 리스트 제외, 개수만 전달)
     if match_type == "keyword":
-        context = f"""
-사용자 질문: {query}
-키워드 매칭된 추천 장소: {len(selected_pois)}개
-
-** 위 장소들은 사용자가 요청한 핵심 키워드와 정확히 일치하는 곳입니다.
-** 장소 이름을 나열하지 말고, "{len(selected_pois)}개 장소를 찾았다"는 내용으로 자연스럽게 응답해주세요.
-"""
+        match_guide = "** 위 장소들은 사용자가 요청한 핵심 키워드와 정확히 일치하는 곳입니다."
     else:
-        context = f"""
+        match_guide = "** 사용자가 요청한 내용과 관련된 장소를 추천드립니다."
+    context = f"""
 사용자 질문: {query}
-추천 장소: {len(selected_pois)}개
+추천 결과: {len(selected_pois)}개의 장소
+{match_guide}
 
-** 사용자가 요청한 내용과 관련된 장소를 추천드립니다.
-** 장소 이름을 나열하지 말고, "{len(selected_pois)}개 장소를 찾았다"는 내용으로 자연스럽게 응답해주세요.
+** 응답 가이드:
+1. "비티만의 추천이에요!" 문구를 포함해서 답변 시작
+2. 검색 결과를 친근하게 소개
+3. 장소 이름은 나열하지 않기
+4. 짧고 자연스럽게 답변하기
 """
 
-    try:
-        client = OpenAI(api_key=service.config["openai_api_key"])
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": service.character_prompt},
-                {"role": "user", "content": f"{context}\n\n위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 장소 이름은 절대 나열하지 마세요."}
-            ],
-            temperature=0.7
-        )
-        answer = response.choices[0].message.content
-    except Exception as e:
-        print(f"[RECOMMEND_PIPELINE] OpenAI 호출 실패: {e}")
-        if match_type == "keyword":
-            answer = f"{len(selected_pois)}개 장소를 찾았어요!"
-        else:
-            answer = f"{len(selected_pois)}개 장소를 추천드릴게요!"
-
     return {
-        "answer": answer,
+        **compose_answer(
+            service, "RECOMMEND", FOUND, context,
+            "위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 장소 이름은 절대 나열하지 마세요.",
+            mode=mode, count=len(selected_pois)
+        ),
         "pois": selected_pois,  # 필터링된 POI만 반환
         "count": len(selected_pois),
         "match_type": match_type,
@@ -536,7 +430,24 @@ def _generate_final_response(service, query: str, pois: List[Dict]) -> Dict:
     }
 
 
-def _generate_beaty_description(service, poi: Dict) -> str:
+async def _add_beaty_descriptions(service, pois: List[Dict], mode: AnswerMode):
+    """Beaty 설명 추가 (DESCRIPTION 우선순위로 동시 생성, TEMPLATE 모드/부하 차단 1단계는 기본 문구)"""
+    pending_pois = [poi for poi in pois if 'beaty_description' not in poi]
+    if mode == AnswerMode.TEMPLATE or admission.degradation().skip_descriptions:
+        for poi in pending_pois:
+            poi["beaty_description"] = _default_description(poi)
+        return
+
+    descriptions = await asyncio.gather(*[_generate_beaty_description(service, poi) for poi in pending_pois])
+    for poi, description in zip(pending_pois, descriptions):
+        poi["beaty_description"] = description
+
+
+def _default_description(poi: Dict) -> str:
+    return f"{poi.get('title', '이곳')}은(는) 추천드리는 장소예요!"
+
+
+async def _generate_beaty_description(service, poi: Dict) -> str:
     """POI에 대한 Beaty 캐릭터 스타일 설명 생성"""
     try:
         context = f"""
@@ -547,8 +458,9 @@ POI 정보:
 
 위 POI에 대해 1-2문장으로 귀엽고 간결하게 소개해주세요.
 """
-        client = OpenAI(api_key=service.config["openai_api_key"])
-        response = client.chat.completions.create(
+        response = await service.llm.chat(
+            Priority.DESCRIPTION,
+            stage="description",
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": service.character_prompt},
@@ -560,15 +472,14 @@ POI 정보:
         return response.choices[0].message.content
     except Exception as e:
         print(f"[RECOMMEND_PIPELINE] Beaty 설명 생성 실패: {e}")
-        return f"{poi.get('title', '이곳')}은(는) 추천드리는 장소예요!"
+        return _default_description(poi)
 
 
-def _generate_alternative_response(service, query: str, category_text: str, similar_pois: List[Dict], location_keyword: str = None) -> Dict:
+async def _generate_alternative_response(service, query: str, category_text: str, similar_pois: List[Dict], location_keyword: str = None) -> Dict:
     """키워드 매칭 실패 시 Vector 유사도 검색 결과로 대안 응답 생성"""
 
-    # Beaty 설명 추가
-    for poi in similar_pois:
-        poi["beaty_description"] = _generate_beaty_description(service, poi)
+    mode = answer_policy.choose(service.llm, "RECOMMEND", ALTERNATIVE)
+    await _add_beaty_descriptions(service, similar_pois, mode)
 
     location_text = f"{location_keyword}의 " if location_keyword else ""
     category_display = category_text if category_text else "해당 종류"
@@ -583,27 +494,14 @@ def _generate_alternative_response(service, query: str, category_text: str, simi
 - 제가 알고 있는 {location_text}'{category_display}'는 없다고 귀엽고 솔직하게 알려드리고 (ㅠㅠ 이런 느낌으로!)
 - 대신 비슷한 곳들을 추천해드린다고 밝게 말씀드리고
 - 마지막으로 구글에서 검색해드릴까요? 라고 물어봐주세요
-
-장소 이름은 나열하지 말고, 짧고 귀엽게 2-3문장으로 말해주세요.
 """
 
-    try:
-        client = OpenAI(api_key=service.config["openai_api_key"])
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": service.character_prompt},
-                {"role": "user", "content": context}
-            ],
-            temperature=0.7
-        )
-        answer = response.choices[0].message.content
-    except Exception as e:
-        print(f"[RECOMMEND_PIPELINE] OpenAI 호출 실패: {e}")
-        answer = f"제가 알고 있는 {location_text}{category_display}는 없네요 ㅠㅠ 대신 비슷한 곳들을 추천해드릴게요! 아니면 구글에서 검색해드릴까요?"
-
     return {
-        "answer": answer,
+        **compose_answer(
+            service, "RECOMMEND", ALTERNATIVE, context,
+            "장소 이름은 나열하지 말고, 짧고 귀엽게 2-3문장으로 말해주세요.",
+            mode=mode, location=location_text, category=category_display, count=len(similar_pois)
+        ),
         "pois": similar_pois,
         "count": len(similar_pois),
         "is_alternative": True,  # 대안 추천임을 표시
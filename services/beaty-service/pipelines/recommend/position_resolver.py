@@ -5,16 +5,17 @@ MasterPosition 로직을 Beaty 서비스 내부로 통합
 
 import asyncpg
 from typing import Dict, List, Optional
-from openai import OpenAI
+from orchestration.llm_scheduler import LLMScheduler, Priority
 
 
 class PositionResolver:
     """위치 키워드를 실제 거점 정보로 해결"""
 
-    def __init__(self, openai_api_key: str, db_config: Dict):
+    def __init__(self, openai_api_key: str, db_config: Dict, llm: Optional[LLMScheduler] = None, db_pool=None):
         self.openai_api_key = openai_api_key
         self.db_config = db_config
-        self.client = OpenAI(api_key=openai_api_key)
+        self.llm = llm or LLMScheduler(openai_api_key)
+        self.db_pool = db_pool  # 있으면 풀에서 연결 대여 (없으면 요청마다 연결)
 
     async def get_db_connection(self):
         """데이터베이스 연결"""
@@ -38,18 +39,30 @@ class PositionResolver:
             print(f"[POSITION_RESOLVER] DB connection error: {e}")
             return None
 
+    async def _fetch(self, query: str, *args) -> Optional[List]:
+        """쿼리 실행 (DB 연결 실패 시 None)"""
+        if self.db_pool:
+            async with self.db_pool.acquire() as conn:
+                return await conn.fetch(query, *args)
+
+        conn = await self.get_db_connection()
+        if not conn:
+            return None
+        try:
+            return await conn.fetch(query, *args)
+        finally:
+            await conn.close()
+
     async def resolve(self, location_keyword: str) -> Optional[Dict]:
         """위치 키워드를 실제 거점 정보로 해결"""
         if not location_keyword:
             return None
 
         try:
-            conn = await self.get_db_connection()
-            if not conn:
-                return None
-
             # 벡터 임베딩 생성
-            response = self.client.embeddings.create(
+            response = await self.llm.embed(
+                Priority.CLASSIFY,
+                stage="position_embedding",
                 model="text-embedding-ada-002",
                 input=location_keyword
             )
@@ -97,8 +110,9 @@ class PositionResolver:
                 LIMIT 1
             """
 
-            rows = await conn.fetch(query, location_keyword, embedding_str, 9159)
-            await conn.close()
+            rows = await self._fetch(query, location_keyword, embedding_str, 9159)
+            if rows is None:
+                return None
 
             if rows:
                 row = rows[0]
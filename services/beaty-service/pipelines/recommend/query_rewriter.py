@@ -5,30 +5,13 @@ Query Rewriter - 쿼리 리라이트 (자연어 → 구조화된 검색 요청)
 
 import json
 from typing import Dict, Any, Optional
-from openai import OpenAI
 from pathlib import Path
 
+from orchestration.llm_scheduler import LLMScheduler, Priority
+from orchestration.prompt_cache import prompt_cache
 
-class QueryRewriter:
-    """쿼리 리라이트 시스템"""
-
-    def __init__(self, openai_api_key: str, categories: str = ""):
-        self.client = OpenAI(api_key=openai_api_key)
-        self.categories = categories
-        self.prompt_file = Path(__file__).parent / "query_rewrite_prompt.txt"
-        self.load_system_prompt()
-        self.setup_function_definition()
-
-    def load_system_prompt(self):
-        """시스템 프롬프트 파일에서 로드"""
-        try:
-            if self.prompt_file.exists():
-                with open(self.prompt_file, "r", encoding="utf-8") as f:
-                    self.system_prompt = f.read()
-                print(f"[QUERY_REWRITER] System prompt loaded from {self.prompt_file}")
-            else:
-                # 기본 프롬프트
-                self.system_prompt = """당신은 서울 여행 검색 쿼리 최적화 전문가입니다.
+# 프롬프트 파일이 없을 때 사용하는 기본 프롬프트
+DEFAULT_SYSTEM_PROMPT = """당신은 서울 여행 검색 쿼리 최적화 전문가입니다.
 
 역할:
 - 사용자의 자연어 질의와 분류/해결된 정보를 받아서
@@ -58,18 +41,28 @@ class QueryRewriter:
 - 불필요한 정보 제거
 - 검색 효율성 최대화
 """
-                # 기본 프롬프트를 파일로 저장
-                self.save_system_prompt(self.system_prompt)
-        except Exception as e:
-            print(f"[QUERY_REWRITER] Error loading system prompt: {e}")
-            self.system_prompt = "당신은 검색 쿼리 최적화 전문가입니다."
+
+
+class QueryRewriter:
+    """쿼리 리라이트 시스템"""
+
+    def __init__(self, openai_api_key: str, categories: str = "", llm: Optional[LLMScheduler] = None):
+        self.llm = llm or LLMScheduler(openai_api_key)
+        self.categories = categories
+        self.prompt_file = Path(__file__).parent / "query_rewrite_prompt.txt"
+        self.setup_function_definition()
+
+    @property
+    def system_prompt(self) -> str:
+        """시스템 프롬프트 (파일 수정 시 자동 반영)"""
+        return prompt_cache.get(self.prompt_file, DEFAULT_SYSTEM_PROMPT)
 
     def save_system_prompt(self, new_prompt: str) -> bool:
         """시스템 프롬프트를 파일에 저장"""
         try:
             with open(self.prompt_file, "w", encoding="utf-8") as f:
                 f.write(new_prompt)
-            self.system_prompt = new_prompt
+            prompt_cache.invalidate(self.prompt_file)
             print(f"[QUERY_REWRITER] System prompt saved to {self.prompt_file}")
             return True
         except Exception as e:
@@ -130,7 +123,7 @@ class QueryRewriter:
             }
         ]
 
-    def rewrite(
+    async def rewrite(
         self,
         original_query: str,
         intent: str,
@@ -170,7 +163,9 @@ class QueryRewriter:
 
 위 정보를 바탕으로 최적의 검색 쿼리를 생성하세요."""
 
-            response = self.client.chat.completions.create(
+            response = await self.llm.chat(
+                Priority.CLASSIFY,
+                stage="rewrite",
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": self.system_prompt},
@@ -228,6 +223,7 @@ class QueryRewriter:
 
 # 테스트 코드
 if __name__ == "__main__":
+    import asyncio
     import os
     from dotenv import load_dotenv
 
@@ -247,7 +243,7 @@ if __name__ == "__main__":
     rewriter = QueryRewriter(openai_api_key)
 
     # 테스트
-    result = rewriter.rewrite(
+    result = asyncio.run(rewriter.rewrite(
         original_query="홍대 근처 조용한 카페 추천해줘, 주차 가능한 곳으로",
         intent="RECOMMEND",
         category={"cat_code": "A05020900", "cat_level": 3, "content_type_id": 39},
@@ -255,7 +251,7 @@ if __name__ == "__main__":
         user_location={"lat": 37.5665, "lng": 126.9780},
         hard_constraints=["주차가능"],
         emotion="조용한, 힐링"
-    )
+    ))
 
     print(f"\n{'='*60}")
     print(f"Result: {json.dumps(result, ensure_ascii=False, indent=2)}")
@@ -0,0 +1,101 @@
+"""
+Recommend Result Cache - poi-service /api/recommend 결과 캐시
+리라이트 결과(카테고리/키워드/필터) + 위치 셀(geohash 또는 geometry_id) 기준으로 결과를 재사용
+"""
+
+import copy
+import json
+import os
+from typing import Dict, Any, Optional, List
+
+from orchestration.ttl_cache import TTLCache
+from orchestration.geo import geohash_encode, haversine_km
+
+# geohash 정밀도 7 ≈ 150m 셀
+GEOHASH_PRECISION = int(os.getenv("RECOMMEND_CACHE_GEOHASH_PRECISION", 7))
+
+
+class RecommendResultCache:
+    """RECOMMEND 검색 결과 캐시"""
+
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 600.0):
+        self.cache = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    def make_key(self, request_data: Dict[str, Any], ranking_text: Optional[str] = None) -> str:
+        """
+        캐시 키 생성
+
+        poi-service 검색 결과에 영향을 주는 필드만 사용
+        - 랭킹 질의: 임베딩되어 하이브리드 랭킹(카테고리별로 남는 limit개)에 쓰이므로 포함 (공백/대소문자 정규화)
+          ranking_text 미지정 시 query_text
+        - preferences는 현재 검색에 사용되지 않으므로 제외
+
+        Args:
+            request_data: /api/recommend 요청
+            ranking_text: 랭킹 임베딩을 만든 문장 (query_text와 다를 때)
+        """
+        core_keywords = request_data.get("core_keywords") or []
+        filters = request_data.get("filters") or {}
+        user_location = request_data.get("user_location")
+        geometry_id = request_data.get("geometry_id")
+
+        # 위치 셀: geometry_id가 있어도 사용자 위치 없이는 거리 정렬이 없으므로 구분
+        location_cell = None
+        if user_location:
+            location_cell = geohash_encode(user_location["lat"], user_location["lng"], GEOHASH_PRECISION)
+
+        if ranking_text is None:
+            ranking_text = request_data.get("query_text") or ""
+
+        key = {
+            "ranking_text": " ".join(ranking_text.lower().split()),
+            # 카테고리는 우선순위 순서가 의미 있으므로 정렬하지 않음
+            "category_ids": request_data.get("category_ids") or [],
+            # 키워드는 매칭 개수만 세므로 순서 무관 (SQL도 LOWER 비교)
+            "core_keywords": sorted(kw.strip().lower() for kw in core_keywords),
+            "filters": {k: v for k, v in sorted(filters.items()) if v is not None},
+            "geometry_id": geometry_id,
+            "location_cell": location_cell,
+            "limit": request_data.get("limit"),
+            "min_poi_count": request_data.get("min_poi_count")
+        }
+        return json.dumps(key, ensure_ascii=False, sort_keys=True)
+
+    def get(self, key: str, user_location: Optional[Dict[str, float]] = None) -> Optional[List[Dict]]:
+        """
+        캐시 조회 - 적중 시 실제 사용자 위치 기준으로 distance_km 재계산
+
+        Returns:
+            POI 리스트 (복사본) 또는 None
+        """
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+
+        pois = copy.deepcopy(cached)
+
+        if user_location:
+            for poi in pois:
+                if poi.get("mapx") is not None and poi.get("mapy") is not None:
+                    poi["distance_km"] = haversine_km(
+                        user_location["lat"], user_location["lng"],
+                        poi["mapy"], poi["mapx"]
+                    )
+            # 순서는 재정렬하지 않음: poi-service 결과는 카테고리 우선순위별로 이어붙인 것이고,
+            # 같은 셀(≈150m) 안에서는 거리 순서 차이가 미미함
+
+        return pois
+
+    def set(self, key: str, pois: List[Dict]):
+        """결과 저장 (이후 파이프라인에서 POI dict를 변경해도 캐시에 영향 없도록 복사)"""
+        self.cache.set(key, copy.deepcopy(pois))
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+
+# 전역 캐시 인스턴스
+recommend_result_cache = RecommendResultCache(
+    max_size=int(os.getenv("RECOMMEND_CACHE_MAX_SIZE", 512)),
+    ttl_seconds=float(os.getenv("RECOMMEND_CACHE_TTL", 600))
+)
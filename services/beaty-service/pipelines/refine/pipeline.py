@@ -0,0 +1,234 @@
+"""
+REFINE 파이프라인 - 직전 결과 목록에 대한 후속 질의 처리
+LLM / DB / 외부 API 호출 없이 세션에 보관된 후보 집합을 필터, 정렬, 페이지 이동
+조건을 판단할 수 없는 경우(속성 정보 없음)에만 원래 파이프라인을 조건을 붙여 재실행
+"""
+from typing import Dict, Any, Optional, List, Callable, Tuple
+import sys
+from pathlib import Path
+
+# 상위 디렉토리의 orchestration 모듈 import
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from orchestration.answer_cache import replay_answer
+from orchestration.geo import haversine_km
+from orchestration.result_state import ResultState
+
+
+def _attribute(*keys: str) -> Callable[[Dict], Optional[bool]]:
+    """여러 필드명 중 값이 있는 첫 필드로 판정 (Google / KTO 필드명이 달라서), 모두 없으면 None"""
+    def predicate(item: Dict) -> Optional[bool]:
+        for key in keys:
+            value = item.get(key)
+            if value is not None:
+                return bool(value)
+        return None
+    return predicate
+
+
+# 필터: 이름 → (안내 문구, hard_constraints 표현, 항목 판정 함수)
+# 판정 함수는 True/False, 정보가 없으면 None
+# Google 장소: parking_available / open_now ..., KTO POI: is_parking_available / is_currently_open
+FILTERS: Dict[str, Tuple[str, str, Callable[[Dict], Optional[bool]]]] = {
+    "parking": ("주차 가능한", "주차가능", _attribute("parking_available", "is_parking_available")),
+    "open_now": ("지금 영업 중인", "영업중", _attribute("open_now", "is_currently_open")),
+    "kids": ("아이와 가기 좋은", "아이동반", lambda item: item.get("good_for_children")),
+    "wheelchair": ("휠체어 이용이 편한", "휠체어", lambda item: item.get("wheelchair_accessible")),
+    "pets": ("반려동물과 갈 수 있는", "반려견동반", lambda item: item.get("allows_dogs")),
+    "reservable": ("예약 가능한", "예약가능", lambda item: item.get("reservable")),
+    "high_rating": ("평점 높은", "평점높은", lambda item: None if item.get("rating") is None else item["rating"] >= 4.5),
+    "has_image": ("사진이 있는", "사진", lambda item: bool(item.get("first_image") or item.get("image"))),
+}
+
+SORT_LABELS = {
+    "distance": "가까운 순으로",
+    "rating": "평점 높은 순으로",
+    "popularity": "리뷰 많은 순으로",
+}
+
+
+async def execute(
+    service,
+    query: str,
+    classification: Dict[str, Any],
+    user_location: Optional[Dict[str, float]] = None,
+    steps: Optional[List[Dict]] = None,
+    result_state: Optional[ResultState] = None
+) -> Dict[str, Any]:
+    """
+    REFINE 파이프라인 실행
+
+    Args:
+        service: BeatyService 인스턴스
+        query: 원본 질의
+        classification: 의도분류 결과 (refine_filters, refine_sort, refine_more, max_distance_km)
+        user_location: 사용자 현재 위치 {lat, lng}
+        steps: 이전 단계 결과
+        result_state: 세션의 직전 결과 (main에서 전달, 결과 보기 상태는 이 객체에 갱신)
+
+    Returns:
+        직전 결과와 같은 의도(RECOMMEND/FIND_PLACE) 형태의 응답 (프론트엔드 렌더링 호환)
+    """
+    if steps is None:
+        steps = []
+
+    print(f"[REFINE_PIPELINE] 시작: '{query}'")
+
+    new_filters = [name for name in classification.get("refine_filters") or [] if name in FILTERS]
+    sort_by = classification.get("refine_sort")
+    more = bool(classification.get("refine_more"))
+    max_distance_km = classification.get("max_distance_km")
+
+    # 조건 누적 ("그 중에 주차 되는 곳" → "그 중 가까운 순")
+    filters = list(dict.fromkeys(result_state.filters + new_filters))
+    if max_distance_km is None:
+        max_distance_km = result_state.max_distance_km
+    if sort_by not in SORT_LABELS:
+        sort_by = result_state.sort_by
+
+    reference = user_location or result_state.user_location
+    items = [_with_distance(item, reference) for item in result_state.items]
+
+    # 판단 불가 조건 → 원래 파이프라인 재실행
+    unsupported = [name for name in new_filters if all(FILTERS[name][2](item) is None for item in items)]
+    if (sort_by == "distance" or max_distance_km) and all(item.get("distance_km") is None for item in items):
+        unsupported.append("distance")
+    if unsupported:
+        return await _rerun_with_constraints(service, query, classification, user_location, steps, result_state, unsupported)
+
+    view = [item for item in items if all(FILTERS[name][2](item) for name in filters)]
+    if max_distance_km:
+        view = [item for item in view if item.get("distance_km") is not None and item["distance_km"] <= max_distance_km]
+    view = _sort(view, sort_by)
+
+    page_size = result_state.page_size or 10
+    start = result_state.shown if more and not new_filters and sort_by == result_state.sort_by else 0
+    page = view[start:start + page_size]
+
+    # 보기 상태 갱신 (다음 후속 질의의 기준)
+    result_state.filters = filters
+    result_state.max_distance_km = max_distance_km
+    result_state.sort_by = sort_by
+    if page:
+        result_state.shown = start + len(page)
+
+    refined = {
+        "filters": filters,
+        "sort_by": sort_by,
+        "max_distance_km": max_distance_km,
+        "more": more,
+        "offset": start,
+        "total": len(view)
+    }
+    steps.append({
+        "step": 2,
+        "name": "결과 다듬기 (REFINE)",
+        "result": {**refined, "candidates": len(items), "count": len(page)}
+    })
+    print(f"[REFINE_PIPELINE] 후보 {len(items)}개 → 조건 일치 {len(view)}개, {start}번째부터 {len(page)}개")
+
+    answer = _build_answer(filters, max_distance_km, sort_by, more, len(page), len(view), start)
+    final_response = {
+        "answer": answer,
+        "answer_stream": replay_answer(answer),
+        result_state.item_key: page,
+        "count": len(page),
+        "refined": refined
+    }
+    steps.append({
+        "step": 3,
+        "name": "최종응답",
+        "result": {k: v for k, v in final_response.items() if k != "answer_stream"}
+    })
+
+    return {
+        "intent": result_state.intent,
+        "steps": steps,
+        "final_response": final_response
+    }
+
+
+def _coords(item: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    """항목 좌표 (Google: lat/lng, KTO: mapy/mapx)"""
+    lat = item.get("lat", item.get("mapy"))
+    lng = item.get("lng", item.get("mapx"))
+    try:
+        return float(lat), float(lng)
+    except (TypeError, ValueError):
+        return None
+
+
+def _with_distance(item: Dict[str, Any], reference: Optional[Dict[str, float]]) -> Dict[str, Any]:
+    """기준 위치가 있으면 거리(km) 재계산 (원본 항목은 그대로 두고 복사본에 기록)"""
+    coords = _coords(item)
+    if not reference or not coords:
+        return item
+    distance = haversine_km(reference["lat"], reference["lng"], coords[0], coords[1])
+    return {**item, "distance_km": round(distance, 2)}
+
+
+def _sort(items: List[Dict[str, Any]], sort_by: Optional[str]) -> List[Dict[str, Any]]:
+    """정렬 (값이 없는 항목은 뒤로, 같은 값은 원래 순서 유지)"""
+    if sort_by == "distance":
+        return sorted(items, key=lambda item: (item.get("distance_km") is None, item.get("distance_km") or 0))
+    if sort_by == "rating":
+        return sorted(items, key=lambda item: (item.get("rating") is None, -(item.get("rating") or 0)))
+    if sort_by == "popularity":
+        return sorted(items, key=lambda item: (item.get("user_rating_count") is None, -(item.get("user_rating_count") or 0)))
+    return items
+
+
+def _build_answer(filters: List[str], max_distance_km: Optional[float], sort_by: Optional[str],
+                  more: bool, count: int, total: int, offset: int) -> str:
+    """템플릿 답변 (LLM 호출 없음)"""
+    conditions = [FILTERS[name][0] for name in filters]
+    if max_distance_km:
+        conditions.insert(0, f"{max_distance_km:g}km 이내의")
+    condition_text = " ".join(conditions)
+    target = f"{condition_text} 곳" if condition_text else "곳"
+
+    if count == 0:
+        if more and offset > 0:
+            return "앗, 더 보여드릴 곳이 없어요. 다른 조건으로 새로 찾아볼까요?"
+        return f"앗, 그 중에 {target}은 없었어요. 조건을 바꿔서 다시 찾아볼까요?"
+
+    sort_text = f" {SORT_LABELS[sort_by]}" if sort_by else ""
+    if more and offset > 0:
+        return f"다른 {target} {count}곳을{sort_text} 더 보여드릴게요! (전체 {total}곳)"
+    return f"그 중에 {target} {count}곳을{sort_text} 골라봤어요!"
+
+
+async def _rerun_with_constraints(
+    service,
+    query: str,
+    classification: Dict[str, Any],
+    user_location: Optional[Dict[str, float]],
+    steps: List[Dict],
+    result_state: ResultState,
+    unsupported: List[str]
+) -> Dict[str, Any]:
+    """직전 결과에 해당 속성 정보가 없으면 원래 의도로 조건을 붙여 다시 검색"""
+    print(f"[REFINE_PIPELINE] 판단 불가 조건 {unsupported} → {result_state.intent} 재실행")
+
+    constraints = [FILTERS[name][1] for name in unsupported if name in FILTERS]
+    if "distance" in unsupported:
+        constraints.append("가까운 곳")
+
+    rerun_classification = {
+        **result_state.classification,
+        "intent": result_state.intent,
+        "hard_constraints": list(result_state.classification.get("hard_constraints") or []) + constraints
+    }
+    steps.append({
+        "step": 2,
+        "name": f"의도 전환 (REFINE → {result_state.intent})",
+        "result": {"reason": "attribute_unavailable", "unsupported": unsupported}
+    })
+
+    execute_original = service.components.get_pipeline(result_state.intent)
+    return await execute_original(
+        service,
+        f"{result_state.query} {query}",
+        rerun_classification,
+        user_location or result_state.user_location,
+        steps
+    )
@@ -1,9 +1,12 @@
 """
 ROUTE 파이프라인 - 경로 검색 의도 처리
 """
-import httpx
+import asyncio
 from typing import Dict, Any, Optional, List
-from openai import OpenAI
+
+from orchestration.answer_templates import FOUND, NONE
+from orchestration.response_generator import compose_answer
+from ..google.pipeline import execute as execute_findplace
 
 
 async def execute(
@@ -57,9 +60,14 @@ async def execute(
         dest_coords = None
         dest_name = None
 
+        # 출발지/도착지 동시 Geocoding
+        origin_result, dest_result = await asyncio.gather(
+            service.google_geocoder.geocode(origin_keyword) if origin_keyword else _skip(),
+            service.google_geocoder.geocode(destination_keyword) if destination_keyword else _skip()
+        )
+
         # 출발지 처리
         if origin_keyword:
-            origin_result = await service.google_geocoder.geocode(origin_keyword)
             if origin_result:
                 origin_coords = {"lat": origin_result["lat"], "lng": origin_result["lng"]}
                 origin_name = origin_result["formatted_address"]
@@ -77,7 +85,6 @@ async def execute(
 
         # 도착지 처리
         if destination_keyword:
-            dest_result = await service.google_geocoder.geocode(destination_keyword)
             if dest_result:
                 dest_coords = {"lat": dest_result["lat"], "lng": dest_result["lng"]}
                 dest_name = dest_result["formatted_address"]
@@ -100,7 +107,6 @@ async def execute(
                 })
 
                 # FIND_PLACE 파이프라인으로 전환
-                from ..findplace.pipeline import execute as execute_findplace
                 return await execute_findplace(
                     service,
                     query,
@@ -130,19 +136,19 @@ async def execute(
         transportation_mode = classification.get("transportation_mode")
         route_preference = classification.get("route_preference", "fastest")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "http://localhost:8002/api/route",
-                json={
-                    "origin": origin_coords,
-                    "destination": dest_coords,
-                    "transportation_mode": transportation_mode,
-                    "route_preference": route_preference
-                },
-                timeout=30.0
-            )
-            response.raise_for_status()
-            route_data = response.json()
+        client = service.http_clients.get("http://localhost:8002")
+        response = await client.post(
+            "http://localhost:8002/api/route",
+            json={
+                "origin": origin_coords,
+                "destination": dest_coords,
+                "transportation_mode": transportation_mode,
+                "route_preference": route_preference
+            },
+            timeout=30.0
+        )
+        response.raise_for_status()
+        route_data = response.json()
 
         step4_result = {
             "paths": route_data.get("paths", []),
@@ -168,7 +174,7 @@ async def execute(
         # 모든 경로에 대한 GeoJSON 생성
         geojson = _generate_geojson_for_all_paths(paths, origin_coords, dest_coords)
 
-        final_response = _generate_final_response(
+        final_response = await _generate_final_response(
             service,
             query,
             origin_name,
@@ -212,6 +218,11 @@ async def execute(
         }
 
 
+async def _skip():
+    """geocoding 생략 (키워드 없음)"""
+    return None
+
+
 def _generate_geojson_for_all_paths(paths: List[Dict], origin: Dict, destination: Dict) -> Dict:
     """모든 경로를 GeoJSON으로 변환 (각 경로별 색상 구분용)"""
     features = []
@@ -294,7 +305,7 @@ def _generate_geojson_for_all_paths(paths: List[Dict], origin: Dict, destination
     }
 
 
-def _generate_final_response(
+async def _generate_final_response(
     service,
     query: str,
     origin: str,
@@ -302,7 +313,7 @@ def _generate_final_response(
     paths: List[Dict],
     geojson: Dict = None
 ) -> Dict:
-    """최종 응답 생성 - Beaty 캐릭터로 응답"""
+    """최종 응답 생성 - 템플릿 우선 (답변 정책에 따라 LLM 스트리밍)"""
 
     # 경로 정보 준비
     if not paths:
@@ -312,23 +323,12 @@ def _generate_final_response(
 도착지: {destination}
 결과: 경로를 찾을 수 없음
 """
-        try:
-            client = OpenAI(api_key=service.config["openai_api_key"])
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": service.character_prompt},
-                    {"role": "user", "content": f"{context}\n\n위 정보를 바탕으로 주인님께 친절하게 답변해주세요."}
-                ],
-                temperature=0.7
-            )
-            answer = response.choices[0].message.content
-        except Exception as e:
-            print(f"[ROUTE_PIPELINE] OpenAI 호출 실패: {e}")
-            answer = f"앗, {destination}까지 가는 경로를 찾을 수 없었어요."
-
         return {
-            "answer": answer,
+            **compose_answer(
+                service, "ROUTE", NONE, context,
+                "위 정보를 바탕으로 주인님께 친절하게 답변해주세요.",
+                origin=origin or "현재 위치", destination=destination
+            ),
             "routes": [],
             "origin": origin,
             "destination": destination
@@ -340,7 +340,7 @@ def _generate_final_response(
     total_time = info.get("totalTime", 0)
     payment = info.get("payment", 0)
 
-    # GPT로 자연스러운 응답 생성 (경로 상세 정보 제외)
+    # 경로 상세 정보 제외, 개수만 전달
     context = f"""
 사용자 질문: {query}
 출발지: {origin or '현재 위치'}
@@ -351,23 +351,12 @@ def _generate_final_response(
 ** 사용자의 질문 의도에 맞춰 공감하며 짧게 답변해주세요.
 """
 
-    try:
-        client = OpenAI(api_key=service.config["openai_api_key"])
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": service.character_prompt},
-                {"role": "user", "content": f"{context}\n\n위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 경로 상세는 언급하지 마세요."}
-            ],
-            temperature=0.7
-        )
-        answer = response.choices[0].message.content
-    except Exception as e:
-        print(f"[ROUTE_PIPELINE] OpenAI 호출 실패: {e}")
-        answer = f"{len(paths)}개 경로를 찾았어요!"
-
     return {
-        "answer": answer,
+        **compose_answer(
+            service, "ROUTE", FOUND, context,
+            "위 정보를 바탕으로 주인님께 친절하고 짧게 답변해주세요. 경로 상세는 언급하지 마세요.",
+            origin=origin or "현재 위치", destination=destination, count=len(paths)
+        ),
         "routes": paths,
         "origin": origin,
         "destination": destination,
@@ -0,0 +1,74 @@
+"""
+REFINE 필터 - KTO POI(RECOMMEND 결과) 속성으로 로컬 필터링되는지 확인
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# pipelines 패키지가 모든 파이프라인을 import → 서비스 의존성 필요
+for module in ("openai", "httpx", "asyncpg"):
+    pytest.importorskip(module)
+
+sys.path.append(str(Path(__file__).parent.parent))
+from orchestration.result_state import ResultState
+from pipelines.refine.pipeline import FILTERS, execute
+
+
+# KTO POI 형태 (poi-service /api/recommend 응답 항목)
+KTO_POIS = [
+    {"content_id": "1", "title": "경복궁", "mapy": 37.5796, "mapx": 126.9770,
+     "is_parking_available": True, "is_currently_open": True, "is_free_admission": False},
+    {"content_id": "2", "title": "북촌한옥마을", "mapy": 37.5826, "mapx": 126.9836,
+     "is_parking_available": False, "is_currently_open": True, "is_free_admission": True},
+    {"content_id": "3", "title": "창덕궁", "mapy": 37.5794, "mapx": 126.9910,
+     "is_parking_available": True, "is_currently_open": False, "is_free_admission": False},
+]
+
+
+def _state(items):
+    return ResultState(
+        intent="RECOMMEND",
+        item_key="pois",
+        items=items,
+        query="종로 관광지 추천",
+        classification={"intent": "RECOMMEND"},
+    )
+
+
+def test_predicates_read_kto_fields():
+    parking = FILTERS["parking"][2]
+    open_now = FILTERS["open_now"][2]
+    assert [parking(poi) for poi in KTO_POIS] == [True, False, True]
+    assert [open_now(poi) for poi in KTO_POIS] == [True, True, False]
+
+
+def test_predicates_read_google_fields():
+    place = {"name": "카페", "parking_available": False, "open_now": True}
+    assert FILTERS["parking"][2](place) is False
+    assert FILTERS["open_now"][2](place) is True
+    assert FILTERS["parking"][2]({"name": "정보 없음"}) is None
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("parking", ["1", "3"]),
+    ("open_now", ["1", "2"]),
+])
+def test_kto_result_filters_locally(name, expected):
+    state = _state(KTO_POIS)
+    # service=None: 재실행 경로로 가면 실패
+    result = asyncio.run(execute(None, "그 중에", {"refine_filters": [name]}, result_state=state))
+
+    pois = result["final_response"]["pois"]
+    assert [poi["content_id"] for poi in pois] == expected
+    assert result["final_response"]["refined"]["filters"] == [name]
+    assert state.filters == [name]
+
+
+def test_filters_accumulate_on_kto_result():
+    state = _state(KTO_POIS)
+    asyncio.run(execute(None, "주차 되는 곳만", {"refine_filters": ["parking"]}, result_state=state))
+    result = asyncio.run(execute(None, "지금 여는 곳", {"refine_filters": ["open_now"]}, result_state=state))
+
+    assert [poi["content_id"] for poi in result["final_response"]["pois"]] == ["1"]
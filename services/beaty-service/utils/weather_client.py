@@ -1,20 +1,134 @@
 """
 OpenWeatherMap API 클라이언트
+비동기 호출 + stale-while-revalidate 캐시 (위경도 격자 셀 단위)
 """
-import requests
-from datetime import datetime
-from typing import Dict, Any, Optional
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, Optional, Tuple
+
+from orchestration.http_clients import http_clients
+from orchestration.swr_cache import SWRCache
+
+# 서울 중심 좌표 (기본값)
+SEOUL_LAT = 37.5665
+SEOUL_LON = 126.9780
+
+# 캐시 격자 크기 (0.1도 ≈ 11km) - 같은 셀의 요청은 하나의 API 결과를 공유
+GRID_DEGREES = 0.1
+
+# 백그라운드 갱신 대상 셀 상한 + 마지막 조회 후 추적 유지 시간 (서울 중심 셀은 항상 유지)
+MAX_TRACKED_CELLS = 64
+TRACKED_CELL_TTL_SECONDS = 3600.0
+
+KST = timezone(timedelta(hours=9))
 
 
 class WeatherClient:
     """OpenWeatherMap API 클라이언트"""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        current_refresh_seconds: float = 300.0,
+        forecast_refresh_seconds: float = 1800.0,
+        max_stale_seconds: float = 3 * 3600.0
+    ):
+        """
+        Args:
+            api_key: OpenWeatherMap API 키
+            current_refresh_seconds: 현재 날씨 갱신 주기 (기본 5분)
+            forecast_refresh_seconds: 예보 갱신 주기 (기본 30분)
+            max_stale_seconds: 만료된 값을 그대로 반환할 최대 시간 (초과 시 동기 조회)
+        """
         self.api_key = api_key
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
         self.forecast_url = "https://api.openweathermap.org/data/2.5/forecast"  # 5일 예보 (3시간 간격)
 
-    def get_current_weather(self, lat: float = 37.5665, lon: float = 126.9780) -> Optional[Dict[str, Any]]:
+        self.current_refresh_seconds = current_refresh_seconds
+        self.forecast_refresh_seconds = forecast_refresh_seconds
+        self.cache = SWRCache(fresh_seconds=current_refresh_seconds, stale_seconds=max_stale_seconds)
+
+        # 백그라운드 리프레셔가 관리하는 셀 → 마지막 조회 시각 (최근 조회된 셀 + 서울 중심)
+        self.seoul_cell = self._cell(SEOUL_LAT, SEOUL_LON)
+        self.tracked_cells: "OrderedDict[Tuple[int, int], float]" = OrderedDict()
+        self._refresher_task: Optional[asyncio.Task] = None
+
+    # ==================== 격자 셀 ====================
+
+    @staticmethod
+    def _cell(lat: float, lon: float) -> Tuple[int, int]:
+        """좌표 → 격자 셀 인덱스"""
+        return (math.floor(lat / GRID_DEGREES), math.floor(lon / GRID_DEGREES))
+
+    def _cell_center(self, cell: Tuple[int, int]) -> Tuple[float, float]:
+        """API 요청 좌표 (서울 중심 셀은 서울 중심 좌표, 나머지는 격자 셀 중심)"""
+        if cell == self.seoul_cell:
+            return (SEOUL_LAT, SEOUL_LON)
+        return (
+            round((cell[0] + 0.5) * GRID_DEGREES, 4),
+            round((cell[1] + 0.5) * GRID_DEGREES, 4)
+        )
+
+    def _track(self, cell: Tuple[int, int]):
+        """조회된 셀을 갱신 대상으로 등록 (상한 초과 시 가장 오래 조회 안 된 셀부터 제외)"""
+        if cell == self.seoul_cell:
+            return
+        self.tracked_cells[cell] = time.monotonic()
+        self.tracked_cells.move_to_end(cell)
+        while len(self.tracked_cells) > MAX_TRACKED_CELLS:
+            self.tracked_cells.popitem(last=False)
+
+    def _refresh_targets(self):
+        """갱신할 셀 목록 (서울 중심 + 최근 TRACKED_CELL_TTL_SECONDS 안에 조회된 셀, 만료 셀은 제거)"""
+        cutoff = time.monotonic() - TRACKED_CELL_TTL_SECONDS
+        for cell in [cell for cell, last_seen in self.tracked_cells.items() if last_seen < cutoff]:
+            del self.tracked_cells[cell]
+        return [self.seoul_cell, *self.tracked_cells]
+
+    # ==================== API 호출 (원본 JSON) ====================
+
+    async def _fetch(self, url: str, lat: float, lon: float, **extra_params) -> Optional[Dict[str, Any]]:
+        """OpenWeatherMap API 호출 (공유 HTTP 클라이언트 사용)"""
+        params = {
+            "lat": lat,
+            "lon": lon,
+            "appid": self.api_key,
+            "units": "metric",  # 섭씨 온도
+            "lang": "kr",  # 한국어
+            **extra_params
+        }
+
+        print(f"[WEATHER_CLIENT] 요청: {url.rsplit('/', 1)[-1]} lat={lat}, lon={lon}")
+
+        client = http_clients.get(url)
+        response = await client.get(url, params=params, timeout=10.0)
+        response.raise_for_status()
+        return response.json()
+
+    async def _get_current_data(self, cell: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """현재 날씨 원본 데이터 (캐시)"""
+        lat, lon = self._cell_center(cell)
+        return await self.cache.get(
+            ("current", cell),
+            lambda: self._fetch(self.base_url, lat, lon),
+            fresh_seconds=self.current_refresh_seconds
+        )
+
+    async def _get_forecast_data(self, cell: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """시간별 예보 원본 데이터 (캐시, 8개 = 24시간)"""
+        lat, lon = self._cell_center(cell)
+        return await self.cache.get(
+            ("forecast", cell),
+            lambda: self._fetch(self.forecast_url, lat, lon, cnt=8),
+            fresh_seconds=self.forecast_refresh_seconds
+        )
+
+    # ==================== 조회 ====================
+
+    async def get_current_weather(self, lat: float = SEOUL_LAT, lon: float = SEOUL_LON) -> Optional[Dict[str, Any]]:
         """
         현재 날씨 정보 조회 (서울 중심 기준)
 
@@ -33,50 +147,29 @@ class WeatherClient:
             }
         """
         try:
-            # API 요청 파라미터
-            params = {
-                "lat": lat,
-                "lon": lon,
-                "appid": self.api_key,
-                "units": "metric",  # 섭씨 온도
-                "lang": "kr"  # 한국어
-            }
-
-            print(f"[WEATHER_CLIENT] 요청: lat={lat}, lon={lon}")
-
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
+            cell = self._cell(lat, lon)
+            self._track(cell)
 
-            # 날씨 정보 추출
-            temperature = round(data["main"]["temp"])
-            humidity = data["main"]["humidity"]
-            wind_speed = data["wind"]["speed"]
+            data = await self._get_current_data(cell)
+            if not data:
+                return None
 
-            # 날씨 상태 코드 (weather[0].id)
+            # 날씨 정보 추출 (이모지는 낮/밤에 따라 달라지므로 조회 시점에 파싱)
             weather_id = data["weather"][0]["id"]
             weather_main = data["weather"][0]["main"]
-            weather_description = data["weather"][0]["description"]
 
             # 하늘상태 및 강수형태 파싱
             sky, precipitation = self._parse_weather(weather_id, weather_main)
 
-            # 날씨 이모지 결정
-            emoji = self._get_weather_emoji(weather_id, weather_main)
-
-            result = {
-                "temperature": temperature,
+            return {
+                "temperature": round(data["main"]["temp"]),
                 "sky": sky,
                 "precipitation": precipitation,
-                "humidity": humidity,
-                "wind_speed": wind_speed,
-                "emoji": emoji
+                "humidity": data["main"]["humidity"],
+                "wind_speed": data["wind"]["speed"],
+                "emoji": self._get_weather_emoji(weather_id, weather_main)
             }
 
-            print(f"[WEATHER_CLIENT] 날씨 정보: {result}")
-            return result
-
         except Exception as e:
             print(f"[WEATHER_CLIENT] 오류 발생: {e}")
             import traceback
@@ -163,7 +256,7 @@ class WeatherClient:
 
         return "☀️"  # 기본값
 
-    def get_detailed_weather(self, lat: float = 37.5665, lon: float = 126.9780) -> Optional[Dict[str, Any]]:
+    async def get_detailed_weather(self, lat: float = SEOUL_LAT, lon: float = SEOUL_LON) -> Optional[Dict[str, Any]]:
         """
         상세 날씨 정보 조회 (현재 날씨 + 시간별 예보 + 일출/일몰)
 
@@ -176,95 +269,96 @@ class WeatherClient:
             }
         """
         try:
-            # 1. 현재 날씨 (일출/일몰 포함)
-            current_params = {
-                "lat": lat,
-                "lon": lon,
-                "appid": self.api_key,
-                "units": "metric",
-                "lang": "kr"
-            }
+            cell = self._cell(lat, lon)
+            self._track(cell)
 
-            current_response = requests.get(self.base_url, params=current_params, timeout=10)
-            current_response.raise_for_status()
-            current_data = current_response.json()
+            # 현재 날씨 + 예보 동시 조회 (캐시 적중 시 외부 호출 없음)
+            current_data, forecast_data = await asyncio.gather(
+                self._get_current_data(cell),
+                self._get_forecast_data(cell)
+            )
+            if not current_data or not forecast_data:
+                return None
 
             # 현재 날씨 파싱
-            temperature = round(current_data["main"]["temp"])
-            feels_like = round(current_data["main"]["feels_like"])
-            humidity = current_data["main"]["humidity"]
-            wind_speed = current_data["wind"]["speed"]
             weather_id = current_data["weather"][0]["id"]
             weather_main = current_data["weather"][0]["main"]
-            weather_description = current_data["weather"][0]["description"]
-
             sky, precipitation = self._parse_weather(weather_id, weather_main)
-            emoji = self._get_weather_emoji(weather_id, weather_main)
-
-            # 일출/일몰 (UTC → 한국시간 KST)
-            from datetime import datetime, timezone, timedelta
-            kst = timezone(timedelta(hours=9))
-            sunrise_utc = datetime.fromtimestamp(current_data["sys"]["sunrise"], tz=timezone.utc)
-            sunset_utc = datetime.fromtimestamp(current_data["sys"]["sunset"], tz=timezone.utc)
-            sunrise_kst = sunrise_utc.astimezone(kst).strftime("%H:%M")
-            sunset_kst = sunset_utc.astimezone(kst).strftime("%H:%M")
 
             current_weather = {
-                "temperature": temperature,
-                "feels_like": feels_like,
+                "temperature": round(current_data["main"]["temp"]),
+                "feels_like": round(current_data["main"]["feels_like"]),
                 "sky": sky,
                 "precipitation": precipitation,
-                "humidity": humidity,
-                "wind_speed": wind_speed,
-                "emoji": emoji,
-                "description": weather_description
-            }
-
-            # 2. 시간별 예보 (3시간 간격, 24시간분만)
-            forecast_params = {
-                "lat": lat,
-                "lon": lon,
-                "appid": self.api_key,
-                "units": "metric",
-                "lang": "kr",
-                "cnt": 8  # 8개 = 24시간 (3시간 * 8)
+                "humidity": current_data["main"]["humidity"],
+                "wind_speed": current_data["wind"]["speed"],
+                "emoji": self._get_weather_emoji(weather_id, weather_main),
+                "description": current_data["weather"][0]["description"]
             }
 
-            forecast_response = requests.get(self.forecast_url, params=forecast_params, timeout=10)
-            forecast_response.raise_for_status()
-            forecast_data = forecast_response.json()
+            # 일출/일몰 (UTC → 한국시간 KST)
+            sunrise_kst = datetime.fromtimestamp(current_data["sys"]["sunrise"], tz=timezone.utc).astimezone(KST).strftime("%H:%M")
+            sunset_kst = datetime.fromtimestamp(current_data["sys"]["sunset"], tz=timezone.utc).astimezone(KST).strftime("%H:%M")
 
+            # 시간별 예보 (3시간 간격, 24시간분만)
             hourly_forecast = []
             for item in forecast_data["list"]:
-                dt = datetime.fromtimestamp(item["dt"], tz=timezone.utc).astimezone(kst)
-                temp = round(item["main"]["temp"])
-                weather_id = item["weather"][0]["id"]
-                weather_main = item["weather"][0]["main"]
-                emoji = self._get_weather_emoji(weather_id, weather_main)
-
+                dt = datetime.fromtimestamp(item["dt"], tz=timezone.utc).astimezone(KST)
                 hourly_forecast.append({
                     "time": dt.strftime("%H:%M"),
                     "hour": dt.strftime("%H시"),
-                    "temperature": temp,
-                    "emoji": emoji
+                    "temperature": round(item["main"]["temp"]),
+                    "emoji": self._get_weather_emoji(item["weather"][0]["id"], item["weather"][0]["main"])
                 })
 
-            result = {
+            return {
                 "current": current_weather,
                 "hourly": hourly_forecast,
                 "sunrise": sunrise_kst,
                 "sunset": sunset_kst
             }
 
-            print(f"[WEATHER_CLIENT] 상세 날씨 정보 조회 완료")
-            return result
-
         except Exception as e:
             print(f"[WEATHER_CLIENT] 상세 날씨 조회 오류: {e}")
             import traceback
             traceback.print_exc()
             return None
 
+    # ==================== 백그라운드 갱신 ====================
+
+    def start_refresher(self):
+        """백그라운드 리프레셔 시작 (앱 startup 시 호출)"""
+        if self._refresher_task is None or self._refresher_task.done():
+            self._refresher_task = asyncio.create_task(self._refresh_loop())
+            print(f"[WEATHER_CLIENT] 리프레셔 시작 (현재 {self.current_refresh_seconds}s, 예보 {self.forecast_refresh_seconds}s)")
+
+    async def stop_refresher(self):
+        """백그라운드 리프레셔 종료 (앱 shutdown 시 호출)"""
+        if self._refresher_task:
+            self._refresher_task.cancel()
+            try:
+                await self._refresher_task
+            except asyncio.CancelledError:
+                pass
+            self._refresher_task = None
+
+    async def _refresh_loop(self):
+        """추적 중인 셀의 현재 날씨/예보를 주기적으로 미리 갱신"""
+        tick = min(self.current_refresh_seconds, self.forecast_refresh_seconds) / 5
+        while True:
+            for cell in self._refresh_targets():
+                lat, lon = self._cell_center(cell)
+
+                current_age = self.cache.age(("current", cell))
+                if current_age is None or current_age >= self.current_refresh_seconds:
+                    await self.cache.refresh(("current", cell), lambda: self._fetch(self.base_url, lat, lon))
+
+                forecast_age = self.cache.age(("forecast", cell))
+                if forecast_age is None or forecast_age >= self.forecast_refresh_seconds:
+                    await self.cache.refresh(("forecast", cell), lambda: self._fetch(self.forecast_url, lat, lon, cnt=8))
+
+            await asyncio.sleep(tick)
+
 
 # 테스트
 if __name__ == "__main__":
@@ -287,7 +381,7 @@ if __name__ == "__main__":
             weather_api_key = config.get("openweathermap_api_key", "")
 
     client = WeatherClient(weather_api_key)
-    weather = client.get_current_weather()
+    weather = asyncio.run(client.get_current_weather())
 
     if weather:
         print("\n=== 날씨 정보 ===")
@@ -0,0 +1,521 @@
+"""
+Beaty Load Test - /api/query SSE 부하 테스트
+의도별 가중치 질의 믹스를 동시 SSE 스트림으로 재생하고 구간별 지연 백분위를 JSON으로 저장
+
+측정 항목 (요청 전송 시각 기준, ms):
+    ttfb_ms         응답 헤더 수신
+    data_ms         첫 data 이벤트 (pois/places/routes) 수신
+    first_chunk_ms  첫 chunk 이벤트 (스트리밍 답변 첫 조각) 수신
+    total_ms        done 이벤트까지 전체 스트림
+    server loop lag beaty-service 이벤트 루프 지연 (/api/runtime/loop-lag)
+    client loop lag 부하 생성기 자체 루프 지연 (높으면 측정값 신뢰 불가)
+
+사용법:
+    # 폐쇄형: 동시 50개 스트림으로 500건
+    python loadtest.py run --concurrency 50 --requests 500 --out results/after.json
+
+    # 개방형: 초당 20건 도착 (포아송), 60초
+    python loadtest.py run --rate 20 --duration 60 --concurrency 200
+
+    # 두 결과 비교 (10% 이상 느려지면 exit 1)
+    python loadtest.py compare results/before.json results/after.json --threshold 10
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+DEFAULT_MIX = Path(__file__).parent / "queries.json"
+LATENCY_METRICS = ("ttfb_ms", "data_ms", "first_chunk_ms", "total_ms")
+PERCENTILES = (50, 90, 95, 99)
+
+
+# =====================================================================================
+# MEASUREMENT
+# =====================================================================================
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """정렬된 값의 q 백분위 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """백분위 요약"""
+    ordered = sorted(values)
+    summary = {"count": len(ordered)}
+    if not ordered:
+        return summary
+    summary["mean"] = round(sum(ordered) / len(ordered), 2)
+    for q in PERCENTILES:
+        summary[f"p{q}"] = round(percentile(ordered, q), 2)
+    summary["max"] = round(ordered[-1], 2)
+    return summary
+
+
+@dataclass
+class QueryItem:
+    expected_intent: str
+    query: str
+    user_location: Optional[Dict[str, float]]
+
+
+@dataclass
+class RequestResult:
+    expected_intent: str
+    query: str
+    intent: Optional[str] = None
+    status: Optional[int] = None
+    ttfb_ms: Optional[float] = None
+    data_ms: Optional[float] = None
+    first_chunk_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+    chunks: int = 0
+    error: Optional[str] = None
+    started_at: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class QueryMix:
+    """의도별 가중치 질의 믹스 (시드 고정)"""
+
+    def __init__(self, path: Path, seed: int, only: Optional[List[str]] = None):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.locations = data.get("locations", [])
+        self.intents = {
+            name: spec for name, spec in data["intents"].items()
+            if spec.get("queries") and (not only or name in only)
+        }
+        if not self.intents:
+            raise ValueError(f"사용할 질의가 없습니다: {path}")
+        self.names = list(self.intents)
+        self.weights = [self.intents[name].get("weight", 1) for name in self.names]
+        self.rng = random.Random(seed)
+
+    def next(self) -> QueryItem:
+        intent = self.rng.choices(self.names, weights=self.weights)[0]
+        query = self.rng.choice(self.intents[intent]["queries"])
+        location = self.rng.choice(self.locations) if self.locations else None
+        return QueryItem(intent, query, location)
+
+    def describe(self) -> Dict[str, Any]:
+        total = sum(self.weights)
+        return {name: round(weight / total, 3) for name, weight in zip(self.names, self.weights)}
+
+
+class ClientLoopLag:
+    """부하 생성기 자체 이벤트 루프 지연 (클라이언트가 병목인지 확인)"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - expected) * 1000)
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+
+
+async def run_one(client: httpx.AsyncClient, url: str, item: QueryItem, timeout: float) -> RequestResult:
+    """SSE 요청 1건 - 이벤트 도착 시각 기록"""
+    result = RequestResult(expected_intent=item.expected_intent, query=item.query, started_at=time.time())
+    payload = {"query": item.query, "mode": "real"}
+    if item.user_location:
+        payload["user_location"] = item.user_location
+
+    start = time.perf_counter()
+    elapsed_ms = lambda: round((time.perf_counter() - start) * 1000, 2)
+
+    async def consume() -> bool:
+        """스트림 소비 - done 이벤트 수신 여부 반환"""
+        async with client.stream("POST", f"{url}/api/query", json=payload) as response:
+            result.status = response.status_code
+            result.ttfb_ms = elapsed_ms()
+            if response.status_code != 200:
+                await response.aread()
+                result.error = f"http_{response.status_code}"
+                return False
+
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                try:
+                    event = json.loads(line[5:].strip())
+                except json.JSONDecodeError:
+                    result.error = "bad_event"
+                    continue
+
+                event_type = event.get("type")
+                if event_type == "data":
+                    if result.data_ms is None:
+                        result.data_ms = elapsed_ms()
+                    result.intent = event.get("intent")
+                elif event_type == "chunk":
+                    if result.first_chunk_ms is None:
+                        result.first_chunk_ms = elapsed_ms()
+                    result.chunks += 1
+                elif event_type == "done":
+                    return True
+                elif event_type == "error":
+                    result.error = "error_event"
+                    return False
+                elif event_type == "busy":
+                    result.error = "busy"
+                    return False
+        return False
+
+    try:
+        done = await asyncio.wait_for(consume(), timeout)
+        result.total_ms = elapsed_ms()
+        if result.error is None and not done:
+            result.error = "incomplete"
+    except (asyncio.TimeoutError, httpx.TimeoutException):
+        result.error = "timeout"
+    except httpx.ConnectError:
+        result.error = "connect"
+    except Exception as e:
+        result.error = f"exception:{type(e).__name__}"
+
+    return result
+
+
+# =====================================================================================
+# LOAD PATTERNS
+# =====================================================================================
+
+async def closed_loop(client, args, mix: QueryMix, results: List[RequestResult]):
+    """폐쇄형 - concurrency개 워커가 응답을 받는 즉시 다음 요청"""
+    deadline = time.perf_counter() + args.duration if args.duration else None
+    issued = 0
+
+    async def worker():
+        nonlocal issued
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            if deadline is None and issued >= args.requests:
+                return
+            issued += 1
+            results.append(await run_one(client, args.url, mix.next(), args.timeout))
+
+    await asyncio.gather(*[worker() for _ in range(args.concurrency)])
+
+
+async def open_loop(client, args, mix: QueryMix, results: List[RequestResult]):
+    """
+    개방형 - 포아송 도착 (응답 속도와 무관하게 rate 유지)
+    동시 요청이 concurrency를 넘으면 보내지 않고 client_saturated로 기록
+    """
+    rng = random.Random(args.seed + 1)
+    deadline = time.perf_counter() + args.duration if args.duration else None
+    in_flight = set()
+    issued = 0
+
+    async def fire(item: QueryItem):
+        results.append(await run_one(client, args.url, item, args.timeout))
+
+    while True:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if deadline is None and issued >= args.requests:
+            break
+        issued += 1
+        item = mix.next()
+        if len(in_flight) >= args.concurrency:
+            results.append(RequestResult(item.expected_intent, item.query, error="client_saturated", started_at=time.time()))
+        else:
+            task = asyncio.create_task(fire(item))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        await asyncio.sleep(rng.expovariate(args.rate))
+
+    if in_flight:
+        await asyncio.gather(*in_flight)
+
+
+async def fetch_json(client: httpx.AsyncClient, url: str) -> Optional[Dict[str, Any]]:
+    try:
+        response = await client.get(url, timeout=5.0)
+        response.raise_for_status()
+        return response.json()
+    except Exception as e:
+        print(f"[LOADTEST] 조회 실패 ({url}): {e}")
+        return None
+
+
+# =====================================================================================
+# REPORT
+# =====================================================================================
+
+def git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True
+        ).stdout.strip())
+        return {"commit": commit, "dirty": dirty}
+    except Exception:
+        return {"commit": None, "dirty": None}
+
+
+def build_report(args, mix: QueryMix, results: List[RequestResult], elapsed: float,
+                 server_lag: Optional[Dict], client_lag: List[float], llm_stats: Optional[Dict],
+                 admission_stats: Optional[Dict] = None) -> Dict[str, Any]:
+    measured = results[args.warmup:]
+    ok = [r for r in measured if r.ok]
+
+    def latency_block(rows: List[RequestResult]) -> Dict[str, Any]:
+        return {
+            metric: summarize([getattr(r, metric) for r in rows if getattr(r, metric) is not None])
+            for metric in LATENCY_METRICS
+        }
+
+    by_intent = {}
+    grouped = defaultdict(list)
+    for r in measured:
+        grouped[r.expected_intent].append(r)
+    for intent, rows in sorted(grouped.items()):
+        rows_ok = [r for r in rows if r.ok]
+        by_intent[intent] = {
+            "requests": len(rows),
+            "errors": len(rows) - len(rows_ok),
+            "observed_intents": dict(Counter(r.intent for r in rows if r.intent)),
+            **latency_block(rows_ok),
+        }
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "url": args.url,
+            "pattern": "open" if args.rate else "closed",
+            "concurrency": args.concurrency,
+            "rate": args.rate,
+            "requests": args.requests,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "mix": mix.describe(),
+            "label": args.label,
+        },
+        "summary": {
+            "requests": len(measured),
+            "ok": len(ok),
+            "errors": len(measured) - len(ok),
+            "error_rate": round((len(measured) - len(ok)) / len(measured), 4) if measured else 0.0,
+            "elapsed_s": round(elapsed, 2),
+            "throughput_rps": round(len(measured) / elapsed, 2) if elapsed > 0 else 0.0,
+        },
+        "latency": latency_block(ok),
+        "errors": dict(Counter(r.error for r in measured if r.error)),
+        "by_intent": by_intent,
+        "loop_lag": {
+            "server": server_lag,
+            "client": summarize(client_lag),
+        },
+        "llm": llm_stats,
+        "admission": admission_stats,
+    }
+
+
+def print_report(report: Dict[str, Any]):
+    summary = report["summary"]
+    meta = report["meta"]
+    print()
+    print(f"=== Beaty Load Test ({meta['pattern']}, concurrency={meta['concurrency']}, git={meta['git']['commit']}) ===")
+    print(f"요청 {summary['requests']}건 | 성공 {summary['ok']} | 오류 {summary['errors']} ({summary['error_rate'] * 100:.2f}%) "
+          f"| {summary['elapsed_s']}s | {summary['throughput_rps']} req/s")
+    print()
+    print(f"{'metric':<16}{'count':>7}{'p50':>10}{'p90':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for metric in LATENCY_METRICS:
+        values = report["latency"][metric]
+        if not values.get("count"):
+            print(f"{metric:<16}{0:>7}")
+            continue
+        print(f"{metric:<16}{values['count']:>7}" + "".join(
+            f"{values[key]:>10.1f}" for key in ("p50", "p90", "p95", "p99", "max")
+        ))
+
+    print()
+    print(f"{'intent':<14}{'reqs':>6}{'errs':>6}{'data p50':>11}{'data p95':>11}{'total p50':>11}{'total p95':>11}")
+    for intent, block in report["by_intent"].items():
+        data, total = block["data_ms"], block["total_ms"]
+        print(f"{intent:<14}{block['requests']:>6}{block['errors']:>6}"
+              f"{data.get('p50', 0):>11.1f}{data.get('p95', 0):>11.1f}{total.get('p50', 0):>11.1f}{total.get('p95', 0):>11.1f}")
+
+    if report["errors"]:
+        print()
+        print("오류: " + ", ".join(f"{kind}={count}" for kind, count in report["errors"].items()))
+
+    server = report["loop_lag"]["server"]
+    client = report["loop_lag"]["client"]
+    print()
+    if server:
+        print(f"server loop lag: p50={server['p50_ms']}ms p99={server['p99_ms']}ms max={server['max_ms']}ms")
+    if client.get("count"):
+        print(f"client loop lag: p50={client['p50']}ms p99={client['p99']}ms max={client['max']}ms")
+        if client["p99"] > 50:
+            print("[LOADTEST] 경고: 부하 생성기 루프 지연이 큽니다 - concurrency를 낮추거나 프로세스를 나눠 실행하세요")
+
+
+async def run(args) -> Dict[str, Any]:
+    mix = QueryMix(Path(args.mix), args.seed, args.intents)
+    limits = httpx.Limits(max_connections=args.concurrency + 10, max_keepalive_connections=args.concurrency + 10)
+    timeout = httpx.Timeout(args.timeout, connect=10.0)
+    results: List[RequestResult] = []
+
+    async with httpx.AsyncClient(limits=limits, timeout=timeout) as client:
+        # 서버 루프 지연 샘플 초기화 (측정 구간만 집계)
+        await fetch_json(client, f"{args.url}/api/runtime/loop-lag?reset=true")
+
+        client_lag = ClientLoopLag()
+        client_lag.start()
+        started = time.perf_counter()
+
+        if args.rate:
+            await open_loop(client, args, mix, results)
+        else:
+            await closed_loop(client, args, mix, results)
+
+        elapsed = time.perf_counter() - started
+        client_lag.stop()
+
+        server_lag = await fetch_json(client, f"{args.url}/api/runtime/loop-lag")
+        llm_stats = await fetch_json(client, f"{args.url}/api/llm/stats")
+        admission_stats = await fetch_json(client, f"{args.url}/api/runtime/admission")
+
+    report = build_report(args, mix, results, elapsed, server_lag, client_lag.samples, llm_stats, admission_stats)
+    if args.raw:
+        report["raw"] = [asdict(r) for r in results]
+    return report
+
+
+# =====================================================================================
+# COMPARE
+# =====================================================================================
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> bool:
+    """두 결과 비교 출력 - threshold(%) 이상 느려진 항목이 있으면 False"""
+    rows = []
+    for metric in LATENCY_METRICS:
+        for key in ("p50", "p95", "p99"):
+            rows.append((f"{metric}.{key}", base["latency"][metric].get(key), new["latency"][metric].get(key), True))
+
+    base_lag = (base.get("loop_lag") or {}).get("server") or {}
+    new_lag = (new.get("loop_lag") or {}).get("server") or {}
+    rows.append(("server_lag.p99_ms", base_lag.get("p99_ms"), new_lag.get("p99_ms"), True))
+    rows.append(("error_rate", base["summary"]["error_rate"], new["summary"]["error_rate"], True))
+    rows.append(("throughput_rps", base["summary"]["throughput_rps"], new["summary"]["throughput_rps"], False))
+
+    print(f"base: {base['meta']['git']['commit']} ({base['meta']['timestamp']})  "
+          f"new: {new['meta']['git']['commit']} ({new['meta']['timestamp']})")
+    if base["meta"].get("mix") != new["meta"].get("mix") or base["meta"].get("concurrency") != new["meta"].get("concurrency"):
+        print("[LOADTEST] 경고: 질의 믹스 또는 동시성 설정이 다릅니다")
+    print()
+    print(f"{'metric':<24}{'base':>12}{'new':>12}{'delta':>10}")
+
+    passed = True
+    for name, old, current, lower_is_better in rows:
+        if old is None or current is None:
+            print(f"{name:<24}{'-':>12}{'-':>12}")
+            continue
+        delta = ((current - old) / old * 100) if old else (0.0 if current == old else math.inf)
+        regressed = delta > threshold if lower_is_better else delta < -threshold
+        # 오류율은 0 → 소량 증가처럼 기준값이 0인 경우 절대 변화로 판단
+        if name == "error_rate":
+            regressed = current - old > threshold / 1000
+        marker = "  REGRESSION" if regressed else ""
+        passed = passed and not regressed
+        print(f"{name:<24}{old:>12.2f}{current:>12.2f}{delta:>9.1f}%{marker}")
+
+    return passed
+
+
+# =====================================================================================
+# CLI
+# =====================================================================================
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Beaty /api/query SSE 부하 테스트")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="부하 테스트 실행")
+    run_parser.add_argument("--url", default="http://localhost:8000", help="beaty-service 주소")
+    run_parser.add_argument("--concurrency", type=int, default=20, help="동시 스트림 수 (개방형에서는 최대 동시 요청)")
+    run_parser.add_argument("--requests", type=int, default=200, help="총 요청 수 (--duration 미지정 시)")
+    run_parser.add_argument("--duration", type=float, default=None, help="실행 시간(초) - 지정 시 --requests 무시")
+    run_parser.add_argument("--rate", type=float, default=None, help="개방형 도착률 (req/s) - 미지정 시 폐쇄형")
+    run_parser.add_argument("--warmup", type=int, default=0, help="집계에서 제외할 앞쪽 요청 수")
+    run_parser.add_argument("--timeout", type=float, default=60.0, help="요청당 타임아웃(초)")
+    run_parser.add_argument("--mix", default=str(DEFAULT_MIX), help="질의 믹스 JSON")
+    run_parser.add_argument("--intents", nargs="*", default=None, help="특정 의도만 실행 (예: ROUTE GENERAL_CHAT)")
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--label", default=None, help="결과에 남길 설명")
+    run_parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    run_parser.add_argument("--raw", action="store_true", help="요청별 원본 측정값도 저장")
+
+    compare_parser = sub.add_parser("compare", help="두 결과 JSON 비교")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=10.0, help="회귀 판정 기준 (%%)")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.base, "r", encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.new, "r", encoding="utf-8") as f:
+            new = json.load(f)
+        return 0 if compare(base, new, args.threshold) else 1
+
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    if args.out:
+        out_path = Path(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n[LOADTEST] 결과 저장: {out_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Fixture Store - 녹화된 업스트림 응답 재생
+fixtures/<endpoint>.json:
+    {
+        "exact": {"<request_key>": <응답 JSON>},              # record 모드가 저장
+        "contains": [{"text": "경복궁", "response": <응답 JSON>}]  # 직접 작성 (부분 문자열 매칭)
+    }
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def _digest(*parts: Any) -> str:
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def last_user_message(body: Dict[str, Any]) -> str:
+    """chat 요청의 마지막 user 메시지"""
+    for message in reversed(body.get("messages", [])):
+        if message.get("role") == "user":
+            content = message.get("content")
+            if isinstance(content, list):
+                return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+            return content or ""
+    return ""
+
+
+def request_key(endpoint: str, payload: Dict[str, Any]) -> str:
+    """
+    픽스처 매칭 키 (API 키 / 타임스탬프 등 요청마다 바뀌는 값 제외)
+    사람이 직접 작성할 수 있도록 가능한 경우 원문 값을 그대로 사용
+    """
+    if endpoint == "openai_chat":
+        function_call = payload.get("function_call")
+        function_name = function_call.get("name") if isinstance(function_call, dict) else None
+        return _digest(payload.get("model"), function_name, last_user_message(payload))
+    if endpoint == "openai_embeddings":
+        return _digest(payload.get("model"), payload.get("input"))
+    if endpoint == "google_places":
+        return payload.get("textQuery", "")
+    if endpoint == "google_details":
+        return payload.get("place_id", "")
+    if endpoint == "google_geocode":
+        return payload.get("address", "")
+    if endpoint == "odsay_search":
+        return ",".join(str(payload.get(name, "")) for name in ("SX", "SY", "EX", "EY", "SearchType", "SearchPathType"))
+    if endpoint == "odsay_lane":
+        return payload.get("mapObject", "")
+    return _digest(payload)
+
+
+def match_text(endpoint: str, payload: Dict[str, Any]) -> str:
+    """contains 규칙에 사용할 텍스트"""
+    if endpoint == "openai_chat":
+        return last_user_message(payload)
+    if endpoint == "openai_embeddings":
+        text = payload.get("input", "")
+        return text if isinstance(text, str) else " ".join(map(str, text))
+    return request_key(endpoint, payload)
+
+
+class FixtureStore:
+    """엔드포인트별 픽스처 (메모리 로드 + record 시 파일 갱신)"""
+
+    def __init__(self, directory: Path = FIXTURE_DIR):
+        self.directory = directory
+        self.fixtures: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """디렉토리의 모든 픽스처 파일 로드"""
+        self.fixtures = {}
+        if not self.directory.exists():
+            return
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self.fixtures[path.stem] = {
+                    "exact": data.get("exact", {}),
+                    "contains": data.get("contains", []),
+                }
+            except Exception as e:
+                print(f"[FIXTURES] 로드 실패 ({path.name}): {e}")
+        total = sum(len(f["exact"]) + len(f["contains"]) for f in self.fixtures.values())
+        print(f"[FIXTURES] {len(self.fixtures)}개 파일, {total}개 픽스처 로드")
+
+    def find(self, endpoint: str, payload: Dict[str, Any]) -> Optional[Any]:
+        """exact 키 → contains 규칙 순으로 검색"""
+        fixture = self.fixtures.get(endpoint)
+        if not fixture:
+            return None
+
+        key = request_key(endpoint, payload)
+        if key in fixture["exact"]:
+            return fixture["exact"][key]
+
+        text = match_text(endpoint, payload)
+        for rule in fixture["contains"]:
+            if rule.get("text") and rule["text"] in text:
+                return rule.get("response")
+        return None
+
+    def record(self, endpoint: str, payload: Dict[str, Any], response: Any):
+        """실제 API 응답 저장 (exact)"""
+        key = request_key(endpoint, payload)
+        with self._lock:
+            fixture = self.fixtures.setdefault(endpoint, {"exact": {}, "contains": []})
+            fixture["exact"][key] = response
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{endpoint}.json"
+            tmp_path = path.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(fixture, f, ensure_ascii=False, indent=2)
+            tmp_path.replace(path)
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        return {
+            endpoint: {"exact": len(f["exact"]), "contains": len(f["contains"])}
+            for endpoint, f in self.fixtures.items()
+        }
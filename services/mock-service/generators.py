@@ -0,0 +1,367 @@
+"""
+Synthetic Generators - 픽스처가 없을 때 사용하는 합성 응답
+같은 요청이면 항상 같은 응답 (요청 내용 해시로 난수 시드 고정)
+"""
+
+import base64
+import hashlib
+import json
+import math
+import random
+import struct
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# 서울 대략 범위 (합성 좌표용)
+SEOUL_LAT = (37.48, 37.62)
+SEOUL_LNG = (126.88, 127.10)
+
+EMBEDDING_DIMENSIONS = {
+    "text-embedding-3-large": 3072,
+}
+DEFAULT_EMBEDDING_DIMENSION = 1536
+
+ANSWER_SENTENCES = [
+    "주인님, 찾아봤어요!",
+    "여기 괜찮은 곳들이 있어요.",
+    "지금 가기 딱 좋은 시간이에요.",
+    "천천히 둘러보시면 좋을 것 같아요.",
+    "혹시 더 궁금한 게 있으면 말씀해 주세요.",
+    "비티가 자신 있게 추천드려요!",
+    "날씨도 좋아서 산책하기 좋겠어요.",
+]
+
+SUBWAY_LINES = ["수도권 1호선", "수도권 2호선", "수도권 3호선", "수도권 4호선", "수도권 5호선", "수도권 9호선"]
+PLACE_TYPES = ["tourist_attraction", "cafe", "restaurant", "museum", "park", "store"]
+
+
+def seeded_rng(*parts: Any) -> random.Random:
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return random.Random(int(hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16], 16))
+
+
+def estimate_tokens(text: str) -> int:
+    """한국어 기준 2자 ≈ 1토큰"""
+    return max(1, math.ceil(len(text) / 2))
+
+
+def split_tokens(text: str) -> List[str]:
+    """스트리밍용 토큰 분할 (2자 단위)"""
+    return [text[i:i + 2] for i in range(0, len(text), 2)] or [""]
+
+
+# =====================================================================================
+# OPENAI
+# =====================================================================================
+
+def _from_schema(schema: Dict[str, Any], rng: random.Random, text: str, depth: int = 0) -> Any:
+    """JSON Schema를 만족하는 임의 값 (function_call arguments 합성)"""
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+
+    schema_type = schema.get("type", "string")
+    if isinstance(schema_type, list):
+        non_null = [t for t in schema_type if t != "null"]
+        schema_type = non_null[0] if non_null else "null"
+
+    if schema_type == "object":
+        properties = schema.get("properties", {})
+        required = set(schema.get("required", []))
+        return {
+            name: _from_schema(prop, rng, text, depth + 1)
+            for name, prop in properties.items()
+            if name in required or (depth < 2 and rng.random() < 0.5)
+        }
+    if schema_type == "array":
+        items = schema.get("items", {})
+        return [_from_schema(items, rng, text, depth + 1) for _ in range(rng.randint(1, 2))]
+    if schema_type == "integer":
+        return rng.randint(schema.get("minimum", 1), schema.get("maximum", 5))
+    if schema_type == "number":
+        return round(rng.uniform(schema.get("minimum", 0.0), schema.get("maximum", 1.0)), 2)
+    if schema_type == "boolean":
+        return rng.random() < 0.5
+    if schema_type == "null":
+        return None
+    words = text.split()
+    return " ".join(words[:3]) if words else "서울"
+
+
+def chat_message(body: Dict[str, Any], user_text: str) -> Dict[str, Any]:
+    """assistant 메시지 합성 (function_call 요청이면 arguments, 아니면 텍스트)"""
+    rng = seeded_rng(body.get("model"), user_text)
+
+    function_call = body.get("function_call")
+    functions = body.get("functions") or []
+    if functions and function_call != "none":
+        name = function_call.get("name") if isinstance(function_call, dict) else functions[0]["name"]
+        function = next((f for f in functions if f.get("name") == name), functions[0])
+        arguments = _from_schema(function.get("parameters", {}), rng, user_text)
+        return {
+            "role": "assistant",
+            "content": None,
+            "function_call": {"name": function["name"], "arguments": json.dumps(arguments, ensure_ascii=False)},
+        }
+
+    max_chars = (body.get("max_tokens") or 150) * 2
+    sentences = rng.sample(ANSWER_SENTENCES, rng.randint(2, 4))
+    content = " ".join(sentences)[:max_chars]
+    return {"role": "assistant", "content": content}
+
+
+def message_text(message: Dict[str, Any]) -> str:
+    """완료 토큰 수 계산용 메시지 텍스트"""
+    if message.get("function_call"):
+        return message["function_call"].get("arguments", "")
+    return message.get("content") or ""
+
+
+def chat_completion(body: Dict[str, Any], message: Dict[str, Any], prompt_tokens: int) -> Dict[str, Any]:
+    completion_tokens = estimate_tokens(message_text(message))
+    return {
+        "id": f"chatcmpl-mock{seeded_rng(body.get('model'), message).randint(0, 10 ** 12):012d}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "gpt-4o-mini"),
+        "choices": [{
+            "index": 0,
+            "message": message,
+            "finish_reason": "function_call" if message.get("function_call") else "stop",
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        },
+    }
+
+
+def chat_chunk(completion_id: str, model: str, delta: Dict[str, Any], finish_reason: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+
+
+def embedding_vector(model: str, text: str, dimensions: Optional[int] = None) -> List[float]:
+    """텍스트 해시로 만든 단위 벡터 (같은 텍스트 → 같은 벡터)"""
+    size = dimensions or EMBEDDING_DIMENSIONS.get(model, DEFAULT_EMBEDDING_DIMENSION)
+    rng = seeded_rng(model, text)
+    vector = [rng.gauss(0.0, 1.0) for _ in range(size)]
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def embeddings_response(body: Dict[str, Any]) -> Dict[str, Any]:
+    """embeddings 응답 (encoding_format=base64 지원 - openai SDK 기본값)"""
+    model = body.get("model", "text-embedding-3-small")
+    inputs = body.get("input", "")
+    if isinstance(inputs, str):
+        inputs = [inputs]
+
+    data = []
+    for index, text in enumerate(inputs):
+        vector = embedding_vector(model, str(text), body.get("dimensions"))
+        if body.get("encoding_format") == "base64":
+            embedding: Any = base64.b64encode(struct.pack(f"<{len(vector)}f", *vector)).decode("ascii")
+        else:
+            embedding = vector
+        data.append({"object": "embedding", "index": index, "embedding": embedding})
+
+    prompt_tokens = sum(estimate_tokens(str(text)) for text in inputs)
+    return {
+        "object": "list",
+        "data": data,
+        "model": model,
+        "usage": {"prompt_tokens": prompt_tokens, "total_tokens": prompt_tokens},
+    }
+
+
+# =====================================================================================
+# GOOGLE
+# =====================================================================================
+
+class PlaceRegistry:
+    """합성한 장소 보관 (searchText 결과를 places/{id} 상세 조회에서 그대로 반환)"""
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max_size
+        self._places: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def put(self, place: Dict[str, Any]):
+        self._places[place["id"]] = place
+        self._places.move_to_end(place["id"])
+        while len(self._places) > self.max_size:
+            self._places.popitem(last=False)
+
+    def get(self, place_id: str) -> Optional[Dict[str, Any]]:
+        return self._places.get(place_id)
+
+
+place_registry = PlaceRegistry()
+
+
+def _synthetic_place(place_id: str, name: str, lat: float, lng: float, rng: random.Random) -> Dict[str, Any]:
+    place_type = rng.choice(PLACE_TYPES)
+    return {
+        "id": place_id,
+        "displayName": {"text": name, "languageCode": "ko"},
+        "formattedAddress": f"대한민국 서울특별시 중구 목업로 {rng.randint(1, 300)}",
+        "location": {"latitude": round(lat, 7), "longitude": round(lng, 7)},
+        "types": [place_type, "point_of_interest", "establishment"],
+        "primaryType": place_type,
+        "rating": round(rng.uniform(3.5, 5.0), 1),
+        "userRatingCount": rng.randint(10, 5000),
+        "priceLevel": rng.choice(["PRICE_LEVEL_INEXPENSIVE", "PRICE_LEVEL_MODERATE", "PRICE_LEVEL_EXPENSIVE"]),
+        "currentOpeningHours": {"openNow": rng.random() < 0.8},
+        "editorialSummary": {"text": f"{name}은(는) 분위기 좋은 곳이에요.", "languageCode": "ko"},
+        "goodForChildren": rng.random() < 0.5,
+        "parkingOptions": {"paidParkingLot": rng.random() < 0.5},
+        "accessibilityOptions": {"wheelchairAccessibleEntrance": rng.random() < 0.5},
+    }
+
+
+def places_search(body: Dict[str, Any]) -> Dict[str, Any]:
+    """places:searchText 응답 - locationBias 중심 주변에 장소 합성"""
+    query = body.get("textQuery", "")
+    rng = seeded_rng("places", query)
+
+    center = body.get("locationBias", {}).get("circle", {}).get("center", {})
+    center_lat = center.get("latitude", 37.5665)
+    center_lng = center.get("longitude", 126.9780)
+
+    count = min(body.get("maxResultCount", 20), rng.randint(3, 10))
+    places = []
+    for index in range(count):
+        place_id = f"mock_{hashlib.sha1(query.encode('utf-8')).hexdigest()[:10]}_{index}"
+        place = _synthetic_place(
+            place_id,
+            f"{query} {index + 1}호점",
+            center_lat + rng.uniform(-0.01, 0.01),
+            center_lng + rng.uniform(-0.01, 0.01),
+            rng
+        )
+        place_registry.put(place)
+        places.append(place)
+    return {"places": places}
+
+
+def place_details(place_id: str) -> Dict[str, Any]:
+    """places/{id} 응답 (searchText에서 만든 장소가 있으면 그대로)"""
+    place = place_registry.get(place_id)
+    if place:
+        return place
+    rng = seeded_rng("details", place_id)
+    return _synthetic_place(
+        place_id,
+        f"장소 {place_id[-6:]}",
+        rng.uniform(*SEOUL_LAT),
+        rng.uniform(*SEOUL_LNG),
+        rng
+    )
+
+
+def geocode(address: str) -> Dict[str, Any]:
+    """Geocoding 응답 - 주소 해시로 서울 안 좌표 합성"""
+    if not address.strip():
+        return {"status": "ZERO_RESULTS", "results": []}
+    rng = seeded_rng("geocode", address)
+    return {
+        "status": "OK",
+        "results": [{
+            "formatted_address": f"대한민국 서울특별시 {address}",
+            "geometry": {
+                "location": {"lat": round(rng.uniform(*SEOUL_LAT), 7), "lng": round(rng.uniform(*SEOUL_LNG), 7)},
+                "location_type": "APPROXIMATE",
+            },
+            "place_id": f"mock_geo_{hashlib.sha1(address.encode('utf-8')).hexdigest()[:12]}",
+            "types": ["point_of_interest"],
+        }],
+    }
+
+
+# =====================================================================================
+# ODSAY
+# =====================================================================================
+
+def _interpolate(start: List[float], end: List[float], steps: int) -> List[List[float]]:
+    return [
+        [start[0] + (end[0] - start[0]) * i / steps, start[1] + (end[1] - start[1]) * i / steps]
+        for i in range(steps + 1)
+    ]
+
+
+def search_pub_trans_path(params: Dict[str, Any]) -> Dict[str, Any]:
+    """searchPubTransPath 응답 - 도보 → 지하철/버스 → 도보 경로 1~3개"""
+    try:
+        sx, sy, ex, ey = (float(params[name]) for name in ("SX", "SY", "EX", "EY"))
+    except (KeyError, ValueError):
+        return {"error": {"code": "-98", "message": "좌표 오류"}}
+
+    rng = seeded_rng("odsay", sx, sy, ex, ey, params.get("SearchType"), params.get("SearchPathType"))
+    distance_m = int(math.hypot((ex - sx) * 88000, (ey - sy) * 111000))
+    if distance_m < 700:
+        return {"error": [{"code": "-98", "message": "출, 도착지가 700m이내입니다."}]}
+
+    search_path_type = int(params.get("SearchPathType", 0) or 0)
+    paths = []
+    for index in range(rng.randint(1, 3)):
+        traffic_type = {1: 1, 2: 2}.get(search_path_type, rng.choice([1, 2]))
+        board = [sx + (ex - sx) * 0.1, sy + (ey - sy) * 0.1]
+        alight = [sx + (ex - sx) * 0.9, sy + (ey - sy) * 0.9]
+        stations = [
+            {"index": i, "stationName": f"정류장{i + 1}", "x": str(round(x, 6)), "y": str(round(y, 6))}
+            for i, (x, y) in enumerate(_interpolate(board, alight, rng.randint(3, 8)))
+        ]
+        map_obj = f"{rng.randint(1000, 9999)}:2:{rng.randint(1, 50)}:{rng.randint(51, 99)}"
+        if traffic_type == 1:
+            lane = [{"name": rng.choice(SUBWAY_LINES), "subwayCode": rng.randint(1, 9), "mapObj": map_obj}]
+        else:
+            lane = [{"busNo": str(rng.randint(100, 7999)), "type": rng.randint(1, 4), "mapObj": map_obj}]
+
+        ride_time = max(3, int(distance_m * 0.8 / 500))
+        walk_start = int(distance_m * 0.1)
+        walk_end = int(distance_m * 0.1)
+        total_time = ride_time + (walk_start + walk_end) // 70 + rng.randint(0, 8)
+
+        paths.append({
+            "pathType": traffic_type,
+            "info": {
+                "totalTime": total_time,
+                "payment": 1400 + 100 * index,
+                "busTransitCount": 1 if traffic_type == 2 else 0,
+                "subwayTransitCount": 1 if traffic_type == 1 else 0,
+                "totalWalk": walk_start + walk_end,
+                "trafficDistance": int(distance_m * 0.8),
+                "totalDistance": distance_m,
+                "firstStartStation": stations[0]["stationName"],
+                "lastEndStation": stations[-1]["stationName"],
+                "mapObj": map_obj,
+            },
+            "subPath": [
+                {"trafficType": 3, "distance": walk_start, "sectionTime": walk_start // 70,
+                 "startX": sx, "startY": sy, "endX": board[0], "endY": board[1]},
+                {"trafficType": traffic_type, "distance": int(distance_m * 0.8), "sectionTime": ride_time,
+                 "stationCount": len(stations) - 1, "lane": lane,
+                 "startName": stations[0]["stationName"], "endName": stations[-1]["stationName"],
+                 "startX": board[0], "startY": board[1], "endX": alight[0], "endY": alight[1],
+                 "passStopList": {"stations": stations}},
+                {"trafficType": 3, "distance": walk_end, "sectionTime": walk_end // 70,
+                 "startX": alight[0], "startY": alight[1], "endX": ex, "endY": ey},
+            ],
+        })
+
+    return {"result": {"searchType": 0, "pathType": search_path_type, "path": paths}}
+
+
+def load_lane(map_object: str) -> Dict[str, Any]:
+    """loadLane 응답 - mapObject 해시로 만든 꺾은선"""
+    rng = seeded_rng("lane", map_object)
+    start = [rng.uniform(*SEOUL_LNG), rng.uniform(*SEOUL_LAT)]
+    end = [start[0] + rng.uniform(-0.05, 0.05), start[1] + rng.uniform(-0.05, 0.05)]
+    graph_pos = [{"x": x, "y": y} for x, y in _interpolate(start, end, rng.randint(10, 40))]
+    return {"result": {"lane": [{"class": rng.choice([1, 2]), "type": 2, "section": [{"graphPos": graph_pos}], "graphPos": graph_pos}]}}
@@ -0,0 +1,450 @@
+"""
+Mock Service - OpenAI / Google / ODSay 대체 서버 (부하 테스트용)
+실제 API 쿼터를 쓰지 않고 /api/query 전체 경로를 재현 가능한 지연·오류 조건에서 실행
+
+각 서비스는 환경변수로 이 서버를 가리킴:
+    OPENAI_BASE_URL=http://localhost:8090/openai/v1
+    GOOGLE_PLACES_BASE_URL=http://localhost:8090/google/places/v1
+    GOOGLE_GEOCODE_URL=http://localhost:8090/google/maps/api/geocode/json
+    ODSAY_BASE_URL=http://localhost:8090/odsay/v1/api
+"""
+
+import asyncio
+import json
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+
+import generators
+from fixtures import FixtureStore, last_user_message
+from mock_profile import ENDPOINTS, MockBehavior
+
+PORT = 8090
+
+# record 모드에서 호출할 실제 업스트림
+REAL_UPSTREAMS = {
+    "openai_chat": "https://api.openai.com/v1/chat/completions",
+    "openai_embeddings": "https://api.openai.com/v1/embeddings",
+    "google_places": "https://places.googleapis.com/v1/places:searchText",
+    "google_details": "https://places.googleapis.com/v1/places",
+    "google_geocode": "https://maps.googleapis.com/maps/api/geocode/json",
+    "odsay_search": "https://api.odsay.com/v1/api/searchPubTransPath",
+    "odsay_lane": "https://api.odsay.com/v1/api/loadLane",
+}
+
+# record 모드에서 그대로 전달할 요청 헤더
+FORWARD_HEADERS = ("authorization", "x-goog-api-key", "x-goog-fieldmask", "content-type")
+
+
+# FastAPI App
+app = FastAPI(
+    title="Mock Service",
+    description="OpenAI / Google / ODSay 대체 서버 (지연·오류 주입, 픽스처 재생)",
+    version="1.0.0"
+)
+
+# CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+behavior = MockBehavior.from_env()
+fixture_store = FixtureStore()
+record_client: Optional[httpx.AsyncClient] = None
+
+# 엔드포인트별 통계
+stats: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+
+@app.on_event("startup")
+async def startup_event():
+    global record_client
+    record_client = httpx.AsyncClient(timeout=60.0)
+    print(f"[MOCK] 모드: {behavior.mode}, 시드: {behavior.profile['seed']}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 클라이언트 정리"""
+    if record_client:
+        await record_client.aclose()
+
+
+# =====================================================================================
+# COMMON
+# =====================================================================================
+
+def error_response(endpoint: str, kind: str, retry_after: float = 1.0) -> JSONResponse:
+    """업스트림별 오류 형식"""
+    status = 429 if kind == "429" else 504 if kind == "timeout" else 500
+
+    if endpoint.startswith("openai"):
+        error_type = {429: "rate_limit_exceeded", 504: "timeout"}.get(status, "server_error")
+        body = {"error": {"message": f"Mock injected {kind}", "type": error_type, "code": error_type}}
+        headers = {"retry-after": f"{retry_after:.3f}"} if status == 429 else {}
+        if status == 429:
+            headers.update(behavior.openai_headers())
+        return JSONResponse(body, status_code=status, headers=headers)
+
+    if endpoint == "google_geocode" and status == 429:
+        # Geocoding API는 한도 초과도 200 + status로 응답
+        return JSONResponse({"status": "OVER_QUERY_LIMIT", "results": [], "error_message": "Mock injected 429"})
+
+    if endpoint.startswith("odsay") and status == 429:
+        return JSONResponse({"error": [{"code": "-8", "message": "Mock injected 429"}]})
+
+    google_status = {429: "RESOURCE_EXHAUSTED", 504: "DEADLINE_EXCEEDED"}.get(status, "INTERNAL")
+    return JSONResponse(
+        {"error": {"code": status, "message": f"Mock injected {kind}", "status": google_status}},
+        status_code=status
+    )
+
+
+async def inject(endpoint: str, streaming: bool = False) -> Optional[str]:
+    """
+    요청 공통 처리 - 지연 적용 + 오류 결정
+
+    Returns:
+        주입할 오류 종류 (없으면 None). streaming이 아니면 stream_abort는 무시
+    """
+    stats[endpoint]["requests"] += 1
+    kind = behavior.sample_error(endpoint)
+    if kind == "stream_abort" and not streaming:
+        kind = None
+
+    if kind == "timeout":
+        await asyncio.sleep(behavior.profile["timeout_hang_seconds"])
+    else:
+        delay = behavior.sample_latency(endpoint)
+        stats[endpoint]["latency_seconds"] += delay
+        await asyncio.sleep(delay)
+
+    if kind:
+        stats[endpoint][f"error_{kind}"] += 1
+    return kind
+
+
+async def record_upstream(endpoint: str, method: str, request: Request, url: str, payload: Dict[str, Any], **kwargs) -> Optional[Any]:
+    """record 모드 - 실제 API 호출 후 픽스처 저장 (실패 시 None → 합성 응답)"""
+    headers = {name: value for name, value in request.headers.items() if name.lower() in FORWARD_HEADERS}
+    try:
+        response = await record_client.request(method, url, headers=headers, **kwargs)
+        response.raise_for_status()
+        data = response.json()
+        fixture_store.record(endpoint, payload, data)
+        stats[endpoint]["recorded"] += 1
+        return data
+    except Exception as e:
+        print(f"[MOCK] {endpoint} 녹화 실패: {e}")
+        return None
+
+
+async def resolve(endpoint: str, payload: Dict[str, Any], synthesize, record=None) -> Any:
+    """모드에 따라 픽스처 / 녹화 / 합성 응답 선택"""
+    mode = behavior.mode
+    if mode != "synthetic":
+        fixture = fixture_store.find(endpoint, payload)
+        if fixture is not None:
+            stats[endpoint]["fixture_hits"] += 1
+            return fixture
+    if mode == "record" and record is not None:
+        recorded = await record()
+        if recorded is not None:
+            return recorded
+    stats[endpoint]["synthetic"] += 1
+    return synthesize()
+
+
+# =====================================================================================
+# OPENAI
+# =====================================================================================
+
+@app.post("/openai/v1/chat/completions")
+async def openai_chat(request: Request):
+    """chat.completions (function_call / stream 지원)"""
+    body = await request.json()
+    endpoint = "openai_chat"
+    streaming = bool(body.get("stream"))
+
+    user_text = last_user_message(body)
+    prompt_text = " ".join(str(message.get("content") or "") for message in body.get("messages", []))
+    prompt_tokens = generators.estimate_tokens(prompt_text) + generators.estimate_tokens(json.dumps(body.get("functions") or []))
+
+    if not behavior.consume_openai(prompt_tokens + (body.get("max_tokens") or 300)):
+        stats[endpoint]["requests"] += 1
+        stats[endpoint]["error_rate_limit"] += 1
+        return error_response(endpoint, "429", behavior.request_window.reset_in())
+
+    kind = await inject(endpoint, streaming)
+    if kind and kind != "stream_abort":
+        return error_response(endpoint, kind)
+
+    async def record():
+        upstream_body = {k: v for k, v in body.items() if k not in ("stream", "stream_options")}
+        return await record_upstream(endpoint, "POST", request, REAL_UPSTREAMS[endpoint], body, json=upstream_body)
+
+    completion = await resolve(
+        endpoint,
+        body,
+        lambda: generators.chat_completion(body, generators.chat_message(body, user_text), prompt_tokens),
+        record
+    )
+    headers = behavior.openai_headers()
+
+    if not streaming:
+        return JSONResponse(completion, headers=headers)
+
+    return StreamingResponse(
+        stream_completion(body, completion, abort=(kind == "stream_abort")),
+        media_type="text/event-stream",
+        headers=headers
+    )
+
+
+async def stream_completion(body: Dict[str, Any], completion: Dict[str, Any], abort: bool = False):
+    """완성 응답을 토큰 속도에 맞춰 SSE chunk로 분할 (abort면 중간에 연결 종료)"""
+    model = completion.get("model", body.get("model", "gpt-4o-mini"))
+    completion_id = completion.get("id", f"chatcmpl-{uuid.uuid4().hex[:12]}")
+    message = completion["choices"][0]["message"]
+    interval = 1.0 / max(behavior.profile["openai"]["tokens_per_second"], 1e-3)
+
+    def sse(data: Dict[str, Any]) -> str:
+        return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    function_call = message.get("function_call")
+    if function_call:
+        yield sse(generators.chat_chunk(completion_id, model, {"role": "assistant", "function_call": {"name": function_call["name"], "arguments": ""}}))
+        pieces = generators.split_tokens(function_call.get("arguments", ""))
+        make_delta = lambda piece: {"function_call": {"arguments": piece}}
+        finish_reason = "function_call"
+    else:
+        yield sse(generators.chat_chunk(completion_id, model, {"role": "assistant", "content": ""}))
+        pieces = generators.split_tokens(message.get("content") or "")
+        make_delta = lambda piece: {"content": piece}
+        finish_reason = "stop"
+
+    abort_at = len(pieces) // 2 if abort else None
+    for index, piece in enumerate(pieces):
+        if index == abort_at:
+            # 스트림 중간 끊김 재현
+            return
+        await asyncio.sleep(interval)
+        yield sse(generators.chat_chunk(completion_id, model, make_delta(piece)))
+
+    yield sse(generators.chat_chunk(completion_id, model, {}, finish_reason))
+
+    if (body.get("stream_options") or {}).get("include_usage"):
+        usage_chunk = generators.chat_chunk(completion_id, model, {})
+        usage_chunk["choices"] = []
+        usage_chunk["usage"] = completion.get("usage")
+        yield sse(usage_chunk)
+
+    yield "data: [DONE]\n\n"
+
+
+@app.post("/openai/v1/embeddings")
+async def openai_embeddings(request: Request):
+    """embeddings (encoding_format=float/base64)"""
+    body = await request.json()
+    endpoint = "openai_embeddings"
+
+    inputs = body.get("input", "")
+    tokens = generators.estimate_tokens(inputs if isinstance(inputs, str) else " ".join(map(str, inputs)))
+    if not behavior.consume_openai(tokens):
+        stats[endpoint]["requests"] += 1
+        stats[endpoint]["error_rate_limit"] += 1
+        return error_response(endpoint, "429", behavior.request_window.reset_in())
+
+    kind = await inject(endpoint)
+    if kind:
+        return error_response(endpoint, kind)
+
+    async def record():
+        return await record_upstream(endpoint, "POST", request, REAL_UPSTREAMS[endpoint], body, json=body)
+
+    result = await resolve(endpoint, body, lambda: generators.embeddings_response(body), record)
+    return JSONResponse(result, headers=behavior.openai_headers())
+
+
+# =====================================================================================
+# GOOGLE
+# =====================================================================================
+
+@app.post("/google/places/v1/places:searchText")
+async def google_places_search(request: Request):
+    """Places API (New) Text Search"""
+    body = await request.json()
+    endpoint = "google_places"
+
+    kind = await inject(endpoint)
+    if kind:
+        return error_response(endpoint, kind)
+
+    async def record():
+        return await record_upstream(endpoint, "POST", request, REAL_UPSTREAMS[endpoint], body, json=body)
+
+    return await resolve(endpoint, body, lambda: generators.places_search(body), record)
+
+
+@app.get("/google/places/v1/places/{place_id}")
+async def google_place_details(place_id: str, request: Request):
+    """Places API (New) Place Details"""
+    endpoint = "google_details"
+    payload = {"place_id": place_id}
+
+    kind = await inject(endpoint)
+    if kind:
+        return error_response(endpoint, kind)
+
+    async def record():
+        return await record_upstream(
+            endpoint, "GET", request, f"{REAL_UPSTREAMS[endpoint]}/{place_id}", payload,
+            params=dict(request.query_params)
+        )
+
+    return await resolve(endpoint, payload, lambda: generators.place_details(place_id), record)
+
+
+@app.get("/google/maps/api/geocode/json")
+async def google_geocode(request: Request):
+    """Geocoding API"""
+    endpoint = "google_geocode"
+    params = dict(request.query_params)
+    payload = {"address": params.get("address", "")}
+
+    kind = await inject(endpoint)
+    if kind:
+        return error_response(endpoint, kind)
+
+    async def record():
+        return await record_upstream(endpoint, "GET", request, REAL_UPSTREAMS[endpoint], payload, params=params)
+
+    return await resolve(endpoint, payload, lambda: generators.geocode(payload["address"]), record)
+
+
+# =====================================================================================
+# ODSAY
+# =====================================================================================
+
+@app.get("/odsay/v1/api/searchPubTransPath")
+async def odsay_search(request: Request):
+    """대중교통 경로 검색"""
+    endpoint = "odsay_search"
+    params = dict(request.query_params)
+    payload = {name: value for name, value in params.items() if name != "apiKey"}
+
+    kind = await inject(endpoint)
+    if kind:
+        return error_response(endpoint, kind)
+
+    async def record():
+        return await record_upstream(endpoint, "GET", request, REAL_UPSTREAMS[endpoint], payload, params=params)
+
+    return await resolve(endpoint, payload, lambda: generators.search_pub_trans_path(payload), record)
+
+
+@app.get("/odsay/v1/api/loadLane")
+async def odsay_load_lane(request: Request):
+    """노선 그래픽 데이터"""
+    endpoint = "odsay_lane"
+    params = dict(request.query_params)
+    payload = {"mapObject": params.get("mapObject", "")}
+
+    kind = await inject(endpoint)
+    if kind:
+        return error_response(endpoint, kind)
+
+    async def record():
+        return await record_upstream(endpoint, "GET", request, REAL_UPSTREAMS[endpoint], payload, params=params)
+
+    return await resolve(endpoint, payload, lambda: generators.load_lane(payload["mapObject"]), record)
+
+
+# =====================================================================================
+# CONTROL
+# =====================================================================================
+
+@app.get("/_mock/profile")
+async def get_profile():
+    """현재 프로필"""
+    return behavior.profile
+
+
+@app.put("/_mock/profile")
+async def update_profile(request: Request):
+    """프로필 부분 변경 (예: {"endpoints": {"openai_chat": {"errors": {"429": 0.1}}}})"""
+    override = await request.json()
+    unknown = set(override.get("endpoints", {})) - set(ENDPOINTS)
+    if unknown:
+        return JSONResponse({"error": f"알 수 없는 엔드포인트: {sorted(unknown)}"}, status_code=400)
+    behavior.update(override)
+    return behavior.profile
+
+
+@app.post("/_mock/reset")
+async def reset():
+    """난수 / 레이트리밋 / 통계 초기화 (같은 시드로 재현 실행)"""
+    behavior.reset()
+    stats.clear()
+    return {"success": True, "seed": behavior.profile["seed"]}
+
+
+@app.post("/_mock/fixtures/reload")
+async def reload_fixtures():
+    """픽스처 파일 다시 로드"""
+    fixture_store.load()
+    return {"success": True, "fixtures": fixture_store.summary()}
+
+
+@app.get("/_mock/stats")
+async def get_stats():
+    """엔드포인트별 요청 / 픽스처 적중 / 합성 / 오류 수"""
+    return {
+        "mode": behavior.mode,
+        "endpoints": {
+            endpoint: {name: round(value, 3) for name, value in values.items()}
+            for endpoint, values in stats.items()
+        },
+        "fixtures": fixture_store.summary(),
+    }
+
+
+@app.get("/health")
+async def health_check():
+    """헬스 체크"""
+    return {"status": "healthy", "service": "mock-service", "mode": behavior.mode}
+
+
+@app.get("/")
+async def root():
+    """루트 엔드포인트"""
+    return {
+        "service": "Mock Service",
+        "version": "1.0.0",
+        "endpoints": {
+            "openai_chat": "POST /openai/v1/chat/completions",
+            "openai_embeddings": "POST /openai/v1/embeddings",
+            "google_places": "POST /google/places/v1/places:searchText",
+            "google_details": "GET /google/places/v1/places/{place_id}",
+            "google_geocode": "GET /google/maps/api/geocode/json",
+            "odsay_search": "GET /odsay/v1/api/searchPubTransPath",
+            "odsay_lane": "GET /odsay/v1/api/loadLane",
+            "profile": "GET|PUT /_mock/profile",
+            "reset": "POST /_mock/reset",
+            "stats": "GET /_mock/stats",
+        }
+    }
+
+
+if __name__ == "__main__":
+    uvicorn.run(app, host="0.0.0.0", port=PORT)
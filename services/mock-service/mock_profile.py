@@ -0,0 +1,202 @@
+"""
+Mock Profile - 지연 분포 / 토큰 속도 / 오류 주입 / 레이트리밋 설정
+MOCK_PROFILE(JSON 파일 경로)로 시작 시 로드, PUT /_mock/profile 로 실행 중 변경
+"""
+
+import copy
+import json
+import math
+import os
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# 업스트림 엔드포인트 이름 (프로필 / 통계 / 픽스처 파일 이름에 공통 사용)
+ENDPOINTS = (
+    "openai_chat",
+    "openai_embeddings",
+    "google_places",
+    "google_details",
+    "google_geocode",
+    "odsay_search",
+    "odsay_lane",
+)
+
+# 정규분포 99 백분위 z값 (lognormal p99 → sigma 변환용)
+Z_99 = 2.326
+
+DEFAULT_PROFILE: Dict[str, Any] = {
+    "seed": 42,
+    # replay: 픽스처 우선 + 없으면 합성 / synthetic: 항상 합성 / record: 실제 API 호출 후 픽스처 저장
+    "mode": "replay",
+    # 오류 주입 시 "timeout"이 응답을 붙잡아 두는 시간(초)
+    "timeout_hang_seconds": 30.0,
+    "endpoints": {
+        "openai_chat": {
+            "latency": {"distribution": "lognormal", "median_ms": 450, "p99_ms": 2500},
+            "errors": {"429": 0.0, "500": 0.0, "timeout": 0.0, "stream_abort": 0.0},
+        },
+        "openai_embeddings": {
+            "latency": {"distribution": "lognormal", "median_ms": 120, "p99_ms": 600},
+            "errors": {"429": 0.0, "500": 0.0, "timeout": 0.0},
+        },
+        "google_places": {
+            "latency": {"distribution": "lognormal", "median_ms": 250, "p99_ms": 1200},
+            "errors": {"429": 0.0, "500": 0.0, "timeout": 0.0},
+        },
+        "google_details": {
+            "latency": {"distribution": "lognormal", "median_ms": 150, "p99_ms": 800},
+            "errors": {"429": 0.0, "500": 0.0, "timeout": 0.0},
+        },
+        "google_geocode": {
+            "latency": {"distribution": "lognormal", "median_ms": 100, "p99_ms": 500},
+            "errors": {"429": 0.0, "500": 0.0, "timeout": 0.0},
+        },
+        "odsay_search": {
+            "latency": {"distribution": "lognormal", "median_ms": 300, "p99_ms": 1500},
+            "errors": {"429": 0.0, "500": 0.0, "timeout": 0.0},
+        },
+        "odsay_lane": {
+            "latency": {"distribution": "lognormal", "median_ms": 120, "p99_ms": 600},
+            "errors": {"429": 0.0, "500": 0.0, "timeout": 0.0},
+        },
+    },
+    "openai": {
+        # 스트리밍 토큰 출력 속도 (첫 토큰까지는 openai_chat.latency)
+        "tokens_per_second": 60.0,
+        # x-ratelimit-* 헤더용 분당 한도 (enforce=True면 초과 시 429)
+        "requests_per_minute": 5000,
+        "tokens_per_minute": 2000000,
+        "enforce_rate_limit": False,
+    },
+}
+
+
+def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """중첩 dict 병합 (override 우선)"""
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+class MinuteWindow:
+    """분 단위 고정 윈도우 사용량 (x-ratelimit-* 헤더 시뮬레이션)"""
+
+    def __init__(self):
+        self.window_start = time.monotonic()
+        self.used = 0.0
+
+    def _roll(self):
+        now = time.monotonic()
+        if now - self.window_start >= 60.0:
+            self.window_start = now
+            self.used = 0.0
+
+    def consume(self, amount: float, limit: float) -> bool:
+        """한도 안이면 소비 후 True"""
+        self._roll()
+        if self.used + amount > limit:
+            return False
+        self.used += amount
+        return True
+
+    def remaining(self, limit: float) -> int:
+        self._roll()
+        return max(0, int(limit - self.used))
+
+    def reset_in(self) -> float:
+        return max(0.0, 60.0 - (time.monotonic() - self.window_start))
+
+
+class MockBehavior:
+    """프로필 기반 지연 / 오류 / 레이트리밋 결정 (시드 고정 난수)"""
+
+    def __init__(self, profile: Optional[Dict[str, Any]] = None):
+        self.profile = deep_merge(DEFAULT_PROFILE, profile or {})
+        self.rng = random.Random(self.profile["seed"])
+        self.request_window = MinuteWindow()
+        self.token_window = MinuteWindow()
+
+    @classmethod
+    def from_env(cls) -> "MockBehavior":
+        """MOCK_PROFILE 환경변수의 JSON 파일로 생성 (없으면 기본 프로필)"""
+        path = os.getenv("MOCK_PROFILE")
+        if not path:
+            return cls()
+        with open(Path(path), "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def update(self, override: Dict[str, Any]):
+        """프로필 부분 변경 (seed가 바뀌면 난수 재설정)"""
+        self.profile = deep_merge(self.profile, override)
+        if "seed" in override:
+            self.rng = random.Random(self.profile["seed"])
+
+    def reset(self):
+        """난수 / 레이트리밋 윈도우 초기화 (같은 시드로 재현)"""
+        self.rng = random.Random(self.profile["seed"])
+        self.request_window = MinuteWindow()
+        self.token_window = MinuteWindow()
+
+    @property
+    def mode(self) -> str:
+        return self.profile.get("mode", "replay")
+
+    def _endpoint(self, endpoint: str) -> Dict[str, Any]:
+        return self.profile["endpoints"].get(endpoint, {})
+
+    def sample_latency(self, endpoint: str) -> float:
+        """지연 시간 샘플(초)"""
+        latency = self._endpoint(endpoint).get("latency", {})
+        distribution = latency.get("distribution", "fixed")
+
+        if distribution == "uniform":
+            ms = self.rng.uniform(latency.get("min_ms", 0), latency.get("max_ms", 0))
+        elif distribution == "lognormal":
+            median = max(latency.get("median_ms", 1), 1e-3)
+            p99 = max(latency.get("p99_ms", median), median)
+            sigma = math.log(p99 / median) / Z_99
+            ms = self.rng.lognormvariate(math.log(median), sigma)
+        else:
+            ms = latency.get("ms", 0)
+
+        return max(ms, 0.0) / 1000.0
+
+    def sample_error(self, endpoint: str) -> Optional[str]:
+        """주입할 오류 ("429" / "500" / "timeout" / "stream_abort") 또는 None"""
+        errors = self._endpoint(endpoint).get("errors", {})
+        roll = self.rng.random()
+        cumulative = 0.0
+        for kind, rate in errors.items():
+            cumulative += rate
+            if roll < cumulative:
+                return kind
+        return None
+
+    def consume_openai(self, tokens: float) -> bool:
+        """OpenAI 분당 요청/토큰 사용량 반영 (enforce 시 한도 초과면 False)"""
+        config = self.profile["openai"]
+        rpm, tpm = config["requests_per_minute"], config["tokens_per_minute"]
+        request_ok = self.request_window.consume(1, rpm)
+        token_ok = self.token_window.consume(tokens, tpm)
+        if not config.get("enforce_rate_limit"):
+            return True
+        return request_ok and token_ok
+
+    def openai_headers(self) -> Dict[str, str]:
+        """x-ratelimit-* 응답 헤더"""
+        config = self.profile["openai"]
+        rpm, tpm = config["requests_per_minute"], config["tokens_per_minute"]
+        return {
+            "x-ratelimit-limit-requests": str(rpm),
+            "x-ratelimit-remaining-requests": str(self.request_window.remaining(rpm)),
+            "x-ratelimit-reset-requests": f"{self.request_window.reset_in():.3f}s",
+            "x-ratelimit-limit-tokens": str(tpm),
+            "x-ratelimit-remaining-tokens": str(self.token_window.remaining(tpm)),
+            "x-ratelimit-reset-tokens": f"{self.token_window.reset_in():.3f}s",
+        }
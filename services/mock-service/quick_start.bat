@@ -0,0 +1,9 @@
+@echo off
+echo ========================================
+echo Mock Service (Port 8090)
+echo ========================================
+echo.
+
+python main.py
+
+pause
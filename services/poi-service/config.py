@@ -40,3 +40,7 @@ def load_config() -> Dict[str, Any]:
 
 # Global config
 CONFIG = load_config()
+
+# 외부 API 주소 (부하 테스트 시 mock-service로 교체, 미설정 시 실제 API)
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+GOOGLE_PLACES_BASE_URL = os.getenv("GOOGLE_PLACES_BASE_URL", "https://places.googleapis.com/v1").rstrip("/")
@@ -9,17 +9,20 @@ Port: 8001
 - Landmark: 필수 명소 제공
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from typing import Optional
 
 from services import (
-    RecommendService, RecommendRequest,
-    GoogleService, GoogleRequest,
+    RecommendService, RecommendRequest, VectorSearchRequest,
+    GoogleService, GoogleRequest, GoogleDetailsRequest,
     RandomPoiService,
     LandmarkService, LandmarkRequest,
-    KtoService, POIMetadata
+    KtoService, KtoBatchRequest, POIMetadata,
+    KtoCatalog, CatalogSnapshot, parse_bbox, wants_columnar
 )
+from utils.http import close_http_clients
+from utils.db import init_db_pool, close_db_pool, pool_stats
 
 # =====================================================================================
 # FASTAPI APP
@@ -49,6 +52,35 @@ google_service = GoogleService()
 random_service = RandomPoiService()
 landmark_service = LandmarkService()
 kto_service = KtoService()
+kto_catalog = KtoCatalog(kto_service)
+
+
+@app.on_event("startup")
+async def startup_event():
+    """서비스 시작 시 DB 커넥션 풀 생성 (실패 시 첫 DB 요청에서 재시도)"""
+    try:
+        await init_db_pool()
+    except Exception as e:
+        print(f"[STARTUP] DB 커넥션 풀 생성 실패: {e}")
+
+    # KTO POI 메타데이터 스냅샷 (/api/kto/list)
+    await kto_catalog.start()
+
+    # 랜덤 추천 후보 풀 (/api/random)
+    await random_service.sampler.start()
+    await recommend_service.keyword_index.start()
+    await recommend_service.category_vectors.start()
+    await recommend_service.poi_embeddings.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서비스 종료 시 공유 HTTP 클라이언트 + DB 커넥션 풀 정리"""
+    await kto_catalog.stop()
+    await random_service.sampler.stop()
+    await recommend_service.keyword_index.stop()
+    await close_http_clients()
+    await close_db_pool()
 
 # =====================================================================================
 # API ENDPOINTS
@@ -63,11 +95,16 @@ async def root():
         "port": 8001,
         "endpoints": {
             "recommend": "POST /api/recommend - 감정 기반 POI 추천",
+            "recommend_vector": "POST /api/recommend/vector - Vector 유사도 대안 검색 (POI 임베딩)",
             "google_search": "POST /api/google/search - Google Places 검색",
+            "google_details": "POST /api/google/details - Google Place ID 일괄 상세 조회",
             "random": "GET /api/random - 무작위 POI 추천",
             "landmark": "POST /api/landmark - 필수 명소 제공",
-            "kto_list": "GET /api/kto/list - KTO POI 메타데이터 목록",
-            "kto_detail": "GET /api/kto/detail/{content_id} - KTO POI 상세정보"
+            "kto_list": "GET /api/kto/list - KTO POI 메타데이터 목록 (ETag/압축 스냅샷, format=columnar, since=version 델타)",
+            "kto_viewport": "GET /api/kto/viewport - 화면(bbox)/줌별 KTO POI 클러스터",
+            "kto_refresh": "POST /api/kto/refresh - KTO POI 메타데이터 스냅샷 갱신",
+            "kto_detail": "GET /api/kto/detail/{content_id} - KTO POI 상세정보",
+            "kto_batch": "POST /api/kto/batch - KTO POI content_id 일괄 조회"
         }
     }
 
@@ -100,6 +137,30 @@ async def recommend(request: RecommendRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/recommend/vector")
+async def recommend_vector(request: VectorSearchRequest):
+    """
+    Vector 유사도 대안 검색 (POI 임베딩 ANN, geometry 필터)
+
+    Request:
+        {
+            "embedding": [0.01, ...],
+            "query_text": "조용한 카페",
+            "geometry_id": 123,
+            "limit": 10
+        }
+    """
+    try:
+        results = await recommend_service.vector_search(request)
+        return {
+            "success": True,
+            "count": len(results),
+            "results": results
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.post("/api/google/search")
 async def google_search(request: GoogleRequest):
     """
@@ -126,10 +187,29 @@ async def google_search(request: GoogleRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/google/details")
+async def google_details(request: GoogleDetailsRequest):
+    """
+    Google Place ID 일괄 상세 조회 (대화기록 복원용)
+
+    Request:
+        {
+            "place_ids": ["ChIJ...", "ChIJ..."],
+            "language": "ko"
+        }
+    """
+    try:
+        result = await google_service.get_place_details(request.place_ids, request.language)
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/api/random")
 async def random_poi(
     lat: Optional[float] = None,
-    lng: Optional[float] = None
+    lng: Optional[float] = None,
+    session: Optional[str] = None
 ):
     """
     무작위 POI 추천
@@ -138,6 +218,7 @@ async def random_poi(
         lat: 사용자 위도 (optional)
         lng: 사용자 경도 (optional)
         - lat/lng 제공 시 반경 1.5km 이내 POI만 조회
+        session: 세션 키 (optional) - 같은 세션에는 후보를 모두 보여줄 때까지 중복 추천 안 함
 
     Response:
         {
@@ -155,7 +236,7 @@ async def random_poi(
         }
     """
     try:
-        result = random_service.get_random_poi(lat=lat, lng=lng)
+        result = await random_service.get_random_poi(lat=lat, lng=lng, session=session)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -192,18 +273,52 @@ async def landmark(request: LandmarkRequest):
         }
     """
     try:
-        result = landmark_service.get_landmarks(request)
+        result = await landmark_service.get_landmarks(request)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 (약한 비교, 목록/* 지원)"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _snapshot_response(request: Request, snapshot: CatalogSnapshot, columnar: bool = False) -> Response:
+    """스냅샷의 미리 직렬화/압축된 본문 반환 (JSON 또는 컬럼형, ETag 일치 시 304)"""
+    representation = snapshot.representation(columnar)
+    headers = {
+        "ETag": representation.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding, Accept",
+        "X-Catalog-Version": str(snapshot.version)
+    }
+    if _etag_matches(request.headers.get("if-none-match"), representation.etag):
+        return Response(status_code=304, headers=headers)
+
+    body, encoding = representation.select(request.headers.get("accept-encoding", ""))
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type=representation.media_type, headers=headers)
+
+
 @app.get("/api/kto/list")
-async def kto_list():
+async def kto_list(request: Request, format: Optional[str] = None, since: Optional[int] = None):
     """
     KTO POI 메타데이터 목록 조회 (경량)
 
     클라이언트에서 전체 로드 후 BBOX/Zoom 필터링에 사용
+    메모리 스냅샷의 미리 직렬화된 응답을 그대로 반환 (ETag 일치 시 304 Not Modified)
+
+    Query Parameters:
+        format: "columnar"면 컬럼형 바이너리 (Accept: application/vnd.tripbee.kto-columnar 와 동일)
+                레이아웃은 services/kto_columnar.py 참고
+        since: 이전에 받은 X-Catalog-Version → 그 이후 변경분만 JSON으로 응답
+               {"version": 현재, "since": since, "full": false, "upserts": [...], "deleted": ["content_id", ...]}
+               since가 너무 오래됐거나 알 수 없으면 full=true + 전체 목록 (upserts)
 
     Response:
         [
@@ -222,8 +337,60 @@ async def kto_list():
         ]
     """
     try:
-        pois = kto_service.get_all_metadata()
-        return pois
+        snapshot = await kto_catalog.get()
+        if since is not None:
+            return kto_catalog.delta(since)
+        columnar = wants_columnar(format, request.headers.get("accept", ""))
+        return _snapshot_response(request, snapshot, columnar)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/kto/viewport")
+async def kto_viewport(
+    bbox: str,
+    zoom: float,
+    categories: Optional[str] = None
+):
+    """
+    지도 화면 안의 KTO POI 클러스터 + 개별 POI
+
+    Query Parameters:
+        bbox: min_lng,min_lat,max_lng,max_lat
+        zoom: 지도 줌 레벨 (10 미만은 10, 17 이상은 클러스터 없이 개별 POI)
+        categories: content_type_id 목록 (쉼표 구분, 없으면 전체)
+
+    Response:
+        {
+            "version": 3,
+            "zoom": 14,
+            "clusters": [
+                {"id": 20412, "lat": 37.57, "lng": 126.98, "count": 12,
+                 "content_type_id": "12", "expansion_zoom": 15}
+            ],
+            "points": [{"content_id": "126508", "title": "경복궁", ...}]  # /api/kto/list 항목과 동일
+        }
+    """
+    try:
+        bounds = parse_bbox(bbox)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        snapshot = await kto_catalog.get()
+        category_list = [c.strip() for c in categories.split(",") if c.strip()] if categories else None
+        result = snapshot.viewport.query(bounds, zoom, category_list)
+        return {"version": snapshot.version, **result}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/kto/refresh")
+async def kto_refresh():
+    """KTO POI 메타데이터 스냅샷 즉시 갱신 (데이터 적재 후 호출)"""
+    try:
+        await kto_catalog.refresh()
+        return {"success": True, "catalog": kto_catalog.stats()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -255,7 +422,7 @@ async def kto_detail(content_id: str):
         }
     """
     try:
-        poi_detail = kto_service.get_poi_detail(content_id)
+        poi_detail = await kto_service.get_poi_detail(content_id)
         return poi_detail
     except Exception as e:
         if "찾을 수 없습니다" in str(e):
@@ -263,13 +430,41 @@ async def kto_detail(content_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/kto/batch")
+async def kto_batch(request: KtoBatchRequest):
+    """
+    KTO POI content_id 일괄 조회 (대화기록 복원용)
+
+    Request:
+        {"content_ids": ["126508", "264337"]}
+
+    Response:
+        {"success": true, "count": 2, "results": [...]}  # 입력 순서 유지
+    """
+    try:
+        results = await kto_service.get_pois_by_ids(request.content_ids)
+        return {
+            "success": True,
+            "count": len(results),
+            "results": results
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/health")
 async def health():
     """헬스체크"""
     return {
         "status": "healthy",
         "service": "POI Service",
-        "port": 8001
+        "port": 8001,
+        "db_pool": pool_stats(),
+        "kto_catalog": kto_catalog.stats(),
+        "random_sampler": random_service.sampler.stats(),
+        "keyword_index": recommend_service.keyword_index.stats(),
+        "category_vectors": recommend_service.category_vectors.stats(),
+        "poi_embeddings": recommend_service.poi_embeddings.stats()
     }
 
 
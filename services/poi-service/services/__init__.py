@@ -6,12 +6,14 @@ POI Service - Services Module
 from .recommend_service import (
     RecommendService,
     RecommendRequest,
+    VectorSearchRequest,
     UserLocation
 )
 
 from .google_service import (
     GoogleService,
     GoogleRequest,
+    GoogleDetailsRequest,
     PlaceInfo,
     PlaceFilters
 )
@@ -28,9 +30,25 @@ from .landmark_service import (
 
 from .kto_service import (
     KtoService,
+    KtoBatchRequest,
     POIMetadata
 )
 
+from .kto_catalog import (
+    KtoCatalog,
+    CatalogSnapshot
+)
+
+from .kto_columnar import (
+    encode_columnar,
+    wants_columnar
+)
+
+from .kto_viewport import (
+    ViewportIndex,
+    parse_bbox
+)
+
 __all__ = [
     # Service Classes
     "RecommendService",
@@ -38,16 +56,25 @@ __all__ = [
     "RandomPoiService",
     "LandmarkService",
     "KtoService",
+    "KtoCatalog",
 
     # Request Models
     "RecommendRequest",
+    "VectorSearchRequest",
     "GoogleRequest",
+    "GoogleDetailsRequest",
     "RandomPoiRequest",
     "LandmarkRequest",
+    "KtoBatchRequest",
 
     # Other Models
     "UserLocation",
     "PlaceInfo",
     "PlaceFilters",
     "POIMetadata",
+    "CatalogSnapshot",
+    "ViewportIndex",
+    "parse_bbox",
+    "encode_columnar",
+    "wants_columnar",
 ]
@@ -2,12 +2,13 @@
 Google Service - Google Places API를 사용한 장소 검색
 """
 
+import asyncio
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 import httpx
-from config import CONFIG
-import psycopg2
-from psycopg2.extras import RealDictCursor
+from config import CONFIG, GOOGLE_PLACES_BASE_URL
+from utils.http import get_http_client
+from utils.db import acquire
 
 
 # =====================================================================================
@@ -39,6 +40,12 @@ class GoogleRequest(BaseModel):
     filters: Optional[PlaceFilters] = None  # 필터 조건
 
 
+class GoogleDetailsRequest(BaseModel):
+    """Google Place ID 일괄 상세 조회 요청 (대화기록 복원용)"""
+    place_ids: List[str]
+    language: Optional[str] = "ko"
+
+
 class PlaceInfo(BaseModel):
     """장소 정보"""
     name: str
@@ -92,20 +99,12 @@ class GoogleService:
 
     def __init__(self):
         self.google_api_key = CONFIG["google_api_key"]
-        self.google_places_url = "https://places.googleapis.com/v1/places:searchText"
-
-    def _get_db_connection(self):
-        """데이터베이스 연결"""
-        return psycopg2.connect(
-            host=CONFIG["db_host"],
-            port=CONFIG["db_port"],
-            database=CONFIG["db_name"],
-            user=CONFIG["db_user"],
-            password=CONFIG["db_password"],
-            cursor_factory=RealDictCursor
-        )
+        self.google_places_url = f"{GOOGLE_PLACES_BASE_URL}/places:searchText"
+        self.google_details_url = f"{GOOGLE_PLACES_BASE_URL}/places"
+        # 진행 중인 감정 원본 저장 작업 (GC로 취소되지 않도록 참조 유지)
+        self._background_tasks = set()
 
-    def _save_emotion_origin(
+    async def _save_emotion_origin(
         self,
         place_id: str,
         source: str,
@@ -114,38 +113,35 @@ class GoogleService:
     ):
         """감정 원본 텍스트 저장 (emotion, emotion_vector는 NULL)"""
         try:
-            conn = self._get_db_connection()
-            cursor = conn.cursor()
-
-            # place_id + source + language 조합이 이미 있는지 확인
-            cursor.execute("""
-                SELECT COUNT(*) FROM place_emotion_tags
-                WHERE place_id = %s AND source = %s AND language = %s
-            """, (place_id, source, language))
-
-            count = cursor.fetchone()[0]
-            if count > 0:
-                print(f"[EMOTION] 이미 존재함 (스킵): {place_id} (source: {source}, language: {language})")
-                cursor.close()
-                conn.close()
-                return
-
-            # 존재하지 않으면 INSERT
-            cursor.execute("""
-                INSERT INTO place_emotion_tags
-                    (place_id, source, language, emotion_origin, emotion, emotion_vector)
-                VALUES (%s, %s, %s, %s, NULL, NULL)
-            """, (place_id, source, language, emotion_origin))
-
-            conn.commit()
-            cursor.close()
-            conn.close()
+            async with acquire() as conn:
+                # place_id + source + language 조합이 이미 있는지 확인
+                count = await conn.fetchval("""
+                    SELECT COUNT(*) FROM place_emotion_tags
+                    WHERE place_id = $1 AND source = $2 AND language = $3
+                """, place_id, source, language)
+
+                if count > 0:
+                    print(f"[EMOTION] 이미 존재함 (스킵): {place_id} (source: {source}, language: {language})")
+                    return
+
+                # 존재하지 않으면 INSERT
+                await conn.execute("""
+                    INSERT INTO place_emotion_tags
+                        (place_id, source, language, emotion_origin, emotion, emotion_vector)
+                    VALUES ($1, $2, $3, $4, NULL, NULL)
+                """, place_id, source, language, emotion_origin)
 
             print(f"[EMOTION] 원본 저장 완료: {place_id} ({language})")
 
         except Exception as e:
             print(f"[EMOTION] 저장 실패 ({place_id}): {e}")
 
+    def _schedule_emotion_origin(self, **kwargs):
+        """감정 원본 저장을 백그라운드 작업으로 실행 (검색 응답을 기다리게 하지 않음)"""
+        task = asyncio.create_task(self._save_emotion_origin(**kwargs))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
     def _build_field_mask(self, filters: Optional[PlaceFilters]) -> str:
         """필터에 따라 동적으로 FieldMask 생성"""
         # 기본 필드 (항상 요청)
@@ -266,6 +262,146 @@ class GoogleService:
 
         return True
 
+    def _parse_place(self, place: Dict[str, Any]) -> Optional[PlaceInfo]:
+        """Google Places API 장소 데이터 → PlaceInfo (좌표 없으면 None)"""
+        # 이름
+        display_name = place.get("displayName", {})
+        name = display_name.get("text", "")
+
+        # 주소
+        address = place.get("formattedAddress", "")
+
+        # 좌표
+        location = place.get("location", {})
+        lat = location.get("latitude")
+        lng = location.get("longitude")
+
+        if not lat or not lng:
+            return None
+
+        # 타입 (카테고리)
+        types = place.get("types", [])
+        category = types[0] if types else None
+        place_type = types[0] if types else None
+
+        # Google Place ID
+        google_id = place.get("id", "")
+
+        # editorialSummary 추출 및 저장
+        editorial_summary = place.get("editorialSummary", {})
+        emotion_origin = editorial_summary.get("text") if editorial_summary else None
+
+        # 추가 정보 파싱
+        rating = place.get("rating")
+        user_rating_count = place.get("userRatingCount")
+        price_level = place.get("priceLevel")
+
+        opening_hours = place.get("currentOpeningHours", {})
+        open_now = opening_hours.get("openNow")
+
+        phone_number = place.get("nationalPhoneNumber")
+        website = place.get("websiteUri")
+
+        # 편의시설 파싱
+        parking_opts = place.get("parkingOptions", {})
+        parking_available = any([
+            parking_opts.get("freeParkingLot"),
+            parking_opts.get("paidParkingLot"),
+            parking_opts.get("freeStreetParking"),
+            parking_opts.get("paidStreetParking"),
+            parking_opts.get("freeGarageParking"),
+            parking_opts.get("paidGarageParking")
+        ]) if parking_opts else None
+
+        good_for_children = place.get("goodForChildren")
+
+        accessibility = place.get("accessibilityOptions", {})
+        wheelchair_accessible = any([
+            accessibility.get("wheelchairAccessibleParking"),
+            accessibility.get("wheelchairAccessibleEntrance"),
+            accessibility.get("wheelchairAccessibleRestroom"),
+            accessibility.get("wheelchairAccessibleSeating")
+        ]) if accessibility else None
+
+        vegetarian_food = place.get("servesVegetarianFood")
+        takeout = place.get("takeout")
+        delivery = place.get("delivery")
+        allows_dogs = place.get("allowsDogs")
+        reservable = place.get("reservable")
+
+        # Photos 파싱
+        photos_data = place.get("photos", [])
+        image_url = None  # 대표 이미지
+        photo_urls = []  # 전체 사진 배열
+
+        if photos_data and len(photos_data) > 0:
+            # 대표 이미지 (첫 번째)
+            photo = photos_data[0]
+            photo_name = photo.get("name")
+            if photo_name:
+                image_url = f"https://places.googleapis.com/v1/{photo_name}/media?key={self.google_api_key}&maxHeightPx=400&maxWidthPx=400"
+
+            # 전체 사진 배열 (제한 없음)
+            for photo in photos_data:
+                photo_name = photo.get("name")
+                if photo_name:
+                    photo_url = f"https://places.googleapis.com/v1/{photo_name}/media?key={self.google_api_key}&maxHeightPx=400&maxWidthPx=400"
+                    photo_urls.append(photo_url)
+
+        # Menu URL (Google Places에서 제공하는 메뉴 링크)
+        menu_url = place.get("menuForBusinessUrl")  # 또는 websiteUri에서 메뉴 찾기
+
+        # Reviews 파싱 (최대 5개)
+        reviews_data = place.get("reviews", [])
+        print(f"[GOOGLE_REVIEWS] place: {name}, reviews count: {len(reviews_data)}")
+        reviews = []
+        for review in reviews_data[:5]:  # 최대 5개만
+            author = review.get("authorAttribution", {})
+            reviews.append({
+                "author_name": author.get("displayName", "익명"),
+                "author_photo": author.get("photoUri"),
+                "rating": review.get("rating"),
+                "text": review.get("text", {}).get("text", ""),
+                "time": review.get("relativePublishTimeDescription", ""),
+                "language": review.get("originalText", {}).get("languageCode", "")
+            })
+
+        return PlaceInfo(
+            name=name,
+            address=address,
+            lat=lat,
+            lng=lng,
+            category=category,
+            place_type=place_type,
+            place_id=google_id,
+            # 추가 정보
+            rating=rating,
+            user_rating_count=user_rating_count,
+            price_level=price_level,
+            open_now=open_now,
+            phone_number=phone_number,
+            website=website,
+            # 편의시설
+            parking_available=parking_available,
+            good_for_children=good_for_children,
+            wheelchair_accessible=wheelchair_accessible,
+            vegetarian_food=vegetarian_food,
+            takeout=takeout,
+            delivery=delivery,
+            allows_dogs=allows_dogs,
+            reservable=reservable,
+            # 감정 태깅용
+            editorial_summary=emotion_origin,
+            # 이미지
+            image=image_url,
+            # 리뷰
+            reviews=reviews if reviews else None,
+            # 사진 갤러리
+            photos=photo_urls if photo_urls else None,
+            # 메뉴
+            menu_url=menu_url
+        )
+
     async def search(self, request: GoogleRequest) -> Dict[str, Any]:
         """
         Google Places API로 장소 검색
@@ -308,15 +444,15 @@ class GoogleService:
                 }
             }
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.google_places_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=10.0
-                )
-                response.raise_for_status()
-                data = response.json()
+            client = get_http_client(self.google_places_url)
+            response = await client.post(
+                self.google_places_url,
+                headers=headers,
+                json=payload,
+                timeout=10.0
+            )
+            response.raise_for_status()
+            data = response.json()
 
             # 디버깅: API 응답 로깅
             places_count = len(data.get('places', []))
@@ -340,37 +476,23 @@ class GoogleService:
                         filtered_count += 1
                         continue
 
-                    # 이름
-                    display_name = place.get("displayName", {})
-                    name = display_name.get("text", "")
-
-                    # 주소
-                    address = place.get("formattedAddress", "")
-
-                    # 좌표
-                    location = place.get("location", {})
-                    lat = location.get("latitude")
-                    lng = location.get("longitude")
-
-                    if not lat or not lng:
+                    place_info = self._parse_place(place)
+                    if not place_info:
                         continue
 
-                    # 타입 (카테고리)
-                    types = place.get("types", [])
-                    category = types[0] if types else None
-                    place_type = types[0] if types else None
+                    name = place_info.name
+                    rating = place_info.rating
+                    lat = place_info.lat
+                    lng = place_info.lng
 
-                    # Google Place ID
-                    google_id = place.get("id", "")
-
-                    # editorialSummary 추출 및 저장
-                    editorial_summary = place.get("editorialSummary", {})
-                    emotion_origin = editorial_summary.get("text") if editorial_summary else None
+                    # editorialSummary 저장
+                    google_id = place_info.place_id
+                    emotion_origin = place_info.editorial_summary
 
                     if emotion_origin and google_id:
                         # 비동기로 DB 저장 (사용자 응답 지연 방지)
                         try:
-                            self._save_emotion_origin(
+                            self._schedule_emotion_origin(
                                 place_id=google_id,
                                 source="google",
                                 language=request.language,
@@ -380,116 +502,6 @@ class GoogleService:
                             print(f"[GOOGLE] 감정 원본 저장 실패: {e}")
                             # 저장 실패해도 검색 결과는 반환
 
-                    # 추가 정보 파싱
-                    rating = place.get("rating")
-                    user_rating_count = place.get("userRatingCount")
-                    price_level = place.get("priceLevel")
-
-                    opening_hours = place.get("currentOpeningHours", {})
-                    open_now = opening_hours.get("openNow")
-
-                    phone_number = place.get("nationalPhoneNumber")
-                    website = place.get("websiteUri")
-
-                    # 편의시설 파싱
-                    parking_opts = place.get("parkingOptions", {})
-                    parking_available = any([
-                        parking_opts.get("freeParkingLot"),
-                        parking_opts.get("paidParkingLot"),
-                        parking_opts.get("freeStreetParking"),
-                        parking_opts.get("paidStreetParking"),
-                        parking_opts.get("freeGarageParking"),
-                        parking_opts.get("paidGarageParking")
-                    ]) if parking_opts else None
-
-                    good_for_children = place.get("goodForChildren")
-
-                    accessibility = place.get("accessibilityOptions", {})
-                    wheelchair_accessible = any([
-                        accessibility.get("wheelchairAccessibleParking"),
-                        accessibility.get("wheelchairAccessibleEntrance"),
-                        accessibility.get("wheelchairAccessibleRestroom"),
-                        accessibility.get("wheelchairAccessibleSeating")
-                    ]) if accessibility else None
-
-                    vegetarian_food = place.get("servesVegetarianFood")
-                    takeout = place.get("takeout")
-                    delivery = place.get("delivery")
-                    allows_dogs = place.get("allowsDogs")
-                    reservable = place.get("reservable")
-
-                    # Photos 파싱
-                    photos_data = place.get("photos", [])
-                    image_url = None  # 대표 이미지
-                    photo_urls = []  # 전체 사진 배열
-
-                    if photos_data and len(photos_data) > 0:
-                        # 대표 이미지 (첫 번째)
-                        photo = photos_data[0]
-                        photo_name = photo.get("name")
-                        if photo_name:
-                            image_url = f"https://places.googleapis.com/v1/{photo_name}/media?key={self.google_api_key}&maxHeightPx=400&maxWidthPx=400"
-
-                        # 전체 사진 배열 (제한 없음)
-                        for photo in photos_data:
-                            photo_name = photo.get("name")
-                            if photo_name:
-                                photo_url = f"https://places.googleapis.com/v1/{photo_name}/media?key={self.google_api_key}&maxHeightPx=400&maxWidthPx=400"
-                                photo_urls.append(photo_url)
-
-                    # Menu URL (Google Places에서 제공하는 메뉴 링크)
-                    menu_url = place.get("menuForBusinessUrl")  # 또는 websiteUri에서 메뉴 찾기
-
-                    # Reviews 파싱 (최대 5개)
-                    reviews_data = place.get("reviews", [])
-                    print(f"[GOOGLE_REVIEWS] place: {name}, reviews count: {len(reviews_data)}")
-                    reviews = []
-                    for review in reviews_data[:5]:  # 최대 5개만
-                        author = review.get("authorAttribution", {})
-                        reviews.append({
-                            "author_name": author.get("displayName", "익명"),
-                            "author_photo": author.get("photoUri"),
-                            "rating": review.get("rating"),
-                            "text": review.get("text", {}).get("text", ""),
-                            "time": review.get("relativePublishTimeDescription", ""),
-                            "language": review.get("originalText", {}).get("languageCode", "")
-                        })
-
-                    place_info = PlaceInfo(
-                        name=name,
-                        address=address,
-                        lat=lat,
-                        lng=lng,
-                        category=category,
-                        place_type=place_type,
-                        place_id=google_id,
-                        # 추가 정보
-                        rating=rating,
-                        user_rating_count=user_rating_count,
-                        price_level=price_level,
-                        open_now=open_now,
-                        phone_number=phone_number,
-                        website=website,
-                        # 편의시설
-                        parking_available=parking_available,
-                        good_for_children=good_for_children,
-                        wheelchair_accessible=wheelchair_accessible,
-                        vegetarian_food=vegetarian_food,
-                        takeout=takeout,
-                        delivery=delivery,
-                        allows_dogs=allows_dogs,
-                        reservable=reservable,
-                        # 감정 태깅용
-                        editorial_summary=emotion_origin,
-                        # 이미지
-                        image=image_url,
-                        # 리뷰
-                        reviews=reviews if reviews else None,
-                        # 사진 갤러리
-                        photos=photo_urls if photo_urls else None,
-                        # 메뉴
-                        menu_url=menu_url
-                    )
                     places.append(place_info)
 
                     rating_str = f" (⭐{rating:.1f})" if rating else ""
@@ -523,3 +535,51 @@ class GoogleService:
             import traceback
             traceback.print_exc()
             raise
+
+    async def get_place_details(self, place_ids: List[str], language: str = "ko") -> Dict[str, Any]:
+        """
+        Place ID 목록으로 장소 상세 일괄 조회 (Place Details, 동시 요청)
+
+        Args:
+            place_ids: Google Place ID 목록
+            language: 언어 코드
+
+        Returns:
+            {"success": True, "results": [PlaceInfo...], "missing": [place_id...]}
+            (results는 입력 순서 유지, 조회 실패한 ID는 missing)
+        """
+        # Place Details는 FieldMask에 "places." 접두어를 쓰지 않음
+        field_mask = ",".join(
+            field[len("places."):] for field in self._build_field_mask(None).split(",")
+        )
+        headers = {
+            "X-Goog-Api-Key": self.google_api_key,
+            "X-Goog-FieldMask": field_mask
+        }
+        client = get_http_client(self.google_details_url)
+
+        async def fetch(place_id: str) -> Optional[PlaceInfo]:
+            try:
+                response = await client.get(
+                    f"{self.google_details_url}/{place_id}",
+                    headers=headers,
+                    params={"languageCode": language},
+                    timeout=10.0
+                )
+                response.raise_for_status()
+                return self._parse_place(response.json())
+            except Exception as e:
+                print(f"[GOOGLE] 상세 조회 실패 ({place_id}): {e}")
+                return None
+
+        unique_ids = list(dict.fromkeys(pid for pid in place_ids if pid))
+        fetched = await asyncio.gather(*[fetch(pid) for pid in unique_ids])
+        by_id = {pid: info for pid, info in zip(unique_ids, fetched) if info}
+
+        print(f"[GOOGLE] 상세 조회: {len(by_id)}/{len(unique_ids)}개 성공")
+
+        return {
+            "success": True,
+            "results": [by_id[pid] for pid in unique_ids if pid in by_id],
+            "missing": [pid for pid in unique_ids if pid not in by_id]
+        }
@@ -0,0 +1,155 @@
+"""
+Hybrid Ranker - 추천 후보 POI 재정렬 (키워드 + 벡터 + 거리 + 인기도)
+- SQL은 카테고리별로 넉넉한 후보만 가져오고 (keyword_match_count, distance 순)
+  최종 순서는 여러 신호를 합쳐 메모리에서 한 번에 계산 (numpy 벡터 연산)
+- 신호 (모두 0~1, 클수록 좋음):
+    lexical:    키워드 매칭 비율 + BM25 점수 (후보 내 최대값 기준 정규화)
+    vector:     리라이트된 쿼리 임베딩과 POI 벡터의 코사인 유사도
+    distance:   exp(-distance_km / DISTANCE_SCALE_KM)
+    popularity: 호출자가 넘긴 인기도 (없으면 사용 안 함)
+- 결합 방식: weighted (가중합, 기본) 또는 rrf (신호별 순위의 Reciprocal Rank Fusion)
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 결합 방식: "weighted" | "rrf"
+RANKING_MODE = os.getenv("RECOMMEND_RANKING_MODE", "weighted").lower()
+
+# 신호별 가중치 (사용할 수 없는 신호는 빠지고 나머지로 다시 정규화)
+WEIGHTS = {
+    "lexical": float(os.getenv("RECOMMEND_WEIGHT_LEXICAL", 0.5)),
+    "vector": float(os.getenv("RECOMMEND_WEIGHT_VECTOR", 0.3)),
+    "distance": float(os.getenv("RECOMMEND_WEIGHT_DISTANCE", 0.2)),
+    "popularity": float(os.getenv("RECOMMEND_WEIGHT_POPULARITY", 0.1)),
+}
+
+# 거리 감쇠 기준 (km) - 이 거리에서 점수 1/e
+DISTANCE_SCALE_KM = 1.0
+
+# 키워드 신호 안에서 매칭 비율 : BM25 비중
+LEXICAL_BM25_SHARE = 0.3
+
+# RRF 상수 (1 / (k + rank))
+RRF_K = 60
+
+
+def _ranks(values) -> Any:
+    """값 내림차순 순위 (1부터, 동점은 같은 순위)"""
+    order = np.argsort(-values, kind="stable")
+    sorted_values = values[order]
+    # 값이 바뀌는 위치에서만 순위 증가 → 동점 공유
+    dense_start = np.concatenate(([True], sorted_values[1:] != sorted_values[:-1]))
+    first_position = np.maximum.accumulate(np.where(dense_start, np.arange(len(values)), 0))
+    ranks = np.empty(len(values), dtype=np.float64)
+    ranks[order] = first_position + 1
+    return ranks
+
+
+class HybridRanker:
+    """후보 POI 다중 신호 재정렬"""
+
+    def __init__(self, mode: str = RANKING_MODE, weights: Optional[Dict[str, float]] = None):
+        self.mode = mode
+        self.weights = dict(weights or WEIGHTS)
+
+    @property
+    def enabled(self) -> bool:
+        return NUMPY_AVAILABLE
+
+    def signals(
+        self,
+        pois: List[Dict[str, Any]],
+        keyword_count: int,
+        query_vector: Optional[Sequence[float]] = None,
+        poi_vectors=None,
+        popularity: Optional[Sequence[float]] = None
+    ) -> Dict[str, Any]:
+        """
+        후보별 신호 배열 (신호 이름 → (n,) float64)
+
+        Args:
+            pois: 후보 POI (keyword_match_count, keyword_score, distance_km 포함)
+            keyword_count: core_keywords 개수
+            query_vector: 쿼리 임베딩 (없으면 vector 신호 제외)
+            poi_vectors: (정규화된 벡터 행렬 (n, 차원), 벡터 있음 여부 (n,))
+            popularity: 후보별 인기도 0~1 (없으면 popularity 신호 제외)
+        """
+        signals = {}
+
+        if keyword_count > 0:
+            counts = np.array([poi.get("keyword_match_count") or 0 for poi in pois], dtype=np.float64)
+            scores = np.array([poi.get("keyword_score") or 0.0 for poi in pois], dtype=np.float64)
+            max_score = scores.max() if len(scores) else 0.0
+            bm25 = scores / max_score if max_score > 0 else scores
+            signals["lexical"] = (1 - LEXICAL_BM25_SHARE) * counts / keyword_count + LEXICAL_BM25_SHARE * bm25
+
+        if query_vector is not None and poi_vectors is not None:
+            matrix, mask = poi_vectors
+            query = np.asarray(query_vector, dtype=np.float32)
+            if matrix.shape[1] == query.shape[0] and mask.any():
+                query = query / max(float(np.linalg.norm(query)), 1e-12)
+                similarity = (matrix @ query).astype(np.float64)
+                signals["vector"] = np.where(mask, np.clip(similarity, 0.0, 1.0), 0.0)
+            else:
+                print(f"[HYBRID_RANKER] vector 신호 제외 (차원 {matrix.shape[1]} vs {query.shape[0]})")
+
+        distances = np.array([poi.get("distance_km") or 0.0 for poi in pois], dtype=np.float64)
+        if distances.any():
+            signals["distance"] = np.exp(-distances / DISTANCE_SCALE_KM)
+
+        if popularity is not None:
+            signals["popularity"] = np.clip(np.asarray(popularity, dtype=np.float64), 0.0, 1.0)
+
+        return signals
+
+    def rank(
+        self,
+        pois: List[Dict[str, Any]],
+        keyword_count: int,
+        query_vector: Optional[Sequence[float]] = None,
+        poi_vectors=None,
+        popularity: Optional[Sequence[float]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        후보 POI를 키워드 매칭 여부 → 결합 점수 내림차순으로 (각 POI에 hybrid_score 추가)
+
+        numpy가 없거나 사용할 신호가 없으면 입력 순서 유지
+        """
+        if not pois or not self.enabled:
+            return pois[:limit] if limit else pois
+
+        signals = self.signals(pois, keyword_count, query_vector, poi_vectors, popularity)
+        weights = {name: self.weights.get(name, 0.0) for name in signals if self.weights.get(name, 0.0) > 0}
+        if not weights:
+            return pois[:limit] if limit else pois
+
+        total_weight = sum(weights.values())
+        fused = np.zeros(len(pois), dtype=np.float64)
+        for name, weight in weights.items():
+            if self.mode == "rrf":
+                fused += (weight / total_weight) / (RRF_K + _ranks(signals[name]))
+            else:
+                fused += (weight / total_weight) * signals[name]
+
+        # 키워드 매칭 POI가 항상 먼저 (결합 점수는 같은 구간 안에서만 순서 결정, 동점은 기존 SQL 순서 유지)
+        # → limit으로 자를 때 매칭 POI가 가까운 비매칭 POI에 밀려 빠지지 않도록
+        matched = np.array([(poi.get("keyword_match_count") or 0) > 0 for poi in pois])
+        order = np.lexsort((-fused, ~matched))
+        if limit:
+            order = order[:limit]
+
+        ranked = []
+        for i in order:
+            poi = pois[int(i)]
+            poi["hybrid_score"] = round(float(fused[i]), 6)
+            ranked.append(poi)
+        return ranked
@@ -0,0 +1,190 @@
+"""
+Keyword Index - POI 제목/개요 글자 bigram 역색인 (core_keywords 매칭)
+- DB의 LOWER(title/overview) LIKE '%kw%'는 인덱스를 못 타고 행마다 긴 overview를 소문자 변환 + 스캔
+- 서비스 시작 시 한국어 POI 제목/개요를 읽어 글자 bigram → 문서 목록 역색인 생성
+- 키워드 bigram 목록 교집합으로 후보를 좁힌 뒤 실제 부분 문자열 포함 여부 확인 (LIKE와 같은 결과)
+- 필드별(제목/개요) 매칭 수 + BM25 점수 계산 → 추천 쿼리에 후보/점수로 전달
+"""
+
+import asyncio
+import math
+import os
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from utils.db import acquire, run_sync
+
+# 인덱스 다시 읽기 간격(초), 0이면 다시 읽지 않음
+INDEX_REFRESH_SECONDS = float(os.getenv("KEYWORD_INDEX_REFRESH_SECONDS", 3600))
+
+# BM25 파라미터 + 제목 가중치 (제목에 한 번 나온 것 = 개요에 TITLE_WEIGHT번 나온 것)
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 3.0
+
+DOCUMENT_QUERY = """
+    SELECT content_id, title, overview
+    FROM KTO_TOUR_BASE_LIST
+    WHERE language = 'Kor' AND title IS NOT NULL
+"""
+
+
+def _bigrams(text: str):
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+@dataclass
+class KeywordMatch:
+    """문서 1개의 키워드 매칭 결과"""
+    content_id: str
+    match_count: int         # 제목 또는 개요에 포함된 키워드 수 (기존 keyword_match_count와 동일)
+    title_matches: int       # 제목에 포함된 키워드 수
+    overview_matches: int    # 개요에 포함된 키워드 수
+    score: float             # BM25
+
+
+class _IndexData:
+    """읽기 전용 색인 (통째로 교체)"""
+
+    def __init__(self, rows):
+        self.content_ids: List[str] = []
+        self.titles: List[str] = []
+        self.overviews: List[str] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+
+        for row in rows:
+            doc = len(self.content_ids)
+            title = (row["title"] or "").lower()
+            overview = (row["overview"] or "").lower()
+            self.content_ids.append(row["content_id"])
+            self.titles.append(title)
+            self.overviews.append(overview)
+            for gram in _bigrams(title) | _bigrams(overview):
+                postings[gram].append(doc)
+
+        # 문서 번호 오름차순 unsigned int 배열 (리스트 대비 메모리 절약)
+        self.postings: Dict[str, array] = {gram: array("I", docs) for gram, docs in postings.items()}
+        lengths = [len(title) * TITLE_WEIGHT + len(overview) for title, overview in zip(self.titles, self.overviews)]
+        self.doc_lengths = lengths
+        self.avg_length = (sum(lengths) / len(lengths)) if lengths else 1.0
+
+    def candidates(self, keyword: str) -> Iterable[int]:
+        """키워드를 포함할 수 있는 문서 번호 (bigram 교집합, 1글자 키워드는 전체)"""
+        if len(keyword) < 2:
+            return range(len(self.content_ids))
+
+        lists = []
+        for gram in _bigrams(keyword):
+            docs = self.postings.get(gram)
+            if docs is None:
+                return range(0)
+            lists.append(docs)
+        lists.sort(key=len)
+
+        result = set(lists[0])
+        for docs in lists[1:]:
+            result.intersection_update(docs)
+            if not result:
+                break
+        return sorted(result)
+
+
+class KeywordIndex:
+    """core_keywords 매칭용 메모리 역색인"""
+
+    def __init__(self):
+        self._data: Optional[_IndexData] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._data is not None
+
+    async def load(self):
+        """DB에서 문서를 읽어 색인 교체 (색인 생성은 스레드 풀에서)"""
+        async with self._lock:
+            async with acquire() as conn:
+                rows = await conn.fetch(DOCUMENT_QUERY)
+            self._data = await run_sync(_IndexData, rows)
+            print(f"[KEYWORD_INDEX] 문서 {len(self._data.content_ids)}개, bigram {len(self._data.postings)}개")
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(INDEX_REFRESH_SECONDS)
+            try:
+                await self.load()
+            except Exception as e:
+                print(f"[KEYWORD_INDEX] 주기적 갱신 실패 (기존 색인 유지): {e}")
+
+    async def start(self):
+        """서비스 시작 시 색인 생성 + 주기적 갱신 시작 (실패 시 추천은 DB LIKE 매칭 사용)"""
+        try:
+            await self.load()
+        except Exception as e:
+            print(f"[KEYWORD_INDEX] 초기 색인 생성 실패: {e}")
+
+        if INDEX_REFRESH_SECONDS > 0 and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def search(self, keywords: List[str]) -> Dict[str, KeywordMatch]:
+        """
+        키워드가 하나라도 포함된 문서 (content_id → 매칭 결과)
+
+        LIKE '%kw%'와 같은 부분 문자열 기준 (대소문자 무시)
+        """
+        data = self._data
+        if data is None:
+            raise RuntimeError("keyword index not loaded")
+
+        total_docs = len(data.content_ids)
+        matches: Dict[int, List] = {}  # doc → [match_count, title_matches, overview_matches, score]
+
+        for keyword in dict.fromkeys(kw.lower() for kw in keywords if kw):
+            hits = []
+            for doc in data.candidates(keyword):
+                title_tf = data.titles[doc].count(keyword)
+                overview_tf = data.overviews[doc].count(keyword)
+                if title_tf or overview_tf:
+                    hits.append((doc, title_tf, overview_tf))
+            if not hits:
+                continue
+
+            idf = math.log((total_docs - len(hits) + 0.5) / (len(hits) + 0.5) + 1)
+            for doc, title_tf, overview_tf in hits:
+                tf = title_tf * TITLE_WEIGHT + overview_tf
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * data.doc_lengths[doc] / data.avg_length)
+                entry = matches.setdefault(doc, [0, 0, 0, 0.0])
+                entry[0] += 1
+                entry[1] += 1 if title_tf else 0
+                entry[2] += 1 if overview_tf else 0
+                entry[3] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        return {
+            data.content_ids[doc]: KeywordMatch(
+                content_id=data.content_ids[doc],
+                match_count=entry[0],
+                title_matches=entry[1],
+                overview_matches=entry[2],
+                score=round(entry[3], 4)
+            )
+            for doc, entry in matches.items()
+        }
+
+    def stats(self):
+        data = self._data
+        if data is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "documents": len(data.content_ids),
+            "bigrams": len(data.postings),
+            "postings": sum(len(docs) for docs in data.postings.values())
+        }
@@ -0,0 +1,277 @@
+"""
+KTO Catalog - POI 메타데이터 메모리 스냅샷
+- 서비스 시작 시 + 주기적으로 KTO_TOUR_BASE_LIST 전체 메타데이터를 한 번만 조회
+- 응답(JSON, 컬럼형 바이너리)을 미리 직렬화/압축(gzip, brotli)해 두고 /api/kto/list는 바이트를 그대로 반환
+- 내용 해시 기반 ETag → 변경이 없으면 304 Not Modified
+- 화면(bbox)/줌 클러스터 인덱스도 스냅샷과 함께 생성 (/api/kto/viewport)
+- POI별 내용 해시로 변경분(추가/수정/삭제)을 계산해 최근 변경 이력 보관 → ?since=version 델타 동기화
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from utils.db import run_sync
+from .kto_columnar import MEDIA_TYPE as COLUMNAR_MEDIA_TYPE, encode_columnar
+from .kto_viewport import ViewportIndex
+
+# brotli는 패키지가 설치된 경우에만 사용
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# 주기적 갱신 간격(초), 0이면 갱신 안 함 (수동 갱신: POST /api/kto/refresh)
+CATALOG_REFRESH_SECONDS = float(os.getenv("KTO_CATALOG_REFRESH_SECONDS", 3600))
+
+# 델타 동기화용으로 보관할 변경 이력 수 (이보다 오래된 version은 전체 목록으로 응답)
+CATALOG_HISTORY = int(os.getenv("KTO_CATALOG_HISTORY", 50))
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """한 가지 표현(JSON / 컬럼형)의 미리 압축한 응답 본문"""
+    media_type: str
+    etag: str                # 따옴표 포함
+    identity: bytes
+    gzip: bytes
+    br: Optional[bytes]
+
+    def select(self, accept_encoding: str):
+        """Accept-Encoding에 맞는 (본문, Content-Encoding) 선택 (br > gzip > identity)"""
+        accepted = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+        if self.br is not None and "br" in accepted:
+            return self.br, "br"
+        if "gzip" in accepted:
+            return self.gzip, "gzip"
+        return self.identity, None
+
+    def sizes(self) -> Dict[str, Optional[int]]:
+        return {
+            "identity": len(self.identity),
+            "gzip": len(self.gzip),
+            "br": len(self.br) if self.br is not None else None
+        }
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """특정 시점의 POI 메타데이터 + 미리 직렬화한 응답"""
+    version: int             # 내용이 바뀔 때마다 증가 (생성 시각 ms - 재시작 후에도 이전 version과 겹치지 않음)
+    etag: str                # 내용 해시 (따옴표 포함, 재시작/다중 인스턴스에서도 동일)
+    pois: List[Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]]
+    row_hashes: Dict[str, str]  # content_id → 행 내용 해시
+    json_body: EncodedBody
+    columnar_body: EncodedBody
+    viewport: ViewportIndex
+    built_at: float
+
+    def representation(self, columnar: bool) -> EncodedBody:
+        return self.columnar_body if columnar else self.json_body
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """base_version → version 사이의 변경된 content_id"""
+    base_version: int
+    version: int
+    upserted: Set[str]
+    deleted: Set[str]
+
+
+def _compress(body: bytes, media_type: str, etag: str) -> EncodedBody:
+    return EncodedBody(
+        media_type=media_type,
+        etag=etag,
+        identity=body,
+        gzip=gzip.compress(body, compresslevel=9),
+        br=brotli.compress(body, quality=11) if BROTLI_AVAILABLE else None
+    )
+
+
+def _row_hashes(pois: List[Dict[str, Any]]) -> Dict[str, str]:
+    """content_id → 행 내용 해시"""
+    return {
+        poi["content_id"]: hashlib.blake2b(
+            json.dumps(poi, ensure_ascii=False, sort_keys=True).encode("utf-8"), digest_size=12
+        ).hexdigest()
+        for poi in pois
+    }
+
+
+def _diff(previous: Dict[str, str], current: Dict[str, str]):
+    """(추가/수정된 content_id, 삭제된 content_id)"""
+    upserted = {content_id for content_id, row_hash in current.items() if previous.get(content_id) != row_hash}
+    deleted = set(previous) - set(current)
+    return upserted, deleted
+
+
+def _serialize(pois: List[Dict[str, Any]]):
+    """JSON / 컬럼형 직렬화 + 압축 + 내용 해시 (CPU 작업 - 스레드 풀에서 실행)"""
+    body = json.dumps(pois, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    json_body = _compress(body, "application/json", f'"{digest}"')
+    columnar_body = _compress(encode_columnar(pois), COLUMNAR_MEDIA_TYPE, f'"{digest}-c"')
+    return json_body, columnar_body, f'"{digest}"', _row_hashes(pois)
+
+
+class KtoCatalog:
+    """KTO POI 메타데이터 스냅샷 관리"""
+
+    def __init__(self, kto_service):
+        self.kto_service = kto_service
+        self.snapshot: Optional[CatalogSnapshot] = None
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refreshes = 0  # 완료된 갱신 횟수
+        self._history: Deque[ChangeSet] = deque(maxlen=CATALOG_HISTORY)
+
+    async def get(self) -> CatalogSnapshot:
+        """현재 스냅샷 (아직 없으면 생성)"""
+        if self.snapshot is None:
+            await self.refresh()
+        return self.snapshot
+
+    async def refresh(self) -> CatalogSnapshot:
+        """DB에서 다시 읽어 스냅샷 교체 (내용이 같으면 기존 스냅샷 유지)"""
+        attempt = self._refreshes
+        async with self._lock:
+            previous = self.snapshot
+            # 기다리는 동안 다른 요청이 갱신을 끝냈으면 그 결과 사용
+            if previous is not None and self._refreshes != attempt:
+                return previous
+
+            started = time.perf_counter()
+            pois = await self.kto_service.get_all_metadata()
+            json_body, columnar_body, etag, row_hashes = await run_sync(_serialize, pois)
+            self._refreshes += 1
+
+            if previous is not None and previous.etag == etag:
+                print(f"[CATALOG] 변경 없음 (version={previous.version})")
+                return previous
+
+            by_id = {poi["content_id"]: poi for poi in pois}
+            version = int(time.time() * 1000)
+            change = None
+            if previous is None:
+                viewport = await run_sync(ViewportIndex, pois)
+            else:
+                version = max(version, previous.version + 1)
+                upserted, deleted = _diff(previous.row_hashes, row_hashes)
+                change = ChangeSet(previous.version, version, upserted, deleted)
+
+                # 바뀐 POI의 이전/현재 카테고리만 클러스터 재계산
+                changed_categories = {
+                    poi.get("content_type_id") or ""
+                    for poi in [by_id[cid] for cid in upserted]
+                    + [previous.by_id[cid] for cid in upserted | deleted if cid in previous.by_id]
+                }
+                viewport = await run_sync(ViewportIndex, pois, previous.viewport, changed_categories)
+                print(
+                    f"[CATALOG] 변경: 추가/수정 {len(upserted)}개, 삭제 {len(deleted)}개 "
+                    f"(클러스터 재계산 카테고리: {viewport.rebuilt})"
+                )
+
+            self.snapshot = CatalogSnapshot(
+                version=version,
+                etag=etag,
+                pois=pois,
+                by_id=by_id,
+                row_hashes=row_hashes,
+                json_body=json_body,
+                columnar_body=columnar_body,
+                viewport=viewport,
+                built_at=time.time()
+            )
+            # 이력은 스냅샷 교체 후에 추가 (그 사이 delta()가 새 변경분 + 이전 스냅샷을 섞어 반환하지 않도록)
+            if change is not None:
+                self._history.append(change)
+            print(
+                f"[CATALOG] 스냅샷 생성: version={self.snapshot.version}, {len(pois)}개 POI, "
+                f"json={len(json_body.identity) // 1024}KB (gzip {len(json_body.gzip) // 1024}KB), "
+                f"columnar={len(columnar_body.identity) // 1024}KB (gzip {len(columnar_body.gzip) // 1024}KB)"
+                f" ({(time.perf_counter() - started) * 1000:.0f}ms)"
+            )
+            return self.snapshot
+
+    def delta(self, since: int) -> Dict[str, Any]:
+        """
+        since 버전 이후 변경분
+
+        Returns:
+            {"version": 현재, "since": since, "full": False, "upserts": [POI, ...], "deleted": [content_id, ...]}
+            since를 이력에서 찾을 수 없으면 (재시작 전 버전, 오래된 버전) full=True + 전체 목록
+        """
+        snapshot = self.snapshot
+        if since == snapshot.version:
+            return {"version": snapshot.version, "since": since, "full": False, "upserts": [], "deleted": []}
+
+        history = list(self._history)
+        start = next((i for i, change in enumerate(history) if change.base_version == since), None)
+        if start is None:
+            return {"version": snapshot.version, "since": since, "full": True, "upserts": snapshot.pois, "deleted": []}
+
+        upserted: Set[str] = set()
+        deleted: Set[str] = set()
+        for change in history[start:]:
+            upserted -= change.deleted
+            deleted |= change.deleted
+            deleted -= change.upserted
+            upserted |= change.upserted
+
+        return {
+            "version": snapshot.version,
+            "since": since,
+            "full": False,
+            "upserts": [snapshot.by_id[cid] for cid in sorted(upserted) if cid in snapshot.by_id],
+            "deleted": sorted(deleted)
+        }
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(CATALOG_REFRESH_SECONDS)
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"[CATALOG] 주기적 갱신 실패 (기존 스냅샷 유지): {e}")
+
+    async def start(self):
+        """서비스 시작 시 스냅샷 생성 + 주기적 갱신 시작 (생성 실패 시 첫 요청에서 재시도)"""
+        try:
+            await self.refresh()
+        except Exception as e:
+            print(f"[CATALOG] 초기 스냅샷 생성 실패: {e}")
+
+        if CATALOG_REFRESH_SECONDS > 0 and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def stats(self) -> Dict[str, Any]:
+        snapshot = self.snapshot
+        if snapshot is None:
+            return {"loaded": False}
+        return {
+            "loaded": True,
+            "version": snapshot.version,
+            "etag": snapshot.etag,
+            "history": len(self._history),
+            "count": len(snapshot.pois),
+            "built_at": snapshot.built_at,
+            "bytes": {
+                "json": snapshot.json_body.sizes(),
+                "columnar": snapshot.columnar_body.sizes()
+            },
+            "viewport": snapshot.viewport.stats()
+        }
@@ -0,0 +1,109 @@
+"""
+KTO Columnar - POI 메타데이터 컬럼형 바이너리 포맷
+JSON 객체 배열은 POI마다 같은 키(content_id, cat1, first_image ...)를 반복
+→ 컬럼별 배열로 저장해 전송 크기와 클라이언트 파싱 시간 절감
+
+레이아웃 (리틀 엔디언):
+    [0:4]   b"KTOC"
+    [4:8]   uint32 헤더 길이
+    [8:]    UTF-8 JSON 헤더 → 이후 4바이트 정렬된 컬럼 섹션들
+헤더:
+    {"format": 1, "count": N, "columns": {이름: 컬럼 정보}}
+컬럼 정보 (offset은 버퍼 시작 기준 바이트 위치):
+    float32:     {"type": "float32", "offset"}                         → Float32Array(N)
+    dict_uint16: {"type": "dict_uint16", "offset", "values": [...]}    → Uint16Array(N), values[code] (0 = null)
+    string:      {"type": "string", "offsets", "data", "data_length"}  → Uint32Array(N + 1) + UTF-8 바이트 (빈 문자열 = null)
+"""
+
+import json
+import struct
+from array import array
+from typing import Any, Dict, List
+
+MAGIC = b"KTOC"
+FORMAT_VERSION = 1
+MEDIA_TYPE = "application/vnd.tripbee.kto-columnar"
+
+FLOAT_COLUMNS = ["lat", "lng"]
+DICT_COLUMNS = ["content_type_id", "cat1", "cat2", "cat3"]
+STRING_COLUMNS = ["content_id", "title", "addr1", "first_image"]
+
+
+def _little_endian(values: array) -> bytes:
+    if struct.pack("=H", 1) != struct.pack("<H", 1):
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_columnar(pois: List[Dict[str, Any]]) -> bytes:
+    """POI 메타데이터 목록 → 컬럼형 바이너리"""
+    sections: List[bytes] = []
+    columns: Dict[str, Dict[str, Any]] = {}
+    position = 0  # 섹션 영역 안에서의 위치 (헤더 길이가 정해진 뒤 절대 위치로 보정)
+
+    def add_section(data: bytes) -> int:
+        nonlocal position
+        start = position
+        padding = (-len(data)) % 4
+        sections.append(data + b"\0" * padding)
+        position += len(data) + padding
+        return start
+
+    for name in FLOAT_COLUMNS:
+        values = array("f", (float(poi.get(name) or 0.0) for poi in pois))
+        columns[name] = {"type": "float32", "offset": add_section(_little_endian(values))}
+
+    for name in DICT_COLUMNS:
+        dictionary: Dict[Any, int] = {None: 0}
+        codes = array("H", (dictionary.setdefault(poi.get(name) or None, len(dictionary)) for poi in pois))
+        if len(dictionary) > 0xFFFF:
+            raise ValueError(f"{name} 값 종류가 너무 많습니다 ({len(dictionary)})")
+        columns[name] = {
+            "type": "dict_uint16",
+            "offset": add_section(_little_endian(codes)),
+            "values": list(dictionary)
+        }
+
+    for name in STRING_COLUMNS:
+        encoded = [(poi.get(name) or "").encode("utf-8") for poi in pois]
+        offsets = array("I", [0])
+        total = 0
+        for item in encoded:
+            total += len(item)
+            offsets.append(total)
+        columns[name] = {
+            "type": "string",
+            "offsets": add_section(_little_endian(offsets)),
+            "data": add_section(b"".join(encoded)),
+            "data_length": total
+        }
+
+    def build_header(base: int) -> bytes:
+        shifted = {}
+        for name, column in columns.items():
+            shifted[name] = {
+                key: (value + base if key in ("offset", "offsets", "data") else value)
+                for key, value in column.items()
+            }
+        header = {"format": FORMAT_VERSION, "count": len(pois), "columns": shifted}
+        return json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    # 헤더 길이가 오프셋(숫자 자릿수)에 따라 달라지므로 길이가 안정될 때까지 반복
+    base = 0
+    while True:
+        header = build_header(base)
+        header_end = 8 + len(header)
+        new_base = header_end + (-header_end) % 4
+        if new_base == base:
+            break
+        base = new_base
+
+    header += b" " * (base - 8 - len(header))  # JSON 뒤 공백으로 4바이트 정렬
+    return MAGIC + struct.pack("<I", len(header)) + header + b"".join(sections)
+
+
+def wants_columnar(format_param: str, accept: str) -> bool:
+    """format=columnar 또는 Accept에 컬럼형 미디어 타입이 있으면 True"""
+    if format_param:
+        return format_param.lower() == "columnar"
+    return MEDIA_TYPE in (accept or "")
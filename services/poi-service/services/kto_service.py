@@ -4,7 +4,7 @@ KTO Service - KTO 관광 데이터 제공 서비스
 
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel
-from utils.db import get_sync_db_connection
+from utils.db import acquire
 
 
 # =====================================================================================
@@ -25,6 +25,11 @@ class POIMetadata(BaseModel):
     first_image: Optional[str] = None
 
 
+class KtoBatchRequest(BaseModel):
+    """content_id 일괄 조회 요청 (대화기록 복원용)"""
+    content_ids: List[str]
+
+
 # =====================================================================================
 # KTO SERVICE
 # =====================================================================================
@@ -35,7 +40,7 @@ class KtoService:
     def __init__(self):
         pass
 
-    def get_all_metadata(self) -> List[Dict[str, Any]]:
+    async def get_all_metadata(self) -> List[Dict[str, Any]]:
         """
         모든 POI 메타데이터 조회 (경량)
 
@@ -61,9 +66,6 @@ class KtoService:
         try:
             print(f"[KTO] 전체 POI 메타데이터 조회 요청")
 
-            conn = get_sync_db_connection()
-            cursor = conn.cursor()
-
             # 경량 메타데이터만 조회 (overview 제외)
             # 같은 좌표에 여러 POI가 있으면 content_type_id가 낮은 것만 선택
             query = """
@@ -107,10 +109,8 @@ class KtoService:
                 ORDER BY content_id
             """
 
-            cursor.execute(query)
-            results = cursor.fetchall()
-            cursor.close()
-            conn.close()
+            async with acquire() as conn:
+                results = await conn.fetch(query)
 
             # float 변환
             pois = []
@@ -138,7 +138,7 @@ class KtoService:
             traceback.print_exc()
             raise
 
-    def get_poi_detail(self, content_id: str) -> Dict[str, Any]:
+    async def get_poi_detail(self, content_id: str) -> Dict[str, Any]:
         """
         특정 POI 상세 정보 조회
 
@@ -169,9 +169,6 @@ class KtoService:
         try:
             print(f"[KTO] POI 상세 조회: {content_id}")
 
-            conn = get_sync_db_connection()
-            cursor = conn.cursor()
-
             query = """
                 SELECT
                     content_id,
@@ -191,14 +188,12 @@ class KtoService:
                     images_data
                 FROM KTO_TOUR_BASE_LIST
                 WHERE
-                    content_id = %s
+                    content_id = $1
                     AND language = 'Kor'
             """
 
-            cursor.execute(query, [content_id])
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            async with acquire() as conn:
+                result = await conn.fetchrow(query, content_id)
 
             if not result:
                 raise Exception(f"POI를 찾을 수 없습니다: {content_id}")
@@ -237,3 +232,89 @@ class KtoService:
             import traceback
             traceback.print_exc()
             raise
+
+    async def get_pois_by_ids(self, content_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        content_id 목록으로 POI 일괄 조회 (대화기록 복원용)
+
+        추천 결과(/api/recommend)와 같은 필드 구성으로 반환하며 입력 순서를 유지
+        (DB에 없는 content_id는 제외)
+
+        Args:
+            content_ids: POI content_id 목록
+
+        Returns:
+            [{"content_id": "126508", "title": "경복궁", "mapx": 126.977, "mapy": 37.5796, ...}]
+        """
+        try:
+            unique_ids = list(dict.fromkeys(str(cid) for cid in content_ids if cid))
+            if not unique_ids:
+                return []
+
+            print(f"[KTO] POI 일괄 조회: {len(unique_ids)}개")
+
+            query = """
+                SELECT
+                    content_id,
+                    content_type_id,
+                    title,
+                    overview,
+                    addr1,
+                    addr2,
+                    mapx,
+                    mapy,
+                    first_image,
+                    first_image2,
+                    cat1,
+                    cat2,
+                    cat3,
+                    is_parking_available,
+                    is_credit_card_ok,
+                    is_free_admission,
+                    is_currently_open,
+                    price_range,
+                    cuisine_type,
+                    accommodation_type
+                FROM KTO_TOUR_BASE_LIST
+                WHERE
+                    content_id = ANY($1::text[])
+                    AND language = 'Kor'
+            """
+
+            async with acquire() as conn:
+                results = await conn.fetch(query, unique_ids)
+
+            by_id = {}
+            for row in results:
+                by_id[row["content_id"]] = {
+                    "content_id": row["content_id"],
+                    "content_type_id": row["content_type_id"],
+                    "title": row["title"],
+                    "overview": row["overview"],
+                    "addr1": row["addr1"],
+                    "addr2": row["addr2"],
+                    "mapx": float(row["mapx"]) if row["mapx"] else None,
+                    "mapy": float(row["mapy"]) if row["mapy"] else None,
+                    "first_image": row["first_image"],
+                    "first_image2": row["first_image2"],
+                    "cat1": row["cat1"],
+                    "cat2": row["cat2"],
+                    "cat3": row["cat3"],
+                    "is_parking_available": row["is_parking_available"],
+                    "is_credit_card_ok": row["is_credit_card_ok"],
+                    "is_free_admission": row["is_free_admission"],
+                    "is_currently_open": row["is_currently_open"],
+                    "price_range": row["price_range"],
+                    "cuisine_type": row["cuisine_type"],
+                    "accommodation_type": row["accommodation_type"]
+                }
+
+            print(f"[KTO] POI 일괄 조회 반환: {len(by_id)}/{len(unique_ids)}개")
+
+            return [by_id[cid] for cid in unique_ids if cid in by_id]
+
+        except Exception as e:
+            print(f"[ERROR] {e}")
+            import traceback
+            traceback.print_exc()
+            raise
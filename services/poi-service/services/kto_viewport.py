@@ -0,0 +1,249 @@
+"""
+KTO Viewport Index - 지도 화면(bbox) + 줌 레벨별 POI 클러스터
+- 카탈로그 스냅샷으로부터 카테고리(content_type_id)별 · 줌 레벨별 클러스터를 미리 계산 (supercluster 방식)
+- 줌 레벨마다 타일 좌표 격자 인덱스 → bbox 조회는 화면에 걸친 셀만 확인
+- /api/kto/viewport 응답 크기가 도시 전체가 아니라 화면 크기에 비례
+- 카탈로그 변경 시 바뀐 카테고리만 다시 계산 (나머지는 이전 인덱스 재사용)
+"""
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# 클러스터를 계산할 줌 범위 (MAX_CLUSTER_ZOOM 초과는 개별 POI)
+MIN_ZOOM = 10
+MAX_CLUSTER_ZOOM = 16
+
+# 클러스터 반경 (타일 512px 기준 픽셀)
+CLUSTER_RADIUS_PX = 60
+TILE_EXTENT_PX = 512
+
+_MAX_LAT = 85.05112878
+
+
+def _lng_x(lng: float) -> float:
+    """경도 → Web Mercator x (0~1)"""
+    return lng / 360 + 0.5
+
+
+def _lat_y(lat: float) -> float:
+    """위도 → Web Mercator y (0~1)"""
+    sin = math.sin(math.radians(max(-_MAX_LAT, min(_MAX_LAT, lat))))
+    return 0.5 - 0.25 * math.log((1 + sin) / (1 - sin)) / math.pi
+
+
+def _x_lng(x: float) -> float:
+    return (x - 0.5) * 360
+
+
+def _y_lat(y: float) -> float:
+    return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y))))
+
+
+@dataclass
+class _Node:
+    """줌 레벨별 노드 (count == 1이면 개별 POI)"""
+    x: float
+    y: float
+    count: int
+    poi: Optional[Dict[str, Any]]  # count == 1일 때 카탈로그 POI
+    formed_zoom: int        # 클러스터가 만들어진 줌 (펼쳐지는 줌 = formed_zoom + 1)
+    node_id: int
+
+
+class _Level:
+    """한 줌 레벨의 노드 + 타일 좌표 격자 인덱스"""
+
+    def __init__(self, zoom: int, nodes: List[_Node]):
+        self.zoom = zoom
+        self.nodes = nodes
+        self.scale = 2 ** zoom
+        self.cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        for i, node in enumerate(nodes):
+            self.cells[(int(node.x * self.scale), int(node.y * self.scale))].append(i)
+
+    def query(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterable[_Node]:
+        """bbox(메르카토르 좌표) 안의 노드"""
+        scale = self.scale
+        x_cells = range(int(min_x * scale), int(max_x * scale) + 1)
+        y_cells = range(int(min_y * scale), int(max_y * scale) + 1)
+
+        # 화면이 채워진 셀 수보다 넓으면 (높은 줌에서 넓은 bbox) 셀 순회 대신 전체 확인
+        if len(x_cells) * len(y_cells) > len(self.cells):
+            candidates = range(len(self.nodes))
+        else:
+            candidates = (i for cx in x_cells for cy in y_cells for i in self.cells.get((cx, cy), ()))
+
+        for i in candidates:
+            node = self.nodes[i]
+            if min_x <= node.x <= max_x and min_y <= node.y <= max_y:
+                yield node
+
+
+def _cluster(nodes: List[_Node], zoom: int, next_id: int) -> Tuple[List[_Node], int]:
+    """한 단계 위 줌의 노드들을 반경 안에서 묶기 (가중 중심, 입력 순서대로 탐욕적 병합)"""
+    radius = CLUSTER_RADIUS_PX / (TILE_EXTENT_PX * 2 ** zoom)
+    grid: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for i, node in enumerate(nodes):
+        grid[(int(node.x / radius), int(node.y / radius))].append(i)
+
+    visited = [False] * len(nodes)
+    clustered: List[_Node] = []
+    radius_sq = radius * radius
+
+    for i, node in enumerate(nodes):
+        if visited[i]:
+            continue
+        visited[i] = True
+
+        members = [node]
+        gx, gy = int(node.x / radius), int(node.y / radius)
+        for cx in (gx - 1, gx, gx + 1):
+            for cy in (gy - 1, gy, gy + 1):
+                for j in grid.get((cx, cy), ()):
+                    if visited[j]:
+                        continue
+                    other = nodes[j]
+                    if (other.x - node.x) ** 2 + (other.y - node.y) ** 2 <= radius_sq:
+                        visited[j] = True
+                        members.append(other)
+
+        if len(members) == 1:
+            clustered.append(node)
+            continue
+
+        count = sum(member.count for member in members)
+        clustered.append(_Node(
+            x=sum(member.x * member.count for member in members) / count,
+            y=sum(member.y * member.count for member in members) / count,
+            count=count,
+            poi=None,
+            formed_zoom=zoom,
+            node_id=next_id
+        ))
+        next_id += 1
+
+    return clustered, next_id
+
+
+class ViewportIndex:
+    """카테고리별 줌 레벨 클러스터 인덱스 (스냅샷 생성 시 1회 계산, 이후 읽기 전용)"""
+
+    def __init__(
+        self,
+        pois: List[Dict[str, Any]],
+        previous: Optional["ViewportIndex"] = None,
+        changed_categories: Optional[Set[str]] = None
+    ):
+        """
+        Args:
+            pois: 카탈로그 POI 목록
+            previous: 이전 스냅샷의 인덱스 (있으면 changed_categories 외 카테고리는 재사용)
+            changed_categories: POI가 추가/수정/삭제된 content_type_id
+        """
+        # content_type_id → {zoom: _Level}
+        self.levels: Dict[str, Dict[int, _Level]] = {}
+        self._next_id = previous._next_id if previous else 0
+        self.rebuilt: List[str] = []
+
+        by_category: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for poi in pois:
+            if poi.get("lat") is None or poi.get("lng") is None:
+                continue
+            by_category[poi.get("content_type_id") or ""].append(poi)
+
+        for category, category_pois in by_category.items():
+            if previous is not None and changed_categories is not None \
+                    and category not in changed_categories and category in previous.levels:
+                self.levels[category] = previous.levels[category]
+                continue
+            self.levels[category] = self._build_levels(category_pois)
+            self.rebuilt.append(category)
+
+    def _build_levels(self, pois: List[Dict[str, Any]]) -> Dict[int, _Level]:
+        points = []
+        for poi in pois:
+            points.append(_Node(
+                x=_lng_x(poi["lng"]),
+                y=_lat_y(poi["lat"]),
+                count=1,
+                poi=poi,
+                formed_zoom=MAX_CLUSTER_ZOOM + 1,
+                node_id=self._next_id
+            ))
+            self._next_id += 1
+
+        levels = {MAX_CLUSTER_ZOOM + 1: _Level(MAX_CLUSTER_ZOOM + 1, points)}
+        nodes = points
+        for zoom in range(MAX_CLUSTER_ZOOM, MIN_ZOOM - 1, -1):
+            nodes, self._next_id = _cluster(nodes, zoom, self._next_id)
+            levels[zoom] = _Level(zoom, nodes)
+        return levels
+
+    @property
+    def categories(self) -> List[str]:
+        return sorted(self.levels)
+
+    def query(
+        self,
+        bbox: Tuple[float, float, float, float],
+        zoom: float,
+        categories: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        화면 안의 클러스터 + 개별 POI
+
+        Args:
+            bbox: (min_lng, min_lat, max_lng, max_lat)
+            zoom: 지도 줌 (소수점 버림, MIN_ZOOM 미만은 MIN_ZOOM으로)
+            categories: content_type_id 목록 (없으면 전체)
+
+        Returns:
+            {"zoom": 14, "clusters": [...], "points": [카탈로그 POI, ...]}
+        """
+        level_zoom = max(MIN_ZOOM, min(MAX_CLUSTER_ZOOM + 1, int(math.floor(zoom))))
+        min_lng, min_lat, max_lng, max_lat = bbox
+        min_x, max_x = _lng_x(min_lng), _lng_x(max_lng)
+        min_y, max_y = _lat_y(max_lat), _lat_y(min_lat)
+
+        clusters = []
+        points = []
+        for category in (categories or self.categories):
+            levels = self.levels.get(category)
+            if not levels:
+                continue
+            for node in levels[level_zoom].query(min_x, min_y, max_x, max_y):
+                if node.count == 1:
+                    points.append(node.poi)
+                    continue
+                clusters.append({
+                    "id": node.node_id,
+                    "lat": round(_y_lat(node.y), 6),
+                    "lng": round(_x_lng(node.x), 6),
+                    "count": node.count,
+                    "content_type_id": category,
+                    "expansion_zoom": node.formed_zoom + 1
+                })
+
+        return {"zoom": level_zoom, "clusters": clusters, "points": points}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "categories": len(self.levels),
+            "nodes_per_zoom": {
+                zoom: sum(len(levels[zoom].nodes) for levels in self.levels.values())
+                for zoom in range(MIN_ZOOM, MAX_CLUSTER_ZOOM + 2)
+            }
+        }
+
+
+def parse_bbox(value: str) -> Tuple[float, float, float, float]:
+    """'min_lng,min_lat,max_lng,max_lat' → 튜플 (형식 오류 시 ValueError)"""
+    parts = [float(part) for part in value.split(",")]
+    if len(parts) != 4:
+        raise ValueError("bbox는 min_lng,min_lat,max_lng,max_lat 형식이어야 합니다")
+    min_lng, min_lat, max_lng, max_lat = parts
+    if min_lng > max_lng or min_lat > max_lat:
+        raise ValueError("bbox 최소값이 최대값보다 큽니다")
+    return min_lng, min_lat, max_lng, max_lat
@@ -5,7 +5,7 @@ Landmark Service - 필수 명소 제공 서비스
 from typing import Optional, Dict, Any, List
 from pydantic import BaseModel
 from config import CONFIG
-from utils.db import get_sync_db_connection
+from utils.db import acquire
 
 
 # =====================================================================================
@@ -28,7 +28,7 @@ class LandmarkService:
     def __init__(self):
         pass
 
-    def get_landmarks(self, request: LandmarkRequest) -> Dict[str, Any]:
+    async def get_landmarks(self, request: LandmarkRequest) -> Dict[str, Any]:
         """
         필수 명소 조회
 
@@ -60,11 +60,8 @@ class LandmarkService:
 
             print(f"[LANDMARK] 요청: location={location_keyword}, limit={limit}")
 
-            conn = get_sync_db_connection()
-            cursor = conn.cursor()
-
             # LANDMARK_MAPPING과 KTO_TOUR_BASE_LIST 조인
-            cursor.execute("""
+            query = """
                 SELECT
                     lm.rank,
                     lm.content_id,
@@ -79,14 +76,13 @@ class LandmarkService:
                     poi.cat3
                 FROM LANDMARK_MAPPING lm
                 LEFT JOIN KTO_TOUR_BASE_LIST poi ON lm.content_id::VARCHAR = poi.content_id
-                WHERE lm.location_keyword = %s
+                WHERE lm.location_keyword = $1
                 ORDER BY lm.rank ASC
-                LIMIT %s
-            """, (location_keyword, limit))
+                LIMIT $2
+            """
 
-            results = cursor.fetchall()
-            cursor.close()
-            conn.close()
+            async with acquire() as conn:
+                results = await conn.fetch(query, location_keyword, limit)
 
             print(f"[LANDMARK] 결과: {len(results)}개 명소")
 
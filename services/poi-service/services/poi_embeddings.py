@@ -0,0 +1,313 @@
+"""
+POI Embeddings - POI별 임베딩 행렬 + IVF 근사 최근접 검색 (Vector 대안 검색)
+- 기존 Vector 대안 검색은 POI를 카테고리(cat1/cat2/cat3)와 JOIN해 카테고리 벡터를 물려받고
+  SELECT DISTINCT + 전체 정렬 → 인덱스 불가, 같은 카테고리 POI는 모두 같은 점수
+- 오프라인 빌드: 제목 + 카테고리 이름 + 개요로 POI마다 임베딩 → 정규화 float32 행렬 + IVF(k-means) 파일
+    cd services/poi-service && python -m services.poi_embeddings
+    (텍스트가 바뀌지 않은 POI는 기존 벡터 재사용)
+- 서비스: 파일을 메모리에 올려 코사인 top-k 검색
+    geometry 후보가 있으면 후보만 정확 계산, 없으면 IVF 상위 클러스터(nprobe)만 계산
+"""
+
+import asyncio
+import hashlib
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.db import acquire, run_sync
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+EMBEDDINGS_PATH = Path(os.getenv(
+    "POI_EMBEDDINGS_PATH",
+    Path(__file__).resolve().parent.parent / "data" / "poi_embeddings.npz"
+))
+
+# 쿼리 임베딩과 같은 모델이어야 함 (beaty Vector 대안 검색 / 추천 쿼리 임베딩)
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# 임베딩 입력에 넣을 개요 최대 길이 + API 배치 크기
+OVERVIEW_CHARS = 1000
+BATCH_SIZE = 256
+
+# IVF: 클러스터 수 = sqrt(N) (최소 1), 검색 시 확인할 클러스터 수
+IVF_PROBES = int(os.getenv("POI_EMBEDDINGS_IVF_PROBES", 16))
+IVF_TRAIN_SAMPLE = 8192
+IVF_ITERATIONS = 10
+
+# 이 수 이하는 IVF 없이 전부 계산
+EXACT_SEARCH_MAX = 4096
+
+SOURCE_QUERY = """
+    SELECT content_id, title, overview, cat1, cat2, cat3
+    FROM KTO_TOUR_BASE_LIST
+    WHERE
+        language = 'Kor'
+        AND title IS NOT NULL
+        AND mapx IS NOT NULL
+        AND mapy IS NOT NULL
+"""
+
+CATEGORY_NAME_QUERY = """
+    SELECT cat_code, name
+    FROM kto_tour_category
+    WHERE lang = 'ko'
+"""
+
+
+def poi_text(row: Dict[str, Any], category_names: Dict[str, str]) -> str:
+    """임베딩 입력 텍스트: 제목 / 카테고리 이름 (대 > 중 > 소) / 개요 앞부분"""
+    categories = " > ".join(
+        category_names[code] for code in (row["cat1"], row["cat2"], row["cat3"]) if code in category_names
+    )
+    overview = (row["overview"] or "")[:OVERVIEW_CHARS]
+    return "\n".join(part for part in (row["title"], categories, overview) if part)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.blake2b(f"{EMBEDDING_MODEL}\n{text}".encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _normalize(matrix):
+    return matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+
+
+def _top_k(scores, k: int):
+    """점수 상위 k개 위치 (내림차순)"""
+    if len(scores) > k:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def train_ivf(vectors, seed: int = 0):
+    """
+    구면 k-means (코사인) → (중심 (nlist, 차원), 행별 클러스터 번호 (N,))
+
+    표본으로 중심을 학습한 뒤 전체 행을 가장 가까운 중심에 배정
+    """
+    rng = np.random.default_rng(seed)
+    nlist = max(1, int(np.sqrt(len(vectors))))
+    sample = vectors[rng.choice(len(vectors), min(len(vectors), IVF_TRAIN_SAMPLE), replace=False)]
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+    for _ in range(IVF_ITERATIONS):
+        assignment = np.argmax(sample @ centroids.T, axis=1)
+        for cluster in range(nlist):
+            members = sample[assignment == cluster]
+            if len(members):
+                centroids[cluster] = members.sum(axis=0)
+        centroids = _normalize(centroids)
+
+    assignments = np.concatenate([
+        np.argmax(vectors[start:start + 4096] @ centroids.T, axis=1)
+        for start in range(0, len(vectors), 4096)
+    ])
+    return centroids.astype(np.float32), assignments.astype(np.int32)
+
+
+async def build_embeddings(client, path: Path = EMBEDDINGS_PATH) -> Dict[str, Any]:
+    """
+    POI 임베딩 파일 생성/갱신 (오프라인)
+
+    Args:
+        client: OpenAI 클라이언트 (동기)
+        path: 저장 경로 (.npz)
+    """
+    async with acquire() as conn:
+        rows = await conn.fetch(SOURCE_QUERY)
+        category_names = {row["cat_code"]: row["name"] for row in await conn.fetch(CATEGORY_NAME_QUERY)}
+
+    # 기존 파일에서 텍스트가 같은 POI 벡터 재사용
+    previous: Dict[str, Any] = {}
+    if path.exists():
+        with np.load(path) as data:
+            for text_hash, vector in zip(data["text_hashes"], data["vectors"]):
+                previous[str(text_hash)] = vector
+
+    content_ids: List[str] = []
+    text_hashes: List[str] = []
+    vectors: List[Any] = []
+    pending: List[Tuple[int, str]] = []
+    for row in rows:
+        text = poi_text(row, category_names)
+        text_hash = _text_hash(text)
+        content_ids.append(row["content_id"])
+        text_hashes.append(text_hash)
+        vectors.append(previous.get(text_hash))
+        if vectors[-1] is None:
+            pending.append((len(vectors) - 1, text))
+
+    print(f"[POI_EMBEDDINGS] POI {len(rows)}개 (재사용 {len(rows) - len(pending)}개, 새로 계산 {len(pending)}개)")
+
+    for start in range(0, len(pending), BATCH_SIZE):
+        batch = pending[start:start + BATCH_SIZE]
+        response = await run_sync(client.embeddings.create, model=EMBEDDING_MODEL, input=[text for _, text in batch])
+        for (row_index, _), item in zip(batch, response.data):
+            vectors[row_index] = item.embedding
+        print(f"[POI_EMBEDDINGS] 임베딩 {min(start + BATCH_SIZE, len(pending))}/{len(pending)}")
+
+    matrix = _normalize(np.asarray(vectors, dtype=np.float32))
+    centroids, assignments = await run_sync(train_ivf, matrix)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(".tmp.npz")
+    np.savez(
+        temp_path,
+        content_ids=np.asarray(content_ids),
+        text_hashes=np.asarray(text_hashes),
+        vectors=matrix,
+        centroids=centroids,
+        assignments=assignments,
+        model=np.asarray(EMBEDDING_MODEL)
+    )
+    os.replace(temp_path, path)
+
+    print(f"[POI_EMBEDDINGS] 저장 완료: {path} ({matrix.shape[0]}×{matrix.shape[1]}, IVF {len(centroids)}개)")
+    return {"count": matrix.shape[0], "dimension": matrix.shape[1], "computed": len(pending), "lists": len(centroids)}
+
+
+class PoiEmbeddingIndex:
+    """POI 임베딩 행렬 + IVF 인덱스 (읽기 전용, 파일 다시 읽기로 교체)"""
+
+    def __init__(self, path: Path = EMBEDDINGS_PATH):
+        self.path = path
+        self.content_ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.vectors = None       # (N, 차원) float32, 정규화
+        self.centroids = None     # (nlist, 차원) float32
+        self.list_order = None    # 클러스터 순으로 정렬한 행 번호
+        self.list_offsets = None  # 클러스터 c의 행 = list_order[offsets[c]:offsets[c + 1]]
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.vectors is not None
+
+    @property
+    def dimension(self) -> int:
+        return self.vectors.shape[1] if self.vectors is not None else 0
+
+    def _load_file(self):
+        with np.load(self.path) as data:
+            model = str(data["model"])
+            if model != EMBEDDING_MODEL:
+                raise ValueError(f"임베딩 모델 불일치 ({model} != {EMBEDDING_MODEL})")
+            content_ids = [str(content_id) for content_id in data["content_ids"]]
+            vectors = np.ascontiguousarray(data["vectors"], dtype=np.float32)
+            if "centroids" in data and len(data["assignments"]) == len(vectors):
+                centroids, assignments = data["centroids"], data["assignments"]
+            else:
+                centroids, assignments = train_ivf(vectors)
+
+        list_order = np.argsort(assignments, kind="stable")
+        list_offsets = np.searchsorted(assignments[list_order], np.arange(len(centroids) + 1))
+        return content_ids, vectors, centroids, list_order, list_offsets
+
+    async def load(self):
+        if not NUMPY_AVAILABLE:
+            print("[POI_EMBEDDINGS] numpy 없음 - POI 임베딩 검색 사용 안 함")
+            return
+        if not self.path.exists():
+            print(f"[POI_EMBEDDINGS] 임베딩 파일 없음: {self.path} (python -m services.poi_embeddings 로 생성)")
+            return
+
+        async with self._lock:
+            content_ids, vectors, centroids, list_order, list_offsets = await run_sync(self._load_file)
+            self.content_ids = content_ids
+            self.rows = {content_id: i for i, content_id in enumerate(content_ids)}
+            self.vectors = vectors
+            self.centroids = centroids
+            self.list_order = list_order
+            self.list_offsets = list_offsets
+            print(f"[POI_EMBEDDINGS] POI {len(content_ids)}개 ({vectors.shape[1]}차원, IVF {len(centroids)}개)")
+
+    async def start(self):
+        try:
+            await self.load()
+        except Exception as e:
+            print(f"[POI_EMBEDDINGS] 임베딩 로드 실패: {e}")
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        k: int = 10,
+        candidate_ids: Optional[Sequence[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        코사인 유사도 top-k [(content_id, similarity), ...]
+
+        Args:
+            query_vector: 쿼리 임베딩 (EMBEDDING_MODEL)
+            k: 결과 수
+            candidate_ids: 후보 content_id (geometry 필터 결과, 있으면 후보만 정확 계산)
+        """
+        query = np.asarray(query_vector, dtype=np.float32)
+        if query.shape[0] != self.dimension:
+            raise ValueError(f"쿼리 임베딩 차원 불일치 ({query.shape[0]} != {self.dimension})")
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        if candidate_ids is not None:
+            rows = np.fromiter(
+                (self.rows[content_id] for content_id in candidate_ids if content_id in self.rows),
+                dtype=np.int64
+            )
+        elif len(self.content_ids) <= EXACT_SEARCH_MAX:
+            rows = None
+        else:
+            probes = _top_k(self.centroids @ query, min(IVF_PROBES, len(self.centroids)))
+            rows = np.concatenate([
+                self.list_order[self.list_offsets[cluster]:self.list_offsets[cluster + 1]]
+                for cluster in probes
+            ])
+
+        if rows is None:
+            scores = self.vectors @ query
+            best = _top_k(scores, k)
+            return [(self.content_ids[i], float(scores[i])) for i in best]
+
+        if len(rows) == 0:
+            return []
+        scores = self.vectors[rows] @ query
+        best = _top_k(scores, k)
+        return [(self.content_ids[rows[i]], float(scores[i])) for i in best]
+
+    def vectors_for(self, pois: List[Dict[str, Any]]) -> Optional[Tuple[Any, Any]]:
+        """POI 목록 → (벡터 행렬 (n, 차원), 벡터 있음 여부 (n,)) - HybridRanker 입력 (CategoryVectorStore와 같은 형식)"""
+        if self.vectors is None:
+            return None
+        rows = np.array([self.rows.get(poi.get("content_id"), -1) for poi in pois], dtype=np.int64)
+        mask = rows >= 0
+        return self.vectors[np.where(mask, rows, 0)], mask
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "count": len(self.content_ids),
+            "dimension": self.dimension,
+            "lists": len(self.centroids) if self.centroids is not None else 0
+        }
+
+
+async def _main():
+    from openai import OpenAI
+    from config import CONFIG, OPENAI_BASE_URL
+    from utils.db import init_db_pool, close_db_pool
+
+    await init_db_pool()
+    try:
+        client = OpenAI(api_key=CONFIG["openai_api_key"], base_url=OPENAI_BASE_URL)
+        await build_embeddings(client)
+    finally:
+        await close_db_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
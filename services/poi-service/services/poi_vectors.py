@@ -0,0 +1,100 @@
+"""
+POI Vectors - 추천 랭킹용 POI 벡터 (카테고리 임베딩)
+- kto_tour_category 임베딩을 서비스 시작 시 한 번 읽어 정규화된 float32 행렬로 보관
+- POI 벡터 = 가장 구체적인 카테고리(cat3 → cat2 → cat1)의 임베딩 (Vector 대안 검색과 같은 기준)
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.db import acquire
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+CATEGORY_QUERY = """
+    SELECT cat_code, embedding::text AS embedding
+    FROM kto_tour_category
+    WHERE lang = 'ko' AND embedding IS NOT NULL
+"""
+
+
+def parse_vector(value: str) -> List[float]:
+    """pgvector 텍스트 '[0.1,0.2,...]' → float 목록"""
+    return json.loads(value)
+
+
+class CategoryVectorStore:
+    """카테고리 코드 → 정규화 임베딩"""
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.matrix = None  # (카테고리 수, 차원) float32, 행 단위 L2 정규화
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.matrix is not None
+
+    @property
+    def dimension(self) -> int:
+        return self.matrix.shape[1] if self.matrix is not None else 0
+
+    async def load(self):
+        if not NUMPY_AVAILABLE:
+            print("[POI_VECTORS] numpy 없음 - 벡터 신호 사용 안 함")
+            return
+
+        async with self._lock:
+            async with acquire() as conn:
+                rows = await conn.fetch(CATEGORY_QUERY)
+
+            codes = {}
+            vectors = []
+            for row in rows:
+                codes[row["cat_code"]] = len(vectors)
+                vectors.append(parse_vector(row["embedding"]))
+
+            if not vectors:
+                print("[POI_VECTORS] 카테고리 임베딩 없음")
+                return
+
+            matrix = np.asarray(vectors, dtype=np.float32)
+            matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+            self.codes = codes
+            self.matrix = matrix
+            print(f"[POI_VECTORS] 카테고리 임베딩 {len(codes)}개 ({matrix.shape[1]}차원)")
+
+    async def start(self):
+        try:
+            await self.load()
+        except Exception as e:
+            print(f"[POI_VECTORS] 카테고리 임베딩 로드 실패: {e}")
+
+    def vectors_for(self, pois: List[Dict[str, Any]]) -> Optional[Tuple[Any, Any]]:
+        """
+        POI 목록 → (벡터 행렬 (n, 차원), 벡터 있음 여부 (n,))
+
+        카테고리 임베딩이 없으면 None
+        """
+        if self.matrix is None:
+            return None
+
+        rows = np.zeros(len(pois), dtype=np.int64)
+        mask = np.zeros(len(pois), dtype=bool)
+        for i, poi in enumerate(pois):
+            for key in ("cat3", "cat2", "cat1"):
+                row = self.codes.get(poi.get(key))
+                if row is not None:
+                    rows[i] = row
+                    mask[i] = True
+                    break
+        return self.matrix[rows], mask
+
+    def stats(self) -> Dict[str, Any]:
+        return {"loaded": self.loaded, "categories": len(self.codes), "dimension": self.dimension}
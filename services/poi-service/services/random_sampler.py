@@ -0,0 +1,230 @@
+"""
+Random POI Sampler - 메모리 기반 랜덤 POI 추출
+- 추천 가능한 POI(overview 50자 초과 등)를 서비스 시작 시 한 번 읽어 균일 위경도 격자에 분류
+- 반경 검색: 반경을 덮는 셀들에서 POI 수에 비례해 뽑고 반경 밖이면 다시 뽑기 (기대 상수 시간)
+- 세션별 중복 방지 덱: 같은 세션에는 후보를 모두 보여줄 때까지 같은 POI를 다시 추천하지 않음
+"""
+
+import asyncio
+import math
+import os
+import random
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.db import acquire
+
+# 격자 셀 크기 (도) - 위도 0.01도 ≈ 1.1km
+CELL_DEG = 0.01
+
+# 반경 검색에서 다시 뽑기 최대 횟수 (초과 시 후보 셀 전체 확인)
+MAX_ATTEMPTS = 16
+
+# 중복 방지 덱을 유지할 최대 세션 수 (오래된 세션부터 제거)
+MAX_SESSIONS = int(os.getenv("RANDOM_DECK_MAX_SESSIONS", 10000))
+
+# 후보 POI 다시 읽기 간격(초), 0이면 다시 읽지 않음
+POOL_REFRESH_SECONDS = float(os.getenv("RANDOM_POOL_REFRESH_SECONDS", 3600))
+
+EARTH_RADIUS_M = 6371000
+
+POOL_QUERY = """
+    SELECT
+        content_id,
+        title,
+        addr1,
+        mapx,
+        mapy,
+        first_image,
+        overview,
+        content_type_id,
+        cat1,
+        cat2,
+        cat3
+    FROM KTO_TOUR_BASE_LIST
+    WHERE
+        language = 'Kor'
+        AND mapx IS NOT NULL
+        AND mapy IS NOT NULL
+        AND title IS NOT NULL
+        AND overview IS NOT NULL
+        AND LENGTH(overview) > 50
+"""
+
+
+def haversine_m(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 좌표 사이 거리 (미터)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def _cell(lat: float, lng: float) -> Tuple[int, int]:
+    return int(math.floor(lat / CELL_DEG)), int(math.floor(lng / CELL_DEG))
+
+
+class RandomPoiSampler:
+    """추천 가능한 POI 메모리 풀 + 격자 인덱스 + 세션별 중복 방지 덱"""
+
+    def __init__(self):
+        self.pool: List[Dict[str, Any]] = []
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self._decks: "OrderedDict[str, Set[str]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self.pool)
+
+    async def load(self):
+        """DB에서 후보 POI를 읽어 풀/격자 교체"""
+        async with self._lock:
+            async with acquire() as conn:
+                rows = await conn.fetch(POOL_QUERY)
+
+            pool = []
+            cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+            for row in rows:
+                poi = dict(row)
+                poi["mapx"] = float(poi["mapx"])
+                poi["mapy"] = float(poi["mapy"])
+                cells[_cell(poi["mapy"], poi["mapx"])].append(len(pool))
+                pool.append(poi)
+
+            self.pool = pool
+            self.cells = dict(cells)
+            print(f"[RANDOM_SAMPLER] 후보 POI {len(pool)}개, 격자 셀 {len(cells)}개")
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(POOL_REFRESH_SECONDS)
+            try:
+                await self.load()
+            except Exception as e:
+                print(f"[RANDOM_SAMPLER] 주기적 갱신 실패 (기존 풀 유지): {e}")
+
+    async def start(self):
+        """서비스 시작 시 풀 생성 + 주기적 갱신 시작 (실패 시 첫 요청에서 재시도)"""
+        try:
+            await self.load()
+        except Exception as e:
+            print(f"[RANDOM_SAMPLER] 초기 풀 생성 실패: {e}")
+
+        if POOL_REFRESH_SECONDS > 0 and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    def _deck(self, session: Optional[str]) -> Set[str]:
+        """세션이 이미 추천받은 content_id (세션 없으면 빈 집합)"""
+        if not session:
+            return set()
+        deck = self._decks.get(session)
+        if deck is None:
+            deck = self._decks[session] = set()
+            while len(self._decks) > MAX_SESSIONS:
+                self._decks.popitem(last=False)
+        else:
+            self._decks.move_to_end(session)
+        return deck
+
+    def sample(
+        self,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        radius_m: float = 1500,
+        session: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        랜덤 POI 1개 (후보가 없으면 None)
+
+        Args:
+            lat, lng: 사용자 위치 (있으면 반경 radius_m 이내에서만)
+            radius_m: 반경 (미터)
+            session: 중복 방지 덱 키 (없으면 매번 독립 추출)
+        """
+        seen = self._deck(session)
+        if lat is not None and lng is not None:
+            poi = self._sample_radius(lat, lng, radius_m, seen)
+        else:
+            poi = self._sample_all(seen)
+
+        if poi is not None and session:
+            seen.add(poi["content_id"])
+        return poi
+
+    def _sample_all(self, seen: Set[str]) -> Optional[Dict[str, Any]]:
+        if not self.pool:
+            return None
+        if len(seen) >= len(self.pool):
+            seen.clear()
+
+        for _ in range(MAX_ATTEMPTS):
+            poi = random.choice(self.pool)
+            if poi["content_id"] not in seen:
+                return poi
+
+        unseen = [poi for poi in self.pool if poi["content_id"] not in seen]
+        if not unseen:
+            seen.clear()
+            unseen = self.pool
+        return random.choice(unseen)
+
+    def _sample_radius(self, lat: float, lng: float, radius_m: float, seen: Set[str]) -> Optional[Dict[str, Any]]:
+        # 반경을 덮는 셀 범위
+        lat_span = math.degrees(radius_m / EARTH_RADIUS_M)
+        lng_span = lat_span / max(math.cos(math.radians(lat)), 1e-6)
+        min_row, min_col = _cell(lat - lat_span, lng - lng_span)
+        max_row, max_col = _cell(lat + lat_span, lng + lng_span)
+
+        candidate_cells = [
+            self.cells[(row, col)]
+            for row in range(min_row, max_row + 1)
+            for col in range(min_col, max_col + 1)
+            if (row, col) in self.cells
+        ]
+        if not candidate_cells:
+            return None
+
+        # POI 수에 비례해 셀 선택 → 후보 셀 안의 POI 전체에서 균등 추출
+        cumulative = list(accumulate(len(cell) for cell in candidate_cells))
+        total = cumulative[-1]
+        for _ in range(MAX_ATTEMPTS):
+            pick = random.randrange(total)
+            cell_index = bisect_right(cumulative, pick)
+            offset = pick - (cumulative[cell_index - 1] if cell_index else 0)
+            poi = self.pool[candidate_cells[cell_index][offset]]
+            if poi["content_id"] not in seen and haversine_m(lat, lng, poi["mapy"], poi["mapx"]) <= radius_m:
+                return poi
+
+        # 반경 안 후보가 드물면 후보 셀을 직접 확인
+        in_radius = [
+            self.pool[i]
+            for cell in candidate_cells
+            for i in cell
+            if haversine_m(lat, lng, self.pool[i]["mapy"], self.pool[i]["mapx"]) <= radius_m
+        ]
+        if not in_radius:
+            return None
+
+        unseen = [poi for poi in in_radius if poi["content_id"] not in seen]
+        if not unseen:
+            # 이 지역 후보를 모두 보여줌 → 덱에서 이 지역만 비우고 다시 시작
+            seen.difference_update(poi["content_id"] for poi in in_radius)
+            unseen = in_radius
+        return random.choice(unseen)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pool": len(self.pool),
+            "cells": len(self.cells),
+            "sessions": len(self._decks)
+        }
@@ -5,8 +5,9 @@ Random POI Service - 랜덤 장소 추천 서비스
 from typing import Optional, Dict, Any
 from pydantic import BaseModel
 from openai import OpenAI
-from config import CONFIG
-from utils.db import get_sync_db_connection
+from config import CONFIG, OPENAI_BASE_URL
+from utils.db import run_sync
+from .random_sampler import RandomPoiSampler
 
 
 # =====================================================================================
@@ -17,6 +18,7 @@ class RandomPoiRequest(BaseModel):
     """랜덤 POI 요청"""
     lat: Optional[float] = None
     lng: Optional[float] = None
+    session: Optional[str] = None
 
 
 # =====================================================================================
@@ -27,9 +29,15 @@ class RandomPoiService:
     """랜덤 POI 추천 서비스"""
 
     def __init__(self):
-        self.client = OpenAI(api_key=CONFIG["openai_api_key"])
-
-    def get_random_poi(self, lat: Optional[float] = None, lng: Optional[float] = None) -> Dict[str, Any]:
+        self.client = OpenAI(api_key=CONFIG["openai_api_key"], base_url=OPENAI_BASE_URL)
+        self.sampler = RandomPoiSampler()
+
+    async def get_random_poi(
+        self,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        session: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         랜덤 POI 조회 및 Beaty 소개
 
@@ -37,6 +45,7 @@ class RandomPoiService:
             lat: 사용자 위치 위도 (optional)
             lng: 사용자 위치 경도 (optional)
             - lat/lng가 제공되면 반경 1.5km 이내의 POI만 조회
+            session: 세션 키 (optional) - 같은 세션에는 후보를 다 보여줄 때까지 중복 추천 안 함
 
         Returns:
             {
@@ -59,81 +68,12 @@ class RandomPoiService:
             else:
                 print("[RANDOM_POI] 랜덤 POI 요청 (전체 지역)")
 
-            conn = get_sync_db_connection()
-            cursor = conn.cursor()
-
-            # KTO_TOUR_BASE_LIST에서 랜덤으로 1개 선택
-            # 조건: language = 'Kor' (한국어), mapx, mapy, title이 있고, overview가 있는 것
-            # + 사용자 위치가 있으면 반경 1.5km 이내 필터링
-
-            if lat is not None and lng is not None:
-                # Haversine 거리 계산 (단위: 미터)
-                query = """
-                    SELECT
-                        content_id,
-                        title,
-                        addr1,
-                        mapx,
-                        mapy,
-                        first_image,
-                        overview,
-                        content_type_id,
-                        cat1,
-                        cat2,
-                        cat3,
-                        (6371000 * acos(
-                            cos(radians(%s)) * cos(radians(mapy)) *
-                            cos(radians(mapx) - radians(%s)) +
-                            sin(radians(%s)) * sin(radians(mapy))
-                        )) AS distance
-                    FROM KTO_TOUR_BASE_LIST
-                    WHERE
-                        language = 'Kor'
-                        AND mapx IS NOT NULL
-                        AND mapy IS NOT NULL
-                        AND title IS NOT NULL
-                        AND overview IS NOT NULL
-                        AND LENGTH(overview) > 50
-                        AND (6371000 * acos(
-                            cos(radians(%s)) * cos(radians(mapy)) *
-                            cos(radians(mapx) - radians(%s)) +
-                            sin(radians(%s)) * sin(radians(mapy))
-                        )) <= 1500
-                    ORDER BY RANDOM()
-                    LIMIT 1
-                """
-                cursor.execute(query, [lat, lng, lat, lat, lng, lat])
-            else:
-                # 전체 지역에서 랜덤 선택
-                query = """
-                    SELECT
-                        content_id,
-                        title,
-                        addr1,
-                        mapx,
-                        mapy,
-                        first_image,
-                        overview,
-                        content_type_id,
-                        cat1,
-                        cat2,
-                        cat3
-                    FROM KTO_TOUR_BASE_LIST
-                    WHERE
-                        language = 'Kor'
-                        AND mapx IS NOT NULL
-                        AND mapy IS NOT NULL
-                        AND title IS NOT NULL
-                        AND overview IS NOT NULL
-                        AND LENGTH(overview) > 50
-                    ORDER BY RANDOM()
-                    LIMIT 1
-                """
-                cursor.execute(query)
-
-            result = cursor.fetchone()
-            cursor.close()
-            conn.close()
+            # 메모리 후보 풀에서 랜덤으로 1개 선택 (DB 조회 없음)
+            # 조건: language = 'Kor', 좌표/제목 있음, overview 50자 초과
+            # + 사용자 위치가 있으면 반경 1.5km 이내
+            if not self.sampler.loaded:
+                await self.sampler.load()
+            result = self.sampler.sample(lat=lat, lng=lng, radius_m=1500, session=session)
 
             if not result:
                 raise Exception("POI를 찾을 수 없습니다")
@@ -153,7 +93,9 @@ class RandomPoiService:
 장소명은 그대로 유지하고, 친근하고 매력적으로 설명해주세요.
 "~예요", "~해요" 같은 존댓말 반말 섞인 톤으로 해주세요."""
 
-                response = self.client.chat.completions.create(
+                # 동기 OpenAI 클라이언트 → 스레드 풀에서 실행 (이벤트 루프 블로킹 방지)
+                response = await run_sync(
+                    self.client.chat.completions.create,
                     model="gpt-4o-mini",
                     messages=[
                         {"role": "system", "content": "당신은 귀엽고 친근한 서울 여행 가이드 비티입니다."},
@@ -3,12 +3,30 @@ Recommend Service - POI 검색 엔진
 CategoryVector + MasterPosition 결과를 받아 실제 POI 검색 수행
 """
 
+import asyncio
 import json
+import os
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel
 from openai import OpenAI
-from config import CONFIG
-from utils.db import get_async_db_connection
+from config import CONFIG, OPENAI_BASE_URL
+from utils.db import acquire, run_sync
+from .keyword_index import KeywordIndex, KeywordMatch
+from .hybrid_ranker import HybridRanker
+from .poi_vectors import CategoryVectorStore
+from .poi_embeddings import EMBEDDING_MODEL, PoiEmbeddingIndex
+
+# 하이브리드 랭킹 사용 시 카테고리별 SQL 후보 수 = limit × 배수 (최종 limit개는 랭커가 선택)
+CANDIDATE_MULTIPLIER = int(os.getenv("RECOMMEND_CANDIDATE_MULTIPLIER", 5))
+
+# 쿼리 임베딩 모델 (POI 임베딩 / kto_tour_category 임베딩과 같은 모델) + 캐시 크기
+QUERY_EMBEDDING_MODEL = EMBEDDING_MODEL
+QUERY_EMBEDDING_CACHE_SIZE = 512
+
+# Vector 대안 검색 결과 컬럼
+VECTOR_RESULT_COLUMNS = """t.content_id, t.title, t.mapx, t.mapy, t.addr1, t.cat1, t.cat2, t.cat3,
+                t.content_type_id, t.first_image, t.overview"""
 
 
 # =====================================================================================
@@ -30,6 +48,14 @@ class RecommendRequest(BaseModel):
     core_keywords: Optional[List[str]] = None
     limit: int = 10
     min_poi_count: int = 5  # 최소 POI 개수 (순차 검색 중단 기준)
+    embedding: Optional[List[float]] = None  # 랭킹용 쿼리 임베딩 (beaty가 LLM 스케줄러로 생성), 없으면 query_text로 생성
+
+
+class VectorSearchRequest(BaseModel):
+    embedding: Optional[List[float]] = None  # 쿼리 임베딩 (text-embedding-3-small), 없으면 query_text로 생성
+    query_text: Optional[str] = None
+    geometry_id: Optional[int] = None
+    limit: int = 10
 
 
 # =====================================================================================
@@ -40,7 +66,12 @@ class RecommendService:
     """POI 추천 검색 서비스"""
 
     def __init__(self):
-        self.client = OpenAI(api_key=CONFIG["openai_api_key"])
+        self.client = OpenAI(api_key=CONFIG["openai_api_key"], base_url=OPENAI_BASE_URL)
+        self.keyword_index = KeywordIndex()
+        self.category_vectors = CategoryVectorStore()
+        self.poi_embeddings = PoiEmbeddingIndex()
+        self.ranker = HybridRanker()
+        self._query_embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
 
     def generate_emotion_embedding(self, emotions: List[str]) -> List[float]:
         """감정/분위기 키워드를 벡터 임베딩으로 변환"""
@@ -54,6 +85,29 @@ class RecommendService:
         )
         return response.data[0].embedding
 
+    async def embed_query(self, text: str) -> Optional[List[float]]:
+        """리라이트된 쿼리 임베딩 (LRU 캐시, 실패 시 None → vector 신호 없이 랭킹)"""
+        cached = self._query_embeddings.get(text)
+        if cached is not None:
+            self._query_embeddings.move_to_end(text)
+            return cached
+
+        try:
+            response = await run_sync(
+                self.client.embeddings.create,
+                model=QUERY_EMBEDDING_MODEL,
+                input=text
+            )
+        except Exception as e:
+            print(f"[RECOMMEND] 쿼리 임베딩 실패: {e}")
+            return None
+
+        embedding = response.data[0].embedding
+        self._query_embeddings[text] = embedding
+        while len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embeddings.popitem(last=False)
+        return embedding
+
     async def get_geometry_info(self, geometry_id: int, conn) -> Optional[Dict]:
         """geometry_id로 geometry 정보 조회"""
         query = """
@@ -70,15 +124,43 @@ class RecommendService:
             }
         return None
 
-    async def _search_single_category(
+    def _geometry_condition(self, geometry_info: Dict, param_idx: int, column: str = "location") -> str:
+        """geometry 위치 조건 (POLYGON: Intersects / POINT: 1500m 반경), 파라미터는 GeoJSON 문자열 1개"""
+        geom_type = geometry_info["geom_type"].upper()
+        if geom_type in ['POLYGON', 'MULTIPOLYGON']:
+            return f"ST_Intersects({column}, ST_GeomFromGeoJSON(${param_idx}))"
+        return f"ST_DWithin({column}::geography, ST_GeomFromGeoJSON(${param_idx})::geography, 1500)"
+
+    def _category_condition(self, category_id: Optional[str], param_idx: int) -> Optional[str]:
+        """category_id 길이로 cat level 결정 (cat1: 3자리 A02 / cat2: 5자리 A0201 / cat3: 9자리 A02010100)"""
+        if not category_id:
+            return None
+        cat_id_len = len(category_id)
+        if cat_id_len == 3:
+            return f"cat1 = ${param_idx}"
+        if cat_id_len == 5:
+            return f"cat2 = ${param_idx}"
+        if cat_id_len >= 9:
+            return f"cat3 = ${param_idx}"
+        print(f"[RECOMMEND] Warning: Invalid category_id length: {cat_id_len} ('{category_id}')")
+        return None
+
+    def _build_search_query(
         self,
-        conn,
-        category_id: Optional[str],
-        emotion_embedding: Optional[List[float]],
+        category_ids: List[Optional[str]],
         geometry_info: Optional[Dict],
-        request: RecommendRequest
-    ) -> List[Dict]:
-        """단일 카테고리로 POI 검색 (내부 메서드)"""
+        request: RecommendRequest,
+        keyword_matches: Optional[Dict[str, KeywordMatch]] = None,
+        candidate_limit: Optional[int] = None
+    ):
+        """
+        카테고리 전체를 한 번에 검색하는 쿼리 (왕복 1회)
+        카테고리마다 기존 단일 카테고리 쿼리와 같은 조건/정렬/LIMIT의 하위 쿼리를 만들고
+        우선순위(priority) 컬럼을 붙여 UNION ALL (카테고리 조건이 단순 비교라 인덱스 사용 가능)
+
+        keyword_matches: 키워드 역색인 결과 (있으면 LIKE 대신 content_id 배열로 매칭 수/점수 전달)
+        candidate_limit: 카테고리별 LIMIT (없으면 request.limit)
+        """
         params = []
         param_idx = 1
 
@@ -95,6 +177,9 @@ class RecommendService:
                 mapy,
                 first_image,
                 first_image2,
+                cat1,
+                cat2,
+                cat3,
                 is_parking_available,
                 is_credit_card_ok,
                 is_free_admission,
@@ -106,8 +191,25 @@ class RecommendService:
 
         # Vector 검색 제거 - emotion_score 항상 0
 
-        # Core keywords LIKE 매칭 점수 추가 (필수)
-        if request.core_keywords and len(request.core_keywords) > 0:
+        # Core keywords 매칭 점수 추가 (필수)
+        keyword_join = ""
+        if request.core_keywords and len(request.core_keywords) > 0 and keyword_matches is not None:
+            # 역색인에서 계산한 매칭 수/BM25 점수를 배열로 넘겨 LEFT JOIN (overview 스캔 없음)
+            select_clause += ",\n    COALESCE(km.km_count, 0) AS keyword_match_count"
+            select_clause += ",\n    COALESCE(km.km_score, 0) AS keyword_score"
+            keyword_join = (
+                f"\nLEFT JOIN unnest(${param_idx}::text[], ${param_idx + 1}::int[], ${param_idx + 2}::float8[])"
+                " AS km(km_id, km_count, km_score) ON km.km_id = content_id"
+            )
+            matches = list(keyword_matches.values())
+            params.extend([
+                [match.content_id for match in matches],
+                [match.match_count for match in matches],
+                [match.score for match in matches]
+            ])
+            param_idx += 3
+        elif request.core_keywords and len(request.core_keywords) > 0:
+            # 역색인 미생성 시 DB LIKE 매칭
             keyword_match_sql = " + ".join([
                 f"CASE WHEN (LOWER(title) LIKE LOWER('%' || ${param_idx + i} || '%') OR LOWER(overview) LIKE LOWER('%' || ${param_idx + i} || '%')) THEN 1 ELSE 0 END"
                 for i in range(len(request.core_keywords))
@@ -115,9 +217,11 @@ class RecommendService:
             select_clause += f",\n    ({keyword_match_sql}) AS keyword_match_count"
             params.extend(request.core_keywords)
             param_idx += len(request.core_keywords)
+            select_clause += ",\n    0 AS keyword_score"
         else:
             # core_keywords 없으면 검색 결과 없음 (Google 폴백으로)
             select_clause += ",\n    0 AS keyword_match_count"
+            select_clause += ",\n    0 AS keyword_score"
 
         # Distance 추가
         if request.user_location:
@@ -128,51 +232,19 @@ class RecommendService:
             select_clause += ",\n    0 AS distance_km"
 
         # FROM clause
-        from_clause = "\nFROM KTO_TOUR_BASE_LIST"
+        from_clause = "\nFROM KTO_TOUR_BASE_LIST" + keyword_join
 
-        # WHERE clause 구성
+        # 카테고리 공통 WHERE 조건
         where_conditions = []
 
         # Language filter
         where_conditions.append("language = 'Kor'")
 
-        # Category filter (절대적 키워드) - category_id로 직접 검색
-        if category_id:
-            # category_id 길이로 cat level 결정
-            # cat1: 3자리 (A02)
-            # cat2: 5자리 (A0201)
-            # cat3: 9자리 (A02010100)
-            cat_id_len = len(category_id)
-            if cat_id_len == 3:
-                where_conditions.append(f"cat1 = ${param_idx}")
-                params.append(category_id)
-                param_idx += 1
-            elif cat_id_len == 5:
-                where_conditions.append(f"cat2 = ${param_idx}")
-                params.append(category_id)
-                param_idx += 1
-            elif cat_id_len >= 9:
-                where_conditions.append(f"cat3 = ${param_idx}")
-                params.append(category_id)
-                param_idx += 1
-            else:
-                print(f"[RECOMMEND] Warning: Invalid category_id length: {cat_id_len} ('{category_id}')")
-
         # Geometry filter (위치 조건)
         if geometry_info:
-            geom_type = geometry_info["geom_type"].upper()
-            geojson_str = json.dumps(geometry_info["geojson"])
-
-            if geom_type in ['POLYGON', 'MULTIPOLYGON']:
-                # POLYGON: Intersects
-                where_conditions.append(f"ST_Intersects(location, ST_GeomFromGeoJSON(${param_idx}))")
-                params.append(geojson_str)
-                param_idx += 1
-            else:
-                # POINT: 1500m 반경
-                where_conditions.append(f"ST_DWithin(location::geography, ST_GeomFromGeoJSON(${param_idx})::geography, 1500)")
-                params.append(geojson_str)
-                param_idx += 1
+            where_conditions.append(self._geometry_condition(geometry_info, param_idx))
+            params.append(json.dumps(geometry_info["geojson"]))
+            param_idx += 1
         elif request.user_location:
             # geometry_id 없으면 사용자 위치 1500m 반경
             where_conditions.append(f"ST_DWithin(location::geography, ST_SetSRID(ST_MakePoint(${param_idx}, ${param_idx + 1}), 4326)::geography, 1500)")
@@ -187,95 +259,262 @@ class RecommendService:
                     params.append(value)
                     param_idx += 1
 
-        # WHERE clause 조합
-        where_clause = "\nWHERE " + " AND ".join(where_conditions) if where_conditions else ""
+        # LIMIT (카테고리별)
+        limit_idx = param_idx
+        params.append(candidate_limit or request.limit)
+        param_idx += 1
 
-        # ORDER BY clause - keyword_match_count만 사용 (vector 제거)
-        order_clause = "\nORDER BY keyword_match_count DESC, distance_km ASC"
+        # 카테고리별 하위 쿼리 - keyword_match_count만 사용 (vector 제거)
+        branches = []
+        for priority, category_id in enumerate(category_ids):
+            conditions = list(where_conditions)
 
-        # LIMIT clause
-        limit_clause = f"\nLIMIT ${param_idx}"
-        params.append(request.limit)
+            # Category filter (절대적 키워드) - category_id로 직접 검색
+            category_condition = self._category_condition(category_id, param_idx)
+            if category_condition:
+                conditions.append(category_condition)
+                params.append(category_id)
+                param_idx += 1
 
-        # 최종 쿼리
-        full_query = select_clause + from_clause + where_clause + order_clause + limit_clause
+            where_clause = "\nWHERE " + " AND ".join(conditions)
+            branches.append(
+                f"(SELECT {priority} AS priority, sub.* FROM ("
+                + select_clause + from_clause + where_clause
+                + f"\nORDER BY keyword_match_count DESC, keyword_score DESC, distance_km ASC\nLIMIT ${limit_idx}"
+                + ") sub)"
+            )
+
+        full_query = "\nUNION ALL\n".join(branches) + "\nORDER BY priority, keyword_match_count DESC, keyword_score DESC, distance_km ASC"
+        return full_query, params
+
+    def _row_to_poi(self, row) -> Dict:
+        return {
+            "content_id": row["content_id"],
+            "content_type_id": row["content_type_id"],
+            "title": row["title"],
+            "overview": row["overview"],
+            "addr1": row["addr1"],
+            "addr2": row["addr2"],
+            "mapx": float(row["mapx"]) if row["mapx"] else None,
+            "mapy": float(row["mapy"]) if row["mapy"] else None,
+            "first_image": row["first_image"],
+            "first_image2": row["first_image2"],
+            "cat1": row["cat1"],
+            "cat2": row["cat2"],
+            "cat3": row["cat3"],
+            "is_parking_available": row["is_parking_available"],
+            "is_credit_card_ok": row["is_credit_card_ok"],
+            "is_free_admission": row["is_free_admission"],
+            "is_currently_open": row["is_currently_open"],
+            "price_range": row["price_range"],
+            "cuisine_type": row["cuisine_type"],
+            "accommodation_type": row["accommodation_type"],
+            "distance_km": float(row["distance_km"]) if row["distance_km"] else 0.0,
+            "keyword_match_count": int(row["keyword_match_count"]) if row["keyword_match_count"] else 0,
+            "keyword_score": float(row["keyword_score"]) if row["keyword_score"] else 0.0
+        }
+
+    async def _search_categories(
+        self,
+        conn,
+        category_ids: List[Optional[str]],
+        geometry_info: Optional[Dict],
+        request: RecommendRequest,
+        keyword_matches: Optional[Dict[str, KeywordMatch]] = None,
+        candidate_limit: Optional[int] = None
+    ) -> List[List[Dict]]:
+        """카테고리 전체 검색 (쿼리 1회) → 우선순위순 카테고리별 결과 목록"""
+        full_query, params = self._build_search_query(
+            category_ids, geometry_info, request, keyword_matches, candidate_limit
+        )
 
-        print(f"[RECOMMEND] Executing query (category: {category_id}) with {len(params)} params")
-        print(f"[RECOMMEND] Params: {params}")
+        print(f"[RECOMMEND] Executing query (categories: {category_ids}) with {len(params)} params")
+        if keyword_matches is None:
+            print(f"[RECOMMEND] Params: {params}")
 
-        # 실행
         rows = await conn.fetch(full_query, *params)
 
-        print(f"[RECOMMEND] Query returned {len(rows)} rows (category: {category_id})")
+        print(f"[RECOMMEND] Query returned {len(rows)} rows (categories: {category_ids})")
 
-        results = []
+        by_priority: List[List[Dict]] = [[] for _ in category_ids]
         for row in rows:
-            results.append({
-                "content_id": row["content_id"],
-                "content_type_id": row["content_type_id"],
-                "title": row["title"],
-                "overview": row["overview"],
-                "addr1": row["addr1"],
-                "addr2": row["addr2"],
-                "mapx": float(row["mapx"]) if row["mapx"] else None,
-                "mapy": float(row["mapy"]) if row["mapy"] else None,
-                "first_image": row["first_image"],
-                "first_image2": row["first_image2"],
-                "is_parking_available": row["is_parking_available"],
-                "is_credit_card_ok": row["is_credit_card_ok"],
-                "is_free_admission": row["is_free_admission"],
-                "is_currently_open": row["is_currently_open"],
-                "price_range": row["price_range"],
-                "cuisine_type": row["cuisine_type"],
-                "accommodation_type": row["accommodation_type"],
-                "distance_km": float(row["distance_km"]) if row["distance_km"] else 0.0,
-                "keyword_match_count": int(row["keyword_match_count"]) if row["keyword_match_count"] else 0
-            })
-
-        return results
+            by_priority[row["priority"]].append(self._row_to_poi(row))
+        return by_priority
 
     async def search_pois(self, request: RecommendRequest) -> List[Dict]:
-        """LIKE 검색만 수행 (Vector 제거) - keyword matching만 사용"""
-        conn = await get_async_db_connection()
-        if not conn:
-            raise Exception("Database connection failed")
+        """키워드 매칭 검색 + 하이브리드 재정렬 (키워드/벡터/거리)"""
+        # 1. core_keywords 매칭은 메모리 역색인에서 (DB 접근 전, overview 길이와 무관)
+        keyword_matches = None
+        if request.core_keywords and self.keyword_index.loaded:
+            keyword_matches = self.keyword_index.search(request.core_keywords)
+            print(f"[RECOMMEND] 키워드 역색인 매칭: {len(keyword_matches)}개 POI (keywords: {request.core_keywords})")
+
+        # 하이브리드 랭킹: 카테고리별 후보를 넉넉히 가져옴
+        # 쿼리 임베딩은 요청에 포함된 것 사용 (beaty), 없을 때만 DB 조회와 동시에 생성
+        candidate_limit = None
+        embedding_task = None
+        if self.ranker.enabled:
+            candidate_limit = request.limit * CANDIDATE_MULTIPLIER
+            if (
+                request.embedding is None
+                and (self.poi_embeddings.loaded or self.category_vectors.loaded)
+                and request.query_text
+            ):
+                embedding_task = asyncio.create_task(self.embed_query(request.query_text))
 
         try:
-            # Vector 검색 제거 - emotion_embedding 사용 안 함
-            emotion_embedding = None
-
-            # 2. Geometry 정보 조회
-            geometry_info = None
-            if request.geometry_id:
-                geometry_info = await self.get_geometry_info(request.geometry_id, conn)
-
-            # 3. 순차 검색 (category_ids 우선순위대로)
-            all_pois = []
-            used_categories = []
-
-            # category_ids가 없으면 [None]로 (카테고리 없이 검색)
-            category_ids = request.category_ids if request.category_ids else [None]
+            async with acquire() as conn:
+                # 2. Geometry 정보 조회
+                geometry_info = None
+                if request.geometry_id:
+                    geometry_info = await self.get_geometry_info(request.geometry_id, conn)
+
+                # category_ids가 없으면 [None]로 (카테고리 없이 검색)
+                category_ids = request.category_ids if request.category_ids else [None]
+
+                # 3. 카테고리 전체를 쿼리 1회로 검색
+                results_by_category = await self._search_categories(
+                    conn, category_ids, geometry_info, request, keyword_matches, candidate_limit
+                )
+        except BaseException:
+            # DB 조회 실패/요청 취소 시 임베딩 작업도 정리
+            if embedding_task is not None:
+                embedding_task.cancel()
+            raise
+
+        # 3-1. 카테고리별 후보 재정렬 (키워드 + 벡터 + 거리) → limit개
+        #      POI 벡터: POI별 임베딩 (없으면 카테고리 임베딩)
+        if candidate_limit:
+            query_vector = request.embedding
+            if embedding_task is not None:
+                query_vector = await embedding_task
+            keyword_count = len(request.core_keywords or [])
+            vector_store = self.poi_embeddings if self.poi_embeddings.loaded else self.category_vectors
+            results_by_category = [
+                self.ranker.rank(
+                    pois,
+                    keyword_count,
+                    query_vector=query_vector,
+                    poi_vectors=vector_store.vectors_for(pois) if pois else None,
+                    limit=request.limit
+                )
+                for pois in results_by_category
+            ]
+
+        # 4. 우선순위대로 누적 (기존 순차 검색과 같은 중단 기준)
+        all_pois = []
+        used_categories = []
+
+        for category_id, pois in zip(category_ids, results_by_category):
+            if pois:
+                all_pois.extend(pois)
+                used_categories.append(category_id)
+                print(f"[RECOMMEND] {len(pois)}개 POI 발견 (카테고리: {category_id}), 누적: {len(all_pois)}개")
+
+                # 충분한 결과가 나왔으면 중단
+                if len(all_pois) >= request.min_poi_count:
+                    print(f"[RECOMMEND] 충분한 결과 확보 ({len(all_pois)}개), 검색 중단")
+                    break
+            else:
+                print(f"[RECOMMEND] 카테고리 {category_id}에서 결과 없음")
 
-            for category_id in category_ids:
-                print(f"[RECOMMEND] 카테고리 {category_id} 검색 중...")
+        print(f"[RECOMMEND] 최종 결과: {len(all_pois)}개 POI (사용 카테고리: {used_categories})")
+        return all_pois
 
-                # 단일 카테고리로 검색
-                pois = await self._search_single_category(conn, category_id, emotion_embedding, geometry_info, request)
+    async def vector_search(self, request: VectorSearchRequest) -> List[Dict]:
+        """
+        Vector 유사도 검색 (키워드 매칭 결과가 없을 때 대안 추천)
 
-                if pois:
-                    all_pois.extend(pois)
-                    used_categories.append(category_id)
-                    print(f"[RECOMMEND] {len(pois)}개 POI 발견 (카테고리: {category_id}), 누적: {len(all_pois)}개")
+        POI 임베딩 인덱스가 있으면 메모리 top-k (geometry는 DB에서 후보 content_id로 먼저 필터),
+        없으면 카테고리 임베딩 JOIN 쿼리
+        """
+        embedding = request.embedding
+        if embedding is None and request.query_text:
+            embedding = await self.embed_query(request.query_text)
+        if embedding is None:
+            return []
 
-                    # 충분한 결과가 나왔으면 중단
-                    if len(all_pois) >= request.min_poi_count:
-                        print(f"[RECOMMEND] 충분한 결과 확보 ({len(all_pois)}개), 검색 중단")
-                        break
-                else:
-                    print(f"[RECOMMEND] 카테고리 {category_id}에서 결과 없음")
+        async with acquire() as conn:
+            geometry_info = None
+            if request.geometry_id:
+                geometry_info = await self.get_geometry_info(request.geometry_id, conn)
 
-            print(f"[RECOMMEND] 최종 결과: {len(all_pois)}개 POI (사용 카테고리: {used_categories})")
-            return all_pois
+            if not self.poi_embeddings.loaded or len(embedding) != self.poi_embeddings.dimension:
+                return await self._category_vector_search(conn, embedding, geometry_info, request.limit)
+
+            candidate_ids = None
+            if geometry_info:
+                rows = await conn.fetch(
+                    "SELECT content_id FROM KTO_TOUR_BASE_LIST WHERE language = 'Kor' AND "
+                    + self._geometry_condition(geometry_info, 1),
+                    json.dumps(geometry_info["geojson"])
+                )
+                candidate_ids = [row["content_id"] for row in rows]
+                print(f"[RECOMMEND] Vector 검색 geometry 후보: {len(candidate_ids)}개")
+
+            hits = self.poi_embeddings.search(embedding, request.limit, candidate_ids)
+            if not hits:
+                return []
+
+            rows = await conn.fetch(
+                f"SELECT {VECTOR_RESULT_COLUMNS} FROM KTO_TOUR_BASE_LIST t "
+                "WHERE t.content_id = ANY($1::text[]) AND t.language = 'Kor'",
+                [content_id for content_id, _ in hits]
+            )
+
+        rows_by_id = {row["content_id"]: row for row in rows}
+        results = [
+            self._vector_row_to_poi(rows_by_id[content_id], similarity)
+            for content_id, similarity in hits
+            if content_id in rows_by_id
+        ]
+        print(f"[RECOMMEND] Vector 검색 (POI 임베딩): {len(results)}개")
+        return results
 
-        finally:
-            await conn.close()
+    async def _category_vector_search(
+        self,
+        conn,
+        embedding: List[float],
+        geometry_info: Optional[Dict],
+        limit: int
+    ) -> List[Dict]:
+        """POI 임베딩이 없을 때: POI가 속한 카테고리 임베딩과의 유사도 (기존 Vector 대안 검색)"""
+        query = f"""
+            SELECT DISTINCT
+                {VECTOR_RESULT_COLUMNS},
+                1 - (c.embedding <=> $1::vector) AS similarity
+            FROM kto_tour_base_list t
+            JOIN kto_tour_category c ON (
+                t.cat1 = c.cat_code OR
+                t.cat2 = c.cat_code OR
+                t.cat3 = c.cat_code
+            )
+            WHERE c.lang = 'ko'
+              AND t.language = 'Kor'
+              AND t.mapx IS NOT NULL
+              AND t.mapy IS NOT NULL
+        """
+        params = [str(embedding), limit]
+        if geometry_info:
+            query += " AND " + self._geometry_condition(geometry_info, 3, column="t.location")
+            params.append(json.dumps(geometry_info["geojson"]))
+
+        rows = await conn.fetch(query + " ORDER BY similarity DESC LIMIT $2", *params)
+        print(f"[RECOMMEND] Vector 검색 (카테고리 임베딩): {len(rows)}개")
+        return [self._vector_row_to_poi(row, row["similarity"]) for row in rows]
+
+    def _vector_row_to_poi(self, row, similarity: float) -> Dict:
+        return {
+            "content_id": str(row["content_id"]),
+            "title": row["title"],
+            "mapx": float(row["mapx"]) if row["mapx"] else 0,
+            "mapy": float(row["mapy"]) if row["mapy"] else 0,
+            "addr1": row["addr1"],
+            "cat1": row["cat1"],
+            "cat2": row["cat2"],
+            "cat3": row["cat3"],
+            "content_type_id": str(row["content_type_id"]),
+            "first_image": row["first_image"],
+            "overview": row["overview"],
+            "similarity": float(similarity)
+        }
@@ -1,8 +1,14 @@
 """Utils package"""
 
-from .db import get_sync_db_connection, get_async_db_connection
+from .db import init_db_pool, close_db_pool, acquire, pool_stats, run_sync
+from .http import get_http_client, close_http_clients
 
 __all__ = [
-    "get_sync_db_connection",
-    "get_async_db_connection"
+    "init_db_pool",
+    "close_db_pool",
+    "acquire",
+    "pool_stats",
+    "run_sync",
+    "get_http_client",
+    "close_http_clients"
 ]
@@ -1,49 +1,128 @@
 """
 Database Connection Utils
-DB 연결 유틸리티 (psycopg2, asyncpg 모두 지원)
+앱 수명 동안 유지되는 asyncpg 커넥션 풀 + 동기 코드용 제한된 스레드 풀
+- 요청마다 SSL 연결을 새로 맺지 않도록 풀을 공유 (startup에서 생성, shutdown에서 종료)
+- 동기 호출(OpenAI SDK 등)은 run_sync로 스레드 풀에서 실행 → 이벤트 루프 블로킹 방지
 """
 
+import asyncio
+import json
+import os
 import ssl
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Callable, Optional
+
 import asyncpg
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import Optional
 from config import CONFIG
 
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 1))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", 10))
+SYNC_WORKERS = int(os.getenv("SYNC_WORKERS", 8))
 
-def get_sync_db_connection():
-    """동기 DB 연결 (psycopg2)"""
-    try:
-        return psycopg2.connect(
-            host=CONFIG["db_host"],
-            port=CONFIG["db_port"],
-            database=CONFIG["db_name"],
-            user=CONFIG["db_user"],
-            password=CONFIG["db_password"],
-            cursor_factory=RealDictCursor
-        )
-    except Exception as e:
-        print(f"[DB] Sync connection error: {e}")
-        raise
-
-
-async def get_async_db_connection():
-    """비동기 DB 연결 (asyncpg)"""
-    try:
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
-        conn = await asyncpg.connect(
-            host=CONFIG["db_host"],
-            port=CONFIG["db_port"],
-            database=CONFIG["db_name"],
-            user=CONFIG["db_user"],
-            password=CONFIG["db_password"],
-            ssl=ssl_context,
-            command_timeout=60
+_pool: Optional[asyncpg.Pool] = None
+_pool_lock: Optional[asyncio.Lock] = None
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _ssl_context() -> ssl.SSLContext:
+    """Supabase 연결용 SSL 설정 (인증서 검증 생략 - 기존 연결 방식과 동일)"""
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+async def _init_connection(conn: asyncpg.Connection):
+    """JSON/JSONB 컬럼을 dict로 디코딩 (psycopg2 RealDictCursor와 동일한 응답 형태 유지)"""
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=json.dumps,
+            decoder=json.loads,
+            schema="pg_catalog"
         )
-        return conn
-    except Exception as e:
-        print(f"[DB] Async connection error: {e}")
-        raise
+
+
+async def init_db_pool() -> asyncpg.Pool:
+    """커넥션 풀 생성 (이미 있으면 그대로 반환, 앱 startup 시 호출)"""
+    global _pool, _pool_lock
+    if _pool is not None:
+        return _pool
+
+    if _pool_lock is None:
+        _pool_lock = asyncio.Lock()
+
+    async with _pool_lock:
+        if _pool is None:
+            try:
+                _pool = await asyncpg.create_pool(
+                    host=CONFIG["db_host"],
+                    port=CONFIG["db_port"],
+                    database=CONFIG["db_name"],
+                    user=CONFIG["db_user"],
+                    password=CONFIG["db_password"],
+                    ssl=_ssl_context(),
+                    min_size=DB_POOL_MIN_SIZE,
+                    max_size=DB_POOL_MAX_SIZE,
+                    command_timeout=60,
+                    init=_init_connection
+                )
+                print(f"[DB] 커넥션 풀 생성 완료 (max_size={DB_POOL_MAX_SIZE})")
+            except Exception as e:
+                print(f"[DB] 커넥션 풀 생성 실패: {e}")
+                raise
+    return _pool
+
+
+async def close_db_pool():
+    """커넥션 풀 + 스레드 풀 종료 (앱 shutdown 시 호출)"""
+    global _pool, _executor
+    if _pool is not None:
+        try:
+            await _pool.close()
+        except Exception as e:
+            print(f"[DB] 커넥션 풀 종료 실패: {e}")
+        _pool = None
+
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+@asynccontextmanager
+async def acquire():
+    """
+    풀에서 연결 대여 (startup 전 호출 시 풀을 먼저 생성)
+
+    사용:
+        async with acquire() as conn:
+            rows = await conn.fetch(query, *params)
+    """
+    pool = _pool or await init_db_pool()
+    async with pool.acquire() as conn:
+        yield conn
+
+
+def pool_stats() -> dict:
+    """커넥션 풀 상태 (헬스체크용)"""
+    if _pool is None:
+        return {"initialized": False}
+    return {
+        "initialized": True,
+        "size": _pool.get_size(),
+        "idle": _pool.get_idle_size(),
+        "max_size": _pool.get_max_size(),
+        "sync_workers": SYNC_WORKERS
+    }
+
+
+async def run_sync(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """동기 함수를 제한된 스레드 풀에서 실행 (최대 SYNC_WORKERS개 동시 실행)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=SYNC_WORKERS, thread_name_prefix="poi-sync")
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
@@ -0,0 +1,58 @@
+"""
+HTTP Client Utils
+외부 API 호출용 공유 httpx.AsyncClient (호스트별 커넥션 풀, keep-alive, 선택적 HTTP/2)
+"""
+
+import os
+from typing import Dict
+from urllib.parse import urlsplit
+
+import httpx
+
+# HTTP/2는 h2 패키지가 설치된 경우에만 사용
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# HTTP/2를 사용할 호스트 (Google API)
+HTTP2_HOSTS = {"places.googleapis.com", "maps.googleapis.com"}
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", 100)),
+    max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", 20)),
+    keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 30.0))
+)
+
+# origin(scheme://host:port) → 공유 클라이언트
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """URL의 호스트에 해당하는 공유 클라이언트 반환 (호출자가 닫지 말 것)"""
+    parts = urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+
+    client = _clients.get(origin)
+    if client is None or client.is_closed:
+        use_http2 = HTTP2_AVAILABLE and parts.hostname in HTTP2_HOSTS
+        client = httpx.AsyncClient(
+            limits=HTTP_LIMITS,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            http2=use_http2
+        )
+        _clients[origin] = client
+        print(f"[HTTP] 클라이언트 생성: {origin} (http2={use_http2})")
+
+    return client
+
+
+async def close_http_clients():
+    """모든 공유 클라이언트 종료 (앱 shutdown 시 호출)"""
+    for origin, client in list(_clients.items()):
+        try:
+            await client.aclose()
+        except Exception as e:
+            print(f"[HTTP] 종료 실패 ({origin}): {e}")
+    _clients.clear()
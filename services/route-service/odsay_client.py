@@ -1,3 +1,4 @@
+import os
 import httpx
 from typing import Optional, List, Dict, Any
 from urllib.parse import urlencode
@@ -6,7 +7,8 @@ from urllib.parse import urlencode
 class ODSayClient:
     """ODSay API 클라이언트"""
 
-    BASE_URL = "https://api.odsay.com/v1/api"
+    # 부하 테스트 시 mock-service로 교체 (ODSAY_BASE_URL)
+    BASE_URL = os.getenv("ODSAY_BASE_URL", "https://api.odsay.com/v1/api").rstrip("/")
 
     def __init__(self, api_key: str):
         self.api_key = api_key